@@ -95,6 +95,7 @@ liblammpsplugin_t *liblammpsplugin_load(const char *lib)
   ADDSYM(reset_box);
 
   ADDSYM(memory_usage);
+  ADDSYM(get_timing);
   ADDSYM(get_mpi_comm);
 
   ADDSYM(extract_setting);
@@ -126,6 +127,7 @@ liblammpsplugin_t *liblammpsplugin_load(const char *lib)
   ADDSYM(gather_angles);
   ADDSYM(gather_dihedrals);
   ADDSYM(gather_impropers);
+  ADDSYM(topology_checksum);
 
   ADDSYM(gather);
   ADDSYM(gather_concat);
@@ -180,6 +182,8 @@ liblammpsplugin_t *liblammpsplugin_load(const char *lib)
   ADDSYM(fix_external_set_energy_peratom);
   ADDSYM(fix_external_set_virial_global);
   ADDSYM(fix_external_set_virial_peratom);
+  ADDSYM(fix_external_get_energy_peratom);
+  ADDSYM(fix_external_get_virial_peratom);
   ADDSYM(fix_external_set_vector_length);
   ADDSYM(fix_external_set_vector);
 
@@ -141,6 +141,7 @@ struct _liblammpsplugin {
   void (*reset_box)(void *, double *, double *, double, double, double);
 
   void (*memory_usage)(void *, double *);
+  void (*get_timing)(void *, double *);
   int (*get_mpi_comm)(void *);
 
   int (*extract_setting)(void *, const char *);
@@ -172,6 +173,7 @@ struct _liblammpsplugin {
   void (*gather_angles)(void *, void *);
   void (*gather_dihedrals)(void *, void *);
   void (*gather_impropers)(void *, void *);
+  int64_t (*topology_checksum)(void *, const char *);
 
   void (*gather)(void *, const char *, int, int, void *);
   void (*gather_concat)(void *, const char *, int, int, void *);
@@ -239,6 +241,8 @@ struct _liblammpsplugin {
   void (*fix_external_set_energy_peratom)(void *, const char *, double *);
   void (*fix_external_set_virial_global)(void *, const char *, double *);
   void (*fix_external_set_virial_peratom)(void *, const char *, double **);
+  double *(*fix_external_get_energy_peratom)(void *, const char *);
+  double **(*fix_external_get_virial_peratom)(void *, const char *);
   void (*fix_external_set_vector_length)(void *, const char *, int);
   void (*fix_external_set_vector)(void *, const char *, int, double);
 
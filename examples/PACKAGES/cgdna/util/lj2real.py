@@ -33,23 +33,7 @@ import datetime
 import os
 import sys
 
-
-class Sections:
-    """Sections of the data file"""
-
-    def __init__(
-        self,
-        bounds: bool,
-        masses: bool,
-        atoms: bool,
-        velocities: bool,
-        ellipsoids: bool,
-    ):
-        self.bounds = bounds  # xlo, xhi, ylo, yhi, zlo, zhi
-        self.masses = masses  # Masses
-        self.atoms = atoms  # Atoms
-        self.velocities = velocities  # Velocities
-        self.ellipsoids = ellipsoids  # Ellipsoids
+import numpy as np
 
 
 # Conversion factors
@@ -137,167 +121,181 @@ class ConversionFactors:
         self.oxrna2_coaxstk_string = "80 0.5 0.6 0.42 0.58 2.0 2.592 0.65 1.3 0.151 0.8 0.9 0.685 0.95 0.9 0.685 0.95 2.0 -0.65 2.0 -0.65"
 
 
-def check_datafile_header(line: str, sections: Sections):
-    """Checks for headers to modify corresponding data, since datafile is split into headers.
-        Modifies the Sections object to keep track of the current section.
+DATAFILE_CHUNK = 65536  # number of data lines converted at once
+WRITE_BUFFER = 1 << 20  # buffer size of the converted files in bytes
+BOUNDS_HEADERS = ["xlo", "xhi", "ylo", "yhi", "zlo", "zhi"]
+
+
+def datafile_columns(section: str, conversion_factors: ConversionFactors):
+    """Returns the columns of a data file section to convert.
 
     Args:
-        line (str): The line to check
-        sections (Sections): The Sections object to modify
+        section (str): The section name, e.g. "Atoms"
+        conversion_factors (ConversionFactors): The conversion factors to use
+
+    Returns:
+        dict: Column index -> (conversion factor, digits to round to or None),
+            empty for sections which are copied unchanged
     """
+    if section == "Masses":
+        return {1: (conversion_factors.mass_conv_factor, 4)}
+    if section == "Atoms":
+        length = (conversion_factors.length_conv_factor, None)
+        density = (conversion_factors.density_conv_factor, None)
+        return {2: length, 3: length, 4: length, 7: density}
+    if section == "Velocities":
+        vel = (conversion_factors.vel_conv_factor, None)
+        angmom = (conversion_factors.angular_mom_conv_factor, None)
+        return {1: vel, 2: vel, 3: vel, 4: angmom, 5: angmom, 6: angmom}
+    if section == "Ellipsoids":
+        length = (conversion_factors.length_conv_factor, None)
+        return {1: length, 2: length, 3: length}
+    return {}
+
+
+def convert_lines(lines: list, columns: dict):
+    """Converts a block of data lines of one section with whole-column NumPy operations.
 
-    if any(header in line for header in ["xlo", "xhi", "ylo", "yhi", "zlo", "zhi"]):
-        sections.bounds = True
-        sections.masses = False
-        sections.atoms = False
-        sections.velocities = False
-        sections.ellipsoids = False
-    elif "Masses" in line:
-        sections.bounds = False
-        sections.masses = True
-        sections.atoms = False
-        sections.velocities = False
-        sections.ellipsoids = False
-    elif "Atoms" in line:
-        sections.bounds = False
-        sections.masses = False
-        sections.atoms = True
-        sections.velocities = False
-        sections.ellipsoids = False
-    elif "Velocities" in line:
-        sections.bounds = False
-        sections.masses = False
-        sections.atoms = False
-        sections.velocities = True
-        sections.ellipsoids = False
-    elif "Ellipsoids" in line:
-        sections.bounds = False
-        sections.masses = False
-        sections.atoms = False
-        sections.velocities = False
-        sections.ellipsoids = True
-    elif "Bonds" in line:
-        sections.bounds = False
-        sections.masses = False
-        sections.atoms = False
-        sections.velocities = False
-        sections.ellipsoids = False
+    Args:
+        lines (list): The data lines, all with the same number of words
+        columns (dict): The columns to convert, see datafile_columns()
 
+    Returns:
+        str: The converted lines, with words separated by single spaces
+    """
+    words = "".join(lines).split()
+    ncol = len(lines[0].split())
+    if len(words) != ncol * len(lines):  # rows of different length, e.g. comments
+        return "".join(convert_lines([line], columns) for line in lines)
+
+    cols = [words[j::ncol] for j in range(ncol)]
+    for j, (factor, ndigits) in columns.items():
+        values = (np.array(cols[j], dtype=np.float64) * factor).tolist()
+        if ndigits is None:
+            cols[j] = list(map(str, values))
+        else:
+            cols[j] = [str(round(x, ndigits)) for x in values]
+    return "\n".join(map(" ".join, zip(*cols))) + "\n"
 
-def modify_datafile(datafile_path: str, conversion_factors: ConversionFactors):
-    """Modifies the file by header to use real units.
+
+def convert_datafile(
+    datafile_path: str, new_datafile_path: str, title: str, conversion_factors: ConversionFactors
+):
+    """Converts the data file into a new file with the given title line.
 
     Args:
-        datafile_path (str): The path to the file to modify
+        datafile_path (str): The path to the file to convert
+        new_datafile_path (str): The path to write the converted file to
+        title (str): The new first line of the data file
         conversion_factors (ConversionFactors): The conversion factors to use
+
+    Returns:
+        int: The number of lines changed
     """
     lines_changed = 0
-    current_section = Sections(False, False, False, False, False)
-
-    with open(datafile_path, "r", encoding="UTF-8") as file:
-        lines = file.readlines()
-        if conversion_factors.inverted:
-            lines[0] = (
-                "LAMMPS data file in LJ units via oxdna lj2real.py, date "
-                + str(datetime.date.today())
-                + "\n"
-            )
-        else:
-            lines[0] = (
-                "LAMMPS data file in real units via oxdna lj2real.py, date "
-                + str(datetime.date.today())
-                + "\n"
-            )
 
-    for i, line in enumerate(lines):
-        check_datafile_header(line, current_section)  # check for headers
+    with open(datafile_path, "r", encoding="UTF-8") as file, open(
+        new_datafile_path, "w", encoding="UTF-8", buffering=WRITE_BUFFER
+    ) as new_file:
+        file.readline()
+        new_file.write(title + str(datetime.date.today()) + "\n")
+
+        section = None  # None in the header, else the current section name
+        columns = {}
+        bounds = False
+        block = []
+
+        for line in file:
+            first = line.lstrip()[:1]
+            if first and first in "0123456789+-.":  # data line
+                if columns:
+                    block.append(line)
+                    if len(block) >= DATAFILE_CHUNK:
+                        new_file.write(convert_lines(block, columns))
+                        lines_changed += len(block)
+                        block = []
+                    continue
+                if section is None:  # header line
+                    if any(header in line for header in BOUNDS_HEADERS):
+                        bounds = True
+                    if bounds:
+                        elements = line.split()
+                        elements[0:2] = [
+                            str(int(float(x) * conversion_factors.length_conv_factor))
+                            for x in elements[0:2]
+                        ]
+                        line = " ".join(elements) + "\n"
+                        lines_changed += 1
+            elif first and first != "#":  # section header
+                section = line.split()[0]
+                columns = datafile_columns(section, conversion_factors)
+            if block:
+                new_file.write(convert_lines(block, columns))
+                lines_changed += len(block)
+                block = []
+            new_file.write(line)
+
+        if block:
+            new_file.write(convert_lines(block, columns))
+            lines_changed += len(block)
+
+    return lines_changed
 
-        elements = line.split()
-        if (
-            not elements
-            or elements[0] == "#"
-            or any(
-                header in line
-                for header in ["Masses", "Atoms", "Velocities", "Ellipsoids", "Bonds"]
-            )
-        ):
-            continue
 
-        # modify the line based on the current section it is in
-        if current_section.bounds:
-            elements[0:2] = [
-                str(int(float(x) * conversion_factors.length_conv_factor))
-                for x in elements[0:2]
-            ]
-            lines[i] = " ".join(elements) + "\n"
-            lines_changed += 1
-        if current_section.masses:
-            elements[1] = str(
-                round(float(elements[1]) * conversion_factors.mass_conv_factor, 4)
-            )
-            lines[i] = " ".join(elements) + "\n"
-            lines_changed += 1
-        elif current_section.atoms:
-            elements[2:5] = [
-                str(float(x) * conversion_factors.length_conv_factor)
-                for x in elements[2:5]
-            ]
-            elements[7] = str(
-                float(elements[7]) * conversion_factors.density_conv_factor
-            )
-            lines[i] = " ".join(elements) + "\n"
-            lines_changed += 1
-        elif current_section.velocities:
-            elements[1:4] = [
-                str(float(x) * conversion_factors.vel_conv_factor)
-                for x in elements[1:4]
-            ]
-            elements[4:7] = [
-                str(float(x) * conversion_factors.angular_mom_conv_factor)
-                for x in elements[4:7]
-            ]
-            lines[i] = " ".join(elements) + "\n"
-            lines_changed += 1
-        elif current_section.ellipsoids:
-            elements[1:4] = [
-                str(float(x) * conversion_factors.length_conv_factor)
-                for x in elements[1:4]
-            ]
-            lines[i] = " ".join(elements) + "\n"
-            lines_changed += 1
+def modify_datafile(datafile_path: str, conversion_factors: ConversionFactors):
+    """Modifies the file by header to use real units.
+
+    The data file is streamed: sections are detected once by their header line,
+    data lines are converted in blocks of DATAFILE_CHUNK lines and written through
+    a buffered writer, so memory use does not grow with the system size.  The
+    output goes to a temporary file that is renamed only after a successful
+    conversion, so an error does not leave a truncated data file behind.
 
+    Args:
+        datafile_path (str): The path to the file to modify
+        conversion_factors (ConversionFactors): The conversion factors to use
+    """
     if conversion_factors.inverted:
         new_datafile_path = datafile_path + "_lj"
+        title = "LAMMPS data file in LJ units via oxdna lj2real.py, date "
     else:
         new_datafile_path = datafile_path + "_real"
+        title = "LAMMPS data file in real units via oxdna lj2real.py, date "
 
-    with open(new_datafile_path, "w", encoding="UTF-8") as file:
-        file.writelines(lines)
-        if lines_changed == 0:
-            print(
-                "Warning: No lines changed in data file. Ensure correct usage: python lj2real.py <datafile> <inputfile> [-i]"
-            )
-        else:
-            print(f"Data file lines changed: {lines_changed}")
+    tmp_datafile_path = new_datafile_path + ".tmp"
+    try:
+        lines_changed = convert_datafile(datafile_path, tmp_datafile_path, title, conversion_factors)
+    except BaseException:
+        if os.path.exists(tmp_datafile_path):
+            os.remove(tmp_datafile_path)
+        raise
+    os.replace(tmp_datafile_path, new_datafile_path)
+
+    if lines_changed == 0:
+        print(
+            "Warning: No lines changed in data file. Ensure correct usage: python lj2real.py <datafile> <inputfile> [-i]"
+        )
+    else:
+        print(f"Data file lines changed: {lines_changed}")
 
     return new_datafile_path
 
 
-def modify_inputfile(inputfile_path: str, conversion_factors: ConversionFactors):
-    """Modifies the input file line by line to use real units.
+def convert_inputfile_lines(lines, conversion_factors: ConversionFactors):
+    """Converts the lines of an input file one by one to use real units.
 
     Args:
-        inputfile_path (str): The path to the input file to modify
+        lines (iterable): The lines of the input file, e.g. an open file
         conversion_factors (ConversionFactors): The conversion factors to use
+
+    Yields:
+        tuple: The converted line and whether it was changed
     """
 
-    lines_changed = 0
     oxdna2_flag, oxrna2_flag = False, False
 
-    with open(inputfile_path, "r", encoding="UTF-8") as file:
-        lines = file.readlines()
-
-    for i, line in enumerate(lines):
+    for line in lines:
+        changed = False
         if "oxdna2" in line and not oxdna2_flag:
             oxdna2_flag = True
             print("Note: oxdna2 found in input file. Using oxdna2 conversion factors.")
@@ -311,6 +309,7 @@ def modify_inputfile(inputfile_path: str, conversion_factors: ConversionFactors)
 
         elements = line.split()
         if not elements:
+            yield line, False
             continue
 
         if "variable T" in line:
@@ -319,29 +318,29 @@ def modify_inputfile(inputfile_path: str, conversion_factors: ConversionFactors)
             new_value = str(
                 round(float(old_value) * conversion_factors.temp_conv_factor, 1)
             )
-            lines[i] = line.replace(old_value, new_value)
-            lines_changed += 1
+            line = line.replace(old_value, new_value)
+            changed = True
 
         elif "units" in line:
             if conversion_factors.inverted:
-                lines[i] = "units lj\n"
+                line = "units lj\n"
             else:
-                lines[i] = "units real\n"
-            lines_changed += 1
+                line = "units real\n"
+            changed = True
 
         elif "atom_modify" in line:
             elements[3] = str(
                 round(float(elements[3]) * conversion_factors.length_conv_factor, 3)
             )
-            lines[i] = " ".join(elements) + "\n"
-            lines_changed += 1
+            line = " ".join(elements) + "\n"
+            changed = True
 
         elif "neighbor" in line:
             elements[1] = str(
                 round(float(elements[1]) * conversion_factors.length_conv_factor, 3)
             )
-            lines[i] = " ".join(elements) + "\n"
-            lines_changed += 1
+            line = " ".join(elements) + "\n"
+            changed = True
 
         elif "read_data" in line:
             if conversion_factors.inverted:
@@ -349,15 +348,15 @@ def modify_inputfile(inputfile_path: str, conversion_factors: ConversionFactors)
             else:
                 elements[1] = elements[1] + "_real"
                 # naming convention of datafile after conversion
-            lines[i] = " ".join(elements) + "\n"
-            lines_changed += 1
+            line = " ".join(elements) + "\n"
+            changed = True
 
         elif "mass" in line:
             elements[4] = str(
                 round(float(elements[4]) * conversion_factors.mass_conv_factor, 4)
             )
-            lines[i] = " ".join(elements) + "\n"
-            lines_changed += 1
+            line = " ".join(elements) + "\n"
+            changed = True
 
         elif "bond_coeff" in line or "pair_coeff" in line:
             if ".cgdna" in line:  # potential files
@@ -365,8 +364,7 @@ def modify_inputfile(inputfile_path: str, conversion_factors: ConversionFactors)
                     line = line.replace("real.cgdna", "lj.cgdna")
                 else:
                     line = line.replace("lj.cgdna", "real.cgdna")
-                lines[i] = line
-                lines_changed += 1
+                changed = True
 
                 # converting modifiable paramters outside of potential files
                 if "stk" in line and "xstk" not in line and "coaxstk" not in line:
@@ -388,7 +386,7 @@ def modify_inputfile(inputfile_path: str, conversion_factors: ConversionFactors)
                     elements[7] = str(  # convert kappa
                         round(float(elements[7]) * conversion_factors.kT_conv_factor, 9)
                     )
-                    lines[i] = " ".join(elements) + "\n"
+                    line = " ".join(elements) + "\n"
 
                 elif "dh" in line:
                     elements = line.split()
@@ -400,7 +398,7 @@ def modify_inputfile(inputfile_path: str, conversion_factors: ConversionFactors)
                                 1,
                             )
                         )
-                        lines[i] = " ".join(elements) + "\n"
+                        line = " ".join(elements) + "\n"
 
             else:  # non-potential files
                 if "bond_coeff" in line:
@@ -506,8 +504,8 @@ def modify_inputfile(inputfile_path: str, conversion_factors: ConversionFactors)
                                 1,
                             )
                         )
-                lines[i] = " ".join(elements) + "\n"
-                lines_changed += 1
+                line = " ".join(elements) + "\n"
+                changed = True
 
         elif "langevin" in line:  # compatible with fix langevin
             if elements[4] != "${T}":
@@ -521,51 +519,61 @@ def modify_inputfile(inputfile_path: str, conversion_factors: ConversionFactors)
             elements[6] = str(
                 round(float(elements[6]) * conversion_factors.time_conv_factor, 2)
             )
-            lines[i] = " ".join(elements) + "\n"
-            lines_changed += 1
+            line = " ".join(elements) + "\n"
+            changed = True
 
         elif "timestep" in line:
             elements[1] = str(
                 round(float(elements[1]) * conversion_factors.time_conv_factor, 5)
             )
-            lines[i] = " ".join(elements) + "\n"
-            lines_changed += 1
+            line = " ".join(elements) + "\n"
+            changed = True
 
         elif "comm_modify" in line:
             elements[2] = str(
                 round(float(elements[2]) * conversion_factors.length_conv_factor, 1)
             )
-            lines[i] = " ".join(elements) + "\n"
-            lines_changed += 1
+            line = " ".join(elements) + "\n"
+            changed = True
 
-        else:
-            continue
+
+        yield line, changed
+
+
+def modify_inputfile(inputfile_path: str, conversion_factors: ConversionFactors):
+    """Modifies the input file line by line to use real units.
+
+    Args:
+        inputfile_path (str): The path to the input file to modify
+        conversion_factors (ConversionFactors): The conversion factors to use
+    """
+
+    lines_changed = 0
 
     if conversion_factors.inverted:
         new_inputfile_path = inputfile_path + "_lj"
+        title = "# LAMMPS input file in LJ units via oxdna lj2real.py, date "
     else:
         new_inputfile_path = inputfile_path + "_real"
+        title = "# LAMMPS input file in real units via oxdna lj2real.py, date "
 
-    with open(new_inputfile_path, "w", encoding="UTF-8") as file:
-        if conversion_factors.inverted:
-            file.write(
-                "# LAMMPS input file in LJ units via oxdna lj2real.py, date "
-                + str(datetime.date.today())
-                + "\n"
-            )
-        else:
-            file.write(
-                "# LAMMPS input file in real units via oxdna lj2real.py, date "
-                + str(datetime.date.today())
-                + "\n"
-            )
-        file.writelines(lines)
-        if lines_changed == 0:
-            print(
-                "Warning: No lines changed in input file. Ensure correct usage: python lj2real.py <datafile> <inputfile> [-i]"
-            )
-        else:
-            print(f"Input file lines changed: {lines_changed}")
+    # input files are small, so the new file is only written after all lines
+    # have been converted and an error does not leave a truncated file behind
+    new_lines = [title + str(datetime.date.today()) + "\n"]
+    with open(inputfile_path, "r", encoding="UTF-8") as file:
+        for line, changed in convert_inputfile_lines(file, conversion_factors):
+            new_lines.append(line)
+            lines_changed += changed
+
+    with open(new_inputfile_path, "w", encoding="UTF-8") as new_file:
+        new_file.writelines(new_lines)
+
+    if lines_changed == 0:
+        print(
+            "Warning: No lines changed in input file. Ensure correct usage: python lj2real.py <datafile> <inputfile> [-i]"
+        )
+    else:
+        print(f"Input file lines changed: {lines_changed}")
 
     return new_inputfile_path
 
@@ -0,0 +1,93 @@
+#!/usr/bin/env python3
+"""Memory-bounded lattice sums over the periodic images of a square 2D lattice
+
+The images are summed over one quadrant {x >= 0, y >= 1}, which covers all
+images except the original one by 90 degree rotations, so the sums have to be
+multiplied by 4.  Images are added ring by ring, where ring n contains all
+images with max(x, y) = n, and rings are processed in chunks of at most
+``chunk`` distances at once.
+"""
+
+import numpy as np
+from scipy.special import erf
+
+SQRTPI_INV = 1 / np.sqrt(np.pi)
+CHUNK = 1 << 20  # maximum number of distances evaluated at once
+
+
+def ring_distances(n_start, n_end):
+    """squared distances (in lattice units) and multiplicities of all images in
+    rings n_start <= n < n_end of one quadrant
+
+    Ring n contains (n, k) for k = 1..n and (k, n) for k = 0..n-1, i.e. the
+    squared distance n^2 + k^2 appears twice for k = 1..n-1 and once for
+    k = 0 and k = n.
+    """
+    n = np.arange(n_start, n_end)
+    size = n + 1
+    nn = np.repeat(n, size)
+    k = np.arange(len(nn)) - np.repeat(np.cumsum(size) - size, size)
+    weights = np.where((k == 0) | (k == nn), 1.0, 2.0)
+    return (nn * nn + k * k).astype(float), weights
+
+
+def rings_in_chunk(n_start, chunk):
+    """largest n_end, for which rings n_start <= n < n_end have at most chunk
+    images, but at least one ring"""
+    # number of images in rings n_start..n_end-1 is (n_end (n_end+1) - n_start (n_start+1)) / 2
+    total = 2 * chunk + n_start * (n_start + 1)
+    n_end = int((np.sqrt(1 + 4 * total) - 1) / 2)
+    return max(n_end, n_start + 1)
+
+
+class ImageSums:
+    """accumulated lattice sums of Gaussian or point charge interactions
+
+    Each term is identified by the out-of-plane distance dz between the two
+    charges and the Gaussian parameter eta, which is None for point charges.
+    With r = sqrt(d^2 + dz^2) for the in-plane image distances d, the
+    potential sums
+
+        potential[dz, eta] = sum erf(eta r) / r      (sum 1 / r for points)
+
+    and the force sums, i.e. the force per charge product and dz,
+
+        force[dz, eta] = sum (erf(eta r) - 2 eta r / sqrt(pi) exp(-eta^2 r^2)) / r^3
+
+    are accumulated over one quadrant.  The distances are computed once for
+    all terms with the same dz and erf() once per term for both sums.
+    """
+
+    def __init__(self, terms, a=1.0, chunk=CHUNK):
+        self.terms = list(dict.fromkeys(terms))
+        self.a = a
+        self.chunk = chunk
+        self.length = 1  # images with max(x, y) < length are included
+        self.potential = dict.fromkeys(self.terms, 0.0)
+        self.force = dict.fromkeys(self.terms, 0.0)
+
+    def extend(self, length):
+        """add all images with max(x, y) < length"""
+        offsets = {}
+        for dz, eta in self.terms:
+            offsets.setdefault(dz, []).append(eta)
+        while self.length < length:
+            n_end = min(rings_in_chunk(self.length, self.chunk), length)
+            d2, weights = ring_distances(self.length, n_end)
+            d2 *= self.a**2
+            for dz, etas in offsets.items():
+                r = np.sqrt(d2 + dz**2)
+                rinv = 1 / r
+                rinv3 = rinv**3
+                for eta in etas:
+                    if eta is None:
+                        pot = rinv
+                        frc = rinv3
+                    else:
+                        etar = eta * r
+                        e = erf(etar)
+                        pot = e * rinv
+                        frc = (e - 2 * SQRTPI_INV * etar * np.exp(-np.square(etar))) * rinv3
+                    self.potential[dz, eta] += np.dot(weights, pot)
+                    self.force[dz, eta] += np.dot(weights, frc)
+            self.length = n_end
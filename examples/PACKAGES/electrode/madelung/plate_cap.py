@@ -1,24 +1,22 @@
 #!/usr/bin/env python3
 
+import argparse
 import time
 
 import numpy as np
 from scipy.special import erf
 
+from image_sums import ImageSums
+
 SQRT2 = np.sqrt(2)
 SQRTPI_INV = 1 / np.sqrt(np.pi)
 COULOMB = 332.06371  #  Coulomb constant in Lammps 'real' units
 QE2F = 23.060549
 NKTV2P = 68568.415  # pressure in 'real' units
-LENGTH = 10000  # convergence parameter
 LZ = 20
-
-
-def lattice(length):
-    """indices combinations of images in one quadrant"""
-    x = np.arange(length)  # range(length)
-    y = np.arange(1, length)
-    return np.array(np.meshgrid(x, y)).T.reshape(-1, 2)
+TOLERANCE = 1e-5  # convergence parameter, max. relative change of results
+MIN_LENGTH = 64  # initial number of images in each direction
+MAX_LENGTH = 100000
 
 
 def a_element(r, eta):
@@ -49,41 +47,44 @@ def force_component(dx, d, qq, eta=None):
         return np.sum(dx / d * force_point(d, qq))
 
 
-time_start = time.perf_counter()
 a = 1  # nearest neighbor distance i.e. lattice constant / sqrt(2)
 x_elec = [-2, 2]
 x_elyt = [-1, 1]
 q_elyt = [0.5, -0.5]
 distance_plates = x_elec[1] - x_elec[0]  # distance between plates
 v = np.array([-0.5, 0.5]) * (QE2F / COULOMB)
+cases = [("", [2.0, 2.0]), ("_eta_mix", [0.5, 3.0])]
+
+
+def mixed_eta(eta_elec):
+    return np.prod(eta_elec) / np.sqrt(np.sum(np.square(eta_elec)))
+
+
+def image_terms(eta_elec):
+    """(out-of-plane distance, eta) of all image sums needed for one case"""
+    terms = [(0, eta / SQRT2) for eta in eta_elec]
+    terms.append((distance_plates, mixed_eta(eta_elec)))
+    for x, eta in zip(x_elec, eta_elec):
+        terms += [(abs(y - x), eta) for y in x_elyt]
+    terms += [(0, None), (abs(x_elyt[1] - x_elyt[0]), None)]
+    return terms
 
-# distances to images within electrode and to opposite electrode
-distances = a * np.linalg.norm(lattice(LENGTH), axis=1)
-opposite_distances = np.sqrt(np.square(distances) + distance_plates**2)
-image_distances = []
-for x in x_elec:
-    image_distances.append([])
-    for y in x_elyt:
-        image_distances[-1].append(np.sqrt(np.square(distances) + np.abs(y - x) ** 2))
-image_elyt_distances = [[None for _ in range(len(x_elyt))] for _ in range(len(x_elyt))]
-for i, (xi, qi) in enumerate(zip(x_elyt, q_elyt)):
-    for j, (xj, qj) in list(enumerate(zip(x_elyt, q_elyt)))[i + 1 :]:
-        image_elyt_distances[i][j] = np.sqrt(
-            np.square(distances) + np.abs(xj - xi) ** 2
-        )
 
-for name, eta_elec in [("", [2.0, 2.0]), ("_eta_mix", [0.5, 3.0])]:
-    # for name, eta_elec in [("", [2.0, 2.0])]:
-    eta_mix = np.prod(eta_elec) / np.sqrt(np.sum(np.square(eta_elec)))
+def plate_cap(sums, eta_elec):
+    """energy, charges, forces, and pressure with the images included in sums
+    image contributions are 4 times the quadrant sums"""
+    pot = sums.potential
+    frc = sums.force
+    eta_mix = mixed_eta(eta_elec)
     # self interaction and within original box
     A_11 = np.sqrt(2 / np.pi) * eta_elec[0]
     A_22 = np.sqrt(2 / np.pi) * eta_elec[1]
     A_12 = erf(eta_mix * distance_plates) / distance_plates
 
     # interaction with periodic images
-    A_11 += 4 * np.sum(a_element(distances, eta_elec[0] / SQRT2))
-    A_22 += 4 * np.sum(a_element(distances, eta_elec[1] / SQRT2))
-    A_12 += 4 * np.sum(a_element(opposite_distances, eta_mix))
+    A_11 += 4 * pot[0, eta_elec[0] / SQRT2]
+    A_22 += 4 * pot[0, eta_elec[1] / SQRT2]
+    A_12 += 4 * pot[distance_plates, eta_mix]
     A = np.array([[A_11, A_12], [A_12, A_22]])
     inv = np.linalg.inv(A)
     e = np.array([1, 1])
@@ -91,18 +92,18 @@ for name, eta_elec in [("", [2.0, 2.0]), ("_eta_mix", [0.5, 3.0])]:
 
     # electrode-electrolyte interaction
     b = []
-    for i, (x, eta) in enumerate(zip(x_elec, eta_elec)):
+    for x, eta in zip(x_elec, eta_elec):
         bi = 0
-        for j, (y, q) in enumerate(zip(x_elyt, q_elyt)):
+        for y, q in zip(x_elyt, q_elyt):
             bi += b_element(np.abs(y - x), q, eta)
-            bi += 4 * np.sum(b_element(image_distances[i][j], q, eta))
+            bi += 4 * q * pot[abs(y - x), eta]
         b.append(bi)
     b = np.array(b)
 
     # electrolyte-electrolyte energy
-    elyt_11 = 4 * np.sum(1 / distances)
+    elyt_11 = 4 * pot[0, None]
     distance_elyt = x_elyt[1] - x_elyt[0]
-    elyt_12 = 1 / distance_elyt + 4 * np.sum(1 / image_elyt_distances[0][1])
+    elyt_12 = 1 / distance_elyt + 4 * pot[distance_elyt, None]
     elyt = np.array([[elyt_11, elyt_12], [elyt_12, elyt_11]])
     energy_elyt = 0.5 * np.dot(q_elyt, np.dot(elyt, q_elyt))
 
@@ -116,7 +117,7 @@ for name, eta_elec in [("", [2.0, 2.0]), ("_eta_mix", [0.5, 3.0])]:
     # electrode-electrode
     dx = x_elec[1] - x_elec[0]
     fij_box = force_component(dx, np.abs(dx), q[0] * q[1], eta_mix)
-    fij_img = 4 * force_component(dx, opposite_distances, q[0] * q[1], eta_mix)
+    fij_img = 4 * dx * q[0] * q[1] * frc[abs(dx), eta_mix]
     f_elec[0] -= fij_box + fij_img
     f_elec[1] += fij_box + fij_img
     # electrode-electrolyte
@@ -124,7 +125,7 @@ for name, eta_elec in [("", [2.0, 2.0]), ("_eta_mix", [0.5, 3.0])]:
         for j, (xj, qj) in enumerate(zip(x_elyt, q_elyt)):
             dx = xj - xi
             fij_box = force_component(dx, np.abs(dx), qi * qj, etai)
-            fij_img = 4 * force_component(dx, image_distances[i][j], qi * qj, etai)
+            fij_img = 4 * dx * qi * qj * frc[abs(dx), etai]
             f_elec[i] -= fij_box + fij_img
             f_elyt[j] += fij_box + fij_img
     # electrolyte-electrolyte
@@ -132,7 +133,7 @@ for name, eta_elec in [("", [2.0, 2.0]), ("_eta_mix", [0.5, 3.0])]:
         for j, (xj, qj) in list(enumerate(zip(x_elyt, q_elyt)))[i + 1 :]:
             dx = xj - xi
             fij_box = force_component(dx, np.abs(dx), qi * qj)
-            fij_img = 4 * force_component(dx, image_elyt_distances[i][j], qi * qj)
+            fij_img = 4 * dx * qi * qj * frc[abs(dx), None]
             f_elyt[i] -= fij_img + fij_box
             f_elyt[j] += fij_img + fij_box
     # force units
@@ -146,7 +147,65 @@ for name, eta_elec in [("", [2.0, 2.0]), ("_eta_mix", [0.5, 3.0])]:
     for x, f in [(x_elec, f_elec), (x_elyt, f_elyt)]:
         virial += np.dot(x, f)
     pressure = NKTV2P * virial / volume
+    return energy, q, inv, b, f_elec, f_elyt, pressure
+
+
+def extrapolate(results, length, previous, previous_length):
+    """remove the leading 1/length truncation error from the results for two lengths"""
+    w = length / (length - previous_length)
+    return [
+        tuple(w * np.asarray(x) - (w - 1) * np.asarray(y) for x, y in zip(r, p))
+        for r, p in zip(results, previous)
+    ]
+
+
+def converged(results, previous, tol):
+    new = np.concatenate([np.ravel(x) for r in results for x in r])
+    old = np.concatenate([np.ravel(x) for r in previous for x in r])
+    return np.all(np.abs(new - old) <= tol * np.abs(new))
+
+
+parser = argparse.ArgumentParser(description="Reference values for the Madelung tests")
+parser.add_argument("--tol", type=float, default=TOLERANCE,
+                    help="max. relative change of results when doubling the images")
+parser.add_argument("--max-length", type=int, default=MAX_LENGTH,
+                    help="max. number of images in each direction")
+parser.add_argument("--no-extrapolate", action="store_true",
+                    help="write the plain sums with --max-length images")
+args = parser.parse_args()
+# without a tolerance the sums are not extrapolated, as in the original script
+extrapolation = args.tol > 0 and not args.no_extrapolate
+
+time_start = time.perf_counter()
 
+# all image sums for both cases are accumulated in a single pass and the
+# number of images is doubled.  the results converge with 1/length, which is
+# removed by extrapolation from the last two lengths.  this is repeated until
+# none of the extrapolated results changes by more than tol.  without
+# extrapolation the images are added up to max_length and the plain sums are
+# written.  extrapolated results are labelled with length = inf
+sums = ImageSums([term for _, eta_elec in cases for term in image_terms(eta_elec)], a)
+length = min(MIN_LENGTH, args.max_length)
+previous = extrapolated = None
+while True:
+    sums.extend(length)
+    results = [plate_cap(sums, eta_elec) for _, eta_elec in cases]
+    if extrapolation and previous:
+        last = extrapolated
+        extrapolated = extrapolate(results, length, previous, previous_length)
+        if last and converged(extrapolated, last, args.tol):
+            break
+    if length >= args.max_length:
+        if extrapolation:
+            print(f"WARNING: results not converged with {length} images")
+        break
+    previous, previous_length = results, length
+    length = min(2 * length, args.max_length)
+if extrapolated is None:
+    extrapolation = False
+
+for (name, eta_elec), result in zip(cases, extrapolated if extrapolation else results):
+    energy, q, inv, b, f_elec, f_elyt, pressure = result
     with open(f"plate_cap{name}.csv", "w") as f:
         f.write(
             "length, energy / kcal/mol, q1 / e, q2 / e, inv11 / A, inv12 / A"
@@ -156,7 +215,7 @@ for name, eta_elec in [("", [2.0, 2.0]), ("_eta_mix", [0.5, 3.0])]:
         f.write(
             ", ".join(
                 [
-                    str(LENGTH),
+                    "inf" if extrapolation else str(length),
                     f"{energy:.8f}",
                     f"{q[0]:.10f}",
                     f"{q[1]:.10f}",
@@ -223,6 +223,14 @@ python3 sequence_driver.py -plugin lammps -mdi "-role DRIVER -name sequence -met
 
 mpirun -np 3 python3 sequence_driver.py -plugin lammps -mdi "-role DRIVER -name sequence -method LINK -plugin_path ${BINPATH}" -plugin_args "-log log.sequence.engine.plugin.3 -in in.sequence".python
 
+# ---
+
+# Throughput benchmark with TCP: 1 proc each
+
+python3 benchmark_driver.py -mdi "-role DRIVER -name bench -method TCP -port 8021" &
+
+${LAMMPS} -mdi "-role ENGINE -name LMP -method TCP -port 8021 -hostname localhost" -log none -in in.sequence.python
+
 # -------------------------------------------------
 # -------------------------------------------------
 
@@ -28,8 +28,8 @@
 
 import sys
 import mdi
-import numpy as np
 from mpi4py import MPI
+from mdi_driver_tools import DriverBuffers
 
 # error message
 
@@ -49,61 +49,43 @@ def perform_aimd(world,mm_comm,qm_comm):
   natoms = mdi.MDI_Recv(1,mdi.MDI_INT,mm_comm)
   natoms = world.bcast(natoms,root=0)
 
-  # allocate arrays for coordinates and forces
+  # allocate buffers for coordinates and forces
+  # they are reused for every timestep
 
-  coords = np.zeros(3*natoms,dtype=np.float64)
-  forces = np.zeros(3*natoms,dtype=np.float64)
+  buffers = DriverBuffers(world,natoms)
+
+  # get coords from MM engine, send them to QM engine,
+  # get QM potential energy and forces, send forces to MM engine
+
+  def qm_forces():
+    buffers.recv_vector("<COORDS",buffers.coords,mm_comm)
+    buffers.send_vector(">COORDS",buffers.coords,qm_comm)
+    qm_pe = buffers.recv_double("<PE",qm_comm)
+    buffers.recv_vector("<FORCES",buffers.forces,qm_comm)
+    buffers.send_vector(">FORCES",buffers.forces,mm_comm)
+    return qm_pe
 
   # MM engine initializes a new MD simulation
-  
+
   mdi.MDI_Send_command("@INIT_MD",mm_comm)
-  
+
   # -----------------
   # compute initial forces for Verlet timestepping
   #   and initial energy for output on step 0
   # -----------------
-  
-  # MM engine proceeds to @FORCES node in setup()
-  
-  mdi.MDI_Send_command("@FORCES",mm_comm)
 
-  # get coords from MM engine
-    
-  mdi.MDI_Send_command("<COORDS",mm_comm)
-  mdi.MDI_Recv(3*natoms,mdi.MDI_DOUBLE,mm_comm,buf=coords)
-  world.Bcast(coords,root=0)
-
-  # send coords to QM engine
-  
-  mdi.MDI_Send_command(">COORDS",qm_comm)
-  mdi.MDI_Send(coords,3*natoms,mdi.MDI_DOUBLE,qm_comm)
-
-  # get QM potential energy
-    
-  mdi.MDI_Send_command("<PE",qm_comm)
-  qm_pe = mdi.MDI_Recv(1,mdi.MDI_DOUBLE,qm_comm)
-  qm_pe = world.bcast(qm_pe,root=0)
-  
-  # get forces from QM engine
-    
-  mdi.MDI_Send_command("<FORCES",qm_comm)
-  mdi.MDI_Recv(3*natoms,mdi.MDI_DOUBLE,qm_comm,buf=forces)
-  world.Bcast(forces,root=0)
+  # MM engine proceeds to @FORCES node in setup()
 
-  # send forces to MM engine
-  
-  mdi.MDI_Send_command(">FORCES",mm_comm)
-  mdi.MDI_Send(forces,3*natoms,mdi.MDI_DOUBLE,mm_comm)
+  mdi.MDI_Send_command("@FORCES",mm_comm)
+  qm_pe = qm_forces()
 
   # get MM kinetic energy
-  
-  mdi.MDI_Send_command("<KE",mm_comm)
-  mm_ke = mdi.MDI_Recv(1,mdi.MDI_DOUBLE,mm_comm)
-  mm_ke = world.bcast(mm_ke,root=0)
+
+  mm_ke = buffers.recv_double("<KE",mm_comm)
 
   # output by driver
   # normalize energies by atom count
-    
+
   if me == 0:
     print("Step %d: MM energy %g, QM energy %g, Total energy %g" % \
           (0,mm_ke/natoms,qm_pe/natoms,(mm_ke+qm_pe)/natoms))
@@ -115,51 +97,22 @@ def perform_aimd(world,mm_comm,qm_comm):
   for istep in range(nsteps):
 
     # MM engine proceeds to @FORCES node
-    
-    mdi.MDI_Send_command("@FORCES",mm_comm)
-
-    # get coords from MM engine
-    
-    mdi.MDI_Send_command("<COORDS",mm_comm)
-    mdi.MDI_Recv(3*natoms,mdi.MDI_DOUBLE,mm_comm,buf=coords)
-    world.Bcast(coords,root=0)
-
-    # send coords to QM engine
-    
-    mdi.MDI_Send_command(">COORDS",qm_comm)
-    mdi.MDI_Send(coords,3*natoms,mdi.MDI_DOUBLE,qm_comm)
-
-    # get QM potential energy
-    
-    mdi.MDI_Send_command("<PE",qm_comm)
-    qm_pe = mdi.MDI_Recv(1,mdi.MDI_DOUBLE,qm_comm)
-    qm_pe = world.bcast(qm_pe,root=0)
 
-    # get forces from QM engine
-    
-    mdi.MDI_Send_command("<FORCES",qm_comm)
-    mdi.MDI_Recv(3*natoms,mdi.MDI_DOUBLE,qm_comm,buf=forces)
-    world.Bcast(forces,root=0)
-
-    # send forces to MM engine
-    
-    mdi.MDI_Send_command(">FORCES",mm_comm)
-    mdi.MDI_Send(forces,3*natoms,mdi.MDI_DOUBLE,mm_comm)
+    mdi.MDI_Send_command("@FORCES",mm_comm)
+    qm_pe = qm_forces()
 
     # MM engine proceeds to @ENDSTEP node
     # so that KE will be for fully updated velocity
-    
+
     mdi.MDI_Send_command("@ENDSTEP",mm_comm)
 
     # get MM kinetic energy
-    
-    mdi.MDI_Send_command("<KE",mm_comm)
-    mm_ke = mdi.MDI_Recv(1,mdi.MDI_DOUBLE,mm_comm)
-    mm_ke = world.bcast(mm_ke,root=0)
+
+    mm_ke = buffers.recv_double("<KE",mm_comm)
 
     # output by driver
     # normalize energies by atom count
-    
+
     if me == 0:
       print("Step %d: MM energy %g, QM energy %g, Total energy %g" % \
             (istep+1,mm_ke/natoms,qm_pe/natoms,(mm_ke+qm_pe)/natoms))
@@ -0,0 +1,197 @@
+# MDI driver to measure the throughput of a sequence of independent
+# calculations in calculations per second, using LAMMPS (or a QM code
+# with MDI support) as an MDI engine, either standalone or as a plugin
+
+# Syntax: python3 benchmark_driver.py switch arg switch arg ...
+#   possible switches:
+#   -mdi "-role DRIVER ..."
+#     required switch
+#     example for stand-alone mode:
+#       -mdi "-role DRIVER -name bench -method TCP -port 8021"
+#     example for plugin mode:
+#       -mdi "-role DRIVER -name bench -method LINK
+#             -plugin_path /home/sjplimp/lammps/src/"
+#   -plugin name
+#     name of plugin library, only when using plugin mode
+#   -plugin_args arglist
+#     args to add when launching plugin library, only when using plugin mode
+#     enclose arglist in quotes if multiple words
+#   -n 1000
+#     number of calculations to perform, default = 1000
+#   -mode eval/run/min
+#     style of calculations: single snapshot evals, dynamics, minimization
+#     default = eval
+#   -size Nx Ny Nz
+#     cubic lattice, default = 4 4 4
+#   -nsteps 10
+#     number of timesteps in dynamics runs, default = 10
+#   -tol 0.001
+#     tolerance for minimizations, default = 0.001
+#   -seed 12345
+#     random number seed > 0, default = 12345
+
+# the engine can use the same input script as the sequence driver:
+#   lmp_mpi -mdi "-role ENGINE -name LMP -method TCP -port 8021
+#                 -hostname localhost" -log none -in in.sequence.python
+
+import sys
+import mdi
+import numpy as np
+from mpi4py import MPI
+from mdi_driver_tools import DriverBuffers,lattice
+
+# error message
+
+def error(txt=None):
+  if txt: raise Exception(txt)
+  raise Exception("Syntax: python3 benchmark_driver.py switch arg switch arg ...")
+
+# perform the calculations and report timings
+# for standalone mode, this is called by main program below
+# for plugin mode, this is a callback function invoked by MDI
+
+def perform_tasks(world,mdicomm,dummy):
+
+  me = world.Get_rank()
+
+  natoms = nx * ny * nz
+  buffers = DriverBuffers(world,natoms)
+  rng = np.random.default_rng(seed)
+
+  # random density and perturbation of a lattice, small random velocities
+  # accumulate time spent in the driver for setting up the systems
+
+  tsetup = [0.0]
+
+  def setup(buffers,icalc):
+    tstart = MPI.Wtime()
+    sigma = pow(1.0/(0.75 + 0.1*(rng.random()-0.5)),1.0/3.0)
+    buffers.set_cell(nx*sigma,ny*sigma,nz*sigma)
+    lattice(nx,ny,nz,sigma,out=buffers.coords)
+    rng.random(out=buffers.work)
+    buffers.work -= 0.5
+    buffers.work *= 0.2
+    buffers.coords += buffers.work
+    rng.random(out=buffers.vels)
+    buffers.vels -= 0.5
+    tsetup[0] += MPI.Wtime() - tstart
+
+  # the first calculation includes the engine's setup and is not timed
+
+  for icalc,pe in buffers.batch(mdicomm,setup,1,mode,nsteps,tol): pass
+  tsetup[0] = 0.0
+
+  world.Barrier()
+  tstart = MPI.Wtime()
+  for icalc,pe in buffers.batch(mdicomm,setup,ncalc,mode,nsteps,tol): pass
+  world.Barrier()
+  elapsed = MPI.Wtime() - tstart
+
+  if me == 0:
+    print("Performed %d %s calculations with %d atoms in %g seconds" % \
+          (ncalc,mode,natoms,elapsed))
+    print("Throughput: %g calculations/second" % (ncalc/elapsed))
+    print("Driver setup time: %g seconds (%.1f%%)" % \
+          (tsetup[0],100.0*tsetup[0]/elapsed))
+    print("Final eng %7.5g" % (pe/natoms))
+
+  # send EXIT command to engine
+  # in plugin mode, removes the plugin library
+
+  mdi.MDI_Send_command("EXIT",mdicomm)
+
+  # return needed for plugin mode
+
+  return 0
+
+# ------------------------
+# main program
+# ------------------------
+
+args = sys.argv[1:]
+narg = len(args)
+
+# defaults for command-line args
+
+mdiarg = ""
+plugin = ""
+plugin_args = ""
+
+ncalc = 1000
+mode = "eval"
+nx = ny = nz = 4
+nsteps = 10
+tol = 0.001
+seed = 12345
+
+# parse command-line args
+
+iarg = 0
+while iarg < narg:
+  if args[iarg] == "-mdi":
+    if iarg+2 > narg: error()
+    mdiarg = args[iarg+1]
+    iarg += 2
+  elif args[iarg] == "-plugin":
+    if iarg+2 > narg: error()
+    plugin = args[iarg+1]
+    iarg += 2
+  elif args[iarg] == "-plugin_args":
+    if iarg+2 > narg: error()
+    plugin_args = args[iarg+1]
+    iarg += 2
+  elif args[iarg] == "-n":
+    if iarg+2 > narg: error()
+    ncalc = int(args[iarg+1])
+    if ncalc <= 0: error()
+    iarg += 2
+  elif args[iarg] == "-mode":
+    if iarg+2 > narg: error()
+    mode = args[iarg+1]
+    if mode != "eval" and mode != "run" and mode != "min": error()
+    iarg += 2
+  elif args[iarg] == "-size":
+    if iarg+4 > narg: error()
+    nx = int(args[iarg+1])
+    ny = int(args[iarg+2])
+    nz = int(args[iarg+3])
+    if nx <= 0 or ny <= 0 or nz <= 0: error()
+    iarg += 4
+  elif args[iarg] == "-nsteps":
+    if iarg+2 > narg: error()
+    nsteps = int(args[iarg+1])
+    if nsteps < 0: error()
+    iarg += 2
+  elif args[iarg] == "-tol":
+    if iarg+2 > narg: error()
+    tol = float(args[iarg+1])
+    if tol < 0.0: error()
+    iarg += 2
+  elif args[iarg] == "-seed":
+    if iarg+2 > narg: error()
+    seed = int(args[iarg+1])
+    if seed <= 0: error()
+    iarg += 2
+  else: error()
+
+if not mdiarg: error()
+
+mdi.MDI_Init(mdiarg)
+
+# LAMMPS engine is a stand-alone code
+# world = MPI communicator for just this driver
+# invoke perform_tasks() directly
+
+if not plugin:
+  world = mdi.MDI_MPI_get_world_comm()
+  mdicomm = mdi.MDI_Accept_Communicator()
+  perform_tasks(world,mdicomm,None)
+
+# LAMMPS engine is a plugin library
+# launch plugin
+# MDI will call back to perform_tasks()
+
+if plugin:
+  world = MPI.COMM_WORLD
+  plugin_args += " -mdi \"-role ENGINE -name LMP -method LINK\""
+  mdi.MDI_Launch_plugin(plugin,plugin_args,world,perform_tasks,None)
@@ -0,0 +1,151 @@
+# Helper functions and classes for Python MDI drivers
+
+# all per-atom and global data exchanged with an MDI engine is kept in
+#   contiguous NumPy buffers that are allocated once per session
+# MDI_Send() and MDI_Recv(...,buf=) read from and write into these
+#   buffers directly, and MPI broadcasts among the driver procs use
+#   the buffer versions (Bcast) instead of pickling Python objects
+# thus no new arrays are created per calculation or per timestep
+
+import mdi
+import numpy as np
+
+# ------------------------
+# create atoms on a perfect simple cubic lattice
+# coords = flat vector of 3*nx*ny*nz values, x varies fastest
+# if out is given, the coords are stored in it
+# ------------------------
+
+def lattice(nx,ny,nz,sigma,out=None):
+  if out is None: out = np.empty(3*nx*ny*nz,dtype=np.float64)
+  xyz = out.reshape(nz,ny,nx,3)
+  xyz[...,0] = sigma*np.arange(nx)
+  xyz[...,1] = sigma*np.arange(ny)[:,None]
+  xyz[...,2] = sigma*np.arange(nz)[:,None,None]
+  return out
+
+# ------------------------
+# buffers for exchanging a system of natoms with an MDI engine
+# world = MPI communicator of the driver
+# ------------------------
+
+class DriverBuffers:
+
+  def __init__(self,world,natoms):
+    self.world = world
+    self.natoms = natoms
+
+    # per-atom types, coords, vels, forces
+
+    self.atypes = np.ones(natoms,dtype=np.int32)
+    self.coords = np.zeros(3*natoms,dtype=np.float64)
+    self.vels = np.zeros(3*natoms,dtype=np.float64)
+    self.forces = np.zeros(3*natoms,dtype=np.float64)
+
+    # scratch vector for random numbers etc
+
+    self.work = np.zeros(3*natoms,dtype=np.float64)
+
+    # global data: cell vectors, virial tensor, minimizer parameters,
+    #   single int and double values
+
+    self.cell = np.zeros(9,dtype=np.float64)
+    self.params = np.zeros(4,dtype=np.float64)
+    self.virial = np.zeros(9,dtype=np.float64)
+    self.ivalue = np.zeros(1,dtype=np.int32)
+    self.dvalue = np.zeros(1,dtype=np.float64)
+
+  # orthogonal box with edge lengths xprd,yprd,zprd
+
+  def set_cell(self,xprd,yprd,zprd):
+    self.cell[:] = 0.0
+    self.cell[0] = xprd
+    self.cell[4] = yprd
+    self.cell[8] = zprd
+
+  # per-atom forces as (natoms,3) view
+
+  def forces3(self):
+    return self.forces.reshape(self.natoms,3)
+
+  # send a single int or double value with the preceding command
+
+  def send_int(self,command,value,mdicomm):
+    self.ivalue[0] = value
+    mdi.MDI_Send_command(command,mdicomm)
+    mdi.MDI_Send(self.ivalue,1,mdi.MDI_INT,mdicomm)
+
+  def send_double(self,command,value,mdicomm):
+    self.dvalue[0] = value
+    mdi.MDI_Send_command(command,mdicomm)
+    mdi.MDI_Send(self.dvalue,1,mdi.MDI_DOUBLE,mdicomm)
+
+  # request a single int or double value and broadcast it to all driver procs
+
+  def recv_int(self,command,mdicomm):
+    mdi.MDI_Send_command(command,mdicomm)
+    mdi.MDI_Recv(1,mdi.MDI_INT,mdicomm,buf=self.ivalue)
+    self.world.Bcast(self.ivalue,root=0)
+    return int(self.ivalue[0])
+
+  def recv_double(self,command,mdicomm):
+    mdi.MDI_Send_command(command,mdicomm)
+    mdi.MDI_Recv(1,mdi.MDI_DOUBLE,mdicomm,buf=self.dvalue)
+    self.world.Bcast(self.dvalue,root=0)
+    return float(self.dvalue[0])
+
+  # send or receive one of the vector buffers
+
+  def send_vector(self,command,buf,mdicomm):
+    mdi.MDI_Send_command(command,mdicomm)
+    mdi.MDI_Send(buf,buf.size,mdi.MDI_DOUBLE,mdicomm)
+
+  def recv_vector(self,command,buf,mdicomm):
+    mdi.MDI_Send_command(command,mdicomm)
+    mdi.MDI_Recv(buf.size,mdi.MDI_DOUBLE,mdicomm,buf=buf)
+    self.world.Bcast(buf,root=0)
+    return buf
+
+  # send the complete system, so that the engine creates it from scratch
+
+  def send_system(self,mdicomm,vels=True):
+    self.send_vector(">CELL",self.cell,mdicomm)
+    self.send_int(">NATOMS",self.natoms,mdicomm)
+    mdi.MDI_Send_command(">TYPES",mdicomm)
+    mdi.MDI_Send(self.atypes,self.natoms,mdi.MDI_INT,mdicomm)
+    self.send_vector(">COORDS",self.coords,mdicomm)
+    if vels: self.send_vector(">VELOCITIES",self.vels,mdicomm)
+
+  # send the current system, eval or run or minimize it,
+  # receive potential energy, virial tensor, and forces
+  # returns potential energy, virial and forces are in the buffers
+
+  def calculate(self,mdicomm,mode="eval",nsteps=0,tol=0.0):
+    self.send_system(mdicomm)
+
+    if mode == "eval":
+      pass
+    elif mode == "run":
+      self.send_int(">NSTEPS",nsteps,mdicomm)
+      mdi.MDI_Send_command("MD",mdicomm)
+    elif mode == "min":
+      self.params[:] = [tol,tol,1000.0,1000.0]
+      self.send_vector(">TOLERANCE",self.params,mdicomm)
+      mdi.MDI_Send_command("OPTG",mdicomm)
+    else: raise Exception("Invalid calculation mode %s" % mode)
+
+    pe = self.recv_double("<PE",mdicomm)
+    self.recv_vector("<STRESS",self.virial,mdicomm)
+    self.recv_vector("<FORCES",self.forces,mdicomm)
+    return pe
+
+  # batch of independent calculations within one MDI session
+  # setup(buffers,icalc) defines the system of each calculation in place,
+  #   i.e. it sets cell, coords, and vels in the buffers
+  # yields calculation index and potential energy after each calculation
+
+  def batch(self,mdicomm,setup,ncalc,mode="eval",nsteps=0,tol=0.0):
+    for icalc in range(ncalc):
+      setup(self,icalc)
+      pe = self.calculate(mdicomm,mode,nsteps,tol)
+      yield icalc,pe
@@ -38,8 +38,8 @@
 
 import sys,math,random
 import mdi
-import numpy as np
 from mpi4py import MPI
+from mdi_driver_tools import DriverBuffers,lattice
 
 # error message
 
@@ -56,143 +56,73 @@ def perform_tasks(world,mdicomm,dummy):
   me = world.Get_rank()
   nprocs = world.Get_size()
 
-  # allocate vectors for per-atom types, coords, vels, forces
+  # allocate buffers for per-atom types, coords, vels, forces
+  # all atoms have type 1
 
   natoms = nx * ny * nz
-  atypes = np.zeros(natoms,dtype=np.int)
-  coords = np.zeros(3*natoms,dtype=np.float64)
-  vels = np.zeros(3*natoms,dtype=np.float64)
-  forces = np.zeros(3*natoms,dtype=np.float64)
-
-  atypes[:] = 1
+  buffers = DriverBuffers(world,natoms)
 
   # initialize RN generator
+  # random numbers are drawn in the same order as in earlier versions of
+  #   this driver, so the systems match the log.sequence.engine.* files
 
   random.seed(seed)
 
-  # loop over sequence of calculations
+  # define the system of one calculation in place in the buffers
 
-  for icalc in range(ncalc):
+  def setup(buffers,icalc):
 
     # define simulation box
 
-    onerho = rho + (random.random()-0.5)*rhodelta;
+    onerho = rho + (random.random()-0.5)*rhodelta
     sigma = pow(1.0/onerho,1.0/3.0)
-  
-    xlo = ylo = zlo = 0.0
-    xhi = nx * sigma
-    yhi = ny * sigma
-    zhi = nz * sigma
-  
-    # send simulation box to engine
-
-    vec = [xhi-xlo,0.0,0.0] + [0.0,yhi-ylo,0.0] + [0.0,0.0,zhi-zlo]
-    mdi.MDI_Send_command(">CELL",mdicomm)
-    mdi.MDI_Send(vec,9,mdi.MDI_DOUBLE,mdicomm)
-  
-    # create atoms on perfect lattice
-
-    m = 0
-    for k in range(nz):
-      for j in range(ny):
-        for i in range(nx):
-          coords[m] = i * sigma
-          coords[m+1] = j * sigma
-          coords[m+2] = k * sigma
-          m += 3
-        
-    # perturb lattice
-
-    for m in range(3*natoms):
-      coords[m] += 2.0*random.random()*delta - delta
+    buffers.set_cell(nx*sigma,ny*sigma,nz*sigma)
+
+    # create atoms on perfect lattice and perturb it
+
+    coords = buffers.coords
+    work = buffers.work
+    lattice(nx,ny,nz,sigma,out=coords)
+    work[:] = [random.random() for m in range(3*natoms)]
+    work *= 2.0
+    work *= delta
+    work -= delta
+    coords += work
 
     # define initial velocities
 
-    for m in range(3*natoms):
-      vels[m] = random.random() - 0.5
-
-    tcurrent = 0.0
-    for m in range(3*natoms):
-      tcurrent += vels[m]*vels[m]
-    tcurrent /= 3*(natoms-1)
-    
-    factor = math.sqrt(tinitial/tcurrent)
-
-    for m in range(3*natoms):
-      vels[m] *= factor
-
-    # send atoms and their properties to engine
-  
-    mdi.MDI_Send_command(">NATOMS",mdicomm)
-    mdi.MDI_Send(natoms,1,mdi.MDI_INT,mdicomm)
-    mdi.MDI_Send_command(">TYPES",mdicomm)
-    mdi.MDI_Send(atypes,natoms,mdi.MDI_INT,mdicomm)
-    mdi.MDI_Send_command(">COORDS",mdicomm)
-    mdi.MDI_Send(coords,3*natoms,mdi.MDI_DOUBLE,mdicomm)
-    mdi.MDI_Send_command(">VELOCITIES",mdicomm)
-    mdi.MDI_Send(vels,3*natoms,mdi.MDI_DOUBLE,mdicomm)
-
-    # eval or run or minimize
-
-    if mode == "eval":
-      pass
-    elif mode == "run":
-      mdi.MDI_Send_command(">NSTEPS",mdicomm)
-      mdi.MDI_Send(nsteps,1,mdi.MDI_INT,mdicomm)
-      mdi.MDI_Send_command("MD",mdicomm)
-    elif mode == "min":
-      mdi.MDI_Send_command(">TOLERANCE",mdicomm)
-      params = [tol,tol,1000.0,1000.0]
-      mdi.MDI_Send(params,4,mdi.MDI_DOUBLE,mdicomm)
-      mdi.MDI_Send_command("OPTG",mdicomm)
-
-    # request potential energy
-
-    mdi.MDI_Send_command("<PE",mdicomm)
-    pe = mdi.MDI_Recv(1,mdi.MDI_DOUBLE,mdicomm)
-    pe = world.bcast(pe,root=0)
-
-    # request virial tensor
-
-    mdi.MDI_Send_command("<STRESS",mdicomm)
-    virial = mdi.MDI_Recv(9,mdi.MDI_DOUBLE,mdicomm)
-    virial = world.bcast(virial,root=0)
-
-    # request forces
-  
-    mdi.MDI_Send_command("<FORCES",mdicomm)
-    mdi.MDI_Recv(3*natoms,mdi.MDI_DOUBLE,mdicomm,buf=forces)
-    world.Bcast(forces,root=0)
+    vels = buffers.vels
+    vels[:] = [random.random() for m in range(3*natoms)]
+    vels -= 0.5
+    tcurrent = sum((vels*vels).tolist()) / (3*(natoms-1))
+    vels *= math.sqrt(tinitial/tcurrent)
+
+  # loop over sequence of calculations within one MDI session
+  # each one sends the atoms and their properties to the engine,
+  #   performs eval or run or minimize,
+  #   and receives potential energy, virial tensor, and forces
+
+  for icalc,pe in buffers.batch(mdicomm,setup,ncalc,mode,nsteps,tol):
 
     # final output from each calculation
     # pressure = trace of virial tensor, no kinetic component
-  
+
+    virial = buffers.virial
     aveeng = pe/natoms
     pressure = (virial[0] + virial[4] + virial[8]) / 3.0
-
-    m = 0
-    fx = fy = fz = 0.0
-    for i in range(natoms):
-      fx += forces[m]
-      fy += forces[m+1]
-      fz += forces[m+2]
-      m += 3
-
-    fx /= natoms
-    fy /= natoms
-    fz /= natoms
+    fx,fy,fz = buffers.forces3().sum(axis=0) / natoms
 
     line = "Calc %d: eng %7.5g pressure %7.5g aveForce %7.5g %7.5g %7.5g" % \
            (icalc+1,aveeng,pressure,fx,fy,fz)
     if me == 0: print(line)
-  
+
   # send EXIT command to engine
   # in plugin mode, removes the plugin library
-    
+
   mdi.MDI_Send_command("EXIT",mdicomm)
-  
+
   # return needed for plugin mode
-    
+
   return 0
 
 # ------------------------
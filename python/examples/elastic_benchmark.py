@@ -0,0 +1,123 @@
+#!/usr/bin/env python
+# preceding line should have path for Python on your machine
+
+# elastic_benchmark.py
+# Purpose: compute the elastic constant tensor of an fcc Lennard-Jones
+#          crystal from 12 strained and relaxed configurations, once by
+#          re-reading a restart file for each strain and once by restoring
+#          an in-memory snapshot, and compare timings and results
+# Syntax:  elastic_benchmark.py Ncell
+#          Ncell = number of unit cells in each direction
+
+from __future__ import print_function
+import sys,time
+
+from lammps import lammps
+
+# zero-pressure fcc Lennard-Jones crystal
+
+def setup(lmp, ncell):
+  lmp.commands_string("""
+units lj
+atom_modify map array
+lattice fcc 1.1
+region box prism 0 {0} 0 {0} 0 {0} 0 0 0
+create_box 1 box
+create_atoms 1 box
+mass 1 1.0
+displace_atoms all random 1.0e-5 1.0e-5 1.0e-5 87287 units box
+""".format(ncell))
+  potential(lmp)
+  lmp.command("fix 3 all box/relax aniso 0.0")
+  lmp.command("minimize 1.0e-12 1.0e-12 1000 10000")
+  lmp.command("unfix 3")
+
+def potential(lmp):
+  lmp.commands_string("""
+pair_style lj/cut 2.5
+pair_coeff 1 1 1.0 1.0 2.5
+pair_modify shift yes
+neighbor 0.3 bin
+neigh_modify once no every 1 delay 0 check yes
+min_style cg
+thermo_style custom step pe pxx pyy pzz pyz pxz pxy
+""")
+
+# apply strain in Voigt direction idir and return the relaxed pressure tensor
+
+strain = ["x delta 0 {d}", "y delta 0 {d}", "z delta 0 {d}",
+          "yz delta {d}", "xz delta {d}", "xy delta {d}"]
+length = ["lx", "ly", "lz", "lz", "lz", "ly"]
+
+def deform(lmp, idir, up):
+  delta = up*lmp.get_thermo(length[idir])
+  lmp.command("change_box all " + strain[idir].format(d=delta) + " remap units box")
+  lmp.command("minimize 1.0e-12 1.0e-12 1000 10000")
+  return [lmp.get_thermo(p) for p in ("pxx", "pyy", "pzz", "pyz", "pxz", "pxy")]
+
+# compute elastic constants, returns Cij and time spent resetting the system
+
+def cij_restart(lmp, up):
+  lmp.command("write_restart restart.equil")
+  cij = []
+  treset = 0.0
+  for idir in range(6):
+    p = []
+    for sign in (-1.0, 1.0):
+      start = time.perf_counter()
+      lmp.command("clear")
+      lmp.command("read_restart restart.equil")
+      potential(lmp)
+      treset += time.perf_counter() - start
+      p.append(deform(lmp, idir, sign*up))
+    cij.append([-(p[1][j] - p[0][j])/(2.0*up) for j in range(6)])
+  return cij, treset
+
+def cij_snapshot(lmp, up):
+  snap = lmp.snapshot()
+  cij = []
+  treset = 0.0
+  for idir in range(6):
+    p = []
+    for sign in (-1.0, 1.0):
+      start = time.perf_counter()
+      lmp.restore(snap)
+      treset += time.perf_counter() - start
+      p.append(deform(lmp, idir, sign*up))
+    cij.append([-(p[1][j] - p[0][j])/(2.0*up) for j in range(6)])
+  return cij, treset
+
+# parse command line
+
+argv = sys.argv
+if len(argv) != 2:
+  print("Syntax: elastic_benchmark.py Ncell")
+  sys.exit()
+
+ncell = int(argv[1])
+up = 1.0e-6
+
+lmp = lammps(cmdargs=["-nocite", "-screen", "none", "-log", "none"])
+setup(lmp, ncell)
+natoms = lmp.get_natoms()
+
+start = time.perf_counter()
+ref, rrestart = cij_restart(lmp, up)
+trestart = time.perf_counter() - start
+
+lmp.command("clear")
+lmp.command("read_restart restart.equil")
+potential(lmp)
+
+start = time.perf_counter()
+cij, rsnapshot = cij_snapshot(lmp, up)
+tsnapshot = time.perf_counter() - start
+lmp.close()
+
+print("elastic constants of %d atom LJ crystal:" % natoms)
+for row in cij:
+  print(" ".join("%10.4f" % c for c in row))
+print("                         total     reset")
+print("clear + read_restart:  %8.3f s %8.4f s" % (trestart, rrestart))
+print("snapshot + restore:    %8.3f s %8.4f s" % (tsnapshot, rsnapshot))
+print("max. difference:       %8.2g" % max(abs(cij[i][j] - ref[i][j]) for i in range(6) for j in range(6)))
@@ -0,0 +1,99 @@
+#!/usr/bin/env python
+# preceding line should have path for Python on your machine
+
+# fix_external_benchmark.py
+# Purpose: compare the overhead of a Python callback for fix external
+#          that creates new NumPy arrays and copies the per-atom energy
+#          and virial on every step to a callback with cached arrays
+#          that writes them directly into the storage of the fix
+# Syntax:  fix_external_benchmark.py Nsteps Nrep
+#          Nsteps = number of MD steps per run
+#          Nrep = lattice replication factor, the system has 4*Nrep^3 atoms
+
+from __future__ import print_function
+import sys,time
+import numpy as np
+
+from lammps import lammps
+
+# Lennard-Jones liquid with an additional harmonic potential from Python
+# per-atom energy and virial are tallied on every step by fix ave/atom
+
+setup = """
+units lj
+atom_style atomic
+lattice fcc 0.8442
+region box block 0 {nrep} 0 {nrep} 0 {nrep}
+create_box 1 box
+create_atoms 1 box
+mass 1 1.0
+velocity all create 1.0 87287 loop geom
+pair_style lj/cut 2.5
+pair_coeff 1 1 1.0 1.0 2.5
+neighbor 0.3 bin
+fix 1 all nve
+fix ext all external pf/callback 1 1
+fix_modify ext energy yes virial yes
+compute eatm all pe/atom fix
+compute vatm all stress/atom NULL fix
+fix 2 all ave/atom 1 1 1 c_eatm c_vatm[*]
+thermo 0
+"""
+
+kspring = 0.01
+
+def harmonic(x, f, eatom, vatom):
+  f[:] = -kspring*x
+  np.sum(x*x, axis=1, out=eatom)
+  eatom *= 0.5*kspring
+  np.multiply(x, f, out=vatom[:,0:3])
+  np.multiply(x[:,0], f[:,1], out=vatom[:,3])
+  np.multiply(x[:,0], f[:,2], out=vatom[:,4])
+  np.multiply(x[:,1], f[:,2], out=vatom[:,5])
+
+# per-atom energy and virial are computed into Python owned arrays and copied
+
+def callback_copy(lmp, ntimestep, nlocal, tag, x, f):
+  eatom = np.empty(nlocal)
+  vatom = np.empty((nlocal,6))
+  harmonic(x, f, eatom, vatom)
+  lmp.numpy.fix_external_set_energy_peratom("ext", eatom)
+  lmp.numpy.fix_external_set_virial_peratom("ext", vatom)
+
+# per-atom energy and virial are computed directly in the storage of the fix
+
+def callback_direct(lmp, ntimestep, nlocal, tag, x, f):
+  eatom = lmp.numpy.fix_external_get_energy_peratom("ext")
+  vatom = lmp.numpy.fix_external_get_virial_peratom("ext")
+  harmonic(x, f, eatom, vatom)
+
+def benchmark(nsteps, nrep, callback, cached):
+  lmp = lammps(cmdargs=["-nocite","-log","none","-screen","none"])
+  lmp.commands_string(setup.format(nrep=nrep))
+  lmp.set_fix_external_callback("ext", callback, lmp, cached=cached)
+  lmp.command("run 0")
+  start = time.perf_counter()
+  lmp.command("run %d" % nsteps)
+  elapsed = time.perf_counter() - start
+  pe = lmp.get_thermo("pe")
+  natoms = lmp.get_natoms()
+  lmp.close()
+  return elapsed, natoms, pe
+
+# parse command line
+
+argv = sys.argv
+if len(argv) != 3:
+  print("Syntax: fix_external_benchmark.py Nsteps Nrep")
+  sys.exit()
+
+nsteps = int(argv[1])
+nrep = int(argv[2])
+
+ref, natoms, pe_ref = benchmark(nsteps, nrep, callback_copy, False)
+print("%d atoms, %d steps" % (natoms, nsteps))
+print("new arrays and copies:   %8.2f steps/s" % (nsteps/ref))
+res, natoms, pe = benchmark(nsteps, nrep, callback_direct, True)
+print("cached arrays, direct:   %8.2f steps/s" % (nsteps/res))
+print("speedup:                 %8.2f" % (ref/res))
+print("difference in PE:        %8.2g" % abs(pe - pe_ref))
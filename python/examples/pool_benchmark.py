@@ -0,0 +1,81 @@
+#!/usr/bin/env python
+# preceding line should have path for Python on your machine
+
+# pool_benchmark.py
+# Purpose: compare throughput of an ensemble of short runs executed with
+#          a pool of persistent LAMMPS instances to creating a new LAMMPS
+#          instance and system for every run
+# Syntax:  pool_benchmark.py Ntasks Nprocs
+#          Ntasks = number of runs in the ensemble
+#          Nprocs = number of worker processes
+
+from __future__ import print_function
+import sys,time
+from multiprocessing import Pool
+
+from lammps import lammps
+from lammps.pool import LammpsPool, POOL_CMDARGS
+
+# equilibrated Lennard-Jones liquid with 4000 atoms as base state
+
+setup = """
+units lj
+atom_style atomic
+lattice fcc 0.8442
+region box block 0 10 0 10 0 10
+create_box 1 box
+create_atoms 1 box
+mass 1 1.0
+velocity all create 3.0 87287 loop geom
+pair_style lj/cut 2.5
+pair_coeff 1 1 1.0 1.0 2.5
+neighbor 0.3 bin
+neigh_modify every 20 delay 0 check no
+fix 1 all nve
+run 100
+unfix 1
+"""
+
+reset = ["fix 1 all nve"]
+
+# each task is a short run with a different initial temperature
+
+def sample(lmp, temp):
+  lmp.command("velocity all create %g 4928459 loop geom" % temp)
+  lmp.command("run 20")
+  return temp, lmp.get_thermo("pe")
+
+def sample_new_instance(temp):
+  lmp = lammps(cmdargs=POOL_CMDARGS)
+  lmp.commands_string(setup)
+  lmp.commands_list(reset)
+  result = sample(lmp, temp)
+  lmp.close()
+  return result
+
+# parse command line
+
+argv = sys.argv
+if len(argv) != 3:
+  print("Syntax: pool_benchmark.py Ntasks Nprocs")
+  sys.exit()
+
+ntasks = int(argv[1])
+nprocs = int(argv[2])
+temps = [0.5 + 2.5*i/ntasks for i in range(ntasks)]
+
+if __name__ == "__main__":
+  start = time.perf_counter()
+  with Pool(nprocs) as pool:
+    ref = dict(pool.imap_unordered(sample_new_instance, temps))
+  elapsed = time.perf_counter() - start
+  print("new instance per task:  %8.2f tasks/s" % (ntasks/elapsed))
+
+  start = time.perf_counter()
+  with LammpsPool(nprocs, setup=setup, reset=reset) as pool:
+    res = dict(pool.imap_unordered(sample, temps))
+  elapsed = time.perf_counter() - start
+  print("persistent LammpsPool:  %8.2f tasks/s" % (ntasks/elapsed))
+
+  maxdiff = max(abs(ref[t] - res[t]) for t in temps)
+  print("max. difference in PE:  %8.2g" % maxdiff)
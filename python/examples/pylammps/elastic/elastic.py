@@ -23,7 +23,7 @@ def potential(lmp, args):
 
     return
 
-def displace(lmp, args, idir):
+def displace(lmp, args, idir, snap):
     """computes the response to a small strain """
 
     if idir == 1:
@@ -33,13 +33,8 @@ def displace(lmp, args, idir):
     else:
         lmp.variable("len0 equal {}".format(lmp.variables["lz0"].value))
 
-    # Reset box and simulation parameters
-    lmp.clear()
-    lmp.box("tilt large")
-    lmp.kim("init", args.kim_model, "metal", "unit_conversion_mode")
-    lmp.read_restart("restart.equil")
-    lmp.change_box("all triclinic")
-    potential(lmp, args)
+    # Reset box and atoms to the equilibrated state
+    lmp.lmp.restore(snap)
 
     # Negative deformation
     lmp.variable("delta equal -${up}*${len0}")
@@ -80,13 +75,8 @@ def displace(lmp, args, idir):
     c5neg = lmp.variables["d5"].value
     c6neg = lmp.variables["d6"].value
 
-    # Reset box and simulation parameters
-    lmp.clear()
-    lmp.box("tilt large")
-    lmp.kim("init", args.kim_model, "metal", "unit_conversion_mode")
-    lmp.read_restart("restart.equil")
-    lmp.change_box("all triclinic")
-    potential(lmp, args)
+    # Reset box and atoms to the equilibrated state
+    lmp.lmp.restore(snap)
 
     # Positive deformation
     lmp.variable("delta equal ${up}*${len0}")
@@ -181,6 +171,8 @@ def elastic():
     # use the OpenKIM model to set the energy interactions
     L.kim("init", args.kim_model, "metal", "unit_conversion_mode")
 
+    # atom map is required to restore snapshots
+    L.atom_modify("map array")
     L.read_data(args.input_data_file)
 
     potential(L, args)
@@ -209,12 +201,13 @@ def elastic():
 
     L.displace_atoms("all", "random", atomjiggle, atomjiggle, atomjiggle, 87287, "units box")
 
-    # Write restart
+    # Keep equilibrated state in memory
     L.unfix(3)
-    L.write_restart("restart.equil")
+    L.change_box("all triclinic")
+    snap = L.lmp.snapshot()
 
     for idir in range(1, 7):
-        displace(L, args, idir)
+        displace(L, args, idir, snap)
 
     postprocess_and_output(L)
     return
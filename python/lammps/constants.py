@@ -50,6 +50,11 @@ LMP_VAR_ATOM       = 1
 LMP_VAR_VECTOR     = 2
 LMP_VAR_STRING     = 3
 
+# sections of the timing breakdown in the order of lammps_get_timing()
+
+LMP_TIMING_CATEGORIES = ("Total", "Pair", "Bond", "Kspace", "Neigh", "Comm",
+                         "Output", "Modify", "Sync", "Other")
+
 # -------------------------------------------------------------------------
 
 def get_ctypes_int(size):
@@ -17,7 +17,11 @@
 from __future__ import print_function
 
 import os
+import re
 import sys
+import threading
+from collections import deque
+from concurrent.futures import Future
 from ctypes import *                    # lgtm [py/polluting-import]
 from os.path import dirname,abspath,join
 from inspect import getsourcefile
@@ -50,6 +54,228 @@ class ExceptionCheck:
 
 # -------------------------------------------------------------------------
 
+class CommandBatch:
+  """Pre-encoded list of LAMMPS commands that can be executed repeatedly.
+
+  .. versionadded:: TBD
+
+  Instances of this class are created by :py:meth:`lammps.command_batch()
+  <lammps.lammps.command_batch()>`.  Calling the instance submits all
+  commands with a single call to :cpp:func:`lammps_commands_list` and a
+  single check for errors.  Commands without placeholders are encoded only
+  once, for commands with ``@{name}`` placeholders only the substituted
+  values need to be converted on each call.
+
+  :param lmp: instance of the :py:class:`lammps <lammps.lammps>` class
+  :type  lmp: lammps
+  :param cmdlist: list of LAMMPS commands
+  :type  cmdlist: list of strings
+  """
+
+  _placeholder = re.compile(r'@\{([A-Za-z_][A-Za-z0-9_]*)\}')
+
+  def __init__(self, lmp, cmdlist):
+    self.lmp = lmp
+    self.ncmd = len(cmdlist)
+    self.args = (c_char_p * self.ncmd)()
+    self.parameters = set()
+    # for each command with placeholders, store index, text fragments and parameter names
+    self._templates = []
+    for i, cmd in enumerate(cmdlist):
+      if type(cmd) is bytes:
+        cmd = cmd.decode()
+      parts = CommandBatch._placeholder.split(cmd)
+      if len(parts) == 1:
+        self.args[i] = cmd.encode()
+      else:
+        self._templates.append((i, parts[0::2], parts[1::2]))
+        self.parameters.update(parts[1::2])
+
+  def __len__(self):
+    return self.ncmd
+
+  def __call__(self, **params):
+    """Execute the batch of commands
+
+    :param params: values to be substituted for the ``@{name}`` placeholders
+    :type params:  any, will be converted to a string
+    """
+    missing = self.parameters.difference(params)
+    if missing:
+      raise ValueError('Missing value(s) for command batch parameter(s): ' + ', '.join(sorted(missing)))
+
+    values = {k: str(v) for k, v in params.items()}
+    for i, text, names in self._templates:
+      cmd = text[0]
+      for name, tail in zip(names, text[1:]):
+        cmd += values[name] + tail
+      self.args[i] = cmd.encode()
+
+    with ExceptionCheck(self.lmp):
+      self.lmp.lib.lammps_commands_list(self.lmp.lmp, self.ncmd, self.args)
+
+# -------------------------------------------------------------------------
+
+class Snapshot:
+  """In-memory copy of the state of a LAMMPS system.
+
+  .. versionadded:: TBD
+
+  Instances of this class are created by :py:meth:`lammps.snapshot()
+  <lammps.lammps.snapshot()>` and passed to :py:meth:`lammps.restore()
+  <lammps.lammps.restore()>`.  The per-atom data is stored ordered by
+  atom ID in ctypes arrays as returned by :py:meth:`lammps.gather()
+  <lammps.lammps.gather()>`.
+
+  :ivar timestep: timestep at which the snapshot was taken
+  :ivar natoms: total number of atoms
+  :ivar box: box parameters boxlo, boxhi, xy, yz, xz
+  :ivar triclinic: 1 if the box was triclinic, 0 otherwise
+  :ivar data: list of per-atom properties as tuples of name, dtype, count, and data
+  """
+
+  def __init__(self, timestep, natoms, box, triclinic):
+    self.timestep = timestep
+    self.natoms = natoms
+    self.box = box
+    self.triclinic = triclinic
+    self.data = []
+
+# -------------------------------------------------------------------------
+
+class AsyncRun:
+  """Handle of a run executed in a worker thread.
+
+  .. versionadded:: TBD
+
+  Instances of this class are created by :py:meth:`lammps.run_async()
+  <lammps.lammps.run_async()>`.  The run is performed as a sequence of
+  :doc:`run <run>` commands of at most *every* steps each in a separate
+  thread, which does not block the calling thread, since the Python
+  interpreter lock is released while the C-library interface is called.
+  After each chunk the output of :py:meth:`lammps.last_thermo()
+  <lammps.lammps.last_thermo()>` is appended to a queue holding at most
+  *maxsize* rows.  When the queue is full, the oldest row is dropped, so
+  a slow or absent consumer never stalls the simulation.
+
+  The handle can be awaited in a coroutine, which returns the last thermo
+  output of the run, and the thermo rows can be consumed with ``async for``.
+  Outside of an event loop, :py:meth:`result` waits for the run to complete
+  and :py:meth:`get_rows` returns the rows queued so far.
+
+  While the run is in progress, no other methods of the LAMMPS instance
+  may be called except :py:attr:`lammps.is_running <lammps.lammps.is_running>`
+  and :py:meth:`lammps.force_timeout() <lammps.lammps.force_timeout()>`.
+
+  :ivar nsteps: total number of timesteps of the run
+  :ivar dropped: number of thermo rows that were dropped from the full queue
+  :ivar cancelled: True if the run was stopped by :py:meth:`cancel`
+  """
+
+  def __init__(self, lmp, nsteps, every, maxsize):
+    self.lmp = lmp
+    self.nsteps = nsteps
+    self.every = every
+    self.dropped = 0
+    self.cancelled = False
+    self._rows = deque(maxlen=maxsize)
+    self._lock = threading.Lock()
+    self._waiter = None
+    self._cancel = threading.Event()
+    self._future = Future()
+    self._thread = threading.Thread(target=self._worker, daemon=True)
+    self._thread.start()
+
+  def _worker(self):
+    try:
+      for step in self.lmp._run_chunks(self.nsteps, self.every, self._cancel.is_set):
+        self._push(self.lmp.last_thermo())
+      if self._cancel.is_set():
+        # the timeout forced by cancel() persists and would stop all following runs
+        self.cancelled = True
+        self.lmp.command("timer timeout off")
+      self._future.set_result(self.lmp.last_thermo())
+    except BaseException as e:
+      self._future.set_exception(e)
+    self._notify()
+
+  def _push(self, row):
+    with self._lock:
+      if len(self._rows) == self._rows.maxlen:
+        self.dropped += 1
+      self._rows.append(row)
+    self._notify()
+
+  def _notify(self):
+    # wake up a coroutine waiting in __anext__() from the worker thread
+    with self._lock:
+      waiter, self._waiter = self._waiter, None
+    if waiter:
+      loop, fut = waiter
+      loop.call_soon_threadsafe(lambda: fut.done() or fut.set_result(None))
+
+  def done(self):
+    """Return True if the run has completed, was cancelled, or failed"""
+    return self._future.done()
+
+  def cancel(self):
+    """Stop the run cooperatively
+
+    The current chunk is stopped at the next timestep via a forced timeout
+    (see :py:meth:`lammps.force_timeout() <lammps.lammps.force_timeout()>`)
+    and no further chunks are started.  The run is cleanly finished, so the
+    instance can be used for further commands afterwards.  Since the forced
+    timeout has to be cleared, a wall time limit set with the
+    :doc:`timer timeout <timer>` command is switched off as well.
+    """
+    self._cancel.set()
+    if self.lmp.is_running:
+      self.lmp.force_timeout()
+
+  def result(self, timeout=None):
+    """Wait for the run to complete and return its last thermo output
+
+    Exceptions raised by LAMMPS during the run are re-raised here.
+
+    :param timeout: maximum time to wait in seconds or None to wait indefinitely
+    :type  timeout: float
+    :return: last thermo output as returned by :py:meth:`lammps.last_thermo() <lammps.lammps.last_thermo()>`
+    :rtype: dict
+    """
+    return self._future.result(timeout)
+
+  def get_rows(self):
+    """Return and remove all thermo rows currently in the queue
+
+    :return: thermo rows in the order they were produced
+    :rtype: list of dict
+    """
+    with self._lock:
+      rows = list(self._rows)
+      self._rows.clear()
+    return rows
+
+  def __await__(self):
+    import asyncio
+    return asyncio.wrap_future(self._future).__await__()
+
+  def __aiter__(self):
+    return self
+
+  async def __anext__(self):
+    import asyncio
+    while True:
+      with self._lock:
+        if self._rows:
+          return self._rows.popleft()
+        if self._future.done():
+          raise StopAsyncIteration
+        fut = asyncio.get_running_loop().create_future()
+        self._waiter = (fut.get_loop(), fut)
+      await fut
+
+# -------------------------------------------------------------------------
+
 class lammps(object):
   """Create an instance of the LAMMPS Python class.
 
@@ -174,6 +400,7 @@ class lammps(object):
 
     self.lib.lammps_command.argtypes = [c_void_p, c_char_p]
     self.lib.lammps_command.restype = c_char_p
+    self.lib.lammps_commands_list.argtypes = [c_void_p, c_int, POINTER(c_char_p)]
     self.lib.lammps_commands_list.restype = None
     self.lib.lammps_commands_string.argtypes = [c_void_p, c_char_p]
     self.lib.lammps_commands_string.restype = None
@@ -219,6 +446,9 @@ class lammps(object):
     self.lib.lammps_gather_impropers.argtypes = [c_void_p,c_void_p]
     self.lib.lammps_gather_impropers.restype = None
 
+    self.lib.lammps_topology_checksum.argtypes = [c_void_p,c_char_p]
+    self.lib.lammps_topology_checksum.restype = c_int64
+
     self.lib.lammps_gather.argtypes = [c_void_p,c_char_p,c_int,c_int,c_void_p]
     self.lib.lammps_gather.restype = None
 
@@ -313,6 +543,11 @@ class lammps(object):
 
     self.lib.lammps_get_mpi_comm.argtypes = [c_void_p]
 
+    self.lib.lammps_memory_usage.argtypes = [c_void_p, POINTER(c_double)]
+    self.lib.lammps_memory_usage.restype = None
+    self.lib.lammps_get_timing.argtypes = [c_void_p, POINTER(c_double)]
+    self.lib.lammps_get_timing.restype = None
+
     self.lib.lammps_decode_image_flags.argtypes = [self.c_imageint, POINTER(c_int*3)]
 
     self.lib.lammps_extract_atom.argtypes = [c_void_p, c_char_p]
@@ -332,6 +567,10 @@ class lammps(object):
     self.lib.lammps_fix_external_set_virial_global.argtypes = [c_void_p, c_char_p, POINTER(c_double)]
     self.lib.lammps_fix_external_set_energy_peratom.argtypes = [c_void_p, c_char_p, POINTER(c_double)]
     self.lib.lammps_fix_external_set_virial_peratom.argtypes = [c_void_p, c_char_p, POINTER(POINTER(c_double))]
+    self.lib.lammps_fix_external_get_energy_peratom.argtypes = [c_void_p, c_char_p]
+    self.lib.lammps_fix_external_get_energy_peratom.restype = POINTER(c_double)
+    self.lib.lammps_fix_external_get_virial_peratom.argtypes = [c_void_p, c_char_p]
+    self.lib.lammps_fix_external_get_virial_peratom.restype = POINTER(POINTER(c_double))
 
     self.lib.lammps_fix_external_set_vector_length.argtypes = [c_void_p, c_char_p, c_int]
     self.lib.lammps_fix_external_set_vector.argtypes = [c_void_p, c_char_p, c_int, c_double]
@@ -648,15 +887,42 @@ class lammps(object):
     :type cmdlist:  list of strings
     """
     cmds = [x.encode() for x in cmdlist if type(x) is str]
-    narg = len(cmdlist)
+    narg = len(cmds)
     args = (c_char_p * narg)(*cmds)
-    self.lib.lammps_commands_list.argtypes = [c_void_p, c_int, c_char_p * narg]
 
     with ExceptionCheck(self):
       self.lib.lammps_commands_list(self.lmp,narg,args)
 
   # -------------------------------------------------------------------------
 
+  def command_batch(self,cmdlist):
+    """Create a pre-encoded batch of LAMMPS commands for repeated execution.
+
+    .. versionadded:: TBD
+
+    The commands are encoded once and stored in a
+    :py:class:`CommandBatch <lammps.CommandBatch>` instance, which submits
+    all of them through a single call to the :cpp:func:`lammps_commands_list`
+    function of the C-library interface each time it is executed.  The
+    commands may contain placeholders of the form ``@{name}`` which are
+    substituted with the keyword arguments passed when executing the batch.
+
+    .. code-block:: python
+
+       batch = lmp.command_batch(["variable lambda equal @{lam}",
+                                  "run 1000 pre no post no"])
+       for lam in windows:
+           batch(lam=lam)
+
+    :param cmdlist: list of LAMMPS commands
+    :type cmdlist:  list of strings
+    :return: batch of pre-encoded commands
+    :rtype:  CommandBatch
+    """
+    return CommandBatch(self, cmdlist)
+
+  # -------------------------------------------------------------------------
+
   def commands_string(self,multicmd):
     """Process a block of LAMMPS input commands from a string.
 
@@ -824,6 +1090,170 @@ class lammps(object):
 
   # -------------------------------------------------------------------------
 
+  def memory_usage(self):
+    """Get memory usage information of the LAMMPS instance
+
+    .. versionadded:: TBD
+
+    This is a wrapper around the :cpp:func:`lammps_memory_usage`
+    function of the C-library interface.  All numbers are in MBytes
+    and refer to the calling MPI process.  The second and third
+    number are zero if the operating system does not provide them.
+
+    :return: tally of the large allocations made by LAMMPS, current
+             memory use, and peak memory use of the process
+    :rtype: tuple(float, float, float)
+    """
+
+    meminfo = (3*c_double)()
+    with ExceptionCheck(self):
+      self.lib.lammps_memory_usage(self.lmp, meminfo)
+    return tuple(meminfo)
+
+  # -------------------------------------------------------------------------
+
+  def timing(self):
+    """Get the timing breakdown of the most recent run or minimization
+
+    .. versionadded:: TBD
+
+    This is a wrapper around the :cpp:func:`lammps_get_timing`
+    function of the C-library interface.  It returns the data of
+    the "MPI task timing breakdown" table printed at the end of a
+    run as a dictionary with the section names in
+    :py:data:`LMP_TIMING_CATEGORIES <lammps.LMP_TIMING_CATEGORIES>`
+    ("Total", "Pair", ..., "Other") as keys.  Each value is a NumPy
+    array of shape (2,3), the first row holds the minimum, average,
+    and maximum wall time across MPI ranks in seconds, the second
+    row the same for the CPU time.  CPU times are only recorded
+    with :doc:`timer full <timer>`.
+
+    This function must be called on all MPI ranks.
+
+    :return: timing data per section
+    :rtype: dict of numpy.array
+    """
+    import numpy as np
+
+    ncategories = len(LMP_TIMING_CATEGORIES)
+    timing = (6*ncategories*c_double)()
+    with ExceptionCheck(self):
+      self.lib.lammps_get_timing(self.lmp, timing)
+    data = np.ctypeslib.as_array(timing).reshape(ncategories, 2, 3).copy()
+    return dict(zip(LMP_TIMING_CATEGORIES, data))
+
+  # -------------------------------------------------------------------------
+
+  def sample_run(self, nsteps, every):
+    """Run MD in chunks and sample timing and memory usage after each chunk
+
+    .. versionadded:: TBD
+
+    This generator performs a run of *nsteps* timesteps as a sequence
+    of :doc:`run <run>` commands of at most *every* steps each.  The
+    *start* and *stop* keywords are set to the beginning and end of the
+    whole run, so that time-dependent fixes and variables behave as for
+    a single run, and only the first chunk performs the setup.  After
+    each chunk the current timestep, the output of :py:meth:`timing()`
+    for that chunk, and the output of :py:meth:`memory_usage()` are
+    yielded.  This allows to monitor load imbalance and memory growth
+    while a simulation progresses:
+
+    .. code-block:: python
+
+       for step, timing, memory in lmp.sample_run(100000, 1000):
+         wall = timing["Pair"][0]
+         if wall[2] > 1.2*wall[1]:
+           print("load imbalance in Pair at step", step)
+
+    This function must be called on all MPI ranks.
+
+    :param nsteps: total number of timesteps
+    :type nsteps: int
+    :param every: number of timesteps between samples
+    :type every: int
+    :return: generator of (timestep, timing, memory usage) tuples
+    :rtype: generator
+    """
+
+    if nsteps < 0 or every <= 0:
+      raise ValueError("Invalid sample_run() arguments: nsteps={} every={}".format(nsteps, every))
+
+    for step in self._run_chunks(nsteps, every):
+      yield step, self.timing(), self.memory_usage()
+
+  # -------------------------------------------------------------------------
+
+  def run_async(self, nsteps, every=1000, maxsize=1000):
+    """Run MD in a worker thread and stream the thermo output
+
+    .. versionadded:: TBD
+
+    This starts a run of *nsteps* timesteps in a separate thread and
+    immediately returns an :py:class:`AsyncRun <lammps.AsyncRun>` handle.
+    As with :py:meth:`sample_run`, the run is performed in chunks of at
+    most *every* steps with the *start* and *stop* keywords of the
+    :doc:`run <run>` command set to the beginning and end of the whole
+    run.  The thermo output at the end of each chunk is put into a queue
+    of the handle.  The handle is awaitable and can be cancelled, which
+    allows to monitor and control many LAMMPS instances from a single
+    :py:mod:`asyncio` event loop:
+
+    .. code-block:: python
+
+       async def monitor(lmp):
+         job = lmp.run_async(100000, 1000)
+         async for thermo in job:
+           if thermo["Temp"] > 10.0:
+             job.cancel()
+         return await job
+
+    This function must be called on all MPI ranks.
+
+    :param nsteps: total number of timesteps
+    :type nsteps: int
+    :param every: number of timesteps between thermo rows put into the queue
+    :type every: int
+    :param maxsize: maximum number of thermo rows kept in the queue
+    :type maxsize: int
+    :return: handle of the run
+    :rtype: AsyncRun
+    """
+
+    if nsteps < 0 or every <= 0 or maxsize <= 0:
+      raise ValueError("Invalid run_async() arguments: nsteps={} every={} maxsize={}".format(nsteps, every, maxsize))
+    if self.is_running:
+      raise RuntimeError("Cannot start a new run while LAMMPS is running")
+
+    return AsyncRun(self, nsteps, every, maxsize)
+
+  # -------------------------------------------------------------------------
+
+  def _run_chunks(self, nsteps, every, stop_requested=None):
+    """Perform a run in chunks and yield the current timestep after each chunk
+
+    Stops early, when a chunk ended before its last step due to a timeout,
+    or when *stop_requested* returns True.
+    """
+
+    start = self.extract_global("ntimestep")
+    stop = start + nsteps
+    step = start
+    while step < stop:
+      if stop_requested and stop_requested():
+        return
+      n = min(every, stop - step)
+      pre = "yes" if step == start else "no"
+      post = "yes" if step + n == stop else "no"
+      self.command("run {} start {} stop {} pre {} post {}".format(n, start, stop, pre, post))
+      step += n
+      current = self.extract_global("ntimestep")
+      yield current
+      if current != step:
+        return
+
+  # -------------------------------------------------------------------------
+
   def extract_setting(self, name):
     """Query LAMMPS about global settings that can be expressed as an integer.
 
@@ -1634,6 +2064,29 @@ class lammps(object):
 
   # -------------------------------------------------------------------------
 
+  def topology_checksum(self, kind):
+    """Compute a checksum of the global list of bonds, angles, dihedrals, or impropers
+
+    .. versionadded:: TBD
+
+    This is a wrapper around the :cpp:func:`lammps_topology_checksum`
+    function of the C-library interface.
+
+    The checksum only changes when the list returned by the corresponding
+    gather function changes, but it is much cheaper to compute.  It can
+    thus be used to check whether a previously gathered list is still
+    current.
+
+    :param kind: kind of bonded interaction: "bonds", "angles", "dihedrals", or "impropers"
+    :type kind:  string
+    :return: checksum or 0 if there are no bonded interactions of that kind
+    :rtype: int
+    """
+    with ExceptionCheck(self):
+      return self.lib.lammps_topology_checksum(self.lmp, kind.encode())
+
+  # -------------------------------------------------------------------------
+
   # return vector of atom/compute/fix properties gathered across procs
   # 3 variants to match src/library.cpp
   # name = atom property recognized by LAMMPS in atom->extract()
@@ -1707,7 +2160,103 @@ class lammps(object):
     with ExceptionCheck(self):
       self.lib.lammps_scatter_subset(self.lmp,newname,dtype,count,ndata,ids,data)
 
-   # -------------------------------------------------------------------------
+  # -------------------------------------------------------------------------
+
+  def snapshot(self, fixes=None):
+    """Capture the current state of the system in memory
+
+    .. versionadded:: TBD
+
+    This stores the timestep, the simulation box, and the positions,
+    velocities, image flags, types, and group membership of all atoms
+    in a :py:class:`Snapshot <lammps.Snapshot>`, plus charges, dipoles,
+    per-atom masses and radii, and angular velocities and momenta when
+    the atom style supports them.  Optionally, the per-atom data of fixes
+    like :doc:`fix store/state <fix_store_state>` can be included.  This
+    is meant to replace writing a restart file and reading it back after
+    :doc:`clear <clear>` when the same configuration is needed multiple
+    times, e.g. to evaluate the response to several strains.
+
+    Global settings, force field parameters, computes, and the global
+    state of fixes are *not* part of the snapshot.  Atoms must have
+    consecutive atom IDs and an atom map, which atomic systems only have
+    when requested with :doc:`atom_modify map <atom_modify>`.
+
+    :param fixes: IDs of fixes whose per-atom data should be included
+    :type  fixes: list of strings
+    :return: snapshot of the current state
+    :rtype:  Snapshot
+    """
+    boxlo, boxhi, xy, yz, xz, periodicity, box_change = self.extract_box()
+    snap = Snapshot(self.extract_global('ntimestep'), self.get_natoms(),
+                    (boxlo, boxhi, xy, yz, xz), self.extract_setting('triclinic'))
+
+    props = [('x', 1, 3), ('v', 1, 3), ('image', 0, 3), ('type', 0, 1), ('mask', 0, 1)]
+    if self.extract_setting('q_flag'): props.append(('q', 1, 1))
+    if self.extract_setting('mu_flag'): props.append(('mu', 1, 4))
+    if self.extract_setting('rmass_flag'): props.append(('rmass', 1, 1))
+    if self.extract_setting('radius_flag'): props.append(('radius', 1, 1))
+    if self.extract_setting('omega_flag'): props.append(('omega', 1, 3))
+    if self.extract_setting('angmom_flag'): props.append(('angmom', 1, 3))
+    for fixid in fixes or []:
+      ncols = self.extract_fix(fixid, LMP_STYLE_ATOM, LMP_SIZE_COLS)
+      props.append(('f_' + fixid, 1, max(ncols, 1)))
+
+    for name, dtype, count in props:
+      snap.data.append((name, dtype, count, self.gather(name, dtype, count)))
+    return snap
+
+  # -------------------------------------------------------------------------
+
+  def restore(self, snap):
+    """Restore the state of the system from a snapshot
+
+    .. versionadded:: TBD
+
+    The simulation box is reset with a :doc:`change_box <change_box>`
+    command and the per-atom data stored in the snapshot is scattered
+    back to the atoms, which are then migrated to the processors owning
+    them.  Unlike reading a restart file, this requires no file I/O and
+    keeps all settings, styles, fixes, and computes defined.  The number
+    of atoms must not have changed since the snapshot was taken.  As
+    with other changes of per-atom data, neighbor lists and forces are
+    only updated by the next :doc:`run <run>` or :doc:`minimize <minimize>`
+    command.
+
+    :param snap: snapshot created by :py:meth:`snapshot()`
+    :type  snap: Snapshot
+    """
+    if self.extract_global('map_style') == 0:
+      raise ValueError('Restoring a snapshot requires an atom map, use atom_modify map yes')
+    if self.get_natoms() != snap.natoms:
+      raise ValueError('Number of atoms %d does not match the snapshot with %d atoms'
+                       % (self.get_natoms(), snap.natoms))
+
+    boxlo, boxhi, xy, yz, xz = snap.box
+    triclinic = self.extract_setting('triclinic')
+    dims = 'xyz' if self.extract_setting('dimension') == 3 else 'xy'
+    cmd = 'change_box all'
+    if snap.triclinic and not triclinic:
+      cmd += ' triclinic'
+    for i, dim in enumerate(dims):
+      cmd += ' %s final %.17g %.17g' % (dim, boxlo[i], boxhi[i])
+    if snap.triclinic or triclinic:
+      cmd += ' xy final %.17g' % xy
+      if len(dims) == 3:
+        cmd += ' xz final %.17g yz final %.17g' % (xz, yz)
+    if triclinic and not snap.triclinic:
+      cmd += ' ortho'
+    self.command(cmd + ' units box')
+
+    for name, dtype, count, data in snap.data:
+      self.scatter(name, dtype, count, data)
+    # wrap atoms back into the box and move them to their new owners
+    self.command('change_box all set')
+
+    if self.extract_global('ntimestep') != snap.timestep:
+      self.command('reset_timestep %d' % snap.timestep)
+
+  # -------------------------------------------------------------------------
 
   def encode_image_flags(self,ix,iy,iz):
     """ convert 3 integers with image flags for x-, y-, and z-direction
@@ -2198,7 +2747,7 @@ class lammps(object):
 
   # -------------------------------------------------------------------------
 
-  def set_fix_external_callback(self, fix_id, callback, caller=None):
+  def set_fix_external_callback(self, fix_id, callback, caller=None, cached=False):
     """Set the callback function for a fix external instance with a given fix ID.
 
     Optionally also set a reference to the calling object.
@@ -2218,7 +2767,14 @@ class lammps(object):
     - x is a 2d NumPy array of doubles of the coordinates of the local atoms
     - f is a 2d NumPy array of doubles of the forces on the local atoms that will be added
 
-    .. versionchanged:: 28Jul2021
+    By default, new NumPy arrays are created for tag, x, and f on every call.
+    With *cached* set to True, the arrays are kept between calls and only
+    recreated when the number of local atoms or the location of the underlying
+    storage has changed (e.g. after atoms migrated or the arrays were grown).
+    The callback must then not keep references to the arrays beyond the call
+    or resize them, since the same objects are passed again on the next call.
+
+    .. versionchanged:: TBD
 
     :param fix_id:  Fix-ID of a fix external instance
     :type: string
@@ -2226,6 +2782,8 @@ class lammps(object):
     :type: function
     :param caller: reference to some object passed to the callback function
     :type: object, optional
+    :param cached: reuse the NumPy arrays between calls unless the storage changed
+    :type: bool, optional
     """
     import numpy as np
 
@@ -2235,7 +2793,24 @@ class lammps(object):
       f   = self.numpy.darray(fext_ptr, nlocal, 3)
       callback(caller, ntimestep, nlocal, tag, x, f)
 
-    cFunc   = self.FIX_EXTERNAL_CALLBACK_FUNC(callback_wrapper)
+    # key of the cached arrays: nlocal and the addresses of the tag, x, and f data
+
+    views = [None, None, None, None]
+
+    def cached_callback_wrapper(caller, ntimestep, nlocal, tag_ptr, x_ptr, fext_ptr):
+      key = (nlocal, cast(tag_ptr, c_void_p).value,
+             cast(x_ptr, POINTER(c_void_p))[0], cast(fext_ptr, POINTER(c_void_p))[0])
+      if key != views[0]:
+        views[0] = key
+        views[1] = self.numpy.iarray(self.c_tagint, tag_ptr, nlocal, 1)
+        views[2] = self.numpy.darray(x_ptr, nlocal, 3)
+        views[3] = self.numpy.darray(fext_ptr, nlocal, 3)
+      callback(caller, ntimestep, nlocal, views[1], views[2], views[3])
+
+    if cached:
+      cFunc = self.FIX_EXTERNAL_CALLBACK_FUNC(cached_callback_wrapper)
+    else:
+      cFunc = self.FIX_EXTERNAL_CALLBACK_FUNC(callback_wrapper)
     cCaller = caller
 
     self.callback[fix_id] = { 'function': cFunc, 'caller': caller }
@@ -2356,6 +2931,50 @@ class lammps(object):
     with ExceptionCheck(self):
       return self.lib.lammps_fix_external_set_virial_peratom(self.lmp, fix_id.encode(), c_virial)
 
+  # -------------------------------------------------------------------------
+
+  def fix_external_get_energy_peratom(self, fix_id):
+    """Get access to the per-atom energy storage of a fix external instance with a given fix ID.
+
+    .. versionadded:: TBD
+
+    This is a wrapper around the :cpp:func:`lammps_fix_external_get_energy_peratom`
+    function of the C-library interface.  The per-atom energy can be written directly
+    into the returned array instead of calling :py:meth:`fix_external_set_energy_peratom`.
+    This is only possible from within the callback function and only on timesteps when
+    per-atom energies are tallied, otherwise a NULL pointer is returned.
+
+    :param fix_id:  Fix-ID of a fix external instance
+    :type: string
+    :return: requested data
+    :rtype: ctypes.POINTER(ctypes.c_double)
+    """
+
+    with ExceptionCheck(self):
+      return self.lib.lammps_fix_external_get_energy_peratom(self.lmp, fix_id.encode())
+
+  # -------------------------------------------------------------------------
+
+  def fix_external_get_virial_peratom(self, fix_id):
+    """Get access to the per-atom virial storage of a fix external instance with a given fix ID.
+
+    .. versionadded:: TBD
+
+    This is a wrapper around the :cpp:func:`lammps_fix_external_get_virial_peratom`
+    function of the C-library interface.  The per-atom virial can be written directly
+    into the returned array instead of calling :py:meth:`fix_external_set_virial_peratom`.
+    This is only possible from within the callback function and only on timesteps when
+    per-atom virials are tallied, otherwise a NULL pointer is returned.
+
+    :param fix_id:  Fix-ID of a fix external instance
+    :type: string
+    :return: requested data
+    :rtype: ctypes.POINTER(ctypes.POINTER(ctypes.c_double))
+    """
+
+    with ExceptionCheck(self):
+      return self.lib.lammps_fix_external_get_virial_peratom(self.lmp, fix_id.encode())
+
   # -------------------------------------------------------------------------
   def fix_external_set_vector_length(self, fix_id, length):
     """Set the vector length for a global vector stored with fix external for analysis
@@ -17,6 +17,7 @@
 # and Axel Kohlmeyer <akohlmey@gmail.com>
 ################################################################################
 
+import os
 import re
 
 has_yaml = False
@@ -126,15 +127,63 @@ class LogFile:
 class AvgChunkFile:
   """Reads files generated by fix ave/chunk
 
+  By default, the values are stored per chunk in dictionaries of lists.
+  With *block* set to True, all rows of a timestep are instead parsed at
+  once with NumPy into a single array of shape (nrows, ncolumns), where
+  nrows is the total number of chunk rows in the file.  A ragged index
+  of row offsets per timestep allows for numbers of chunks that change
+  over time.  If the number of chunks is the same for all timesteps, the
+  array is also available with shape (ntimesteps, nchunks, ncolumns).
+
+  If a *cache* file name is given in block mode, the parsed values are
+  written to that file in NumPy ``.npy`` format and the index to a file
+  with the suffix ``.index.npz`` added.  The values are then accessed
+  through a memory map, and the file is not parsed again when the cache
+  is newer than the ave/chunk file.
+
+  .. code-block:: python
+
+     profile = AvgChunkFile('profile.dat', block=True, cache='profile.npy')
+     vx = profile.column('vx')    # shape (ntimesteps, nchunks)
+
   :param filename: path to ave/chunk file
   :type  filename: str
-
-  :ivar timesteps: List of timesteps stored in file
-  :ivar total_count: total count over time
-  :ivar chunks: List of chunks. Each chunk is a dictionary containing its ID, the coordinates, and the averaged quantities
+  :param block: parse the file with NumPy in blocks of rows
+  :type  block: bool
+  :param cache: path to the cache file for the parsed values (block mode only)
+  :type  cache: str
+
+  :ivar timesteps: List of timesteps stored in file (NumPy array in block mode)
+  :ivar total_count: total count over time (NumPy array in block mode)
+  :ivar chunks: List of chunks. Each chunk is a dictionary containing its ID, the coordinates, and the averaged quantities (None in block mode)
+  :ivar columns: List of column names
+  :ivar nchunks: number of chunks per timestep (block mode only)
+  :ivar offsets: index of the first row of each timestep in values and total number of rows (block mode only)
+  :ivar values: all rows of the file as array of shape (nrows, ncolumns) (block mode only)
+  :ivar data: values as array of shape (ntimesteps, nchunks, ncolumns) or None if the number of chunks changes (block mode only)
   """
-  def __init__(self, filename):
+
+  # minimum number of values parsed at once in block mode
+  BLOCK_SIZE = 1 << 20
+
+  def __init__(self, filename, block=False, cache=None):
     with open(filename, 'rt') as f:
+      columns, ndim, compress = self._read_header(f)
+      if block:
+        self._read_blocks(f, filename, cache)
+        return
+
+      if ndim > 0:
+        coord_start = columns.index("Coord1")
+        coord_end   = columns.index("Coord%d" % ndim)
+        ncount_start = coord_end + 1
+        data_start = ncount_start + 1
+      else:
+        coord_start = None
+        coord_end = None
+        ncount_start = 2
+        data_start = 3
+
       timestep = None
       chunks_read = 0
 
@@ -142,36 +191,7 @@ class AvgChunkFile:
       self.total_count = []
       self.chunks = []
 
-      for lineno, line in enumerate(f):
-        if lineno == 0:
-          if not line.startswith("# Chunk-averaged data for fix"):
-            raise Exception("Chunk data reader only supports default avg/chunk headers!")
-          parts = line.split()
-          self.fix_name = parts[5]
-          self.group_name = parts[8]
-          continue
-        elif lineno == 1:
-          if not line.startswith("# Timestep Number-of-chunks Total-count"):
-            raise Exception("Chunk data reader only supports default avg/chunk headers!")
-          continue
-        elif lineno == 2:
-          if not line.startswith("#"):
-            raise Exception("Chunk data reader only supports default avg/chunk headers!")
-          columns = line.split()[1:]
-          ndim = line.count("Coord")
-          compress = 'OrigID' in line
-          if ndim > 0:
-            coord_start = columns.index("Coord1")
-            coord_end   = columns.index("Coord%d" % ndim)
-            ncount_start = coord_end + 1
-            data_start = ncount_start + 1
-          else:
-            coord_start = None
-            coord_end = None
-            ncount_start = 2
-            data_start = 3
-          continue
-
+      for line in f:
         parts = line.split()
 
         if timestep is None:
@@ -225,3 +245,380 @@ class AvgChunkFile:
 
           self.timesteps.append(timestep)
           self.total_count.append(total_count)
+
+  def _read_header(self, f):
+    """Check the three header lines and return columns, dimension, and compress flag"""
+    line = f.readline()
+    if not line.startswith("# Chunk-averaged data for fix"):
+      raise Exception("Chunk data reader only supports default avg/chunk headers!")
+    parts = line.split()
+    self.fix_name = parts[5]
+    self.group_name = parts[8]
+
+    line = f.readline()
+    if not line.startswith("# Timestep Number-of-chunks Total-count"):
+      raise Exception("Chunk data reader only supports default avg/chunk headers!")
+
+    line = f.readline()
+    if not line.startswith("#"):
+      raise Exception("Chunk data reader only supports default avg/chunk headers!")
+    self.columns = line.split()[1:]
+    return self.columns, line.count("Coord"), 'OrigID' in line
+
+  def _read_blocks(self, f, filename, cache):
+    """Parse all timesteps with NumPy, optionally through a cache file"""
+    import numpy as np
+
+    self.chunks = None
+    ncols = len(self.columns)
+    index = cache + '.index.npz' if cache else None
+    if cache and os.path.exists(cache) and os.path.exists(index) \
+       and os.path.getmtime(cache) >= os.path.getmtime(filename):
+      with np.load(index) as idx:
+        if list(idx['columns']) == self.columns:
+          self._set_index(idx['timesteps'], idx['nchunks'], idx['total_count'])
+          self._set_values(np.load(cache, mmap_mode='r'))
+          return
+
+    # first pass: read only the timestep lines to build the index
+
+    start = f.tell()
+    timesteps = []
+    nchunks = []
+    total_count = []
+    while True:
+      line = f.readline()
+      if not line:
+        break
+      parts = line.split()
+      if not parts:
+        continue
+      timesteps.append(int(parts[0]))
+      nchunks.append(int(parts[1]))
+      total_count.append(float(parts[2]))
+      for i in range(nchunks[-1]):
+        f.readline()
+    self._set_index(timesteps, nchunks, total_count)
+
+    nrows = int(self.offsets[-1])
+    if cache:
+      values = np.lib.format.open_memmap(cache, mode='w+', dtype=np.float64, shape=(nrows, ncols))
+    else:
+      values = np.empty((nrows, ncols), dtype=np.float64)
+
+    # second pass: parse the chunk rows of as many timesteps at once as fit into a block
+
+    f.seek(start)
+    maxrows = max(1, AvgChunkFile.BLOCK_SIZE // max(1, ncols))
+    row = 0
+    lines = []
+    for n in self.nchunks:
+      f.readline()
+      lines.extend(f.readline() for i in range(n))
+      if len(lines) >= maxrows:
+        row = self._parse_rows(lines, values, row)
+        lines = []
+    self._parse_rows(lines, values, row)
+
+    if cache:
+      values.flush()
+      del values
+      np.savez(index, timesteps=self.timesteps, nchunks=self.nchunks,
+               total_count=self.total_count, columns=np.array(self.columns))
+      values = np.load(cache, mmap_mode='r')
+    self._set_values(values)
+
+  def _parse_rows(self, lines, values, row):
+    import numpy as np
+    if not lines:
+      return row
+    block = np.array("".join(lines).split(), dtype=np.float64)
+    ncols = values.shape[1]
+    if len(block) != len(lines)*ncols:
+      raise Exception("Chunk data rows after row %d do not have %d columns or are incomplete" % (row, ncols))
+    values[row:row+len(lines)] = block.reshape(-1, ncols)
+    return row + len(lines)
+
+  def _set_index(self, timesteps, nchunks, total_count):
+    import numpy as np
+    self.timesteps = np.asarray(timesteps, dtype=np.int64)
+    self.nchunks = np.asarray(nchunks, dtype=np.int64)
+    self.total_count = np.asarray(total_count, dtype=np.float64)
+    self.offsets = np.zeros(len(self.nchunks) + 1, dtype=np.int64)
+    np.cumsum(self.nchunks, out=self.offsets[1:])
+
+  def _set_values(self, values):
+    self.values = values
+    self.data = None
+    if len(self.nchunks) and (self.nchunks == self.nchunks[0]).all():
+      self.data = values.reshape(len(self.nchunks), int(self.nchunks[0]), values.shape[1])
+
+  def block(self, index):
+    """Return the rows of all chunks of a timestep (block mode only)
+
+    :param index: index of the timestep
+    :type  index: int
+    :return: array of shape (nchunks, ncolumns)
+    :rtype:  numpy.array
+    """
+    return self.values[self.offsets[index]:self.offsets[index+1]]
+
+  def column(self, name):
+    """Return the values of one column for all timesteps and chunks (block mode only)
+
+    :param name: name of the column, e.g. "Ncount" or "Coord1"
+    :type  name: str
+    :return: array of shape (ntimesteps, nchunks) or (nrows,) if the number of chunks changes
+    :rtype:  numpy.array
+    """
+    icol = self.columns.index(name)
+    if self.data is not None:
+      return self.data[:, :, icol]
+    return self.values[:, icol]
+
+class BinaryDumpFile:
+  """Reads binary dump files generated by dump atom or dump custom
+
+  The file is memory-mapped and only the headers of the frames are read
+  when the file is opened to build an index of all frames.  The per-atom
+  data of a frame is returned as NumPy array of shape (natoms, ncolumns)
+  that is a view of the mapped file, i.e. no data is read or copied until
+  it is accessed, unless the frame consists of multiple chunks (one per
+  MPI rank that wrote it) or non-contiguous columns are selected.  Use
+  :py:meth:`chunks` for zero-copy access to the individual chunks.  The
+  atoms are stored in the order they were written, use ``dump_modify sort``
+  to get them ordered by atom ID.
+
+  Incomplete frames at the end of the file, e.g. of a running simulation,
+  are ignored.  Files written with LAMMPS versions from before 2022 do not
+  contain column names, so columns can only be selected by index.
+
+  .. code-block:: python
+
+     dump = BinaryDumpFile('dump.bin')
+     for step, x in zip(dump.timesteps, dump.frames(['x', 'y', 'z'])):
+         print(step, x.mean(axis=0))
+
+  :param filename: path to binary dump file
+  :type  filename: str
+
+  :ivar timesteps: List of timesteps of the frames in the file
+  :ivar natoms: List of the number of atoms in each frame
+  :ivar columns: List of column names of the first frame or None if not stored
+  :ivar units: Unit style or None if not stored
+  """
+
+  # dump styles with the supported header layout
+  MAGIC_STRINGS = ('DUMPATOM', 'DUMPCUSTOM')
+
+  def __init__(self, filename):
+    import numpy as np
+    import struct
+
+    self.filename = filename
+    self.timesteps = []
+    self.natoms = []
+    self.columns = None
+    self.units = None
+    self._frames = []
+    self._data = np.memmap(filename, dtype=np.uint8, mode='r') if os.path.getsize(filename) > 0 else b''
+
+    data = self._data
+    size = len(data)
+    offset = 0
+
+    def read(fmt):
+      nonlocal offset
+      # native byte order without padding
+      fmt = '=' + fmt
+      if offset + struct.calcsize(fmt) > size:
+        raise EOFError
+      values = struct.unpack_from(fmt, data, offset)
+      offset += struct.calcsize(fmt)
+      return values
+
+    def read_string(n):
+      nonlocal offset
+      if offset + n > size:
+        raise EOFError
+      text = bytes(data[offset:offset+n]).decode()
+      offset += n
+      return text
+
+    while offset < size:
+      start = offset
+      try:
+        ntimestep, = read('q')
+        revision = 1
+        if ntimestep < 0:
+          magic = read_string(-ntimestep)
+          if magic not in BinaryDumpFile.MAGIC_STRINGS:
+            raise Exception("Unsupported binary dump format: %s" % magic)
+          endian, = read('i')
+          if endian != 1:
+            raise Exception("Binary dump file was written on a machine with different byte order")
+          revision, ntimestep = read('iq')
+
+        natoms, triclinic = read('qi')
+        boundary = read('6i')
+        if triclinic == 0:
+          box = read('6d')
+        elif triclinic == 1:
+          box = read('9d')
+        elif triclinic == 2:
+          box = read('12d')
+        else:
+          raise Exception("Invalid box type %d in binary dump frame at offset %d" % (triclinic, start))
+        size_one, = read('i')
+
+        time = None
+        columns = None
+        if revision > 1:
+          nlen, = read('i')
+          if nlen > 0:
+            self.units = read_string(nlen)
+          flag, = read('b')
+          if flag:
+            time, = read('d')
+          nlen, = read('i')
+          columns = read_string(nlen).split()
+
+        nchunk, = read('i')
+        chunks = []
+        for i in range(nchunk):
+          n, = read('i')
+          if offset + 8*n > size:
+            raise EOFError
+          chunks.append((offset, n))
+          offset += 8*n
+      except EOFError:
+        break
+
+      if columns is not None and len(columns) != size_one:
+        raise Exception("Number of column names does not match number of values per atom")
+      if sum(n for o, n in chunks) != natoms*size_one:
+        raise Exception("Size of per-atom data does not match number of atoms at timestep %d" % ntimestep)
+      if not self._frames:
+        self.columns = columns
+
+      self.timesteps.append(ntimestep)
+      self.natoms.append(natoms)
+      self._frames.append({'timestep': ntimestep,
+                           'natoms': natoms,
+                           'triclinic': triclinic,
+                           'boundary': boundary,
+                           'box': box,
+                           'time': time,
+                           'size_one': size_one,
+                           'columns': columns,
+                           'chunks': chunks})
+
+  def __len__(self):
+    return len(self._frames)
+
+  def __getitem__(self, index):
+    return self.frame(index)
+
+  def __iter__(self):
+    return self.frames()
+
+  def index(self, timestep):
+    """Return the index of the first frame with the given timestep
+
+    :param timestep: timestep to look up
+    :type  timestep: int
+    :return: frame index
+    :rtype:  int
+    """
+    return self.timesteps.index(timestep)
+
+  def header(self, index):
+    """Return the header information of a frame
+
+    The dictionary contains the keys 'timestep', 'natoms', 'triclinic'
+    (0 orthogonal, 1 restricted triclinic, 2 general triclinic), 'boundary'
+    (6 integers with 0 = p, 1 = f, 2 = s, 3 = m), 'box' (the box parameters
+    in the order they are stored in the file), 'time' (None unless written
+    with ``dump_modify time yes``), 'size_one' and 'columns'.
+
+    :param index: frame index
+    :type  index: int
+    :return: header information
+    :rtype:  dict
+    """
+    frame = dict(self._frames[index])
+    del frame['chunks']
+    return frame
+
+  def _column_index(self, frame, columns):
+    """Convert column names or indices into an index usable on an array"""
+    if columns is None:
+      return slice(None)
+    single = isinstance(columns, (str, int))
+    if single:
+      columns = [columns]
+    idx = []
+    for c in columns:
+      if isinstance(c, str):
+        if frame['columns'] is None:
+          raise Exception("Binary dump file does not contain column names")
+        if c not in frame['columns']:
+          raise Exception("Column %s is not in the dump: %s" % (c, " ".join(frame['columns'])))
+        idx.append(frame['columns'].index(c))
+      else:
+        idx.append(int(c))
+    if single:
+      return idx[0]
+    # ranges of consecutive columns can be selected as a view
+    if idx and idx == list(range(idx[0], idx[0] + len(idx))):
+      return slice(idx[0], idx[0] + len(idx))
+    return idx
+
+  def chunks(self, index, columns=None):
+    """Return the per-atom data of a frame as a list of arrays, one per chunk
+
+    The arrays are views of the memory-mapped file, unless non-consecutive
+    columns are selected.
+
+    :param index: frame index
+    :type  index: int
+    :param columns: name or index of a column, or a list of those (default: all columns)
+    :type  columns: str, int, or list
+    :return: per-atom data of each chunk of the frame
+    :rtype:  list of numpy.array
+    """
+    import numpy as np
+    frame = self._frames[index]
+    cols = self._column_index(frame, columns)
+    size_one = frame['size_one']
+    return [np.frombuffer(self._data, dtype=np.float64, count=n, offset=offset).reshape(-1, size_one)[:, cols]
+            for offset, n in frame['chunks']]
+
+  def frame(self, index, columns=None):
+    """Return the per-atom data of a frame
+
+    :param index: frame index
+    :type  index: int
+    :param columns: name or index of a column, or a list of those (default: all columns)
+    :type  columns: str, int, or list
+    :return: per-atom data with one row per atom, 1d if a single column was selected
+    :rtype:  numpy.array
+    """
+    import numpy as np
+    chunks = self.chunks(index, columns)
+    if len(chunks) == 1:
+      return chunks[0]
+    if not chunks:
+      return np.empty((0, self._frames[index]['size_one']))[:, self._column_index(self._frames[index], columns)]
+    return np.concatenate(chunks)
+
+  def frames(self, columns=None):
+    """Iterate over the per-atom data of all frames
+
+    :param columns: name or index of a column, or a list of those (default: all columns)
+    :type  columns: str, int, or list
+    :return: generator of per-atom data arrays as returned by :py:meth:`frame`
+    :rtype:  generator
+    """
+    for i in range(len(self._frames)):
+      yield self.frame(i, columns)
@@ -21,6 +21,7 @@ from ctypes import POINTER, c_void_p, c_char_p, c_double, c_int, c_int32, c_int6
 
 
 from .constants import *                # lgtm [py/polluting-import]
+from .core import ExceptionCheck
 from .data import NeighList
 
 
@@ -39,8 +40,17 @@ class numpy_wrapper:
   :param lmp: instance of the :py:class:`lammps` class
   :type  lmp: lammps
   """
+
+  # global count, number of columns, and gather function per kind of bonded interaction
+  _topology_kinds = { 'bonds': ('nbonds', 3, 'lammps_gather_bonds'),
+                      'angles': ('nangles', 4, 'lammps_gather_angles'),
+                      'dihedrals': ('ndihedrals', 5, 'lammps_gather_dihedrals'),
+                      'impropers': ('nimpropers', 5, 'lammps_gather_impropers') }
+
   def __init__(self, lmp):
     self.lmp = lmp
+    self._image_settings = None
+    self._topology_generation = {}
 
   # -------------------------------------------------------------------------
 
@@ -54,6 +64,17 @@ class numpy_wrapper:
 
   # -------------------------------------------------------------------------
 
+  def _image_constants(self):
+    # image flag bit layout is a compile time setting, so query it only once
+    if self._image_settings is None:
+      self._image_settings = (self.lmp.extract_setting("IMGMASK"),
+                              self.lmp.extract_setting("IMGMAX"),
+                              self.lmp.extract_setting("IMGBITS"),
+                              self.lmp.extract_setting("IMG2BITS"))
+    return self._image_settings
+
+  # -------------------------------------------------------------------------
+
   def extract_atom(self, name, dtype=LAMMPS_AUTODETECT, nelem=LAMMPS_AUTODETECT, dim=LAMMPS_AUTODETECT):
     """Retrieve per-atom properties from LAMMPS as NumPy arrays
 
@@ -270,75 +291,358 @@ class numpy_wrapper:
 
     # -------------------------------------------------------------------------
 
-  def gather_bonds(self):
+  def create_atoms(self, ids, types, x, v=None, image=None, shrinkexceed=False, chunksize=None):
+    """Create atoms from NumPy arrays of coordinates and properties
+
+    .. versionadded:: TBD
+
+    This is an alternative to :py:meth:`lammps.create_atoms() <lammps.lammps.create_atoms()>`.
+    It behaves the same as the original method, but the number of atoms is
+    taken from the length of *types* and the per-atom data is handed to the
+    :cpp:func:`lammps_create_atoms` function of the C-library interface
+    without copying it element by element into ``ctypes`` arrays.  Arrays
+    that are already C-contiguous and of the matching data type (``tagint``
+    for *ids*, ``int`` for *types*, ``double`` for *x* and *v*, and
+    ``imageint`` for *image*) are passed on directly, all others are
+    converted once with :py:func:`numpy.ascontiguousarray`.  Coordinates and
+    velocities may be given as either (N,3) or flat (3N) arrays.
+
+    For very large systems, the atoms can be inserted in chunks of at most
+    *chunksize* atoms per call to the C library to limit the size of the
+    temporary buffers LAMMPS needs to allocate.  The number of atoms
+    per call is always limited to the largest 32-bit signed integer.
+
+    :param ids: atom IDs with N elements or None
+    :type ids: numpy.array of lammps.tagint
+    :param types: atom types with N elements
+    :type types: numpy.array of int
+    :param x: coordinates for x-, y-, and z as (N,3) or (3N) array
+    :type x: numpy.array of float
+    :param v: velocities for x-, y-, and z as (N,3) or (3N) array or None (optional)
+    :type v: numpy.array of float
+    :param image: encoded image flags with N elements or None (optional)
+    :type image: numpy.array of lammps.imageint
+    :param shrinkexceed: whether to expand shrink-wrap boundaries if atoms are outside the box (optional)
+    :type shrinkexceed: bool
+    :param chunksize: maximum number of atoms to insert with a single library call (optional)
+    :type chunksize: int
+    :return: number of atoms created. 0 if insufficient or invalid data
+    :rtype: int
+    """
+    import numpy as np
+
+    types = np.ascontiguousarray(types, dtype=np.intc).reshape(-1)
+    n = len(types)
+    x = np.ascontiguousarray(x, dtype=np.double).reshape(-1)
+    if x.size < 3*n:
+      return 0
+
+    if ids is not None:
+      ids = np.ascontiguousarray(ids, dtype=self._ctype_to_numpy_int(self.lmp.c_tagint)).reshape(-1)
+      if ids.size < n:
+        return 0
+    if v is not None:
+      v = np.ascontiguousarray(v, dtype=np.double).reshape(-1)
+      if v.size < 3*n:
+        return 0
+    if image is not None:
+      image = np.ascontiguousarray(image, dtype=self._ctype_to_numpy_int(self.lmp.c_imageint)).reshape(-1)
+      if image.size < n:
+        return 0
+
+    maxchunk = 2**31 - 1
+    if chunksize is None or chunksize <= 0 or chunksize > maxchunk:
+      chunksize = maxchunk
+
+    def ptr(a, lo, hi):
+      return None if a is None else a[lo:hi].ctypes.data
+
+    self.lmp.lib.lammps_create_atoms.argtypes = [c_void_p, c_int, c_void_p, c_void_p,
+                                                 c_void_p, c_void_p, c_void_p, c_int]
+    se_lmp = 1 if shrinkexceed else 0
+    ncreated = 0
+    for lo in range(0, n, chunksize):
+      hi = min(lo + chunksize, n)
+      with ExceptionCheck(self.lmp):
+        ncreated += self.lmp.lib.lammps_create_atoms(self.lmp.lmp, hi - lo, ptr(ids, lo, hi),
+                                                     ptr(types, lo, hi), ptr(x, 3*lo, 3*hi),
+                                                     ptr(v, 3*lo, 3*hi), ptr(image, lo, hi), se_lmp)
+    return ncreated
+
+    # -------------------------------------------------------------------------
+
+  def encode_image_flags(self, ix, iy, iz):
+    """Convert arrays of image flags for x-, y-, and z-direction into encoded image flags
+
+    .. versionadded:: TBD
+
+    This is a vectorized alternative to
+    :py:meth:`lammps.encode_image_flags() <lammps.lammps.encode_image_flags()>`.
+    It performs the same bit-shift and bit-wise OR operations, but for all
+    elements of the arguments at once and using the bit layout of the
+    loaded LAMMPS library.  The arguments may be scalars or arrays and are
+    broadcast against each other.
+
+    :param ix: x-direction image flags
+    :type  ix: int or numpy.array
+    :param iy: y-direction image flags
+    :type  iy: int or numpy.array
+    :param iz: z-direction image flags
+    :type  iz: int or numpy.array
+    :return: encoded image flags
+    :rtype: numpy.array of lammps.imageint
+    """
+    import numpy as np
+    imgmask, imgmax, imgbits, img2bits = self._image_constants()
+    np_imageint = self._ctype_to_numpy_int(self.lmp.c_imageint)
+
+    imgx = (np.asarray(ix).astype(np_imageint) + imgmax) & imgmask
+    imgy = (np.asarray(iy).astype(np_imageint) + imgmax) & imgmask
+    imgz = (np.asarray(iz).astype(np_imageint) + imgmax) & imgmask
+    return imgx | (imgy << imgbits) | (imgz << img2bits)
+
+    # -------------------------------------------------------------------------
+
+  def decode_image_flags(self, image):
+    """Convert an array of encoded image flags into an array of image flags per direction
+
+    .. versionadded:: TBD
+
+    This is a vectorized alternative to
+    :py:meth:`lammps.decode_image_flags() <lammps.lammps.decode_image_flags()>`.
+    The last dimension of the result holds the image flags in x-, y-,
+    and z-direction.
+
+    :param image: encoded image flags
+    :type image:  lammps.imageint or numpy.array
+    :return: decoded image flags
+    :rtype: numpy.array with shape image.shape + (3,)
+    """
+    import numpy as np
+    imgmask, imgmax, imgbits, img2bits = self._image_constants()
+    np_imageint = self._ctype_to_numpy_int(self.lmp.c_imageint)
+
+    shifts = np.array([0, imgbits, img2bits], dtype=np_imageint)
+    image = np.asarray(image).astype(np_imageint, copy=False)
+    flags = (image[..., np.newaxis] >> shifts) & imgmask
+    return flags.astype(np.intc) - imgmax
+
+    # -------------------------------------------------------------------------
+
+  def unwrap(self, x, image):
+    """Compute unwrapped coordinates from wrapped coordinates and image flags
+
+    .. versionadded:: TBD
+
+    The image flags may be provided either encoded, e.g. as returned by
+    :py:meth:`extract_atom("image") <lammps.numpy_wrapper.numpy_wrapper.extract_atom()>`,
+    or already decoded as (N,3) array.  The box dimensions and, for
+    triclinic boxes, the tilt factors are taken from the current simulation
+    box, so that the unwrapped position is :math:`x + i_x \\vec{a} + i_y
+    \\vec{b} + i_z \\vec{c}` with :math:`\\vec{a}, \\vec{b}, \\vec{c}`
+    being the edge vectors of the box.
+
+    :param x: wrapped coordinates
+    :type x:  numpy.array(N,3)
+    :param image: encoded image flags or decoded image flags
+    :type image:  numpy.array(N) or numpy.array(N,3)
+    :return: unwrapped coordinates
+    :rtype: numpy.array(N,3)
+    """
+    import numpy as np
+    boxlo, boxhi, xy, yz, xz, periodicity, box_change = self.lmp.extract_box()
+    xprd, yprd, zprd = [hi - lo for lo, hi in zip(boxlo, boxhi)]
+    h = np.array([[xprd, 0.0, 0.0], [xy, yprd, 0.0], [xz, yz, zprd]])
+
+    image = np.asarray(image)
+    if image.ndim < 2 or image.shape[-1] != 3:
+      image = self.decode_image_flags(image)
+    return np.asarray(x, dtype=np.double) + image @ h
+
+    # -------------------------------------------------------------------------
+
+  def _topology_kind(self, kind):
+    try:
+      return self._topology_kinds[kind]
+    except KeyError:
+      raise KeyError("Unknown kind of bonded interaction: %s" % kind) from None
+
+    # -------------------------------------------------------------------------
+
+  def _gather_topology(self, kind, out):
+    import numpy as np
+    nglobal, ncols, gather = self._topology_kind(kind)
+    nrows = self.lmp.extract_global(nglobal)
+    np_tagint = self._ctype_to_numpy_int(self.lmp.c_tagint)
+
+    # reuse the provided buffer, if it is compatible and large enough
+    if out is None or out.dtype != np_tagint or out.ndim != 2 or out.shape[0] < nrows \
+       or out.shape[1] != ncols or not out.flags['C_CONTIGUOUS']:
+      out = np.empty((nrows, ncols), dtype=np_tagint)
+    if nrows > 0:
+      with ExceptionCheck(self.lmp):
+        getattr(self.lmp.lib, gather)(self.lmp.lmp, out.ctypes.data)
+    return out[:nrows]
+
+    # -------------------------------------------------------------------------
+
+  def gather_bonds(self, out=None):
     """Retrieve global list of bonds as a NumPy array
 
     .. versionadded:: 28Jul2021
 
+    .. versionchanged:: TBD
+
     This is a wrapper around :py:meth:`lammps.gather_bonds() <lammps.lammps.gather_bonds()>`.
     It behaves the same as the original method, but returns a NumPy array instead
-    of a ``ctypes`` list.
+    of a ``ctypes`` list.  If a suitable NumPy array is passed as *out*, the data
+    is written into it and a view of its first nbonds rows is returned.
+    Only the first rows of *out* are written; to keep its spare rows for later
+    calls, pass the original buffer again rather than the returned view.
 
+    :param out: buffer to store the data in (optional)
+    :type out:  numpy.array(N,3) of lammps.tagint
     :return: the requested data as a 2d-integer numpy array
     :rtype: numpy.array(nbonds,3)
     """
-    import numpy as np
-    nbonds, value = self.lmp.gather_bonds()
-    return np.ctypeslib.as_array(value).reshape(nbonds,3)
+    return self._gather_topology('bonds', out)
 
     # -------------------------------------------------------------------------
 
-  def gather_angles(self):
+  def gather_angles(self, out=None):
     """ Retrieve global list of angles as a NumPy array
 
     .. versionadded:: 8Feb2023
 
+    .. versionchanged:: TBD
+
     This is a wrapper around :py:meth:`lammps.gather_angles() <lammps.lammps.gather_angles()>`.
     It behaves the same as the original method, but returns a NumPy array instead
-    of a ``ctypes`` list.
+    of a ``ctypes`` list.  If a suitable NumPy array is passed as *out*, the data
+    is written into it and a view of its first nangles rows is returned.
+    Only the first rows of *out* are written; to keep its spare rows for later
+    calls, pass the original buffer again rather than the returned view.
 
+    :param out: buffer to store the data in (optional)
+    :type out:  numpy.array(N,4) of lammps.tagint
     :return: the requested data as a 2d-integer numpy array
     :rtype: numpy.array(nangles,4)
     """
-    import numpy as np
-    nangles, value = self.lmp.gather_angles()
-    return np.ctypeslib.as_array(value).reshape(nangles,4)
+    return self._gather_topology('angles', out)
 
     # -------------------------------------------------------------------------
 
-  def gather_dihedrals(self):
+  def gather_dihedrals(self, out=None):
     """ Retrieve global list of dihedrals as a NumPy array
 
     .. versionadded:: 8Feb2023
 
+    .. versionchanged:: TBD
+
     This is a wrapper around :py:meth:`lammps.gather_dihedrals() <lammps.lammps.gather_dihedrals()>`.
     It behaves the same as the original method, but returns a NumPy array instead
-    of a ``ctypes`` list.
+    of a ``ctypes`` list.  If a suitable NumPy array is passed as *out*, the data
+    is written into it and a view of its first ndihedrals rows is returned.
+    Only the first rows of *out* are written; to keep its spare rows for later
+    calls, pass the original buffer again rather than the returned view.
 
+    :param out: buffer to store the data in (optional)
+    :type out:  numpy.array(N,5) of lammps.tagint
     :return: the requested data as a 2d-integer numpy array
     :rtype: numpy.array(ndihedrals,5)
     """
-    import numpy as np
-    ndihedrals, value = self.lmp.gather_dihedrals()
-    return np.ctypeslib.as_array(value).reshape(ndihedrals,5)
+    return self._gather_topology('dihedrals', out)
 
     # -------------------------------------------------------------------------
 
-  def gather_impropers(self):
+  def gather_impropers(self, out=None):
     """ Retrieve global list of impropers as a NumPy array
 
     .. versionadded:: 8Feb2023
 
+    .. versionchanged:: TBD
+
     This is a wrapper around :py:meth:`lammps.gather_impropers() <lammps.lammps.gather_impropers()>`.
     It behaves the same as the original method, but returns a NumPy array instead
-    of a ``ctypes`` list.
+    of a ``ctypes`` list.  If a suitable NumPy array is passed as *out*, the data
+    is written into it and a view of its first nimpropers rows is returned.
+    Only the first rows of *out* are written; to keep its spare rows for later
+    calls, pass the original buffer again rather than the returned view.
 
+    :param out: buffer to store the data in (optional)
+    :type out:  numpy.array(N,5) of lammps.tagint
     :return: the requested data as a 2d-integer numpy array
     :rtype: numpy.array(nimpropers,5)
     """
-    import numpy as np
-    nimpropers, value = self.lmp.gather_impropers()
-    return np.ctypeslib.as_array(value).reshape(nimpropers,5)
+    return self._gather_topology('impropers', out)
+
+    # -------------------------------------------------------------------------
+
+  def topology_generation(self, kind):
+    """Return a counter that is incremented whenever the list of bonded interactions changes
+
+    .. versionadded:: TBD
+
+    The counter is maintained separately for each kind of bonded
+    interaction and each :py:class:`lammps <lammps.lammps>` instance.
+    Changes are detected by comparing the result of
+    :py:meth:`lammps.topology_checksum() <lammps.lammps.topology_checksum()>`
+    with the value from the previous call, so the counter is bumped on the
+    first query after a change, regardless of how many changes happened in
+    between.
+
+    :param kind: kind of bonded interaction: "bonds", "angles", "dihedrals", or "impropers"
+    :type kind:  string
+    :return: topology generation counter
+    :rtype: int
+    :raises KeyError: if *kind* is not a kind of bonded interaction
+    """
+    self._topology_kind(kind)
+    checksum = self.lmp.topology_checksum(kind)
+    last, generation = self._topology_generation.get(kind, (None, -1))
+    if checksum != last:
+      generation += 1
+      self._topology_generation[kind] = (checksum, generation)
+    return generation
+
+    # -------------------------------------------------------------------------
+
+  def gather_topology(self, kind, out=None, generation=None):
+    """Gather a list of bonded interactions into a reusable buffer, if it has changed
+
+    .. versionadded:: TBD
+
+    This combines :py:meth:`topology_generation()` with the gather
+    functions for bonds, angles, dihedrals, and impropers.  When the
+    current topology generation is equal to *generation* and *out* holds
+    the previously gathered data, the gather operation is skipped and
+    *out* is returned unchanged.  Otherwise the list is gathered into
+    *out*, or into a newly allocated array, if *out* is missing or too
+    small.  Only the array passed as *out* is written to, so a preallocated
+    buffer with spare rows must be kept and passed again by the caller for
+    its capacity to be reused.  Typical use is:
+
+    .. code-block:: python
+
+       gen, bonds = lmp.numpy.gather_topology("bonds")
+       while running:
+           lmp.command("run 100")
+           gen, bonds = lmp.numpy.gather_topology("bonds", bonds, gen)
+
+    :param kind: kind of bonded interaction: "bonds", "angles", "dihedrals", or "impropers"
+    :type kind:  string
+    :param out: buffer with the result of the previous call (optional)
+    :type out:  numpy.array
+    :param generation: topology generation of the data in *out* (optional)
+    :type generation:  int
+    :return: tuple with current topology generation and the list of bonded interactions
+    :rtype: (int, numpy.array)
+    :raises KeyError: if *kind* is not a kind of bonded interaction
+    """
+    current = self.topology_generation(kind)
+    if out is not None and generation == current:
+      return current, out
+    return current, self._gather_topology(kind, out)
 
     # -------------------------------------------------------------------------
 
@@ -385,7 +689,7 @@ class numpy_wrapper:
       raise Exception('per-atom energy dimension must be at least nlocal')
 
     c_double_p = POINTER(c_double)
-    value = eatom.astype(np.double)
+    value = np.ascontiguousarray(eatom, dtype=np.double)
     return self.lmp.lib.lammps_fix_external_set_energy_peratom(self.lmp.lmp, fix_id.encode(),
                                                                value.ctypes.data_as(c_double_p))
 
@@ -426,6 +730,54 @@ class numpy_wrapper:
 
     # -------------------------------------------------------------------------
 
+  def fix_external_get_energy_peratom(self, fix_id):
+    """Get access to the per-atom energy storage of a fix external instance with a given fix ID.
+
+    .. versionadded:: TBD
+
+    This function is a wrapper around the
+    :py:meth:`lammps.fix_external_get_energy_peratom() <lammps.lammps.fix_external_get_energy_peratom()>`
+    method.  It behaves the same as the original method, but returns a NumPy array instead
+    of a ``ctypes`` pointer.  Values assigned to the array are stored directly in the fix,
+    so no copy is made as with :py:meth:`fix_external_set_energy_peratom`.
+
+    :param fix_id:  Fix-ID of a fix external instance
+    :type: string
+    :return: per-atom energy of the local atoms or None if not tallied on this timestep
+    :rtype: numpy.array
+    """
+    value = self.lmp.fix_external_get_energy_peratom(fix_id)
+    if not value:
+      return None
+    nlocal = self.lmp.extract_setting('nlocal')
+    return self.darray(value,nlocal)
+
+    # -------------------------------------------------------------------------
+
+  def fix_external_get_virial_peratom(self, fix_id):
+    """Get access to the per-atom virial storage of a fix external instance with a given fix ID.
+
+    .. versionadded:: TBD
+
+    This function is a wrapper around the
+    :py:meth:`lammps.fix_external_get_virial_peratom() <lammps.lammps.fix_external_get_virial_peratom()>`
+    method.  It behaves the same as the original method, but returns a NumPy array instead
+    of a ``ctypes`` pointer.  Values assigned to the array are stored directly in the fix,
+    so no copy is made as with :py:meth:`fix_external_set_virial_peratom`.
+
+    :param fix_id:  Fix-ID of a fix external instance
+    :type: string
+    :return: per-atom virial of the local atoms or None if not tallied on this timestep
+    :rtype: numpy.array
+    """
+    value = self.lmp.fix_external_get_virial_peratom(fix_id)
+    if not value:
+      return None
+    nlocal = self.lmp.extract_setting('nlocal')
+    return self.darray(value,nlocal,6)
+
+    # -------------------------------------------------------------------------
+
   def get_neighlist(self, idx):
     """Returns an instance of :class:`NumPyNeighList` which wraps access to the neighbor list with the given index
 
@@ -0,0 +1,196 @@
+# ----------------------------------------------------------------------
+#   LAMMPS - Large-scale Atomic/Molecular Massively Parallel Simulator
+#   https://www.lammps.org/ Sandia National Laboratories
+#   LAMMPS Development team: developers@lammps.org
+#
+#   Copyright (2003) Sandia Corporation.  Under the terms of Contract
+#   DE-AC04-94AL85000 with Sandia Corporation, the U.S. Government retains
+#   certain rights in this software.  This software is distributed under
+#   the GNU General Public License.
+#
+#   See the README file in the top-level LAMMPS directory.
+# -------------------------------------------------------------------------
+
+################################################################################
+# Pool of persistent LAMMPS instances for ensembles of short runs
+################################################################################
+
+import os
+import shutil
+import tempfile
+import multiprocessing
+import multiprocessing.util
+from functools import partial
+
+from .core import lammps
+
+# default command line flags for the LAMMPS instances in the worker processes
+POOL_CMDARGS = ['-nocite', '-screen', 'none', '-log', 'none']
+
+# state of the LAMMPS instance owned by the current worker process
+_worker = None
+
+# -------------------------------------------------------------------------
+
+def _apply(lmp, commands):
+  """Execute a list of commands or call a function on a LAMMPS instance"""
+  if commands is None:
+    return
+  if callable(commands):
+    commands(lmp)
+  elif isinstance(commands, str):
+    lmp.commands_string(commands)
+  else:
+    lmp.commands_list(commands)
+
+# -------------------------------------------------------------------------
+
+class _PoolWorker:
+  """LAMMPS instance and cached base state of a single worker process"""
+
+  def __init__(self, name, cmdargs, setup, reset, tmpdir):
+    self.lmp = lammps(name=name, cmdargs=cmdargs)
+    self.reset_commands = reset
+    self.restart = None
+    self.dirty = False
+
+    _apply(self.lmp, setup)
+    if self.lmp.extract_setting('box_exist'):
+      self.restart = os.path.join(tmpdir, 'base.%d.restart' % os.getpid())
+      self.lmp.command('write_restart ' + self.restart)
+    _apply(self.lmp, reset)
+
+  def reset(self):
+    """Return the instance to the base state created by the setup"""
+    self.lmp.command('clear')
+    if self.restart:
+      self.lmp.command('read_restart ' + self.restart)
+    _apply(self.lmp, self.reset_commands)
+    self.dirty = False
+
+  def run(self, func, task):
+    if self.dirty:
+      self.reset()
+    self.dirty = True
+    return func(self.lmp, task)
+
+  def close(self):
+    self.lmp.close()
+    if self.restart and os.path.exists(self.restart):
+      os.remove(self.restart)
+
+# -------------------------------------------------------------------------
+
+def _init_worker(name, cmdargs, setup, reset, tmpdir):
+  global _worker
+  _worker = _PoolWorker(name, cmdargs, setup, reset, tmpdir)
+  # close the LAMMPS instance when the worker process exits
+  multiprocessing.util.Finalize(_worker, _worker.close, exitpriority=10)
+
+def _run_task(func, task):
+  return _worker.run(func, task)
+
+# -------------------------------------------------------------------------
+
+class LammpsPool:
+  """Pool of worker processes, each owning one persistent LAMMPS instance.
+
+  .. versionadded:: TBD
+
+  This is meant for ensembles of many short, independent runs such as
+  parameter sweeps, where the cost of creating a LAMMPS instance, reading
+  the initial configuration and setting up the force field would otherwise
+  be paid for every single run.  Each worker process creates its LAMMPS
+  instance once and then executes the *setup* on it.  If that creates a
+  simulation box, the resulting system is written to a restart file in a
+  temporary directory (on a RAM backed file system like ``/dev/shm`` when
+  available), which serves as the cached base state.
+
+  Tasks are executed by calling ``func(lmp, task)`` in one of the workers
+  and the return values are sent back to the calling process.  Before each
+  task except the first, the instance is reset to the base state with a
+  :doc:`clear <clear>` command, reading the cached restart and executing
+  *reset*.  The latter must re-create all settings that are not stored in
+  restart files, e.g. fixes, computes, or the coefficients of manybody
+  pair styles.  Both *setup* and *reset* may be a list of commands, a
+  string with multiple lines of commands, or a function that is called
+  with the LAMMPS instance as its argument.
+
+  Since functions and results are transferred between processes with
+  :py:mod:`pickle`, *func* must be defined at the top level of a module
+  and its return value must be picklable (so no ctypes pointers or NumPy
+  views of LAMMPS data).  The worker instances are created without MPI
+  communicator and thus should use a serial LAMMPS library or run as a
+  single MPI rank.
+
+  :param processes: number of worker processes (default: number of CPUs)
+  :type  processes: int
+  :param setup: commands or function to create the base state
+  :type  setup: list, str, or callable
+  :param reset: commands or function to apply after the base state is (re-)created
+  :type  reset: list, str, or callable
+  :param cmdargs: command line arguments for the LAMMPS instances
+  :type  cmdargs: list
+  :param name: machine suffix of the LAMMPS shared library
+  :type  name: str
+  :param context: :py:mod:`multiprocessing` start method, e.g. 'fork' or 'spawn'
+  :type  context: str
+  """
+
+  def __init__(self, processes=None, setup=None, reset=None, cmdargs=None, name='', context=None):
+    if cmdargs is None:
+      cmdargs = POOL_CMDARGS
+    if processes is None:
+      processes = os.cpu_count() or 1
+    self.processes = processes
+    shm = '/dev/shm'
+    self.tmpdir = tempfile.mkdtemp(prefix='lammps-pool-',
+                                   dir=shm if os.access(shm, os.W_OK) else None)
+    ctx = multiprocessing.get_context(context)
+    self.pool = ctx.Pool(processes, initializer=_init_worker,
+                         initargs=(name, cmdargs, setup, reset, self.tmpdir))
+
+  def __enter__(self):
+    return self
+
+  def __exit__(self, ex_type, ex_value, ex_traceback):
+    self.close()
+
+  def map(self, func, tasks, chunksize=1):
+    """Run all tasks and return the list of results in the order of the tasks
+
+    :param func: function called as ``func(lmp, task)`` for each task
+    :type  func: callable
+    :param tasks: task descriptions, e.g. parameters of a run
+    :type  tasks: iterable
+    :param chunksize: number of tasks sent to a worker at once
+    :type  chunksize: int
+    :return: list of the return values of *func*
+    :rtype: list
+    """
+    return self.pool.map(partial(_run_task, func), tasks, chunksize)
+
+  def imap(self, func, tasks, chunksize=1):
+    """Run tasks and iterate over the results in the order of the tasks
+
+    Same as :py:meth:`map`, but results are returned as soon as they and
+    the results of all preceding tasks are available.
+    """
+    return self.pool.imap(partial(_run_task, func), tasks, chunksize)
+
+  def imap_unordered(self, func, tasks, chunksize=1):
+    """Run tasks and iterate over the results in the order they complete
+
+    Same as :py:meth:`map`, but each result is returned as soon as it is
+    available.  To associate results with tasks, *func* should include
+    an identifier of the task in its return value.
+    """
+    return self.pool.imap_unordered(partial(_run_task, func), tasks, chunksize)
+
+  def close(self):
+    """Shut down the worker processes and remove the cached base states"""
+    if self.pool is not None:
+      self.pool.close()
+      self.pool.join()
+      self.pool = None
+    shutil.rmtree(self.tmpdir, ignore_errors=True)
@@ -380,5 +380,17 @@ void *FixExternal::extract(const char *str, int &dim)
     dim = 2;
     return (void *) fexternal;
   }
+
+  // per-atom energy and virial storage is only valid when it is tallied
+  // on the current timestep, i.e. from within the callback
+
+  if (strcmp(str, "eatom") == 0) {
+    dim = 1;
+    return eflag_atom ? (void *) eatom : nullptr;
+  }
+  if (strcmp(str, "vatom") == 0) {
+    dim = 2;
+    return vflag_atom ? (void *) vatom : nullptr;
+  }
   return nullptr;
 }
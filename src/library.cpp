@@ -1075,6 +1075,77 @@ void lammps_memory_usage(void *handle, double *meminfo)
 
 /* ---------------------------------------------------------------------- */
 
+/** Get the timing breakdown of the most recent run or minimization
+ *
+\verbatim embed:rst
+
+.. versionadded:: TBD
+
+This function retrieves the data of the "MPI task timing breakdown" table
+that LAMMPS prints at the end of a run or minimization.  The *timing*
+buffer is filled with 6 numbers for each of the 10 categories "Total",
+"Pair", "Bond", "Kspace", "Neigh", "Comm", "Output", "Modify", "Sync",
+and "Other" (in this order): the minimum, average, and maximum wall time
+across all MPI ranks followed by the minimum, average, and maximum CPU
+time.  "Other" is the part of the total time that is not accounted for
+by any of the other categories.
+
+The timers are reset at the beginning of each run, so the data refers
+only to the most recent run; calling this function while a run is in
+progress gives meaningless "Total" and "Other" times.  Per-category
+times are only collected with :doc:`timer normal <timer>` (the default)
+or :doc:`timer full <timer>` and CPU times only with *timer full*, the
+corresponding entries are zero otherwise.
+
+This function performs MPI collective operations and thus must be called
+on all MPI ranks of the LAMMPS instance.
+
+\endverbatim
+ *
+ * \param  handle  pointer to a previously created LAMMPS instance
+ * \param  timing  buffer with space for at least 60 doubles to store
+ * data in. */
+
+void lammps_get_timing(void *handle, double *timing)
+{
+  auto lmp = (LAMMPS *) handle;
+  Timer *timer = lmp->timer;
+  const Timer::ttype sections[] = {Timer::TOTAL,  Timer::PAIR,   Timer::BOND,
+                                   Timer::KSPACE, Timer::NEIGH,  Timer::COMM,
+                                   Timer::OUTPUT, Timer::MODIFY, Timer::SYNC};
+  constexpr int nsections = sizeof(sections) / sizeof(sections[0]);
+  constexpr int ncategories = nsections + 1;
+
+  double wall[ncategories], cpu[ncategories];
+  for (int i = 0; i < nsections; ++i) {
+    wall[i] = timer->get_wall(sections[i]);
+    cpu[i] = timer->get_cpu(sections[i]);
+  }
+  wall[nsections] = wall[0] - timer->get_wall(Timer::ALL);
+  cpu[nsections] = timer->has_full() ? cpu[0] - timer->get_cpu(Timer::ALL) : 0.0;
+
+  double wmin[ncategories], wsum[ncategories], wmax[ncategories];
+  double cmin[ncategories], csum[ncategories], cmax[ncategories];
+  MPI_Allreduce(wall, wmin, ncategories, MPI_DOUBLE, MPI_MIN, lmp->world);
+  MPI_Allreduce(wall, wsum, ncategories, MPI_DOUBLE, MPI_SUM, lmp->world);
+  MPI_Allreduce(wall, wmax, ncategories, MPI_DOUBLE, MPI_MAX, lmp->world);
+  MPI_Allreduce(cpu, cmin, ncategories, MPI_DOUBLE, MPI_MIN, lmp->world);
+  MPI_Allreduce(cpu, csum, ncategories, MPI_DOUBLE, MPI_SUM, lmp->world);
+  MPI_Allreduce(cpu, cmax, ncategories, MPI_DOUBLE, MPI_MAX, lmp->world);
+
+  const double nprocs = lmp->comm->nprocs;
+  for (int i = 0; i < ncategories; ++i) {
+    timing[6 * i] = wmin[i];
+    timing[6 * i + 1] = wsum[i] / nprocs;
+    timing[6 * i + 2] = wmax[i];
+    timing[6 * i + 3] = cmin[i];
+    timing[6 * i + 4] = csum[i] / nprocs;
+    timing[6 * i + 5] = cmax[i];
+  }
+}
+
+/* ---------------------------------------------------------------------- */
+
 /** Return current LAMMPS world communicator as integer
  *
 \verbatim embed:rst
@@ -4067,6 +4138,105 @@ void lammps_gather_impropers(void *handle, void *data)
   END_CAPTURE
 }
 
+/* ---------------------------------------------------------------------- */
+
+// 64-bit integer hash finalizer from the SplitMix64 random number generator
+
+static uint64_t topology_mix(uint64_t z)
+{
+  z = (z ^ (z >> 30)) * 0xbf58476d1ce4e5b9ULL;
+  z = (z ^ (z >> 27)) * 0x94d049bb133111ebULL;
+  return z ^ (z >> 31);
+}
+
+/** Compute a checksum of the global list of bonds, angles, dihedrals, or impropers
+ *
+\verbatim embed:rst
+
+.. versionadded:: TBD
+
+This function computes a 64-bit checksum of the same list of bonded
+interactions that would be returned by :cpp:func:`lammps_gather_bonds`,
+:cpp:func:`lammps_gather_angles`, :cpp:func:`lammps_gather_dihedrals`,
+or :cpp:func:`lammps_gather_impropers` for the keywords "bonds",
+"angles", "dihedrals", or "impropers", respectively.  The checksum
+does not depend on the order of the entries or how they are
+distributed across MPI ranks, so it only changes when the topology
+itself changes, e.g. due to bonds being created or broken by fixes
+like :doc:`fix bond/react <fix_bond_react>`.  Unlike the gather
+functions, this requires no global communication of the list itself
+and no global buffer, so it can be used to decide cheaply whether a
+previously gathered list needs to be refreshed.  The value is the same
+on all MPI ranks.  If the keyword is not recognized or there are no
+bonded interactions of the requested kind, 0 is returned.
+
+\endverbatim
+ *
+ * \param  handle   pointer to a previously created LAMMPS instance
+ * \param  keyword  string with the kind of bonded interaction
+ * \return          checksum of the list of bonded interactions */
+
+int64_t lammps_topology_checksum(void *handle, const char *keyword)
+{
+  auto lmp = (LAMMPS *) handle;
+  int64_t checksum = 0;
+
+  BEGIN_CAPTURE {
+    Atom *atom = lmp->atom;
+    int (AtomVec::*pack)(tagint **);
+    bigint ntotal;
+    int nitems;
+
+    if (strcmp(keyword,"bonds") == 0) {
+      ntotal = atom->nbonds;
+      pack = &AtomVec::pack_bond;
+      nitems = 3;
+    } else if (strcmp(keyword,"angles") == 0) {
+      ntotal = atom->nangles;
+      pack = &AtomVec::pack_angle;
+      nitems = 4;
+    } else if (strcmp(keyword,"dihedrals") == 0) {
+      ntotal = atom->ndihedrals;
+      pack = &AtomVec::pack_dihedral;
+      nitems = 5;
+    } else if (strcmp(keyword,"impropers") == 0) {
+      ntotal = atom->nimpropers;
+      pack = &AtomVec::pack_improper;
+      nitems = 5;
+    } else return 0;
+
+    if (ntotal == 0) return 0;
+
+    int nlocal = (atom->avec->*pack)(nullptr);
+    tagint **list;
+    // add 1 to nlocal, so "list" does not become a NULL pointer
+    lmp->memory->create(list, nlocal+1, nitems, "library:topology_checksum:list");
+    (atom->avec->*pack)(list);
+
+    // sum of per-entry hashes is independent of order and distribution
+
+    uint64_t mysum = 0;
+    for (int i = 0; i < nlocal; ++i) {
+      uint64_t hash = topology_mix(nitems);
+      for (int j = 0; j < nitems; ++j) hash = topology_mix(hash ^ (uint64_t) list[i][j]);
+      mysum += hash;
+    }
+    lmp->memory->destroy(list);
+
+    // reduce low and high 32-bit halves separately to avoid signed overflow
+
+    bigint mine[2], all[2];
+    mine[0] = (bigint) (mysum & 0xffffffffULL);
+    mine[1] = (bigint) (mysum >> 32);
+    MPI_Allreduce(mine, all, 2, MPI_LMP_BIGINT, MPI_SUM, lmp->world);
+    uint64_t sum = ((uint64_t) all[1] << 32) + (uint64_t) all[0];
+    checksum = (int64_t) sum;
+  }
+  END_CAPTURE
+
+  return checksum;
+}
+
 /** Gather the named per-atom, per-atom fix, per-atom compute, or fix property/atom-based entities
  *  from all processes, in order by atom ID.
  *
@@ -6740,6 +6910,95 @@ void lammps_fix_external_set_virial_peratom(void *handle, const char *id, double
   END_CAPTURE
 }
 
+/** Get pointer to the per-atom energy storage in a fix external instance with the given ID.
+
+\verbatim embed:rst
+
+.. versionadded:: TBD
+
+This is a companion function to :cpp:func:`lammps_set_fix_external_callback`
+and an alternative to :cpp:func:`lammps_fix_external_set_energy_peratom`.
+Instead of copying a caller provided array, the per-atom energy
+contribution of the external code can be written directly into the
+storage of the fix.  The returned array has ``nlocal`` elements and is
+zeroed before the callback function is called.
+
+The storage is only allocated and tallied when per-atom energies are
+requested on the current timestep, so this function must be called
+from within the callback function and will return a ``NULL`` pointer
+on all other timesteps.  It is compatible with "pf/callback" mode only.
+
+\endverbatim
+ *
+ * \param  handle   pointer to a previously created LAMMPS instance cast to ``void *``.
+ * \param  id       fix ID of fix external instance
+ * \return          a pointer to the per-atom energy array of the fix or ``NULL`` */
+
+double *lammps_fix_external_get_energy_peratom(void *handle, const char *id)
+{
+  auto lmp = (LAMMPS *) handle;
+  double *eatom = nullptr;
+
+  BEGIN_CAPTURE
+  {
+    auto fix = lmp->modify->get_fix_by_id(id);
+    if (!fix) lmp->error->all(FLERR,"Can not find fix with ID '{}'!", id);
+
+    if (strcmp("external",fix->style) != 0)
+      lmp->error->all(FLERR,"Fix '{}' is not of style external!", id);
+
+    int tmp;
+    eatom = (double *)fix->extract("eatom",tmp);
+  }
+  END_CAPTURE
+  return eatom;
+}
+
+/** Get pointer to the per-atom virial storage in a fix external instance with the given ID.
+
+\verbatim embed:rst
+
+.. versionadded:: TBD
+
+This is a companion function to :cpp:func:`lammps_set_fix_external_callback`
+and an alternative to :cpp:func:`lammps_fix_external_set_virial_peratom`.
+Instead of copying a caller provided array, the per-atom virial
+contribution of the external code can be written directly into the
+storage of the fix.  The returned array has the dimensions
+``double virial[nlocal][6]`` and is zeroed before the callback function
+is called.
+
+The storage is only allocated and tallied when per-atom virials are
+requested on the current timestep, so this function must be called
+from within the callback function and will return a ``NULL`` pointer
+on all other timesteps.  It is compatible with "pf/callback" mode only.
+
+\endverbatim
+ *
+ * \param  handle   pointer to a previously created LAMMPS instance cast to ``void *``.
+ * \param  id       fix ID of fix external instance
+ * \return          a pointer to the per-atom virial array of the fix or ``NULL`` */
+
+double **lammps_fix_external_get_virial_peratom(void *handle, const char *id)
+{
+  auto lmp = (LAMMPS *) handle;
+  double **vatom = nullptr;
+
+  BEGIN_CAPTURE
+  {
+    auto fix = lmp->modify->get_fix_by_id(id);
+    if (!fix) lmp->error->all(FLERR,"Can not find fix with ID '{}'!", id);
+
+    if (strcmp("external",fix->style) != 0)
+      lmp->error->all(FLERR,"Fix '{}' is not of style external!", id);
+
+    int tmp;
+    vatom = (double **)fix->extract("vatom",tmp);
+  }
+  END_CAPTURE
+  return vatom;
+}
+
 /** Set the vector length for a global vector stored with fix external for analysis
 
 \verbatim embed:rst
@@ -156,6 +156,7 @@ void lammps_extract_box(void *handle, double *boxlo, double *boxhi, double *xy,
 void lammps_reset_box(void *handle, double *boxlo, double *boxhi, double xy, double yz, double xz);
 
 void lammps_memory_usage(void *handle, double *meminfo);
+void lammps_get_timing(void *handle, double *timing);
 int lammps_get_mpi_comm(void *handle);
 
 int lammps_extract_setting(void *handle, const char *keyword);
@@ -203,6 +204,7 @@ void lammps_gather_bonds(void *handle, void *data);
 void lammps_gather_angles(void *handle, void *data);
 void lammps_gather_dihedrals(void *handle, void *data);
 void lammps_gather_impropers(void *handle, void *data);
+int64_t lammps_topology_checksum(void *handle, const char *keyword);
 
 void lammps_gather(void *handle, const char *name, int type, int count, void *data);
 void lammps_gather_concat(void *handle, const char *name, int type, int count, void *data);
@@ -292,6 +294,8 @@ void lammps_fix_external_set_energy_global(void *handle, const char *id, double
 void lammps_fix_external_set_energy_peratom(void *handle, const char *id, double *eng);
 void lammps_fix_external_set_virial_global(void *handle, const char *id, double *virial);
 void lammps_fix_external_set_virial_peratom(void *handle, const char *id, double **virial);
+double *lammps_fix_external_get_energy_peratom(void *handle, const char *id);
+double **lammps_fix_external_get_virial_peratom(void *handle, const char *id);
 void lammps_fix_external_set_vector_length(void *handle, const char *id, int len);
 void lammps_fix_external_set_vector(void *handle, const char *id, int idx, double val);
 
@@ -1,21 +1,94 @@
-#! /usr/bin/evn python2
+#! /usr/bin/env python3
 
 # This is amber2lammps, a program written by Keir E. Novik to convert
 # Amber files to Lammps files.
 #
 # Copyright 1999, 2000 Keir E. Novik; all rights reserved.
-# 
+#
 # Modified by Vikas Varshney, U Akron, 5 July 2005, as described in README
 # Bug Fixed :Third argument in Dihedral Coeffs section is an integer - Ketan S Khare September 26, 2011
 # Modified by Vikas Varshney, Oct 8, 2013 to include additional flags (Atomic_Number, Coulombic and van der Waals 1-4 factors which are included in newer versions of .top and .crd files in amber12.
+# Converted to Python 3 and NumPy: the .top file is split into its %FLAG
+# sections once and each section is parsed with its fixed-width %FORMAT,
+# the data file is formatted in bulk, one string operation per section.
+
+import math
+import os
+import re
+import sys
+from itertools import chain
+
+import numpy as np
+
+#============================================================
+
+def Parse_format(Format):
+    'Return count, type, and width of a Fortran format like 10I8 or 5E16.8'
+    Match = re.match(r'\(?\s*(\d*)\s*([aAiIeEfF])\s*(\d+)', Format)
+    if not Match:
+        raise ValueError('unsupported format ' + Format)
+    Count, Type, Width = Match.groups()
+    return int(Count or 1), Type.upper(), int(Width)
+
+#============================================================
+
+def Parse_fixed(Lines, Format):
+    'Parse lines of fixed-width fields into a NumPy array'
+    '''Fields are cut at multiples of the field width, so they need not
+    be separated by blanks.  Each line holds up to Count fields; a short
+    last line holds fewer.  Blanks past the last field are ignored and
+    a truncated last field is padded.  Integer and real fields are
+    converted with a single NumPy cast, character fields are returned
+    stripped.'''
+
+    Count, Type, Width = Parse_format(Format)
+
+    Text = []
+    for Line in Lines:
+        Line = Line.rstrip('\r\n')
+        Size = min(Count, -(-len(Line.rstrip()) // Width)) * Width
+        Text.append(Line[:Size].ljust(Size))
+    Fields = np.frombuffer(''.join(Text).encode(), dtype='S%d' % Width)
+
+    if Type == 'I':
+        return Fields.astype(np.int64)
+    if Type in 'EF':
+        return Fields.astype(np.float64)
+    return np.char.strip(Fields.astype('U%d' % Width))
+
+#============================================================
+
+def Split_sections(Lines):
+    'Return a dictionary of %FLAG name: (%FORMAT, list of data lines)'
+    Sections = {}
+    Flag = None
+    for Line in Lines:
+        if Line.startswith('%FLAG'):
+            Flag = Line.split()[1]
+            Sections[Flag] = ['', []]
+        elif Line.startswith('%FORMAT'):
+            if Flag is not None:
+                Sections[Flag][0] = Line[7:].strip()
+        elif Line.startswith('%'):
+            continue
+        elif Flag is not None:
+            Sections[Flag][1].append(Line)
+    return Sections
 
 #============================================================
 
-def Pop(S, I=-1):
-    'Pop item I from list'
-    X = S[I]
-    del S[I]
-    return X
+def Format_section(Name, Columns):
+    'Return the lines of a data file section, numbered from 1'
+    '''Columns is a list of NumPy arrays, one value per entry.  Integer
+    columns are written with %d, real columns with repr(), i.e. with
+    all significant digits.'''
+
+    N = len(Columns[0])
+    Format = '%d' + ''.join([' %d' if Column.dtype.kind in 'iub' else ' %r'
+                             for Column in Columns]) + '\n'
+    Values = zip(range(1, N + 1), *[Column.tolist() for Column in Columns])
+    return [Name + '\n\n', (Format * N) % tuple(chain.from_iterable(Values)),
+            '\n']
 
 #============================================================
 
@@ -25,154 +98,234 @@ class Lammps:
 
     def Dump(self):
         'Write out contents of self (intended for debugging)'
-        Name_list = self.__dict__.keys()
-        Name_list.sort()
-        for Name in Name_list:
-            print Name + ':', self.__dict__[Name]
+        for Name in sorted(self.__dict__):
+            print(Name + ':', self.__dict__[Name])
 
     #--------------------------------------------------------
 
     def Write_data(self, Basename, Item_list):
         'Write the Lammps data to file (used by Write_Lammps)'
-        import os, sys
 
         Filename = 'data.' + Basename
 
         Dir_list = os.listdir('.')
         i = 1
         while Filename in Dir_list:
-            Filename = 'data' + `i` + '.' + Basename
+            Filename = 'data' + repr(i) + '.' + Basename
             i = i +1
         del i
 
-        print 'Writing', Filename + '...',
+        print('Writing', Filename + '...', end=' ')
         sys.stdout.flush()
 
         try:
             F = open(Filename, 'w')
-        except IOError, Detail:
-            print '(error:', Detail[1] + '!)'
+        except IOError as Detail:
+            print('(error:', Detail.strerror + '!)')
             return
 
         try:
             F.writelines(Item_list)
-        except IOError, Detail:
-            print '(error:', Detail[1] + '!)'
+        except IOError as Detail:
+            print('(error:', Detail.strerror + '!)')
             F.close()
             return
 
         F.close()
-        print 'done.'
+        print('done.')
 
     #--------------------------------------------------------
 
     def Write_Lammps(self, Basename):
         'Write the Lammps data file, ignoring blank sections'
-        import string
         L = []
 
         L.append('LAMMPS data file for ' + self.name + '\n\n')
 
-        L.append(`self.atoms` + ' atoms\n')
-        L.append(`self.bonds` + ' bonds\n')
-        L.append(`self.angles` + ' angles\n')
-        L.append(`self.dihedrals` + ' dihedrals\n')
-        L.append(`self.impropers` + ' impropers\n\n')
-
-        L.append(`self.atom_types` + ' atom types\n')
-	if self.bonds > 0:
-            L.append(`self.bond_types` + ' bond types\n')
-	if self.angles > 0:
-            L.append(`self.angle_types` + ' angle types\n')
-	if self.dihedrals > 0:
-            L.append(`self.dihedral_types` + ' dihedral types\n')
-	L.append('\n')
-        
-        L.append(`self.xlo` + ' ' + `self.xhi` + ' xlo xhi\n')
-        L.append(`self.ylo` + ' ' + `self.yhi` + ' ylo yhi\n')
-        L.append(`self.zlo` + ' ' + `self.zhi` + ' zlo zhi\n\n')
+        L.append(repr(self.atoms) + ' atoms\n')
+        L.append(repr(self.bonds) + ' bonds\n')
+        L.append(repr(self.angles) + ' angles\n')
+        L.append(repr(self.dihedrals) + ' dihedrals\n')
+        L.append(repr(self.impropers) + ' impropers\n\n')
+
+        L.append(repr(self.atom_types) + ' atom types\n')
+        if self.bonds > 0:
+            L.append(repr(self.bond_types) + ' bond types\n')
+        if self.angles > 0:
+            L.append(repr(self.angle_types) + ' angle types\n')
+        if self.dihedrals > 0:
+            L.append(repr(self.dihedral_types) + ' dihedral types\n')
+        L.append('\n')
+
+        L.append(repr(self.xlo) + ' ' + repr(self.xhi) + ' xlo xhi\n')
+        L.append(repr(self.ylo) + ' ' + repr(self.yhi) + ' ylo yhi\n')
+        L.append(repr(self.zlo) + ' ' + repr(self.zhi) + ' zlo zhi\n\n')
 
         if self.atom_types != 0:
-            L.append('Masses\n\n')
-            for i in range(self.atom_types):
-                L.append(`i+1` + ' ' + `self.Masses[i]` + '\n')
-            L.append('\n')
-
-            L.append('Pair Coeffs\n\n')
-            for i in range(self.atom_types):
-                L.append(`i+1`)
-                for j in range(len(self.Nonbond_Coeffs[0])):
-                    L.append(' ' + `self.Nonbond_Coeffs[i][j]`)
-                L.append('\n')
-            L.append('\n')
+            L += Format_section('Masses', [self.Masses])
+            L += Format_section('Pair Coeffs', self.Nonbond_Coeffs)
 
         if self.bonds != 0 and self.bond_types != 0:
-            L.append('Bond Coeffs\n\n')
-            for i in range(self.bond_types):
-                L.append(`i+1`)
-                for j in range(len(self.Bond_Coeffs[0])):
-                    L.append(' ' + `self.Bond_Coeffs[i][j]`)
-                L.append('\n')
-            L.append('\n')
+            L += Format_section('Bond Coeffs', self.Bond_Coeffs)
 
         if self.angles != 0 and self.angle_types != 0:
-            L.append('Angle Coeffs\n\n')
-            for i in range(self.angle_types):
-                L.append(`i+1`)
-                for j in range(len(self.Angle_Coeffs[0])):
-                    L.append(' ' + `self.Angle_Coeffs[i][j]`)
-                L.append('\n')
-            L.append('\n')
+            L += Format_section('Angle Coeffs', self.Angle_Coeffs)
 
         if self.dihedrals != 0 and self.dihedral_types != 0:
-            L.append('Dihedral Coeffs\n\n')
-            for i in range(self.dihedral_types):
-                L.append(`i+1`)
-                for j in range(len(self.Dihedral_Coeffs[0])):
-                    L.append(' ' + `self.Dihedral_Coeffs[i][j]`)
-                L.append('\n')
-            L.append('\n')
+            L += Format_section('Dihedral Coeffs', self.Dihedral_Coeffs)
 
         if self.atoms != 0:
-            L.append('Atoms\n\n')
-            for i in range(self.atoms):
-                L.append(`i+1`)
-                for j in range(len(self.Atoms[0])):
-                    L.append(' ' + `self.Atoms[i][j]`)
-                L.append('\n')
-            L.append('\n')
+            L += Format_section('Atoms', self.Atoms)
 
         if self.bonds != 0 and self.bond_types != 0:
-            L.append('Bonds\n\n')
-            for i in range(self.bonds):
-                L.append(`i+1`)
-                for j in range(len(self.Bonds[0])):
-                    L.append(' ' + `self.Bonds[i][j]`)
-                L.append('\n')
-            L.append('\n')
+            L += Format_section('Bonds', self.Bonds)
 
         if self.angles != 0 and self.angle_types != 0:
-            L.append('Angles\n\n')
-            for i in range(self.angles):
-                L.append(`i+1`)
-                for j in range(len(self.Angles[0])):
-                    L.append(' ' + `self.Angles[i][j]`)
-                L.append('\n')
-            L.append('\n')
+            L += Format_section('Angles', self.Angles)
 
         if self.dihedrals != 0 and self.dihedral_types != 0:
-            L.append('Dihedrals\n\n')
-            for i in range(self.dihedrals):
-                L.append(`i+1`)
-                for j in range(len(self.Dihedrals[0])):
-                    L.append(' ' + `self.Dihedrals[i][j]`)
-                L.append('\n')
-            L.append('\n')
+            L += Format_section('Dihedrals', self.Dihedrals)
 
         self.Write_data(Basename, L)
 
 #============================================================
 
+# Sections of the .top file read by Read_TOP, in the order of the file:
+# %FLAG name, attribute name(s), number of values per attribute,
+# condition for the section to be required, and message to print.
+# Sections with several attributes hold one tuple per entry.
+
+TOP_sections = [
+    ('ATOM_NAME', ('IGRAPH',), lambda a: a.NATOM, None, None),
+    ('CHARGE', ('CHRG',), lambda a: a.NATOM, None,
+     'Reading Charges...'),
+    ('ATOMIC_NUMBER', ('ANUMBER',), lambda a: a.NATOM, None,
+     'Reading Atomic Number...'),
+    ('MASS', ('AMASS',), lambda a: a.NATOM, None,
+     'Reading Atomic Masses...'),
+    ('ATOM_TYPE_INDEX', ('IAC',), lambda a: a.NATOM, None,
+     'Reading Atom Types...'),
+    ('NUMBER_EXCLUDED_ATOMS', ('NUMEX',), lambda a: a.NATOM, None,
+     'Reading Excluded Atoms...'),
+    ('NONBONDED_PARM_INDEX', ('ICO',), lambda a: a.NTYPES**2, None,
+     'Reading Non-bonded Parameter Index...'),
+    ('RESIDUE_LABEL', ('LABRES',), lambda a: a.NRES, None,
+     'Reading Residue Labels...'),
+    ('RESIDUE_POINTER', ('IPRES',), lambda a: a.NRES, None,
+     'Reading Residues Starting Pointers...'),
+    ('BOND_FORCE_CONSTANT', ('RK',), lambda a: a.NUMBND, None,
+     'Reading Bond Force Constants...'),
+    ('BOND_EQUIL_VALUE', ('REQ',), lambda a: a.NUMBND, None,
+     'Reading Equilibrium Bond Values...'),
+    ('ANGLE_FORCE_CONSTANT', ('TK',), lambda a: a.NUMANG, None,
+     'Reading Angle Force Constants...'),
+    ('ANGLE_EQUIL_VALUE', ('TEQ',), lambda a: a.NUMANG, None,
+     'Reading Equilibrium Angle Values...'),
+    ('DIHEDRAL_FORCE_CONSTANT', ('PK',), lambda a: a.NPTRA, None,
+     'Reading Dihedral Force Constants...'),
+    ('DIHEDRAL_PERIODICITY', ('PN',), lambda a: a.NPTRA, None,
+     'Reading Dihedral Periodicity...'),
+    ('DIHEDRAL_PHASE', ('PHASE',), lambda a: a.NPTRA, None,
+     'Reading Dihedral Phase...'),
+    ('SCEE_SCALE_FACTOR', ('SCEEFAC',), lambda a: a.NPTRA, None,
+     'Reading 1-4 Electrostatic Scaling Factor...'),
+    ('SCNB_SCALE_FACTOR', ('SCNBFAC',), lambda a: a.NPTRA, None,
+     'Reading 1-4 Van der Waals Scaling Factor...'),
+    ('SOLTY', ('SOLTY',), lambda a: a.NATYP, None,
+     'Reading Solty...'),
+    ('LENNARD_JONES_ACOEF', ('CN1',), lambda a: a.NTYPES*(a.NTYPES+1)//2,
+     None, 'Reading LJ A Coefficient...'),
+    ('LENNARD_JONES_BCOEF', ('CN2',), lambda a: a.NTYPES*(a.NTYPES+1)//2,
+     None, 'Reading LJ B Coefficient...'),
+    ('BONDS_INC_HYDROGEN', ('IBH', 'JBH', 'ICBH'), lambda a: a.NBONH, None,
+     'Reading Bonds which include hydrogen...'),
+    ('BONDS_WITHOUT_HYDROGEN', ('IB', 'JB', 'ICB'), lambda a: a.NBONA, None,
+     'Reading Bonds which dont include hydrogen...'),
+    ('ANGLES_INC_HYDROGEN', ('ITH', 'JTH', 'KTH', 'ICTH'),
+     lambda a: a.NTHETH, None,
+     'Reading Angles which include hydrogen...'),
+    ('ANGLES_WITHOUT_HYDROGEN', ('IT', 'JT', 'KT', 'ICT'),
+     lambda a: a.NTHETA, None,
+     'Reading Angles which dont include hydrogen...'),
+    ('DIHEDRALS_INC_HYDROGEN', ('IPH', 'JPH', 'KPH', 'LPH', 'ICPH'),
+     lambda a: a.NPHIH, None,
+     'Reading Dihedrals which include hydrogen...'),
+    ('DIHEDRALS_WITHOUT_HYDROGEN', ('IP', 'JP', 'KP', 'LP', 'ICP'),
+     lambda a: a.NPHIA, None,
+     'Reading Dihedrals which dont include hydrogen...'),
+    ('EXCLUDED_ATOMS_LIST', ('NATEX',), lambda a: a.NEXT, None,
+     'Reading Excluded Atom List...'),
+    ('HBOND_ACOEF', ('ASOL',), lambda a: a.NPHB, None,
+     'Reading H-Bond A Coefficient, corresponding to r**12 term for all possible types...'),
+    ('HBOND_BCOEF', ('BSOL',), lambda a: a.NPHB, None,
+     'Reading H-Bond B Coefficient, corresponding to r**10 term for all possible types...'),
+    ('HBCUT', ('HBCUT',), lambda a: a.NPHB, None,
+     'Reading H-Bond Cut...'),
+    ('AMBER_ATOM_TYPE', ('ISYMBL',), lambda a: a.NATOM, None,
+     'Reading Amber Atom Types for each atom...'),
+    ('TREE_CHAIN_CLASSIFICATION', ('ITREE',), lambda a: a.NATOM, None,
+     'Reading Tree Chain Classification...'),
+    ('JOIN_ARRAY', ('JOIN',), lambda a: a.NATOM, None,
+     'Reading Join Array: Tree joining information'),
+    ('IROTAT', ('IROTAT',), lambda a: a.NATOM, None,
+     'Reading IRotate...'),
+    ('SOLVENT_POINTERS', ('SOLVENT_POINTERS',), lambda a: 3,
+     lambda a: a.IFBOX > 0,
+     'Reading final residue which is part of solute, total number of molecules, first solvent molecule index...'),
+    ('ATOMS_PER_MOLECULE', ('NSP',), lambda a: a.NSPM,
+     lambda a: a.IFBOX > 0,
+     'Reading atom per molecule...'),
+    ('BOX_DIMENSIONS', ('BOX_DIMENSIONS',), lambda a: 4,
+     lambda a: a.IFBOX > 0,
+     'Reading Box Dimensions...'),
+    ('CAP_INFO', ('NATCAP',), lambda a: 1, lambda a: a.IFCAP > 0,
+     'Reading ICAP variables::: For details, refer to online AMBER format manual'),
+    ('CAP_INFO2', ('CAP_INFO2',), lambda a: 4, lambda a: a.IFCAP > 0,
+     None),
+    ('PERT_BOND_ATOMS', ('IBPER', 'JBPER'), lambda a: a.NBPER,
+     lambda a: a.IFPERT > 0,
+     'Reading perturb variables, 1. Bond, 2. Angles, 3. Dihedrals, etc etc.::: For details, refer to online AMBER format manual'),
+    ('PERT_BOND_PARAMS', ('ICBPER',), lambda a: 2 * a.NBPER,
+     lambda a: a.IFPERT > 0, None),
+    ('PERT_ANGLE_ATOMS', ('ITPER', 'JTPER', 'KTPER'), lambda a: a.NGPER,
+     lambda a: a.IFPERT > 0, None),
+    ('PERT_ANGLE_PARAMS', ('ICTPER',), lambda a: 2 * a.NGPER,
+     lambda a: a.IFPERT > 0, None),
+    ('PERT_DIHEDRAL_ATOMS', ('IPPER', 'JPPER', 'KPPER', 'LPPER'),
+     lambda a: a.NDPER, lambda a: a.IFPERT > 0, None),
+    ('PERT_DIHEDRAL_PARAMS', ('ICPPER',), lambda a: 2 * a.NDPER,
+     lambda a: a.IFPERT > 0, None),
+    ('PERT_RESIDUE_NAME', ('LABRES_PERT',), lambda a: a.NRES,
+     lambda a: a.IFPERT > 0, None),
+    ('PERT_ATOM_NAME', ('IGRPER',), lambda a: a.NATOM,
+     lambda a: a.IFPERT > 0, None),
+    ('PERT_ATOM_SYMBOL', ('ISMPER',), lambda a: a.NATOM,
+     lambda a: a.IFPERT > 0, None),
+    ('ALMPER', ('ALMPER',), lambda a: a.NATOM,
+     lambda a: a.IFPERT > 0, None),
+    ('IAPER', ('IAPER',), lambda a: a.NATOM,
+     lambda a: a.IFPERT > 0, None),
+    ('PERT_ATOM_TYPE_INDEX', ('IACPER',), lambda a: a.NATOM,
+     lambda a: a.IFPERT > 0, None),
+    ('PERT_CHARGE', ('CGPER',), lambda a: a.NATOM,
+     lambda a: a.IFPERT > 0, None),
+    ('POLARIZABILITY', ('ATPOL',), lambda a: a.NATOM,
+     lambda a: a.IPOL == 1,
+     'Reading Polarizability Data. For details, refer to online AMBER format manual'),
+    ('PERT_POLARIZABILITY', ('ATPOL1',), lambda a: a.NATOM,
+     lambda a: a.IPOL == 1 and a.IFPERT == 1, None),
+]
+
+# Names of the values in the POINTERS section, in order
+
+TOP_pointers = ['NATOM', 'NTYPES', 'NBONH', 'MBONA', 'NTHETH', 'MTHETA',
+                'NPHIH', 'MPHIA', 'NHPARM', 'NPARM', 'NEXT', 'NRES',
+                'NBONA', 'NTHETA', 'NPHIA', 'NUMBND', 'NUMANG', 'NPTRA',
+                'NATYP', 'NPHB', 'IFPERT', 'NBPER', 'NGPER', 'NDPER',
+                'MBPER', 'MGPER', 'MDPER', 'IFBOX', 'NMXRS', 'IFCAP']
+
+#============================================================
+
 class Amber:
     def __init__(self):
         'Initialize the Amber class'
@@ -183,21 +336,17 @@ class Amber:
 
     def Dump(self):
         'Write out contents of self (intended for debugging)'
-        Name_list = self.__dict__.keys()
-        Name_list.sort()
-        for Name in Name_list:
-            print Name + ':', self.__dict__[Name]
+        for Name in sorted(self.__dict__):
+            print(Name + ':', self.__dict__[Name])
 
     #--------------------------------------------------------
 
     def Coerce_to_Lammps(self):
         'Return the Amber data converted to Lammps format'
 
-        import math
-
         if self.CRD_is_read and self.TOP_is_read:
             l = Lammps()
-            print 'Converting...',
+            print('Converting...', end=' ')
 
             l.name = self.ITITL
             l.atoms = self.NATOM
@@ -210,726 +359,295 @@ class Amber:
             l.angle_types = self.NUMANG
             l.dihedral_types = self.NPTRA
 
+            X = self.X
+            Y = self.Y
+            Z = self.Z
+
             Shift = 0
-            if self.__dict__.has_key('BOX'):
+            if 'BOX' in self.__dict__:
                 l.xlo = 0.0
                 l.xhi = self.BOX[0]
                 l.ylo = 0.0
                 l.yhi = self.BOX[1]
                 l.zlo = 0.0
                 l.zhi = self.BOX[2]
-                if (l.xlo > min(self.X)) or (l.xhi < max(self.X)) or \
-                   (l.ylo > min(self.Y)) or (l.yhi < max(self.Y)) or \
-                   (l.zlo > min(self.Z)) or (l.zhi < max(self.Z)):
-                    #  Vikas Modification: Disabling Shifting. This means I am intend to send exact coordinates of each atom and let LAMMPS 
-                    #  take care of imaging into periodic image cells. If one wants to shift all atoms in the periodic box, 
+                if (l.xlo > X.min()) or (l.xhi < X.max()) or \
+                   (l.ylo > Y.min()) or (l.yhi < Y.max()) or \
+                   (l.zlo > Z.min()) or (l.zhi < Z.max()):
+                    #  Vikas Modification: Disabling Shifting. This means I am intend to send exact coordinates of each atom and let LAMMPS
+                    #  take care of imaging into periodic image cells. If one wants to shift all atoms in the periodic box,
                     #  please uncomment the below 2 lines.
-	            print '(warning: Currently not shifting the atoms to the periodic box)' 
+                    print('(warning: Currently not shifting the atoms to the periodic box)')
                     #Shift = 1
             else:
-                print '(warning: Guessing at periodic box!)',
-                l.xlo = min(self.X)
-                l.xhi = max(self.X)
-                l.ylo = min(self.Y)
-                l.yhi = max(self.Y)
-                l.zlo = min(self.Z)
-                l.zhi = max(self.Z)
+                print('(warning: Guessing at periodic box!)', end=' ')
+                l.xlo = float(X.min())
+                l.xhi = float(X.max())
+                l.ylo = float(Y.min())
+                l.yhi = float(Y.max())
+                l.zlo = float(Z.min())
+                l.zhi = float(Z.max())
 
             # This doesn't check duplicate values
-            l.Masses = []
-            for i in range(l.atom_types):
-                l.Masses.append(0)
-            for i in range(self.NATOM):
-                l.Masses[self.IAC[i] - 1] = self.AMASS[i]
-
-            l.Nonbond_Coeffs = []
-            for i in range(self.NTYPES):
-                l.Nonbond_Coeffs.append([0,0])
-            for i in range(self.NTYPES):
-                j = self.ICO[i * (self.NTYPES + 1)] - 1
-                if self.CN1[j] == 0.0:
-                    l.Nonbond_Coeffs[i][0] = 0.0
-                else:
-                    l.Nonbond_Coeffs[i][0] = \
-                                0.25 * (self.CN2[j])**2 / self.CN1[j]
-                if self.CN2[j] == 0.0:
-                    l.Nonbond_Coeffs[i][1] = 0.0
-                else:
-                    l.Nonbond_Coeffs[i][1] = \
-                                (self.CN1[j] / self.CN2[j])**(1.0/6.0)
-
-            l.Bond_Coeffs = []
-            for i in range(self.NUMBND):
-                l.Bond_Coeffs.append([0,0])
-            for i in range(self.NUMBND):
-                l.Bond_Coeffs[i][0] = self.RK[i]
-                l.Bond_Coeffs[i][1] = self.REQ[i]
-
-            l.Angle_Coeffs = []
-            for i in range(self.NUMANG):
-                l.Angle_Coeffs.append([0,0])
-            for i in range(self.NUMANG):
-                l.Angle_Coeffs[i][0] = self.TK[i]
-                l.Angle_Coeffs[i][1] = (180/math.pi) * self.TEQ[i]
-
-            l.Dihedral_Coeffs = []
-            for i in range(self.NPTRA):
-                l.Dihedral_Coeffs.append([0,0,0])
-            for i in range(self.NPTRA):
-                l.Dihedral_Coeffs[i][0] = self.PK[i]
-                if self.PHASE[i] == 0:
-                    l.Dihedral_Coeffs[i][1] = 1
-                else:
-                    l.Dihedral_Coeffs[i][1] = -1
-                l.Dihedral_Coeffs[i][2] = int(self.PN[i])
-
-            l.Atoms = []
-            for i in range(self.NATOM):
-                x = self.X[i]
-                y = self.Y[i]
-                z = self.Z[i]
-                if Shift:
-                    while x < l.xlo:
-                        x = x + self.BOX[0]
-                    while x > l.xhi:
-                        x = x - self.BOX[0]
-                    while y < l.ylo:
-                        y = y + self.BOX[1]
-                    while y > l.yhi:
-                        y = y - self.BOX[1]
-                    while z < l.zlo:
-                        z = z + self.BOX[2]
-                    while z > l.zhi:
-                        z = z - self.BOX[2]
-                l.Atoms.append([0, self.IAC[i], self.CHRG[i]/18.2223, \
-                                x, y, z])
-
-            l.Bonds = []
-            for i in range(l.bonds):
-                l.Bonds.append([0,0,0])
-            for i in range(self.NBONH):
-                l.Bonds[i][0] = self.ICBH[i]
-                l.Bonds[i][1] = abs(self.IBH[i])/3 + 1
-                l.Bonds[i][2] = abs(self.JBH[i])/3 + 1
-            for i in range(self.NBONA):
-                l.Bonds[self.NBONH + i][0] = self.ICB[i]
-                l.Bonds[self.NBONH + i][1] = abs(self.IB[i])/3 + 1
-                l.Bonds[self.NBONH + i][2] = abs(self.JB[i])/3 + 1
-
-            l.Angles = []
-            for i in range(l.angles):
-                l.Angles.append([0,0,0,0])
-            for i in range(self.NTHETH):
-                l.Angles[i][0] = self.ICTH[i]
-                l.Angles[i][1] = abs(self.ITH[i])/3 + 1
-                l.Angles[i][2] = abs(self.JTH[i])/3 + 1
-                l.Angles[i][3] = abs(self.KTH[i])/3 + 1
-            for i in range(self.NTHETA):
-                l.Angles[self.NTHETH + i][0] = self.ICT[i]
-                l.Angles[self.NTHETH + i][1] = abs(self.IT[i])/3 + 1
-                l.Angles[self.NTHETH + i][2] = abs(self.JT[i])/3 + 1
-                l.Angles[self.NTHETH + i][3] = abs(self.KT[i])/3 + 1
-
-            l.Dihedrals = []
-            for i in range(l.dihedrals):
-                l.Dihedrals.append([0,0,0,0,0])
-            for i in range(self.NPHIH):
-                l.Dihedrals[i][0] = self.ICPH[i]
-                l.Dihedrals[i][1] = abs(self.IPH[i])/3 + 1
-                l.Dihedrals[i][2] = abs(self.JPH[i])/3 + 1
-                l.Dihedrals[i][3] = abs(self.KPH[i])/3 + 1
-                l.Dihedrals[i][4] = abs(self.LPH[i])/3 + 1
-            for i in range(self.NPHIA):
-                l.Dihedrals[self.NPHIH + i][0] = self.ICP[i]
-                l.Dihedrals[self.NPHIH + i][1] = abs(self.IP[i])/3 + 1
-                l.Dihedrals[self.NPHIH + i][2] = abs(self.JP[i])/3 + 1
-                l.Dihedrals[self.NPHIH + i][3] = abs(self.KP[i])/3 + 1
-                l.Dihedrals[self.NPHIH + i][4] = abs(self.LP[i])/3 + 1
-
-            print 'done.'
+            l.Masses = np.zeros(l.atom_types)
+            l.Masses[self.IAC - 1] = self.AMASS
+
+            j = self.ICO[np.arange(self.NTYPES) * (self.NTYPES + 1)] - 1
+            CN1 = self.CN1[j]
+            CN2 = self.CN2[j]
+            with np.errstate(divide='ignore', invalid='ignore'):
+                Epsilon = np.where(CN1 == 0.0, 0.0, 0.25 * CN2**2 / CN1)
+                Sigma = np.where(CN2 == 0.0, 0.0, (CN1 / CN2)**(1.0/6.0))
+            l.Nonbond_Coeffs = [Epsilon, Sigma]
+
+            l.Bond_Coeffs = [self.RK, self.REQ]
+
+            l.Angle_Coeffs = [self.TK, (180/math.pi) * self.TEQ]
+
+            l.Dihedral_Coeffs = [self.PK, np.where(self.PHASE == 0, 1, -1),
+                                 self.PN.astype(np.int64)]
+
+            if Shift:
+                X = l.xlo + np.mod(X - l.xlo, self.BOX[0])
+                Y = l.ylo + np.mod(Y - l.ylo, self.BOX[1])
+                Z = l.zlo + np.mod(Z - l.zlo, self.BOX[2])
+            l.Atoms = [np.zeros(self.NATOM, dtype=np.int64), self.IAC,
+                       self.CHRG/18.2223, X, Y, Z]
+
+            # Atom indices in the .top file are 3 * (atom number - 1),
+            # negative for some dihedrals
+
+            def Atom(I):
+                return np.abs(I)//3 + 1
+
+            l.Bonds = [np.concatenate(Column) for Column in
+                       ((self.ICBH, self.ICB[:self.NBONA]),
+                        (Atom(self.IBH), Atom(self.IB[:self.NBONA])),
+                        (Atom(self.JBH), Atom(self.JB[:self.NBONA])))]
+
+            l.Angles = [np.concatenate(Column) for Column in
+                        ((self.ICTH, self.ICT[:self.NTHETA]),
+                         (Atom(self.ITH), Atom(self.IT[:self.NTHETA])),
+                         (Atom(self.JTH), Atom(self.JT[:self.NTHETA])),
+                         (Atom(self.KTH), Atom(self.KT[:self.NTHETA])))]
+
+            l.Dihedrals = [np.concatenate(Column) for Column in
+                           ((self.ICPH, self.ICP[:self.NPHIA]),
+                            (Atom(self.IPH), Atom(self.IP[:self.NPHIA])),
+                            (Atom(self.JPH), Atom(self.JP[:self.NPHIA])),
+                            (Atom(self.KPH), Atom(self.KP[:self.NPHIA])),
+                            (Atom(self.LPH), Atom(self.LP[:self.NPHIA])))]
+
+            print('done.')
             return l
         else:
-            print '(Error: Not all the Amber data has been read!)'
-    
+            print('(Error: Not all the Amber data has been read!)')
+
     #--------------------------------------------------------
 
     def Read_data(self, Filename):
-        'Read the filename, returning a list of strings'
-
-        import string, sys
+        'Read the filename, returning a list of lines'
 
-        print 'Reading', Filename + '...',
+        print('Reading', Filename + '...', end=' ')
         sys.stdout.flush()
 
         try:
             F = open(Filename)
-        except IOError, Detail:
-            print '(error:', Detail[1] + '!)'
+        except IOError as Detail:
+            print('(error:', Detail.strerror + '!)')
             return
 
         try:
             Lines = F.readlines()
-        except IOError, Detail:
-            print '(error:', Detail[1] + '!)'
+        except IOError as Detail:
+            print('(error:', Detail.strerror + '!)')
             F.close()
             return
 
         F.close()
+        return Lines
 
-        # If the first line is empty, use the Basename
-        if Filename[-4:] == '.crd':
-	    if string.split(Lines[0]) == []: # This line corresponds to TITLE name in CRD file
-                Basename = Filename[:string.find(Filename, '.')]
-                Item_list = [Basename]
-                print 'Warning: Title not present... Assigning Basename as Title'
-	    else:
-                Item_list = []
-	else:
-	    if string.split(Lines[3]) == []: # This line corresponds to TITLE name in TOPOLOGY file
-                Basename = Filename[:string.find(Filename, '.')]
-                Item_list = [Basename]
-                print 'Warning: Title not present... Assigning Basename as Title'
-            else:
-                Item_list = []
-
-        for Line in Lines:
-	    if Line[0]!='%': #Vikas' Modification: This condition ignores all the lines starting with % in the topology file.
-            	Item_list.extend(string.split(Line))
+    #--------------------------------------------------------
 
-        return Item_list
+    def Set_title(self, Title, Filename):
+        'Set or check the title, use the Basename if it is not present'
+        Title = Title.strip()
+        if not Title:
+            Title = Filename[:Filename.find('.')]
+            print('Warning: Title not present... Assigning Basename as Title')
+        if 'ITITL' in self.__dict__:
+            if Title != self.ITITL:
+                print('(warning: ITITL differs!)', end=' ')
+        else:
+            self.ITITL = Title
+        print(self.ITITL) #Vikas Modification : Priting the Title
 
     #--------------------------------------------------------
 
     def Read_CRD(self, Basename):
         'Read the Amber coordinate/restart (.crd) file'
 
-        # The optional velocities and periodic box size are not yet parsed.
-
-        Item_list = self.Read_data(Basename + '.crd')
+        Filename = Basename + '.crd'
+        Lines = self.Read_data(Filename)
 
-        if Item_list == None:
+        if Lines == None:
             return
-        elif len(Item_list) < 2:
-            print '(error: File too short!)'
+        elif len(Lines) < 2:
+            print('(error: File too short!)')
             return
 
         # Parse the data
-        if self.__dict__.has_key('ITITL'):
-            if Pop(Item_list,0) != self.ITITL:
-	        print '(warning: ITITL differs!)',
-        else:
-            self.ITITL = Pop(Item_list,0)
-        print self.ITITL #Vikas Modification : Priting the Title
+        self.Set_title(Lines[0], Filename)
 
-        if self.__dict__.has_key('NATOM'):
-            if eval(Pop(Item_list,0)) != self.NATOM:
-		print '(error: NATOM differs!)'
+        Words = Lines[1].split()
+        if 'NATOM' in self.__dict__:
+            if int(Words[0]) != self.NATOM:
+                print('(error: NATOM differs!)')
                 return
         else:
-            self.NATOM = eval(Pop(Item_list,0))
-	print self.NATOM # Vikas' Modification: Printing number of atoms just to make sure that the program is reading the correct value. 
+            self.NATOM = int(Words[0])
+        print(self.NATOM) # Vikas' Modification: Printing number of atoms just to make sure that the program is reading the correct value.
 
-        #if len(Item_list) == 1 + 3 * self.NATOM:
-        # Vikas' Modification: I changed the condition.
-	if (len(Item_list)%3) != 0:
-	    self.TIME = eval(Pop(Item_list,0))
+        if len(Words) > 1:
+            self.TIME = float(Words[1])
         else:
             self.TIME = 0
-	print self.TIME # Vikas' Modification : Printing simulation time, just to make sure that the program is readint the correct value.
-        if len(Item_list) < 3 * self.NATOM:
-            print '(error: File too short!)'
-            return
+        print(self.TIME) # Vikas' Modification : Printing simulation time, just to make sure that the program is readint the correct value.
 
-        self.X = []
-        self.Y = []
-        self.Z = []
-        for i in range(self.NATOM):
-            self.X.append(eval(Pop(Item_list,0)))
-            self.Y.append(eval(Pop(Item_list,0)))
-            self.Z.append(eval(Pop(Item_list,0)))
-
-        if (self.NATOM == 1) and len(Item_list):
-            print '(warning: Ambiguity!)',
-
-        if len(Item_list) >= 3 * self.NATOM:
-                self.VX = []
-                self.VY = []
-                self.VZ = []
-                for i in range(self.NATOM):
-                    self.VX.append(eval(Pop(Item_list,0)))
-                    self.VY.append(eval(Pop(Item_list,0)))
-                    self.VZ.append(eval(Pop(Item_list,0)))
-
-        if len(Item_list) >= 3:
-            self.BOX = []
-            for i in range(3):
-                self.BOX.append(eval(Pop(Item_list,0)))
-
-        if len(Item_list):
-            print '(warning: File too large!)',
-        
-        print 'done.'
-        self.CRD_is_read = 1
-
-    #--------------------------------------------------------
+        # coordinates, optional velocities, and optional box are
+        # written in the same 6F12.7 format
 
-    def Read_TOP(self, Basename):
-        'Read the Amber parameter/topology (.top) file'
-        Item_list = self.Read_data(Basename + '.top')
-
-        if Item_list == None:
-            return
-        elif len(Item_list) < 31:
-            print '(error: File too short!)'
+        Values = Parse_fixed(Lines[2:], '6F12.7')
+        N = 3 * self.NATOM
+        if len(Values) < N:
+            print('(error: File too short!)')
             return
 
-       # Parse the data
-        if self.__dict__.has_key('ITITL'):
-            if Pop(Item_list,0) != self.ITITL:
-                print '(warning: ITITL differs!)'
-        else:
-            self.ITITL = Pop(Item_list,0)
-	print self.ITITL # Printing Self Title
+        XYZ = Values[:N].reshape(self.NATOM, 3)
+        self.X = XYZ[:, 0].copy()
+        self.Y = XYZ[:, 1].copy()
+        self.Z = XYZ[:, 2].copy()
+        Values = Values[N:]
 
-        if self.__dict__.has_key('NATOM'):
-            if eval(Pop(Item_list,0)) != self.NATOM:
-                print '(error: NATOM differs!)'
- 		return
-        else:
-            self.NATOM = eval(Pop(Item_list,0))
-        print self.NATOM # Printing total number of atoms just to make sure that thing are going right
-        self.NTYPES = eval(Pop(Item_list,0))
-        self.NBONH  = eval(Pop(Item_list,0))
-        self.MBONA  = eval(Pop(Item_list,0))
-        self.NTHETH = eval(Pop(Item_list,0))
-        self.MTHETA = eval(Pop(Item_list,0))
-        self.NPHIH  = eval(Pop(Item_list,0))
-        self.MPHIA  = eval(Pop(Item_list,0))
-        self.NHPARM = eval(Pop(Item_list,0))
-        self.NPARM  = eval(Pop(Item_list,0))
-        self.NEXT   = eval(Pop(Item_list,0))
-        self.NRES   = eval(Pop(Item_list,0))
-        self.NBONA  = eval(Pop(Item_list,0))
-        self.NTHETA = eval(Pop(Item_list,0))
-        self.NPHIA  = eval(Pop(Item_list,0))
-        self.NUMBND = eval(Pop(Item_list,0))
-        self.NUMANG = eval(Pop(Item_list,0))
-        self.NPTRA  = eval(Pop(Item_list,0))
-        self.NATYP  = eval(Pop(Item_list,0))
-        self.NPHB   = eval(Pop(Item_list,0))
-        self.IFPERT = eval(Pop(Item_list,0))
-        self.NBPER  = eval(Pop(Item_list,0))
-        self.NGPER  = eval(Pop(Item_list,0))
-        self.NDPER  = eval(Pop(Item_list,0))
-        self.MBPER  = eval(Pop(Item_list,0))
-        self.MGPER  = eval(Pop(Item_list,0))
-        self.MDPER  = eval(Pop(Item_list,0))
-        self.IFBOX  = eval(Pop(Item_list,0))
-        self.NMXRS  = eval(Pop(Item_list,0))
-        self.IFCAP  = eval(Pop(Item_list,0))
+        if (self.NATOM == 1) and len(Values):
+            print('(warning: Ambiguity!)', end=' ')
 
-        #....................................................
+        if len(Values) >= N:
+            VXYZ = Values[:N].reshape(self.NATOM, 3)
+            self.VX = VXYZ[:, 0].copy()
+            self.VY = VXYZ[:, 1].copy()
+            self.VZ = VXYZ[:, 2].copy()
+            Values = Values[N:]
 
-        if len(Item_list) < 5 * self.NATOM + self.NTYPES**2 + \
-           2*(self.NRES + self.NUMBND + self.NUMANG) + \
-           3*self.NPTRA + self.NATYP:
-            print '(error: File too short!)'
-            return -1
+        if len(Values) >= 3:
+            self.BOX = Values[:3].tolist()
+            Values = Values[3:]
 
-        self.IGRAPH = []
-        Pop(Item_list,0)
-
-	  # A little kludge is needed here, since the IGRAPH strings are
-        # not separated by spaces if 4 characters in length.
-        for i in range(self.NATOM):
-            if len(Item_list[0]) > 4:
-                Item_list.insert(1, Item_list[0][4:])
-                Item_list.insert(1, Item_list[0][0:4])
-                del Item_list[0]
-            self.IGRAPH.append(Pop(Item_list,0))
-        
-	# Vikas' Modification : In the following section, I am printing out each quantity which is currently being read from the topology file.
-	print 'Reading Charges...'
-        self.CHRG = []
-      	for i in range(self.NATOM):
-            self.CHRG.append(eval(Pop(Item_list,0)))
-
-	print 'Reading Atomic Number...'
-        self.ANUMBER = []
-      	for i in range(self.NATOM):
-            self.ANUMBER.append(eval(Pop(Item_list,0)))
-
-        print 'Reading Atomic Masses...'
-	self.AMASS = []
-        for i in range(self.NATOM):
-            self.AMASS.append(eval(Pop(Item_list,0)))
-
-	print 'Reading Atom Types...'
-        self.IAC = []
-        for i in range(self.NATOM):
-            self.IAC.append(eval(Pop(Item_list,0)))
-
-        print 'Reading Excluded Atoms...'
-	self.NUMEX = []
-        for i in range(self.NATOM):
-            self.NUMEX.append(eval(Pop(Item_list,0)))
-
-	print 'Reading Non-bonded Parameter Index...'
-        self.ICO = []
-        for i in range(self.NTYPES**2):
-            self.ICO.append(eval(Pop(Item_list,0)))
-
-        print 'Reading Residue Labels...'
-	self.LABRES = []
-        for i in range(self.NRES):
-            self.LABRES.append(Pop(Item_list,0))
-
-        print 'Reading Residues Starting Pointers...'
-	self.IPRES = []
-        for i in range(self.NRES):
-            self.IPRES.append(eval(Pop(Item_list,0)))
-
-	print 'Reading Bond Force Constants...'
-        self.RK = []
-        for i in range(self.NUMBND):
-            self.RK.append(eval(Pop(Item_list,0)))
-
-	print 'Reading Equilibrium Bond Values...'
-        self.REQ = []
-        for i in range(self.NUMBND):
-            self.REQ.append(eval(Pop(Item_list,0)))
-
-	print 'Reading Angle Force Constants...' 
-        self.TK = []
-        for i in range(self.NUMANG):
-            self.TK.append(eval(Pop(Item_list,0)))
-
-	print 'Reading Equilibrium Angle Values...'
-        self.TEQ = []
-        for i in range(self.NUMANG):
-            self.TEQ.append(eval(Pop(Item_list,0)))
-
-	print 'Reading Dihedral Force Constants...'
-        self.PK = []
-        for i in range(self.NPTRA):
-            self.PK.append(eval(Pop(Item_list,0)))
-        
-	print 'Reading Dihedral Periodicity...' 
-        self.PN = []
-        for i in range(self.NPTRA):
-            self.PN.append(eval(Pop(Item_list,0)))
-        
-	print 'Reading Dihedral Phase...'
-        self.PHASE = []
-        for i in range(self.NPTRA):
-            self.PHASE.append(eval(Pop(Item_list,0)))
-        
-	print 'Reading 1-4 Electrostatic Scaling Factor...'
-        self.SCEEFAC = []
-        for i in range(self.NPTRA):
-            self.SCEEFAC.append(eval(Pop(Item_list,0)))
-        
-	print 'Reading 1-4 Van der Waals Scaling Factor...'
-        self.SCNBFAC = []
-        for i in range(self.NPTRA):
-            self.SCNBFAC.append(eval(Pop(Item_list,0)))
-        
-	print 'Reading Solty...' #I think this is currently not used in AMBER. Check it out, though
-        self.SOLTY = []
-        for i in range(self.NATYP):
-            self.SOLTY.append(eval(Pop(Item_list,0)))
+        # box angles are not used
+        if len(Values) > 3:
+            print('(warning: File too large!)', end=' ')
 
-        #....................................................
+        print('done.')
+        self.CRD_is_read = 1
 
-        if len(Item_list) < 2 * self.NTYPES * (self.NTYPES + 1) / 2:
-            print '(error: File too short!)'
-            return -1
+    #--------------------------------------------------------
+
+    def Read_TOP(self, Basename):
+        'Read the Amber parameter/topology (.top) file'
 
-	print 'Reading LJ A Coefficient...'
-        self.CN1 = []
-        for i in range(self.NTYPES * (self.NTYPES + 1) / 2):
-            self.CN1.append(eval(Pop(Item_list,0)))
+        Filename = Basename + '.top'
+        Lines = self.Read_data(Filename)
 
-	print 'Reading LJ B Coefficient...'
-        self.CN2 = []
-        for i in range(self.NTYPES * (self.NTYPES + 1) / 2):
-            self.CN2.append(eval(Pop(Item_list,0)))
+        if Lines == None:
+            return
 
-        #....................................................
+        # Split into %FLAG sections once, each section is parsed
+        # with the field widths given by its %FORMAT
 
-        if len(Item_list) < 3 * (self.NBONH + self.NBONA) + \
-           4 * (self.NTHETH + self.NTHETA) + 5 * (self.NPHIH + self.NPHIA):
-            print '(error: File too short!)'
+        Sections = Split_sections(Lines)
+        if 'POINTERS' not in Sections:
+            print('(error: No %FLAG POINTERS section!)')
             return -1
 
-	print 'Reading Bonds which include hydrogen...'
-        self.IBH = []
-        self.JBH = []
-        self.ICBH = []
-        for i in range(self.NBONH):
-            self.IBH.append(eval(Pop(Item_list,0)))
-            self.JBH.append(eval(Pop(Item_list,0)))
-            self.ICBH.append(eval(Pop(Item_list,0)))
-
-	print 'Reading Bonds which dont include hydrogen...'
-        self.IB = []
-        self.JB = []
-        self.ICB = []
-        for i in range(self.NBONA):
-            self.IB.append(eval(Pop(Item_list,0)))
-            self.JB.append(eval(Pop(Item_list,0)))
-            self.ICB.append(eval(Pop(Item_list,0)))
-
-	print 'Reading Angles which include hydrogen...' 
-        self.ITH = []
-        self.JTH = []
-        self.KTH = []
-        self.ICTH = []
-        for i in range(self.NTHETH):
-            self.ITH.append(eval(Pop(Item_list,0)))
-            self.JTH.append(eval(Pop(Item_list,0)))
-            self.KTH.append(eval(Pop(Item_list,0)))
-            self.ICTH.append(eval(Pop(Item_list,0)))
-
-	print 'Reading Angles which dont include hydrogen...'
-        self.IT = []
-        self.JT = []
-        self.KT = []
-        self.ICT = []
-        for i in range(self.NTHETA):
-            self.IT.append(eval(Pop(Item_list,0)))
-            self.JT.append(eval(Pop(Item_list,0)))
-            self.KT.append(eval(Pop(Item_list,0)))
-            self.ICT.append(eval(Pop(Item_list,0)))
-
-	print 'Reading Dihedrals which include hydrogen...'
-        self.IPH = []
-        self.JPH = []
-        self.KPH = []
-        self.LPH = []
-        self.ICPH = []
-        for i in range(self.NPHIH):
-            self.IPH.append(eval(Pop(Item_list,0)))
-            self.JPH.append(eval(Pop(Item_list,0)))
-            self.KPH.append(eval(Pop(Item_list,0)))
-            self.LPH.append(eval(Pop(Item_list,0)))
-            self.ICPH.append(eval(Pop(Item_list,0)))
-
-	print 'Reading Dihedrals which dont include hydrogen...'
-        self.IP = []
-        self.JP = []
-        self.KP = []
-        self.LP = []
-        self.ICP = []
-        for i in range(self.NPHIA):
-            self.IP.append(eval(Pop(Item_list,0)))
-            self.JP.append(eval(Pop(Item_list,0)))
-            self.KP.append(eval(Pop(Item_list,0)))
-            self.LP.append(eval(Pop(Item_list,0)))
-            self.ICP.append(eval(Pop(Item_list,0)))
+        def Section(Flag):
+            Format, Data = Sections[Flag]
+            return Parse_fixed(Data, Format)
 
-        #....................................................
+        # Parse the data
+        if 'TITLE' in Sections:
+            Title = ''.join(Sections['TITLE'][1])
+        else:
+            Title = ''.join(Sections.get('CTITLE', ['', ['']])[1])
+        self.Set_title(Title, Filename)
 
-        if len(Item_list) < self.NEXT + 3 * self.NPHB + 4 * self.NATOM:
-            print '(error: File too short!)'
+        Pointers = Section('POINTERS')
+        if len(Pointers) < len(TOP_pointers):
+            print('(error: File too short!)')
             return -1
 
-	print 'Reading Excluded Atom List...'
-        self.NATEX = []
-        for i in range(self.NEXT):
-            self.NATEX.append(eval(Pop(Item_list,0)))
-
-	print 'Reading H-Bond A Coefficient, corresponding to r**12 term for all possible types...'
-        self.ASOL = []
-        for i in range(self.NPHB):
-            self.ASOL.append(eval(Pop(Item_list,0)))
-
-	print 'Reading H-Bond B Coefficient, corresponding to r**10 term for all possible types...'
-        self.BSOL = []
-        for i in range(self.NPHB):
-            self.BSOL.append(eval(Pop(Item_list,0)))
-
-	print 'Reading H-Bond Cut...' # I think it is not being used nowadays
-        self.HBCUT = []
-        for i in range(self.NPHB):
-            self.HBCUT.append(eval(Pop(Item_list,0)))
-
-	print 'Reading Amber Atom Types for each atom...'
-        self.ISYMBL = []
-        for i in range(self.NATOM):
-            self.ISYMBL.append(Pop(Item_list,0))
-
-	print 'Reading Tree Chain Classification...'
-        self.ITREE = []
-        for i in range(self.NATOM):
-            self.ITREE.append(Pop(Item_list,0))
-
-	print 'Reading Join Array: Tree joining information' # Currently unused in Sander, an AMBER module
-        self.JOIN = []
-        for i in range(self.NATOM):
-            self.JOIN.append(eval(Pop(Item_list,0)))
-
-	print 'Reading IRotate...' # Currently unused in Sander and Gibbs
-        self.IROTAT = []
-        for i in range(self.NATOM):
-            self.IROTAT.append(eval(Pop(Item_list,0)))
+        if 'NATOM' in self.__dict__:
+            if Pointers[0] != self.NATOM:
+                print('(error: NATOM differs!)')
+                return
+        for Name, Value in zip(TOP_pointers, Pointers.tolist()):
+            self.__dict__[Name] = Value
+        print(self.NATOM) # Printing total number of atoms just to make sure that thing are going right
 
-        #....................................................
+        self.IPOL = 0
+        if 'IPOL' in Sections:
+            self.IPOL = int(Section('IPOL')[0])
 
-        if self.IFBOX > 0:
-            if len(Item_list) < 3:
-                print '(error: File too short!)'
-                return -1
+        #....................................................
 
-            print 'Reading final residue which is part of solute...'
-	    self.IPTRES = eval(Pop(Item_list,0))
-	    print 'Reading total number of molecules...'
-            self.NSPM = eval(Pop(Item_list,0))
-	    print 'Reading first solvent moleule index...'
-            self.NSPSOL = eval(Pop(Item_list,0))
+        for Flag, Names, Count, Condition, Message in TOP_sections:
 
-            if len(Item_list) < self.NSPM + 4:
-                print '(error: File too short!)'
+            if Flag == 'ATOMS_PER_MOLECULE' and self.IFBOX > 0:
+                self.IPTRES, self.NSPM, self.NSPSOL = \
+                             self.SOLVENT_POINTERS.tolist()
+            if Condition and not Condition(self):
+                continue
+            if Flag not in Sections:
+                if Condition:
+                    print('(error: No %FLAG ' + Flag + ' section!)')
+                    return -1
+                continue
+
+            if Message:
+                print(Message)
+            Values = Section(Flag)
+            N = Count(self)
+            if len(Values) < N * len(Names):
+                print('(error: File too short!)')
                 return -1
 
-	    print 'Reading atom per molecule...' 
-            self.NSP = []
-            for i in range(self.NSPM):
-                self.NSP.append(eval(Pop(Item_list,0)))
-
-            self.BETA = eval(Pop(Item_list,0))
-
-	    print 'Reading Box Dimensions...' 
-            if self.__dict__.has_key('BOX'):
-                BOX = []
-                for i in range(3):
-                    BOX.append(eval(Pop(Item_list,0)))
-                for i in range(3):
-                    if BOX[i] != self.BOX[i]:
-                        print '(warning: BOX differs!)',
-                        break
-                del BOX
+            if len(Names) == 1:
+                self.__dict__[Names[0]] = Values
             else:
-                self.BOX = []
-                for i in range(3):
-                    self.BOX.append(eval(Pop(Item_list,0)))
+                Values = Values[:N * len(Names)].reshape(N, len(Names))
+                for i, Name in enumerate(Names):
+                    self.__dict__[Name] = Values[:, i].copy()
 
         #....................................................
 
-        if self.IFCAP > 0:
-            if len(Item_list) < 5:
-                print '(error: File too short!)'
-                return -1
-	    print 'Reading ICAP variables::: For details, refer to online AMBER format manual'
-            self.NATCAP = eval(Pop(Item_list,0))
-            self.CUTCAP = eval(Pop(Item_list,0))
-            self.XCAP = eval(Pop(Item_list,0))
-            self.YCAP = eval(Pop(Item_list,0))
-            self.ZCAP = eval(Pop(Item_list,0))
+        if self.IFBOX > 0:
+            self.BETA = self.BOX_DIMENSIONS[0]
+            BOX = self.BOX_DIMENSIONS[1:4].tolist()
+            if 'BOX' in self.__dict__:
+                if BOX != self.BOX:
+                    print('(warning: BOX differs!)', end=' ')
+            else:
+                self.BOX = BOX
 
-        #....................................................
+        if self.IFCAP > 0:
+            self.NATCAP = int(self.NATCAP[0])
+            self.CUTCAP, self.XCAP, self.YCAP, self.ZCAP = \
+                         self.CAP_INFO2.tolist()
 
         if self.IFPERT > 0:
-            if len(Item_list) < 4 * self.NBPER + 5 * self.NGPER + \
-               6 * self.NDPER + self.NRES + 6 * self.NATOM:
-                print '(error: File too short!)'
-                return -1
-
-	    print 'Reading perturb variables, 1. Bond, 2. Angles, 3. Dihedrals, etc etc.::: For details, refer to online AMBER format manual' 
-            self.IBPER = []
-            self.JBPER = []
-            for i in range(self.NBPER):
-                self.IBPER.append(eval(Pop(Item_list,0)))
-                self.JBPER.append(eval(Pop(Item_list,0)))
-
-            self.ICBPER = []
-            for i in range(2 * self.NBPER):
-                self.ICBPER.append(eval(Pop(Item_list,0)))
-
-            self.ITPER = []
-            self.JTPER = []
-            self.KTPER = []
-            for i in range(self.NGPER):
-                self.ITPER.append(eval(Pop(Item_list,0)))
-                self.JTPER.append(eval(Pop(Item_list,0)))
-                self.KTPER.append(eval(Pop(Item_list,0)))
-
-            self.ICTPER = []
-            for i in range(2 * self.NGPER):
-                self.ICTPER.append(eval(Pop(Item_list,0)))
-
-            self.IPPER = []
-            self.JPPER = []
-            self.KPPER = []
-            self.LPPER = []
-            for i in range(self.NDPER):
-                self.IPPER.append(eval(Pop(Item_list,0)))
-                self.JPPER.append(eval(Pop(Item_list,0)))
-                self.KPPER.append(eval(Pop(Item_list,0)))
-                self.LPPER.append(eval(Pop(Item_list,0)))
-
-            self.ICPPER = []
-            for i in range(2 * self.NDPER):
-                self.ICPPER.append(eval(Pop(Item_list,0)))
-
-            LABRES = []
-            for i in range(self.NRES):
-                LABRES.append(Pop(Item_list,0))
-            for i in range(self.NRES):
-                if LABRES[i] != self.LABRES[i]:
-                    print '(warning: BOX differs!)',
-                    break
-
-            self.IGRPER = []
-            for i in range(self.NATOM):
-                self.IGRPER.append(eval(Pop(Item_list,0)))
-
-            self.ISMPER = []
-            for i in range(self.NATOM):
-                self.ISMPER.append(eval(Pop(Item_list,0)))
-
-            self.ALMPER = []
-            for i in range(self.NATOM):
-                self.ALMPER.append(eval(Pop(Item_list,0)))
-
-            self.IAPER = []
-            for i in range(self.NATOM):
-                self.IAPER.append(eval(Pop(Item_list,0)))
-
-            self.IACPER = []
-            for i in range(self.NATOM):
-                self.IACPER.append(eval(Pop(Item_list,0)))
-
-            self.CGPER = []
-            for i in range(self.NATOM):
-                self.CGPER.append(eval(Pop(Item_list,0)))
+            if self.LABRES_PERT.tolist() != self.LABRES.tolist():
+                print('(warning: LABRES differs!)', end=' ')
 
-        #....................................................
-
-        self.IPOL = 0
-        if self.IPOL == 1:
-            if len(Item_list) < self.NATOM:
-                print '(error: File too short!)'
-                return -1
-	    print 'Reading Polarizability Data. For details, refer to online AMBER format manual'
-            self.ATPOL = []
-            for i in range(self.NATOM):
-                self.ATPOL.append(eval(Pop(Item_list,0)))
-
-            if self.IFPERT == 1:
-                if len(Item_list) < self.NATOM:
-                    print '(error: File too short!)'
-                    return -1
-                self.ATPOL1 = []
-                for i in range(self.NATOM):
-                    self.ATPOL1.append(eval(Pop(Item_list,0)))
-
-        #....................................................
-
-        if len(Item_list):
-            print '(warning: File too large!)',
-
-        print 'done.'
+        print('done.')
         self.TOP_is_read = 1
 
 #============================================================
@@ -944,8 +662,6 @@ def Find_Amber_files():
 
     # Date and existence checks not yet implemented
 
-    import os, sys
-
     Basename_list = []
 
     # Extract basenames from command line
@@ -964,7 +680,7 @@ def Find_Amber_files():
             Basename_list.remove(Basename)
 
     if Basename_list == []:
-        print 'Looking for Amber files...',
+        print('Looking for Amber files...', end=' ')
         Dir_list = os.listdir('.')
         Dir_list.sort()
         for File in Dir_list:
@@ -973,23 +689,23 @@ def Find_Amber_files():
                 if (Basename + '.crd') in Dir_list:
                     Basename_list.append(Basename)
         if Basename_list != []:
-            print 'found',
+            print('found', end=' ')
             for i in range(len(Basename_list)-1):
-                print Basename_list[i] + ',',
-            print Basename_list[-1] + '\n'
-    
+                print(Basename_list[i] + ',', end=' ')
+            print(Basename_list[-1] + '\n')
+
     if Basename_list == []:
-        print 'none.\n'
+        print('none.\n')
 
     return Basename_list
-    
+
 #============================================================
 
 def Convert_Amber_files():
     'Handle the whole conversion process'
-    print
-    print 'Welcome to amber2lammps, a program to convert Amber files to Lammps format!'
-    print
+    print()
+    print('Welcome to amber2lammps, a program to convert Amber files to Lammps format!')
+    print()
     Basename_list = Find_Amber_files()
     for Basename in Basename_list:
         a = Amber()
@@ -1001,8 +717,9 @@ def Convert_Amber_files():
                 l.Write_Lammps(Basename)
                 del l
         del a
-        print
+        print()
 
 #============================================================
 
-Convert_Amber_files()
+if __name__ == '__main__':
+    Convert_Amber_files()
@@ -9,8 +9,10 @@ written by: Germain Clavier g.m.g.c.clavier@tue.nl
 This script requires the numpy library.
 """
 
+import os
 import sys
 import argparse as ap
+import multiprocessing as mp
 from datetime import date
 
 import numpy as np
@@ -24,48 +26,111 @@ def prof(at, r):
     return f
 
 
-def pair(at1, at2, r):
-    atom = Database[at1]
+def pure_pair(at, r):
+    atom = Database[at]
     psi1 = atom.A * np.exp(-atom.alpha * (r / atom.re - 1.0))
     psi1 /= 1.0 + (r / atom.re - atom.cai) ** 20
     psi2 = atom.B * np.exp(-atom.beta * (r / atom.re - 1.0))
     psi2 /= 1.0 + (r / atom.re - atom.ramda) ** 20
+    return psi1 - psi2
+
+
+def mix_pair(prof1, prof2, psia, psib):
+    return 0.5 * (prof2 / prof1 * psia + prof1 / prof2 * psib)
+
+
+def pair(at1, at2, r):
     if at1 == at2:
-        psi = psi1 - psi2
-    else:
-        psia = psi1 - psi2
-        atom2 = Database[at2]
-        psi1 = atom2.A * np.exp(-atom2.alpha * (r / atom2.re - 1.0))
-        psi1 /= 1.0 + (r / atom2.re - atom2.cai) ** 20
-        psi2 = atom2.B * np.exp(-atom2.beta * (r / atom2.re - 1.0))
-        psi2 /= 1.0 + (r / atom2.re - atom2.ramda) ** 20
-        psib = psi1 - psi2
-        prof1 = prof(at1, r)
-        prof2 = prof(at2, r)
-        psi = 0.5 * (prof2 / prof1 * psia + prof1 / prof2 * psib)
-    return psi
+        return pure_pair(at1, r)
+    return mix_pair(prof(at1, r), prof(at2, r), pure_pair(at1, r), pure_pair(at2, r))
 
 
 def embed(at, rho):
     atom = Database[at]
-    Fm33 = np.zeros(rho.shape)
-    Fm33[rho < atom.rhoe] = atom.Fm3
-    Fm33[rho >= atom.rhoe] = atom.Fm4
+    Fm33 = np.where(rho < atom.rhoe, atom.Fm3, atom.Fm4)
     emb = np.zeros(rho.shape)
-    for i, r in enumerate(rho):
-        if r == 0:
-            emb[i] = 0
-        elif r < atom.rhoin:
-            dr = r / atom.rhoin - 1
-            emb[i] = atom.Fi0 + atom.Fi1 * dr + atom.Fi2 * dr**2 + atom.Fi3 * dr**3
-        elif r < atom.rhoout:
-            dr = r / atom.rhoe - 1
-            emb[i] = atom.Fm0 + atom.Fm1 * dr + atom.Fm2 * dr**2 + Fm33[i] * dr**3
-        else:
-            dr = r / atom.rhos
-            emb[i] = atom.Fn * (1.0 - atom.fnn * np.log(dr)) * dr**atom.fnn
+    # evaluate each branch only for its own range of rho
+    low = (rho != 0) & (rho < atom.rhoin)
+    mid = (rho >= atom.rhoin) & (rho < atom.rhoout)
+    high = (rho != 0) & (rho >= atom.rhoin) & (rho >= atom.rhoout)
+    dr = rho[low] / atom.rhoin - 1
+    emb[low] = atom.Fi0 + atom.Fi1 * dr + atom.Fi2 * dr**2 + atom.Fi3 * dr**3
+    dr = rho[mid] / atom.rhoe - 1
+    emb[mid] = atom.Fm0 + atom.Fm1 * dr + atom.Fm2 * dr**2 + Fm33[mid] * dr**3
+    dr = rho[high] / atom.rhos
+    emb[high] = atom.Fn * (1.0 - atom.fnn * np.log(dr)) * dr**atom.fnn
     return emb
 
+
+def r_profiles(task):
+    at, r = task
+    return np.array([prof(at, r), pure_pair(at, r)])
+
+
+def rho_profiles(task):
+    at, rho = task
+    return embed(at, rho)
+
+
+class PairProfiles:
+    """
+    r*phi(r) for all pairs of elements, indexed like an array with z2r[i, j].
+    Since z2r is symmetric, only the pairs that are requested are computed
+    from the cached per-element profiles when they are needed.
+    """
+
+    def __init__(self, attypes, r, rprof):
+        self.attypes = attypes
+        self.r = r
+        self.rprof = rprof
+
+    def __getitem__(self, idx):
+        prof1, psia = self.rprof[self.attypes[idx[0]]]
+        prof2, psib = self.rprof[self.attypes[idx[1]]]
+        if self.attypes[idx[0]] == self.attypes[idx[1]]:
+            return self.r * psia
+        return self.r * mix_pair(prof1, prof2, psia, psib)
+
+
+def element_profiles(func, attypes, grid, key, nprocs=1, cache=None):
+    """
+    Compute func((element, grid)) for all elements, in parallel with nprocs
+    processes.  With a cache directory, results are stored as NumPy files and
+    reused for the same element and grid, as identified by key.
+    """
+    data = {}
+    for at in attypes:
+        if cache:
+            try:
+                data[at] = np.load(os.path.join(cache, "{}.{}.npy".format(at, key)))
+            except (OSError, ValueError):
+                pass
+    missing = [at for at in dict.fromkeys(attypes) if at not in data]
+    tasks = [(at, grid) for at in missing]
+    if nprocs > 1 and len(tasks) > 1:
+        with mp.Pool(min(nprocs, len(tasks))) as pool:
+            results = pool.map(func, tasks)
+    else:
+        results = [func(task) for task in tasks]
+    for at, res in zip(missing, results):
+        data[at] = res
+        if cache:
+            os.makedirs(cache, exist_ok=True)
+            np.save(os.path.join(cache, "{}.{}.npy".format(at, key)), res)
+    return data
+
+
+def write_values(f, values, chunk=5 * 4096):
+    # five values per line, a line of the remaining values is not terminated
+    nfull = len(values) - len(values) % 5
+    fmt = " %24.16E" * 5 + "\n"
+    for i in range(0, nfull, chunk):
+        block = values[i:min(i + chunk, nfull)]
+        f.write((fmt * (len(block) // 5)) % tuple(block.tolist()))
+    if nfull < len(values):
+        f.write((" %24.16E" * (len(values) - nfull)) % tuple(values[nfull:].tolist()))
+
+
 def write_file(attypes, filename, Fr, rhor, z2r, nrho, drho, nr, dr, rc):
     struc = "fcc"
     with open(filename, "w") as f:
@@ -83,20 +148,12 @@ def write_file(attypes, filename, Fr, rhor, z2r, nrho, drho, nr, dr, rc):
                     atom.ielement, atom.amass, atom.blat, struc
                 )
             )
-            for i, fr in enumerate(Fr[at]):
-                f.write(" {:>24.16E}".format(fr))
-                if not (i + 1) % 5:
-                    f.write("\n")
-            for i, rho in enumerate(rhor[at]):
-                f.write(" {:>24.16E}".format(rho))
-                if not (i + 1) % 5:
-                    f.write("\n")
+            write_values(f, np.asarray(Fr[at]))
+            write_values(f, np.asarray(rhor[at]))
+        # z2r is symmetric, only the lower triangle is written
         for n1 in range(len(attypes)):
             for n2 in range(n1 + 1):
-                for i, z in enumerate(z2r[n1, n2]):
-                    f.write(" {:>24.16E}".format(z))
-                    if not (i + 1) % 5:
-                        f.write("\n")
+                write_values(f, np.asarray(z2r[n1, n2]))
 
 def create_eam(argv=None):
     parser = ap.ArgumentParser(description="Script to create EAM alloy potential files.")
@@ -107,6 +164,10 @@ def create_eam(argv=None):
                         help="Number of point in r space [default 2000]")
     parser.add_argument("-nrho", dest="nrho", type=int, default=2000,
                         help="Number of point in rho space [default 2000]")
+    parser.add_argument("-np", dest="nprocs", type=int, default=1,
+                        help="Number of processes for computing the element profiles [default 1]")
+    parser.add_argument("-c", "--cache", dest="cache", default=None,
+                        help="Directory for reusing computed element profiles [default none]")
     args = parser.parse_args(argv)
     if not args.name:
         parser.print_help()
@@ -124,10 +185,7 @@ def create_eam(argv=None):
             valid = "Supported elements are: {}".format(" ".join(Database.keys()))
             sys.exit("".join([output, valid]))
 
-    ntypes = len(atnames)
     outfilename = "".join([*atnames, ".eam.alloy"])
-    rhor = {}
-    Fr = {}
 
     alatmax = max([Database[at].blat for at in atnames])
     rhoemax = max([Database[at].rhoe for at in atnames])
@@ -136,25 +194,19 @@ def create_eam(argv=None):
     r = np.linspace(0.0, rc, num=nr, dtype=np.double)
     dr = r[1] - r[0]
     r[r < rst] = rst
-    z2r = np.zeros([ntypes, ntypes, nr])
-    rhomax = -np.inf
-
-    for i, n1 in enumerate(atnames):
-        for j, n2 in enumerate(atnames):
-            if j > i:
-                continue
-            if i == j:
-                rhor[n1] = prof(n1, r)
-                rhomax = max(rhomax,np.max(rhor[n1]))
-                z2r[i, j, :] = r * pair(n1, n2, r)
-            else:
-                z2r[i, j, :] = r * pair(n1, n2, r)
-    z2r = np.where(z2r, z2r, z2r.transpose((1, 0, 2)))
+
+    # density and pair function of each element, the mixed pairs are derived from these
+    rprof = element_profiles(r_profiles, atnames, r, "r{}_{}".format(nr, float(rc).hex()),
+                             args.nprocs, args.cache)
+    rhor = {at: rprof[at][0] for at in atnames}
+    rhomax = max([np.max(rhor[at]) for at in atnames])
+    z2r = PairProfiles(atnames, r, rprof)
+
     rhomax = max(rhomax, 2.0 * rhoemax, 100.0)
     rho = np.linspace(0.0, rhomax, num=nrho, dtype=np.double)
     drho = rho[1] - rho[0]
-    for i, n1 in enumerate(atnames):
-        Fr[n1] = embed(n1, rho)
+    Fr = element_profiles(rho_profiles, atnames, rho,
+                          "rho{}_{}".format(nrho, float(rhomax).hex()), args.nprocs, args.cache)
 
     write_file(atnames, outfilename, Fr, rhor, z2r, nrho, drho, nr, dr, rc)
 
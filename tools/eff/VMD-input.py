@@ -1,4 +1,4 @@
-#!/usr/local/bin/python-2.5/bin/python
+#!/usr/bin/env python3
 
 import sys, os
 from getopt import gnu_getopt as getopt
@@ -21,7 +21,7 @@ Example: python VMD-input.py dump.lammpstrj 5 6
 
 """
 
-from lmp2radii_col import makeradii 
+from lmp2radii import makeradii
 from lmp2xyz import lmp2xyz
  
 def printHelp(input):
@@ -31,7 +31,7 @@ if __name__ == '__main__':
     
    # if no input, print help and exit
     if len(sys.argv) < 2:
-        print "Usage: python VMD-input.py lammps_dump_filename radii_column xpos_column\n"
+        print("Usage: python VMD-input.py lammps_dump_filename radii_column xpos_column\n")
         sys.exit(1)
     else:
         infile=sys.argv[1]
@@ -40,19 +40,19 @@ if __name__ == '__main__':
     tools=sys.argv[0].split('VMD-input.py')[0]
     # set defaults
     outfile = infile.split('.')[0]
-    print sys.argv
+    print(sys.argv)
     if len(sys.argv) == 4:
       column = int(sys.argv[2])
       xpos = int(sys.argv[3])
-      print "Assuming xpos=eradius+1"
+      print("Assuming xpos=eradius+1")
     elif len(sys.argv) == 3:
       column = int(sys.argv[2])
       xpos = column+1
-      print "Assuming xpos=eradius+1"
+      print("Assuming xpos=eradius+1")
     elif len(sys.argv) == 2:
       column=5    # default = radius for dump -> id type q spin eradius x y z
       xpos=6
-    else: print "Incorrect number of arguments"
+    else: print("Incorrect number of arguments")
 
     # check for input:
     opts, argv = getopt(sys.argv[1:], 'c:o:ha')
@@ -65,14 +65,14 @@ if __name__ == '__main__':
           outfile=arg
         if opt == '-c':         # select column from lammpstrj file to tabulate
           column=int(arg)
-    print column,xpos
-    makeradii(infile,outfile+".out",column,True)
+    print(column,xpos)
+    makeradii(infile,outfile+".out",column)
     lmp2xyz(infile,outfile+".xyz",xpos)
-    print "Creating %s file ..."%(outfile+".vmd")
+    print("Creating %s file ..."%(outfile+".vmd"))
     os.system("cat %s | sed 's/xyzfile/%s/' > %s"%(tools+"radii.vmd",outfile+".xyz","temp"))
     os.system("cat %s | sed 's/radiifile/%s/' > %s; rm temp"%("temp",outfile+".out",workdir+'/'+outfile+".vmd"))
-    print "Done !! (you can now source %s using VMD's console) \n"%(outfile+".vmd")
+    print("Done !! (you can now source %s using VMD's console) \n"%(outfile+".vmd"))
 
-    print "NOTE: In VMD, set graphics representation for electrons to transparency,"
-    print "and change the atom types in the xyz file according to your values,"
-    print "for simplicity, they are set using the same mass sequence definition\nfrom your lammps data file\n"
+    print("NOTE: In VMD, set graphics representation for electrons to transparency,")
+    print("and change the atom types in the xyz file according to your values,")
+    print("for simplicity, they are set using the same mass sequence definition\nfrom your lammps data file\n")
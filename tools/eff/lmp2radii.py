@@ -1,7 +1,7 @@
-#!/usr/local/bin/python-2.5/bin/python
+#!/usr/bin/env python3
 
 Info="""
-Module name: lmp2radii.py 
+Module name: lmp2radii.py
 
 Author: (c) Andres Jaramillo-Botero
 California Institute of Technology
@@ -9,105 +9,148 @@ ajaramil@wag.caltech.edu
 Project: pEFF
 Version: August 2009
 
-Extracts the electron radii from a lammps trajectory dump of style custom:
+Extracts the electron radii (or any other per-atom column) from a lammps
+trajectory dump of style custom:
 
 dump    1 all custom period dump_file id type q spin eradius x y z...
 
-NOTE: The radius must be the 5th column per trajectory entry in the dump file
+and writes them as a table with one row per electron and one column per
+frame.  Electrons are the atoms with a nonzero value in the first frame,
+with -a all atoms are written.
+
+Options:
+  -c column  column to tabulate, either its 1-based position or its name
+             in the ITEM: ATOMS line, default = 5 (eradius above)
+  -o file    output file, default = dump_file.out
+  -a         write all atoms (nuclei and electrons)
+  -f format  format of the values, default = %f
+
+NOTE: The dump is read frame by frame, each frame is parsed with a few
+NumPy operations, and the table is written in blocks of rows, so no
+Cython version (formerly lmp2radii.pyx) is needed.
 
 """
 
-# import essentials: 
-import sys, os 
-from math import log10
-from shutil import rmtree 
+# import essentials:
+import sys
+from itertools import islice
 from getopt import gnu_getopt as getopt
 import numpy
 
 def printHelp():
-    print Info
-    print "Usage: python lmp2radii.pyx test.lammpstrj\n"
+    print(Info)
+    print("Usage: python lmp2radii.py [-c column] [-o file] [-a] [-f format] test.lammpstrj\n")
     return
 
-def makeradii(infile):
+def readframes(fin,column):
+  """Generator of (timestep,values) per frame of a dump file
+
+  values are the entries of the selected column, ordered by atom id.
+  column is a 1-based position or a name from the ITEM: ATOMS line.
+  """
+
+  while True:
+    line = fin.readline()
+    if not line: return
+    if not line.startswith("ITEM: TIMESTEP"):
+      raise Exception("Expected ITEM: TIMESTEP, found: %s" % line.strip())
+    timestep = int(fin.readline().split()[0])
+    fin.readline()
+    natoms = int(fin.readline().split()[0])
+    fin.readline()
+    for i in range(3): fin.readline()
+    names = fin.readline().split()[2:]
+    ncol = len(names)
+
+    if isinstance(column,str) and not column.isdigit():
+      if column not in names:
+        raise Exception("Column %s is not in the dump: %s" % (column," ".join(names)))
+      icol = names.index(column)
+    else: icol = int(column) - 1
+    if icol < 0 or icol >= ncol:
+      raise Exception("Column %s is not in the dump: %s" % (column," ".join(names)))
+    iid = names.index("id") if "id" in names else 0
+
+    words = "".join(islice(fin,natoms)).split()
+    if len(words) != natoms*ncol:
+      raise Exception("Incomplete frame at timestep %d" % timestep)
+
+    ids = numpy.array(words[iid::ncol],dtype=numpy.int64)
+    values = numpy.zeros(natoms,dtype=numpy.float64)
+    values[ids-1] = numpy.array(words[icol::ncol],dtype=numpy.float64)
+    yield timestep,values
+
+def makeradii(infile,outfile="",column=5,flag_all=False,fmt="%f"):
 
-    print "Reading %s ... [WAIT]"%infile,
+    if outfile == "": outfile = infile + '.out'
+    if flag_all: atom_type = "nuclei and electron"
+    else: atom_type = "electron"
+
+    print("Extracting %s column %s per frame from %s ... " % (atom_type,column,infile),end="")
+    sys.stdout.flush()
     fin = open(infile,'r')
-    lines = fin.xreadlines()
-    print 7*"\b"+"[DONE]"
-    frame=0
-    radii=[]
-    # grep the number of frames and atoms/frame
-    os.system("grep TIMESTEP %s | wc -l > frames; grep -m 1 -A 1 ATOMS %s > atoms"%(infile,infile))
-    tmp=open("frames",'r')
-    frames=int(tmp.readline().split()[0])
-    tmp.close()
-    tmp=open("atoms",'r')
-    atoms=int(tmp.readlines()[1].split()[0])
-    tmp.close()
-    os.system("rm -rf frames atoms lines")
-    arry=numpy.zeros((atoms,frames),dtype=float)
-    framecnt=0
-    header=9
-    ecount=0
-    print "Extracting electron radii per frame from %s ...  "%(infile),
-    for i,line in enumerate(lines):
-      lo=(atoms+header)*framecnt+header
-      hi=lo+atoms
-      if (i<lo): 
-        continue
-      elif (i >= lo) and (i < hi):
-        lparse=line.split()
-        id=int(lparse[0])
-        r=float(lparse[4])
-        if (r!=0.0): 
-          arry[id-1][framecnt]=r
-          if (framecnt==0): ecount+=1
-        if (i==lo+1): 
-          sys.stdout.write("%d/%d%s"%(framecnt+1,frames,(int(log10(framecnt+1))+3+int(log10(frames)))*"\b"))
-          sys.stdout.flush()
-      if (i == hi+1): 
-        framecnt+=1
-    print
-    print "Writing radii/frame table to %s ... "%(infile+'.out'),
+    frames = [values for timestep,values in readframes(fin,column)]
+    fin.close()
+    print("%d frames" % len(frames))
+    if not frames:
+      print("No frames found in %s" % infile)
+      return
+
+    # one row per atom, one column per frame
+    # electrons have a nonzero value in the first frame
+
+    natoms = len(frames[0])
+    table = numpy.empty((natoms,len(frames)+1),dtype=numpy.float64)
+    table[:,0] = numpy.arange(1,natoms+1)
+    for f,values in enumerate(frames):
+      if len(values) != natoms:
+        raise Exception("Number of atoms changes in frame %d" % f)
+      table[:,f+1] = values
+    del frames
+    if not flag_all: table = table[table[:,1] != 0.0]
+
+    print("Writing %s/frame table for %d atoms to %s ... " % (column,len(table),outfile),end="")
     sys.stdout.flush()
-    fout=open(infile+'.out','w')
-    for i in range(frames):
-      fout.writelines('\tF'+str(i))
-    fout.writelines("\n")
-    e=1
-    for a in range(atoms):
-      if arry[a][0] == 0.0: continue
-      else:
-        sys.stdout.write("%d/%d%s"%(e,ecount,(int(log10(e))+int(log10(ecount))+3)*"\b"))
-        sys.stdout.flush()
-        e+=1
-        fout.writelines("%d\t"%(a+1))
-        for f in range(frames):
-          fout.writelines("%f\t"%(arry[a][f]))
-        fout.writelines("\n")
-    print
-    print "Done !! (generated radii/frame table) \n"
+    fout = open(outfile,'w')
+    fout.write("".join(["\tF%d" % i for i in range(table.shape[1]-1)]) + "\n")
+    rowfmt = "%d\t" + (fmt + "\t")*(table.shape[1]-1) + "\n"
+    nrows = max(1,65536 // table.shape[1])
+    for i in range(0,len(table),nrows):
+      block = table[i:i+nrows]
+      fout.write((rowfmt*len(block)) % tuple(block.ravel().tolist()))
     fout.close()
-    fin.close()
+    print("[DONE]")
+    print("Done !! (generated radii/frame table) \n")
 
 if __name__ == '__main__':
 
     # set defaults
-    
+    outfile = ""
+    flag_all = False
+    column = 5    # default = radius for dump -> id type q spin eradius x y z
+    fmt = "%f"
+
     # check for input:
-    opts, argv = getopt(sys.argv[1:], 'h')
+    opts, argv = getopt(sys.argv[1:], 'c:o:f:ha')
 
     # if no input, print help and exit
     if len(argv) != 1:
         printHelp()
         sys.exit(1)
-    else: 
+    else:
         infile=argv[0]
 
     # read options
     for opt, arg in opts:
         if opt == '-h':             # -h: print help
           printHelp()
+        if opt == '-o':             # output file name
+          outfile=arg
+        if opt == '-a':             # all nuclii+electrons
+          flag_all=True
+        if opt == '-c':             # select column from lammpstrj file to tabulate
+          column=arg
+        if opt == '-f':             # format of the tabulated values
+          fmt=arg
 
-    makeradii(infile)
+    makeradii(infile,outfile,column,flag_all,fmt)
@@ -22,10 +22,10 @@ masses={"1.00794":"H","4.002602":"He","6.941":"Li","9.012182":"Be","10.811":"B",
 mass_floor={1:"H",4:"He",6:"Li",9:"Be",10:"B",12:"C",0:"Au",28:"Si"}
 
 def lmp2xyz(lammps,xyz,xpos):
-  print "\nGenerating %s file"%(xyz)
+  print("\nGenerating %s file"%(xyz))
   fin=open(lammps,'r')
   fout=open(xyz,'w')
-  data=raw_input("Do you have a corresponding data file? please enter filename or 'n': ")
+  data=input("Do you have a corresponding data file? please enter filename or 'n': ")
   count=1
   if data!='n': 
     dataf=open(data,'r')
@@ -43,7 +43,7 @@ def lmp2xyz(lammps,xyz,xpos):
       mass[i]=float(datafile[count].split()[1])
       count+=1
   else: 
-    print "\nWill continue without a data file specification"
+    print("\nWill continue without a data file specification")
   header=9
   lines=fin.readlines()
   numatoms=lines[3].split()[0]
@@ -77,8 +77,8 @@ def lmp2xyz(lammps,xyz,xpos):
       parse=line.split()
       if parse[0]!="":
         if data!='n': 
-          if parse[1] not in types.keys():
-            type=raw_input("Atom name for type %s: "%parse[1])
+          if parse[1] not in types:
+            type=input("Atom name for type %s: "%parse[1])
             types[parse[1]]=type
           coords[int(parse[0])-1]=[types[parse[1]],float(parse[xpos-1]),float(parse[xpos]),float(parse[xpos+1])]
         else: 
@@ -92,7 +92,7 @@ def lmp2xyz(lammps,xyz,xpos):
           if data!='n': fout.writelines("%s %2.4f %2.4f %2.4f\n"%(coords[i][0],coords[i][1],coords[i][2],coords[i][3]))
           else: fout.writelines("%d %2.4f %2.4f %2.4f\n"%(coords[i][0],coords[i][1],coords[i][2],coords[i][3]))
 
-  print "\nDone converting to xyz!!\n"
+  print("\nDone converting to xyz!!\n")
   fin.close()
   fout.close()
   return
@@ -101,7 +101,7 @@ if __name__ == '__main__':
 
     # if no input, print help and exit
     if len(sys.argv) < 2:
-        print Info()
+        print(Info)
         sys.exit(1)
 
     inputfile=sys.argv[1]
@@ -26,7 +26,10 @@ ny = int(sys.argv[5])
 nz = int(sys.argv[6])
 cfgfile = sys.argv[7]
 
-d = dump(dumpfile)
+# read and convert one snapshot at a time
+
+d = dump(dumpfile,0)
 d.map(nid,"id",ntype,"type",nx,"x",ny,"y",nz,"z")
+d.stream()
 c = cfg(d)
 c.one(cfgfile)
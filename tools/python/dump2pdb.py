@@ -30,8 +30,11 @@ pfile = sys.argv[7]
 if len(sys.argv) == 9: template = sys.argv[8]
 else: template = ""
 
-d = dump(dumpfile)
+# read and convert one snapshot at a time
+
+d = dump(dumpfile,0)
 d.map(nid,"id",ntype,"type",nx,"x",ny,"y",nz,"z")
+d.stream()
 if template: p = pdbfile(template,d)
 else: p = pdbfile(d)
 p.one(pfile)
@@ -2,10 +2,11 @@
 
 # Script:  dumpsort.py
 # Purpose: sort the snapshots in a LAMMPS dump file by atom ID
-# Syntax:  dumpsort.py oldfile N newfile
+# Syntax:  dumpsort.py oldfile N newfile [P]
 #          oldfile = old LAMMPS dump file in native LAMMPS format
 #          N = column # for atom ID (usually 1)
 #          newfile = new sorted LAMMPS dump file
+#          P = # of processes to use (optional, default = all cores)
 # Author:  Steve Plimpton (Sandia), sjplimp at gmail.com
 
 import sys,os
@@ -13,14 +14,18 @@ path = os.environ["LAMMPS_PYTHON_TOOLS"]
 sys.path.insert(1,path)
 from dump import dump
 
-if len(sys.argv) != 4:
-  sys.exit("Syntax: dumpsort.py oldfile N newfile")
+if len(sys.argv) != 4 and len(sys.argv) != 5:
+  sys.exit("Syntax: dumpsort.py oldfile N newfile [P]")
 
 oldfile = sys.argv[1]
 ncolumn = int(sys.argv[2])
 newfile = sys.argv[3]
+nprocs = 0
+if len(sys.argv) == 5: nprocs = int(sys.argv[4])
 
-d = dump(oldfile)
+# snapshots are sorted in parallel, one block of snapshots per process
+
+d = dump(oldfile,0)
+d.index()
 d.map(ncolumn,"id")
-d.sort()
-d.write(newfile)
+d.parallel(newfile,nprocs,"sort")
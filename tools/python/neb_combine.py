@@ -13,7 +13,7 @@
 import sys,os
 path = os.environ["LAMMPS_PYTHON_TOOLS"]
 sys.path.insert(1,path)
-from dump import dump
+from dump import dump, pfor
 
 # parse args
 
@@ -41,48 +41,49 @@ while iarg < narg:
 if iarg < narg or not outfile or not rfiles:
   sys.exit("Syntax: neb_combine.py -o outfile -b backfile -r dump1 dump2 ...")
 
-if os.path.exists(outfile): os.remove(outfile)
-
 # ntotal = total atoms in each snapshot
-# reset IDs of atoms in each NEB dump file
+# snapshots of NEB dump files are indexed, not read
+# IDs of atoms in each NEB dump file are reset when a snapshot is read
 
 ntotal = 0
 d = []
+idstart = []
+frames = []
 for file in rfiles:
-  one = dump(file)
-  nnew = one.snaps[0].nselect
-  idvec = range(ntotal+1,ntotal+nnew+1)
-  one.setv("id",idvec)
+  one = dump(file,0)
+  one.index()
+  nnew = one.frames[0][3]
+  idstart.append(ntotal)
   ntotal += nnew
   d.append(one)
+  frames.append(dict((frame[2],frame) for frame in one.frames))
 
 # nback = additional atoms in each snapshot
-# reset IDs of atoms in background file
+# reset IDs of atoms in first snapshot of background file
 
 if backfile:
-  back = dump(backfile)
-  t = back.time()
-  back.tselect.one(t[0])
-  nback = back.snaps[0].nselect
-  idvec = range(ntotal+1,ntotal+nback+1)
-  back.setv("id",idvec)
+  back = dump(backfile,0)
+  back.index()
+  bsnap = back.read_frame(back.frames[0])
+  nback = bsnap.natoms
+  bsnap.atoms[:,back.names["id"]] = range(ntotal+1,ntotal+nback+1)
 else: nback = 0
 ntotal += nback
 
 # write out each snapshot
 # natoms = ntotal, by overwriting nselect
 # add background atoms if requested
+# snapshots are combined in parallel, one block of timesteps per process
 
-times = d[0].time()
-for time in times:
-  d[0].tselect.one(time)
-  i = d[0].findtime(time)
-  hold = d[0].snaps[i].nselect
-  d[0].snaps[i].nselect = ntotal
-  d[0].write(outfile,1,1)
-  d[0].snaps[i].nselect = hold
-  for one in d[1:]:
-    one.tselect.one(time)
-    one.write(outfile,0,1)
-  if backfile: back.write(outfile,0,1)
+def combine(time,f):
+  for i,one in enumerate(d):
+    snap = one.read_frame(frames[i][time])
+    snap.atoms[:,one.names["id"]] = range(idstart[i]+1,idstart[i]+snap.natoms+1)
+    if i == 0:
+      snap.nselect = ntotal
+      one.write_snapshot(f,snap,1)
+    else: one.write_snapshot(f,snap,0)
+  if backfile: back.write_snapshot(f,bsnap,0)
 
+times = [frame[2] for frame in d[0].frames]
+pfor(combine,times,outfile)
@@ -21,6 +21,9 @@ c.many()                write snapshots to tmp0000.cfg, tmp0001.cfg, etc
 c.many("new")           write snapshots to new0000.cfg, new0001.cfg, etc
 c.single(N)             write snapshot for timestep N to tmp.cfg
 c.single(N,"file")      write snapshot for timestep N to file.cfg
+
+  if d is a dump object in streaming mode (d.stream()), one() and many()
+    convert one snapshot at a time with constant memory use
 """
 
 # History
@@ -39,6 +42,8 @@ c.single(N,"file")      write snapshot for timestep N to file.cfg
 # Imports and external programs
 
 import sys
+import numpy as np
+from dump import BUFSIZE, dump, write_rows
 
 # Class definition
 
@@ -56,37 +61,12 @@ class cfg:
     elif args[0][-4:] == ".cfg": file = args[0]
     else: file = args[0] + ".cfg"
 
-    f = open(file,"w")
+    f = open(file,"w",BUFSIZE)
     n = flag = 0
     while 1:
       which,time,flag = self.data.iterator(flag)
       if flag == -1: break
-      time,box,atoms,bonds,tris,lines = self.data.viz(which)
-
-      xlen = box[3]-box[0]
-      ylen = box[4]-box[1]
-      zlen = box[5]-box[2]
-
-      print("Number of particles = %d " % len(atoms), file=f)
-      print("# Timestep %d \n#\nA = 1.0 Angstrom" % time, file=f)
-      print("H0(1,1) = %20.10f A " % xlen, file=f)
-      print("H0(1,2) = 0.0 A ", file=f)
-      print("H0(1,3) = 0.0 A ", file=f)
-      print("H0(2,1) = 0.0 A ", file=f)
-      print("H0(2,2) = %20.10f A " % ylen, file=f)
-      print("H0(2,3) = 0.0 A ", file=f)
-      print("H0(3,1) = 0.0 A ", file=f)
-      print("H0(3,2) = 0.0 A ", file=f)
-      print("H0(3,3) = %20.10f A " % zlen, file=f)
-      print("#", file=f)
-
-      for atom in atoms:
-        itype = int(atom[1])
-        xfrac = (atom[2]-box[0])/xlen
-        yfrac = (atom[3]-box[1])/ylen
-        zfrac = (atom[4]-box[2])/zlen
-#        print("1.0  %d   %15.10f  %15.10f  %15.10f  %15.10f  %15.10f  %15.10f " % (itype,xfrac,yfrac,zfrac,atom[5],atom[6],atom[7]), file=f)
-        print("1.0  %d   %15.10f  %15.10f  %15.10f  0.0 0.0 0.0 " % (itype,xfrac,yfrac,zfrac), file=f)
+      self.convert(f,which)
 
       print(time)
       sys.stdout.flush()
@@ -105,8 +85,6 @@ class cfg:
     while 1:
       which,time,flag = self.data.iterator(flag)
       if flag == -1: break
-      time,box,atoms,bonds,tris,lines = self.data.viz(which)
-
       if n < 10:
         file = root + "000" + str(n)
       elif n < 100:
@@ -116,32 +94,8 @@ class cfg:
       else:
         file = root + str(n)
       file += ".cfg"
-      f = open(file,"w")
-
-      xlen = box[3]-box[0]
-      ylen = box[4]-box[1]
-      zlen = box[5]-box[2]
-
-      print("Number of particles = %d " % len(atoms), file=f)
-      print("# Timestep %d \n#\nA = 1.0 Angstrom" % time, file=f)
-      print("H0(1,1) = %20.10f A " % xlen, file=f)
-      print("H0(1,2) = 0.0 A ", file=f)
-      print("H0(1,3) = 0.0 A ", file=f)
-      print("H0(2,1) = 0.0 A ", file=f)
-      print("H0(2,2) = %20.10f A " % ylen, file=f)
-      print("H0(2,3) = 0.0 A ", file=f)
-      print("H0(3,1) = 0.0 A ", file=f)
-      print("H0(3,2) = 0.0 A ", file=f)
-      print("H0(3,3) = %20.10f A " % zlen, file=f)
-      print("#", file=f)
-
-      for atom in atoms:
-        itype = int(atom[1])
-        xfrac = (atom[2]-box[0])/xlen
-        yfrac = (atom[3]-box[1])/ylen
-        zfrac = (atom[4]-box[2])/zlen
-#        print("1.0  %d   %15.10f  %15.10f  %15.10f  %15.10f  %15.10f  %15.10f " % (itype,xfrac,yfrac,zfrac,atom[5],atom[6],atom[7]), file=f)
-        print("1.0  %d   %15.10f  %15.10f  %15.10f  0.0 0.0 0.0 " % (itype,xfrac,yfrac,zfrac), file=f)
+      f = open(file,"w",BUFSIZE)
+      self.convert(f,which)
 
       print(time)
       sys.stdout.flush()
@@ -158,8 +112,21 @@ class cfg:
     else: file = args[0] + ".cfg"
 
     which = self.data.findtime(time)
-    time,box,atoms,bonds,tris,lines = self.data.viz(which)
-    f = open(file,"w")
+    f = open(file,"w",BUFSIZE)
+    self.convert(f,which)
+    f.close()
+
+  # --------------------------------------------------------------------
+  # write selected atoms of one snapshot to f in CFG format
+  # CFG uses fractional coords
+  # dump objects return atoms directly as NumPy array
+
+  def convert(self,f,which):
+    if isinstance(self.data,dump):
+      time,box,atoms,bonds,tris,lines = self.data.viz(which,1)
+    else:
+      time,box,atoms,bonds,tris,lines = self.data.viz(which)
+      atoms = np.asarray(atoms,float).reshape(-1,5)
 
     xlen = box[3]-box[0]
     ylen = box[4]-box[1]
@@ -178,12 +145,7 @@ class cfg:
     print("H0(3,3) = %20.10f A " % zlen, file=f)
     print("#", file=f)
 
-    for atom in atoms:
-      itype = int(atom[1])
-      xfrac = (atom[2]-box[0])/xlen
-      yfrac = (atom[3]-box[1])/ylen
-      zfrac = (atom[4]-box[2])/zlen
-#        print("1.0  %d   %15.10f  %15.10f  %15.10f  %15.10f  %15.10f  %15.10f " % (itype,xfrac,yfrac,zfrac,atom[5],atom[6],atom[7]), file=f)
-      print("1.0  %d   %15.10f  %15.10f  %15.10f  0.0 0.0 0.0 " % (itype,xfrac,yfrac,zfrac), file=f)
-
-    f.close()
+    rows = np.empty((len(atoms),4))
+    rows[:,0] = atoms[:,1]
+    rows[:,1:4] = (atoms[:,2:5] - np.array(box[0:3])) / np.array([xlen,ylen,zlen])
+    write_rows(f,"1.0  %d   %15.10f  %15.10f  %15.10f  0.0 0.0 0.0 \n",rows)
@@ -32,6 +32,15 @@ time = d.next()                   read next snapshot from dump files
   return -1 if no snapshots left or last snapshot is incomplete
   no column name assignment or unscaling is performed
 
+d.stream()                        iterate over snapshots without storing them
+
+  used with 2-argument constructor to convert large dump files
+  iterator() then reads the next snapshot from the dump files (can be gzipped)
+    and discards the previous one, so only one snapshot is kept in memory
+  iterator(0) restarts from the first file
+  column names are assigned and snapshots are unscaled as they are read
+  duplicate time stamps are not culled, snapshots are not sorted by time
+
 d.map(1,"id",3,"x")               assign names to atom columns (1-N)
 
   not needed if dump file is self-describing
@@ -69,6 +78,20 @@ d.scatter("tmp")                   write selected steps/atoms to multiple files
     headd = 0/1 for no/yes snapshot header, app = 0/1 for write vs append
   scatter() files are given timestep suffix: e.g. tmp.0, tmp.100, etc
 
+d.index()                          locate snapshots in files by byte offset
+d.parallel("file",P,"sort",...)    process and write snapshots on P processes
+
+  used with 2-argument constructor for dump files too large to read at once
+  index() orders snapshots by time stamp and skips duplicate time stamps
+    column names are assigned from the first snapshot, so use map() after it
+    gzipped dump files cannot be indexed
+  parallel() reads, modifies, and writes all indexed snapshots
+    P = # of processes, 0 = use all cores
+    further args = operations applied to each snapshot in order
+      "scale", "unscale", "wrap", "unwrap", "sort", or a function f(snap)
+    each process writes a contiguous block of snapshots to its own file
+      and the files are concatenated in order into the new dump file
+
 d.scale()                          scale x,y,z to 0-1 for all timesteps
 d.scale(100)                       scale atom coords for timestep N
 d.unscale()                        unscale x,y,z to box size to all timesteps
@@ -121,6 +144,7 @@ fx,fy,... = d.vecs(1000,"fx","fy",...)  return vector(s) for timestep N
 
 index,time,flag = d.iterator(0/1)          loop over dump snapshots
 time,box,atoms,bonds,tris = d.viz(index)   return list of viz objects
+time,box,atoms,bonds,tris = d.viz(index,1) return atoms,bonds as arrays
 d.atype = "color"                          set column returned as "type" by viz
 d.extra("dump.bond")                       read bond list from dump file
 d.extra(data)                              extract bond/tri/line list from data
@@ -136,6 +160,8 @@ d.extra(data)                              extract bond/tri/line list from data
     atoms = id,type,x,y,z for each atom as 2d array
     bonds = id,type,x1,y1,z1,x2,y2,z2,t1,t2 for each bond as 2d array
       if bonds() was used to define bonds, else empty list
+    with 2nd arg = 1, atoms and bonds are (N,5) and (M,10) NumPy arrays
+      instead of lists, bonds is then an empty array if no bonds defined
     tris = id,type,x1,y1,z1,x2,y2,z2,x3,y3,z3,nx,ny,nz for each tri as 2d array
       if extra() was used to define tris, else empty list
     lines = id,type,x1,y1,z1,x2,y2,z2 for each line as 2d array
@@ -152,7 +178,6 @@ d.extra(data)                              extract bond/tri/line list from data
 #   08/22, Axel Kohlmeyer (Temple U): remove Numeric, more Python 2/3 compatibility
 
 # ToDo list
-#   try to optimize this line in read_snap: words += f.readline().split()
 #   allow $name in aselect.test() and set() to end with non-space
 #   should next() snapshot be auto-unscaled ?
 
@@ -161,6 +186,9 @@ d.extra(data)                              extract bond/tri/line list from data
 #   increment = 1 if reading snapshots one-at-a-time
 #   nextfile = which file to read from via next()
 #   eof = ptr into current file for where to read via next()
+#   streaming = 1 if iterator() reads and discards snapshots one at a time
+#   sfile = open file that snapshots are streamed from
+#   frames = list of (file,offset,time,natoms) for snapshots found by index()
 #   nsnaps = # of snapshots
 #   nselect = # of selected snapshots
 #   snaps = list of snapshots
@@ -184,10 +212,11 @@ d.extra(data)                              extract bond/tri/line list from data
 #     aselect[i] = 0/1 for each atom
 #     xlo,xhi,ylo,yhi,zlo,zhi = box bounds (float)
 #     atoms[i][j] = 2d array of floats, i = 0 to natoms-1, j = 0 to ncols-1
+#     idindex = cached (ordering,sorted IDs) of atoms, None if not yet created
 
 # Imports and external programs
 
-import sys, re, glob, types
+import sys, os, re, glob, types, shutil, tempfile, multiprocessing
 from os import popen
 from math import *             # any function could be used by set()
 
@@ -196,6 +225,67 @@ import numpy as np
 try: from DEFAULTS import PIZZA_GUNZIP
 except: PIZZA_GUNZIP = "gunzip"
 
+# size of output file buffers in bytes
+
+BUFSIZE = 1 << 20
+
+# write rows of 2d array with format string fmt for a single row
+# formats a large block of rows with one string operation
+
+def write_rows(f,fmt,rows,chunk=16384):
+  for i in range(0,len(rows),chunk):
+    block = rows[i:i+chunk]
+    f.write((fmt*len(block)) % tuple(block.ravel().tolist()))
+
+# --------------------------------------------------------------------
+# call func(task,f) for each task on nprocs processes (0 = all cores)
+# f = open output file, func writes output for its task to it
+# tasks are split into contiguous blocks, each block is written to its
+#   own temporary file, files are appended to outfile in task order
+# func is inherited by the forked processes, so it need not be picklable
+
+pfunc = None
+
+def pblock(args):
+  tasks,file = args
+  f = open(file,"w",BUFSIZE)
+  for task in tasks: pfunc(task,f)
+  f.close()
+  return file
+
+def pfor(func,tasks,outfile,nprocs=0):
+  global pfunc
+  if nprocs <= 0: nprocs = multiprocessing.cpu_count()
+  nblocks = min(len(tasks),4*nprocs)
+
+  if nprocs == 1 or nblocks <= 1:
+    f = open(outfile,"w",BUFSIZE)
+    for task in tasks: func(task,f)
+    f.close()
+    return
+
+  tmpdir = tempfile.mkdtemp(dir=os.path.dirname(os.path.abspath(outfile)))
+  blocks = []
+  for i in range(nblocks):
+    lo = i*len(tasks) // nblocks
+    hi = (i+1)*len(tasks) // nblocks
+    blocks.append((tasks[lo:hi],os.path.join(tmpdir,"block.%d" % i)))
+
+  pfunc = func
+  pool = multiprocessing.get_context("fork").Pool(min(nprocs,nblocks))
+  try:
+    with open(outfile,"wb") as out:
+      for file in pool.imap(pblock,blocks):
+        with open(file,"rb") as part:
+          shutil.copyfileobj(part,out,BUFSIZE)
+        os.remove(file)
+    pool.close()
+  finally:
+    pool.terminate()
+    pool.join()
+    shutil.rmtree(tmpdir,ignore_errors=True)
+    pfunc = None
+
 # --------------------------------------------------------------------
 # wrapper to convert old style comparision function to key function
 
@@ -231,6 +321,9 @@ class dump:
     self.triobj = 0
     self.lineflag = 0
     self.linelist = []
+    self.streaming = 0
+    self.sfile = None
+    self.frames = []
 
     # flist = list of all dump file names
 
@@ -283,17 +376,7 @@ class dump:
 
     # set default names for atom columns if file wasn't self-describing
 
-    if len(self.snaps) == 0:
-      print("no column assignments made")
-    elif len(self.names):
-      print("assigned columns:",self.names2str())
-    elif self.snaps[0].atoms is None:
-      print("no column assignments made")
-    elif len(self.snaps[0].atoms[0]) == 5:
-      self.map(1,"id",2,"type",3,"x",4,"y",5,"z")
-      print("assigned columns:",self.names2str())
-    elif len(self.snaps[0].atoms[0]) == 8:
-      self.map(1,"id",2,"type",3,"x",4,"y",5,"z",6,"ix",7,"iy",8,"iz")
+    if len(self.snaps) and self.default_names(self.snaps[0]):
       print("assigned columns:",self.names2str())
     else:
       print("no column assignments made")
@@ -348,6 +431,158 @@ class dump:
 
     return snap.time
 
+  # --------------------------------------------------------------------
+  # assign default column names from # of columns in snapshot
+  # return 1 if names are assigned, 0 if not
+
+  def default_names(self,snap):
+    if len(self.names): return 1
+    if snap.atoms is None: return 0
+    if len(snap.atoms[0]) == 5:
+      self.map(1,"id",2,"type",3,"x",4,"y",5,"z")
+    elif len(snap.atoms[0]) == 8:
+      self.map(1,"id",2,"type",3,"x",4,"y",5,"z",6,"ix",7,"iy",8,"iz")
+    else: return 0
+    return 1
+
+  # --------------------------------------------------------------------
+  # switch iterator() to reading one snapshot at a time from the files
+
+  def stream(self):
+    if not self.increment: raise Exception("cannot stream after reading all snapshots")
+    self.streaming = 1
+
+  # --------------------------------------------------------------------
+  # replace current snapshot with next one from files in streaming mode
+  # return snapshot time stamp or -1 if no snapshots left
+
+  def stream_next(self):
+    self.snaps = []
+    self.nsnaps = self.nselect = 0
+
+    while True:
+      if not self.sfile:
+        if self.nextfile == len(self.flist): return -1
+        file = self.flist[self.nextfile]
+        if file[-3:] == ".gz":
+          self.sfile = popen("%s -c %s" % (PIZZA_GUNZIP,file),'r')
+        else: self.sfile = open(file)
+      snap = self.read_snapshot(self.sfile)
+      if snap: break
+      self.sfile.close()
+      self.sfile = None
+      self.nextfile += 1
+
+    self.prepare(snap)
+    self.snaps.append(snap)
+    self.nsnaps = self.nselect = 1
+    return snap.time
+
+  # --------------------------------------------------------------------
+  # select all atoms of a snapshot read one at a time
+  # assign default column names and unscale it if needed
+
+  def prepare(self,snap):
+    snap.tselect = 1
+    snap.nselect = snap.natoms
+    snap.aselect[:] = 1
+    self.default_names(snap)
+    if "x" in self.names and "y" in self.names and "z" in self.names:
+      if self.scaled_one(snap):
+        self.unscale_one(snap,self.names["x"],self.names["y"],self.names["z"])
+
+  # --------------------------------------------------------------------
+  # find time stamp, byte offset and # of atoms of all snapshots in files
+  # offset is the first ITEM line of a snapshot, so UNITS and TIME are kept
+  # store them in frames, ordered by time stamp without duplicates
+  # assign column names from first snapshot if not already done
+
+  def index(self):
+    if not self.increment: raise Exception("cannot index after reading all snapshots")
+
+    frames = []
+    for file in self.flist:
+      if file[-3:] == ".gz":
+        raise Exception("cannot index gzipped dump file %s" % file)
+      f = open(file,"rb")
+      start = None
+      while True:
+        offset = f.tell()
+        line = f.readline()
+        if not line: break
+        if not line.startswith(b"ITEM:"): continue
+        if start is None: start = offset
+        if not line.startswith(b"ITEM: TIMESTEP"): continue
+        try:
+          time = int(f.readline().split()[0])
+          f.readline()
+          natoms = int(f.readline())
+        except: break
+        line = f.readline()
+        while line and not line.startswith(b"ITEM: ATOMS"): line = f.readline()
+        if not line: break
+        n = 0
+        while n < natoms and f.readline(): n += 1
+        if n < natoms: break
+        frames.append((file,start,time,natoms))
+        start = None
+      f.close()
+
+    frames.sort(key=lambda frame: frame[2])
+    self.frames = []
+    for frame in frames:
+      if not self.frames or frame[2] != self.frames[-1][2]:
+        self.frames.append(frame)
+    print("indexed %d snapshots" % len(self.frames))
+
+    if self.frames and not len(self.names): self.read_frame(self.frames[0])
+
+  # --------------------------------------------------------------------
+  # read snapshot for one frame found by index() and select all its atoms
+
+  def read_frame(self,frame):
+    f = open(frame[0])
+    f.seek(frame[1])
+    snap = self.read_snapshot(f)
+    f.close()
+    if not snap:
+      raise Exception("could not read snapshot %d from %s" % (frame[2],frame[0]))
+    self.prepare(snap)
+    return snap
+
+  # --------------------------------------------------------------------
+  # read all indexed snapshots, apply ops to each, and write them to file
+  # snapshots are processed in parallel on nprocs processes
+
+  def parallel(self,file,nprocs,*ops):
+    if not self.frames: self.index()
+    for op in ops:
+      if not callable(op) and \
+         op not in ("scale","unscale","wrap","unwrap","sort"):
+        raise Exception("unknown parallel() operation %s" % op)
+
+    def one(frame,f):
+      snap = self.read_frame(frame)
+      for op in ops:
+        if callable(op): op(snap)
+        elif op == "sort": self.sort_one(snap,self.names["id"])
+        else:
+          x = self.names["x"]
+          y = self.names["y"]
+          z = self.names["z"]
+          if op == "scale": self.scale_one(snap,x,y,z)
+          elif op == "unscale": self.unscale_one(snap,x,y,z)
+          else:
+            ix = self.names["ix"]
+            iy = self.names["iy"]
+            iz = self.names["iz"]
+            if op == "wrap": self.wrap_one(snap,x,y,z,ix,iy,iz)
+            else: self.unwrap_one(snap,x,y,z,ix,iy,iz)
+      self.write_snapshot(f,snap)
+
+    pfor(one,self.frames,file,nprocs)
+    print("%d snapshots" % len(self.frames))
+
   # --------------------------------------------------------------------
   # read a single snapshot from file f
   # return snapshot or 0 if failed
@@ -357,6 +592,7 @@ class dump:
   def read_snapshot(self,f):
     try:
       snap = Snap()
+      snap.idindex = None
       snap.units = 'unknown'
       snap.stime = -1.0
       # read until hitting next "TIMESTEP" item
@@ -400,12 +636,9 @@ class dump:
             else: self.names[words[i]] = i
 
       if snap.natoms:
-        words = f.readline().split()
-        ncol = len(words)
-        for i in range(1,snap.natoms):
-          words += f.readline().split()
-        floats = map(float,words)
-        atom_data = np.array(list(floats),float)
+        lines = [f.readline() for i in range(snap.natoms)]
+        ncol = len(lines[0].split())
+        atom_data = np.array(''.join(lines).split(),float)
 
         snap.atoms = atom_data.reshape((snap.natoms, ncol))
       else:
@@ -418,17 +651,20 @@ class dump:
   # decide if snapshot i is scaled/unscaled from coords of first and last atom
 
   def scaled(self,i):
+    return self.scaled_one(self.snaps[i])
+
+  def scaled_one(self,snap):
     ix = self.names["x"]
     iy = self.names["y"]
     iz = self.names["z"]
-    natoms = self.snaps[i].natoms
+    natoms = snap.natoms
     if natoms == 0: return 0
-    x1 = self.snaps[i].atoms[0][ix]
-    y1 = self.snaps[i].atoms[0][iy]
-    z1 = self.snaps[i].atoms[0][iz]
-    x2 = self.snaps[i].atoms[natoms-1][ix]
-    y2 = self.snaps[i].atoms[natoms-1][iy]
-    z2 = self.snaps[i].atoms[natoms-1][iz]
+    x1 = snap.atoms[0][ix]
+    y1 = snap.atoms[0][iy]
+    z1 = snap.atoms[0][iz]
+    x2 = snap.atoms[natoms-1][ix]
+    y2 = snap.atoms[natoms-1][iy]
+    z2 = snap.atoms[natoms-1][iz]
     if x1 >= -0.1 and x1 <= 1.1 and y1 >= -0.1 and y1 <= 1.1 and \
        z1 >= -0.1 and z1 <= 1.1 and x2 >= -0.1 and x2 <= 1.1 and \
        y2 >= -0.1 and y2 <= 1.1 and z2 >= -0.1 and z2 <= 1.1:
@@ -529,14 +765,18 @@ class dump:
     iy = self.names["iy"]
     iz = self.names["iz"]
 
-    for snap in self.snaps:
-      xprd = snap.xhi - snap.xlo
-      yprd = snap.yhi - snap.ylo
-      zprd = snap.zhi - snap.zlo
-      atoms = snap.atoms
-      atoms[:,x] -= atoms[:,ix]*xprd
-      atoms[:,y] -= atoms[:,iy]*yprd
-      atoms[:,z] -= atoms[:,iz]*zprd
+    for snap in self.snaps: self.wrap_one(snap,x,y,z,ix,iy,iz)
+
+  # --------------------------------------------------------------------
+
+  def wrap_one(self,snap,x,y,z,ix,iy,iz):
+    xprd = snap.xhi - snap.xlo
+    yprd = snap.yhi - snap.ylo
+    zprd = snap.zhi - snap.zlo
+    atoms = snap.atoms
+    atoms[:,x] -= atoms[:,ix]*xprd
+    atoms[:,y] -= atoms[:,iy]*yprd
+    atoms[:,z] -= atoms[:,iz]*zprd
 
   # --------------------------------------------------------------------
   # unwrap coords from inside box to outside
@@ -551,14 +791,18 @@ class dump:
     iy = self.names["iy"]
     iz = self.names["iz"]
 
-    for snap in self.snaps:
-      xprd = snap.xhi - snap.xlo
-      yprd = snap.yhi - snap.ylo
-      zprd = snap.zhi - snap.zlo
-      atoms = snap.atoms
-      atoms[:,x] += atoms[:,ix]*xprd
-      atoms[:,y] += atoms[:,iy]*yprd
-      atoms[:,z] += atoms[:,iz]*zprd
+    for snap in self.snaps: self.unwrap_one(snap,x,y,z,ix,iy,iz)
+
+  # --------------------------------------------------------------------
+
+  def unwrap_one(self,snap,x,y,z,ix,iy,iz):
+    xprd = snap.xhi - snap.xlo
+    yprd = snap.yhi - snap.ylo
+    zprd = snap.zhi - snap.zlo
+    atoms = snap.atoms
+    atoms[:,x] += atoms[:,ix]*xprd
+    atoms[:,y] += atoms[:,iy]*yprd
+    atoms[:,z] += atoms[:,iz]*zprd
 
   # --------------------------------------------------------------------
   # wrap coords to same image as atom ID stored in "other" column
@@ -566,7 +810,9 @@ class dump:
   def owrap(self,other):
     print("Wrapping to other ...")
 
-    id = self.names["id"]
+    # atom IDs are looked up by idindex() in owrap_one()
+    if "id" not in self.names:
+      raise Exception("owrap() requires the id column")
     x = self.names["x"]
     y = self.names["y"]
     z = self.names["z"]
@@ -576,24 +822,32 @@ class dump:
     iother = self.names[other]
 
     for snap in self.snaps:
-      xprd = snap.xhi - snap.xlo
-      yprd = snap.yhi - snap.ylo
-      zprd = snap.zhi - snap.zlo
-      atoms = snap.atoms
-      ids = {}
-      for i in range(snap.natoms):
-        ids[atoms[i][id]] = i
-      for i in range(snap.natoms):
-        j = ids[atoms[i][iother]]
-        atoms[i][x] += (atoms[i][ix]-atoms[j][ix])*xprd
-        atoms[i][y] += (atoms[i][iy]-atoms[j][iy])*yprd
-        atoms[i][z] += (atoms[i][iz]-atoms[j][iz])*zprd
+      self.owrap_one(snap,iother,x,y,z,ix,iy,iz)
+
+  # --------------------------------------------------------------------
+  # row j of the other atom is found via the sorted atom IDs
+
+  def owrap_one(self,snap,iother,x,y,z,ix,iy,iz):
+    xprd = snap.xhi - snap.xlo
+    yprd = snap.yhi - snap.ylo
+    zprd = snap.zhi - snap.zlo
+    atoms = snap.atoms
+    ordering,ids = self.idindex(snap)
+    others = atoms[:,iother].astype(int)
+    index = np.searchsorted(ids,others)
+    index[index == len(ids)] = 0
+    if (ids[index] != others).any():
+      raise Exception("owrap() found atom ID that does not exist")
+    j = ordering[index]
+    atoms[:,x] += (atoms[:,ix]-atoms[j,ix])*xprd
+    atoms[:,y] += (atoms[:,iy]-atoms[j,iy])*yprd
+    atoms[:,z] += (atoms[:,iz]-atoms[j,iz])*zprd
 
   # --------------------------------------------------------------------
   # convert column names assignment to a string, in column order
 
-  def names2str(self):
-    ncol = len(self.snaps[0].atoms[0])
+  def names2str(self,ncol=0):
+    if not ncol: ncol = len(self.snaps[0].atoms[0])
     pairs = self.names.items()
     str = ""
     for i in range(ncol):
@@ -629,49 +883,52 @@ class dump:
     atoms = snap.atoms
     ids = atoms[:,id]
     ordering = np.argsort(ids)
-    for i in range(len(atoms[0])):
-      atoms[:,i] = np.take(atoms[:,i],ordering)
+    atoms[:] = atoms[ordering]
+    snap.idindex = None
 
   # --------------------------------------------------------------------
   # write a single dump file from current selection
 
   def write(self,file,header=1,append=0):
-    if len(self.snaps): namestr = self.names2str()
-    if not append: f = open(file,"w")
-    else: f = open(file,"a")
+    if not append: f = open(file,"w",BUFSIZE)
+    else: f = open(file,"a",BUFSIZE)
     for snap in self.snaps:
       if not snap.tselect: continue
       print(snap.time,end=' ')
       sys.stdout.flush()
-
-      if header:
-        print("ITEM: TIMESTEP",file=f)
-        print(snap.time,file=f)
-        print("ITEM: NUMBER OF ATOMS",file=f)
-        print(snap.nselect,file=f)
-        print("ITEM: BOX BOUNDS",file=f)
-        print(snap.xlo,snap.xhi,file=f)
-        print(snap.ylo,snap.yhi,file=f)
-        print(snap.zlo,snap.zhi,file=f)
-        print("ITEM: ATOMS",namestr,file=f)
-
-      atoms = snap.atoms
-      nvalues = len(atoms[0])
-      keys = dict()
-      for pair in self.names.items():
-        keys[pair[1]] = pair[0]
-      for i in range(snap.natoms):
-        if not snap.aselect[i]: continue
-        line = ""
-        for j in range(nvalues):
-          if keys[j] == 'id' or keys[j] == 'type' or keys[j] == 'mol':
-            line += str(int(atoms[i][j])) + " "
-          else:
-            line += str(atoms[i][j]) + " "
-        print(line,file=f)
+      self.write_snapshot(f,snap,header)
     f.close()
     print("\n%d snapshots" % self.nselect)
 
+  # --------------------------------------------------------------------
+  # write selected atoms of one snapshot to open file f
+  # id, type, mol columns are written as ints
+
+  def write_snapshot(self,f,snap,header=1):
+    if snap.natoms: ncol = len(snap.atoms[0])
+    else: ncol = len(self.names)
+
+    if header:
+      print("ITEM: TIMESTEP",file=f)
+      print(snap.time,file=f)
+      print("ITEM: NUMBER OF ATOMS",file=f)
+      print(snap.nselect,file=f)
+      print("ITEM: BOX BOUNDS",file=f)
+      print(snap.xlo,snap.xhi,file=f)
+      print(snap.ylo,snap.yhi,file=f)
+      print(snap.zlo,snap.zhi,file=f)
+      print("ITEM: ATOMS",self.names2str(ncol),file=f)
+    if not snap.natoms: return
+
+    keys = dict()
+    for pair in self.names.items():
+      keys[pair[1]] = pair[0]
+    fmt = ""
+    for j in range(ncol):
+      if keys[j] == 'id' or keys[j] == 'type' or keys[j] == 'mol': fmt += "%d "
+      else: fmt += "%r "
+    write_rows(f,fmt + "\n",snap.atoms[snap.aselect != 0])
+
   # --------------------------------------------------------------------
   # write one dump file per snapshot from current selection
 
@@ -716,12 +973,11 @@ class dump:
     min = 1.0e20
     max = -min
     for snap in self.snaps:
-      if not snap.tselect: continue
-      atoms = snap.atoms
-      for i in range(snap.natoms):
-        if not snap.aselect[i]: continue
-        if atoms[i][icol] < min: min = atoms[i][icol]
-        if atoms[i][icol] > max: max = atoms[i][icol]
+      if not snap.tselect or not snap.natoms: continue
+      values = snap.atoms[snap.aselect != 0,icol]
+      if not len(values): continue
+      if values.min() < min: min = values.min()
+      if values.max() > max: max = values.max()
     return (min,max)
 
   # --------------------------------------------------------------------
@@ -747,6 +1003,7 @@ class dump:
       if not snap.tselect: continue
       for i in range(snap.natoms):
         if snap.aselect[i]: exec(ceq)
+      if lhs == "id": snap.idindex = None
 
   # --------------------------------------------------------------------
   # set a column value via an input vec for all selected snapshots/atoms
@@ -767,6 +1024,7 @@ class dump:
         if snap.aselect[i]:
           atoms[i][icol] = vec[m]
           m += 1
+      if colname == "id": snap.idindex = None
 
   # --------------------------------------------------------------------
   # clone value in col across selected timesteps for atoms with same ID
@@ -914,6 +1172,16 @@ class dump:
   # iterate over selected snapshots
 
   def iterator(self,flag):
+    if self.streaming:
+      if not flag:
+        if self.sfile: self.sfile.close()
+        self.sfile = None
+        self.nextfile = 0
+      time = self.stream_next()
+      if time < 0: return 0,0,-1
+      self.iterate = 0
+      return 0,time,1
+
     start = 0
     if flag: start = self.iterate + 1
     for i in range(start,self.nsnaps):
@@ -926,7 +1194,7 @@ class dump:
   # return list of atoms to viz for snapshot isnap
   # augment with bonds, tris, lines if extra() was invoked
 
-  def viz(self,isnap):
+  def viz(self,isnap,array=0):
     snap = self.snaps[isnap]
 
     time = snap.time
@@ -937,35 +1205,40 @@ class dump:
     y = self.names["y"]
     z = self.names["z"]
 
-    # create atom list needed by viz from id,type,x,y,z
-    # need Numeric/Numpy mode here
-
-    atoms = []
-    for i in range(snap.natoms):
-      if not snap.aselect[i]: continue
-      atom = snap.atoms[i]
-      atoms.append([atom[id],atom[type],atom[x],atom[y],atom[z]])
-
-    # create list of current bond coords from static bondlist
-    # alist = dictionary of atom IDs for atoms list
-    # lookup bond atom IDs in alist and grab their coords
-    # try is used since some atoms may be unselected
-    #   any bond with unselected atom is not returned to viz caller
-    # need Numeric/Numpy mode here
-
-    bonds = []
-    if self.bondflag:
-      alist = {}
-      for i in range(len(atoms)): alist[int(atoms[i][0])] = i
-      for bond in self.bondlist:
-        try:
-          i = alist[bond[2]]
-          j = alist[bond[3]]
-          atom1 = atoms[i]
-          atom2 = atoms[j]
-          bonds.append([bond[0],bond[1],atom1[2],atom1[3],atom1[4],
-                        atom2[2],atom2[3],atom2[4],atom1[1],atom2[1]])
-        except: continue
+    # create atom array needed by viz from id,type,x,y,z of selected atoms
+
+    atoms = np.zeros((0,5))
+    if snap.natoms:
+      select = snap.aselect != 0
+      atoms = snap.atoms[select][:,[id,type,x,y,z]]
+
+    # create array of current bond coords from static bondlist
+    # lookup bond atom IDs in sorted IDs of snapshot to get their rows
+    # any bond with unknown or unselected atom is not returned to viz caller
+    # rows of all atoms are then mapped to rows of selected atoms
+
+    bonds = np.zeros((0,10))
+    if self.bondflag and snap.natoms:
+      bondlist = np.asarray(self.bondlist,int).reshape(-1,4)
+      ordering,ids = self.idindex(snap)
+      index = np.searchsorted(ids,bondlist[:,2:4])
+      index[index == len(ids)] = 0
+      found = (ids[index] == bondlist[:,2:4]).all(1)
+      rows = ordering[index]
+      found &= select[rows].all(1)
+      bondlist = bondlist[found]
+      iselect = np.cumsum(select) - 1
+      atom1 = atoms[iselect[rows[found,0]]]
+      atom2 = atoms[iselect[rows[found,1]]]
+      bonds = np.column_stack((bondlist[:,0:2],atom1[:,2:5],atom2[:,2:5],
+                               atom1[:,1],atom2[:,1]))
+
+    # bond ID and type are ints in list mode, as in bondlist
+
+    if not array:
+      atoms = atoms.tolist()
+      bonds = [ids + coords for ids,coords in
+               zip(bonds[:,0:2].astype(int).tolist(),bonds[:,2:].tolist())]
 
     tris = []
     if self.triflag:
@@ -979,6 +1252,16 @@ class dump:
 
     return time,box,atoms,bonds,tris,lines
 
+  # --------------------------------------------------------------------
+  # return ordering and sorted atom IDs of a snapshot, cached until sort()
+
+  def idindex(self,snap):
+    if snap.idindex is None:
+      ids = snap.atoms[:,self.names["id"]].astype(int)
+      ordering = np.argsort(ids,kind="stable")
+      snap.idindex = (ordering,ids[ordering])
+    return snap.idindex
+
   # --------------------------------------------------------------------
 
   def findtime(self,n):
@@ -1069,7 +1352,7 @@ class dump:
                            int(words[2]),int(words[3])])
         if bondlist:
           self.bondflag = 1
-          self.bondlist = bondlist
+          self.bondlist = np.array(bondlist,int)
       except:
         raise Exception("could not extract bonds from data object")
 
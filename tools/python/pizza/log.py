@@ -23,6 +23,9 @@ l = log("log.lammps",0)               two args = store filename, but don't read
 time = l.next()                       read new thermo info from file
 
   used with 2-argument constructor to allow reading thermo incrementally
+  only the part of the file written since the last read is read, so
+    next() can follow the log of a running simulation with constant memory
+  file need not exist yet when log() is called
   return time stamp of last thermo read
   return -1 if no new thermo since last read
 
@@ -34,6 +37,8 @@ l.write("file.txt",0)                 write all vectors to a file, done write he
 l.write("file.txt",1,"Time","PE",...) write listed vectors to a file, include header comment
 
   get and write allow abbreviated (uniquely) vector names
+  get returns vectors as NumPy arrays
+  thermo sections with different vectors than the first one are skipped
 """
 
 # History
@@ -47,18 +52,30 @@ l.write("file.txt",1,"Time","PE",...) write listed vectors to a file, include he
 #   names = list of vector names
 #   ptr = dictionary, key = name, value = index into data for which column
 #   data[i][j] = 2d array of floats, i = 0 to # of entries, j = 0 to nvecs-1
+#     view of the first nlen rows of buf
+#   buf = 2d array with column storage for each vector, grown as needed
 #   style = style of LAMMPS log file, 1 = multi, 2 = one, 3 = gran
-#   firststr = string that begins a thermo section in log file
 #   increment = 1 if log file being read incrementally
 #   eof = ptr into incremental file for where to start next read
+#   section = 1 inside thermo section with same vectors, -1 inside
+#     thermo section with different vectors, 0 outside of thermo section
 
 # Imports and external programs
 
-import sys, re, glob
-from os import popen
+import sys, re, glob, gzip
 
-try: tmp = PIZZA_GUNZIP
-except: PIZZA_GUNZIP = "gunzip"
+import numpy as np
+from dump import BUFSIZE, write_rows
+
+# size of chunks the log files are read in
+
+CHUNK = 1 << 20
+
+# patterns for thermo keywords and values in multi-style entries
+
+pat_keyword = re.compile(br"\s(\S*)\s*=")
+pat_step = re.compile(br"Step\s*(\S*)\s")
+pat_value = re.compile(br"=\s*(\S*)")
 
 # Class definition
 
@@ -68,10 +85,13 @@ class log:
 
   def __init__(self,*arglist):
     self.nvec = 0
+    self.nlen = 0
     self.names = []
     self.ptr = {}
-    self.data = []
+    self.buf = np.zeros((0,0))
+    self.data = self.buf
     self.style = -1
+    self.section = 0
 
     # flist = list of all log file names
 
@@ -87,6 +107,7 @@ class log:
     else:
       if len(self.flist) > 1:
         raise ValueError("Can only read one log file incrementally")
+      if len(self.flist) == 0: self.flist = words[:1]
       self.increment = 1
       self.eof = 0
 
@@ -94,34 +115,31 @@ class log:
   # read all thermo from all files
 
   def read_all(self):
-    self.read_header(self.flist[0])
+    for file in self.flist:
+      self.section = 0
+      self.read_one(file)
     if self.nvec == 0: raise Exception("log file has no values")
 
-    # read all files
-
-    for file in self.flist: self.read_one(file)
-
     # sort entries by timestep, cull duplicates
 
-    self.data.sort(key=(lambda elem: elem[0]))
     self.cull()
-    self.nlen = len(self.data)
     print("read %d log entries" % self.nlen)
 
   # --------------------------------------------------------------------
+  # read thermo entries added to file since last call
+  # only complete entries are read, rest is read by next call
 
   def next(self):
     if not self.increment: raise Exception("cannot read incrementally")
 
-    if self.nvec == 0:
-      try:
-        fp = open(self.flist[0],'r')
-        fp.close()
-      except: return -1
-      self.read_header(self.flist[0])
-      if self.nvec == 0: return -1
+    try:
+      fp = open(self.flist[0],'r')
+      fp.close()
+    except: return -1
 
+    nlen = self.nlen
     self.eof = self.read_one(self.flist[0],self.eof)
+    if self.nlen == nlen: return -1
     return int(self.data[-1][0])
 
   # --------------------------------------------------------------------
@@ -147,9 +165,7 @@ class log:
 
     vecs = []
     for i in range(len(keys)):
-      vecs.append(self.nlen * [0])
-      for j in range(self.nlen):
-        vecs[i][j] = self.data[j][colmap[i]]
+      vecs.append(self.data[:,colmap[i]].copy())
 
     if len(keys) == 1: return vecs[0]
     else: return vecs
@@ -175,7 +191,7 @@ class log:
     else:
       colmap = range(self.nvec)
 
-    f = open(filename,"w")
+    f = open(filename,"w",BUFSIZE)
 
     # write col names from dict in the right order
     if writenames:
@@ -185,11 +201,8 @@ class log:
         print(colnames[j], file=f, end=" ")
       print("\n", file=f, end="")
 
-    # write data
-    for i in range(self.nlen):
-      for j in range(len(colmap)):
-        print(self.data[i][colmap[j]],file=f,end=" "),
-      print("\n",file=f,end="")
+    # write data in blocks of rows
+    write_rows(f,len(colmap)*"%r " + "\n",self.data[:,list(colmap)])
     f.close()
 
   # --------------------------------------------------------------------
@@ -203,151 +216,143 @@ class log:
       return 0
 
   # --------------------------------------------------------------------
+  # sort entries by timestep, keep first of entries with same timestep
 
   def cull(self):
-    i = 1
-    while i < len(self.data):
-      if self.data[i][0] == self.data[i-1][0]: del self.data[i]
-      else: i += 1
+    order = np.argsort(self.data[:,0],kind="stable")
+    steps = self.data[order,0]
+    keep = np.ones(len(order),bool)
+    keep[1:] = steps[1:] != steps[:-1]
+    self.buf = np.asfortranarray(self.data[order[keep]])
+    self.nlen = len(self.buf)
+    self.data = self.buf
 
   # --------------------------------------------------------------------
-
-  def read_header(self, file):
-    str_multi = "----- Step"
-    str_one = "Step "
-
-    if file[-3:] == ".gz":
-      fp = popen("%s -c %s" % (PIZZA_GUNZIP,file),'r')
-      txt = fp.read()
-    else:
-      fp = open(file)
-      txt = fp.read()
-
-    if txt.find(str_multi) >= 0:
-      self.firststr = str_multi
-      self.style = 1
-    elif txt.find(str_one) >= 0:
-      self.firststr = str_one
-      self.style = 2
-    else:
-      fp.close()
-      return
-
-    if self.style == 1:
-      s1 = txt.find(self.firststr)
-      s2 = txt.find("\n--",s1)
-      if (s2 == -1):
-        s2 = txt.find("\nLoop time of",s1)
-      pattern = "\s(\S*)\s*="
-      keywords = re.findall(pattern,txt[s1:s2])
-      keywords.insert(0,"Step")
-      i = 0
-      for keyword in keywords:
-        self.names.append(keyword)
-        self.ptr[keyword] = i
-        i += 1
-
-    else:
-      s1 = txt.find(self.firststr)
-      s2 = txt.find("\n",s1)
-      line = txt[s1:s2]
-      words = line.split()
-      for i in range(len(words)):
-        self.names.append(words[i])
-        self.ptr[words[i]] = i
-
-    self.nvec = len(self.names)
-    fp.close()
+  # append rows of values to data, grow column storage as needed
+
+  def append(self,rows):
+    n = self.nlen + len(rows)
+    if n > len(self.buf):
+      buf = np.zeros((max(n,2*len(self.buf),1024),self.nvec),order='F')
+      buf[:self.nlen] = self.buf[:self.nlen]
+      self.buf = buf
+    self.buf[self.nlen:n] = rows
+    self.nlen = n
+    self.data = self.buf[:n]
 
   # --------------------------------------------------------------------
+  # assign vector names from thermo header of first section found
 
-  def read_one(self,*arglist):
+  def set_names(self,names):
+    self.names = names
+    self.nvec = len(names)
+    self.ptr = {}
+    for i in range(self.nvec): self.ptr[names[i]] = i
+    self.buf = np.zeros((0,self.nvec),order='F')
+    self.data = self.buf
 
-    # if 2nd arg exists set file ptr io that value
-    # read entire (rest of) file into txt
+  # --------------------------------------------------------------------
+  # convert lines of one-line style thermo output to rows of values
+  # lines with wrong # of values or non-numeric values are skipped
+
+  def add_lines(self,lines):
+    if not lines: return
+    words = b" ".join(lines).split()
+    try:
+      if len(words) != len(lines)*self.nvec: raise ValueError
+      rows = np.array(words,float)
+    except ValueError:
+      rows = []
+      for line in lines:
+        words = line.split()
+        if len(words) != self.nvec: continue
+        try: rows += [float(word) for word in words]
+        except ValueError: continue
+      rows = np.array(rows,float)
+    self.append(rows.reshape(-1,self.nvec))
 
-    file = arglist[0]
-    if file[-3:] == ".gz":
-      f = popen("%s -c %s" % (PIZZA_GUNZIP,file),'r')
-    else:
-      f = open(file,'r')
+  # --------------------------------------------------------------------
+  # convert one multi style thermo entry to a row of values
+  # final = 1 if entry is known to be complete, so names can be assigned
+  # return 0 if entry is incomplete
+
+  def add_entry(self,entry,final=1):
+    txt = b"".join(entry)
+    if not self.nvec:
+      if not final: return 0
+      names = [word.decode() for word in re.findall(pat_keyword,txt)]
+      self.set_names(["Step"] + names)
+    words = re.findall(pat_step,txt)[:1] + re.findall(pat_value,txt)
+    if len(words) != self.nvec: return 0
+    try: self.append(np.array(words,float).reshape(1,self.nvec))
+    except ValueError: return 0
+    return 1
 
-    if len(arglist) == 2: f.seek(arglist[1])
-    txt = f.read()
-    if file[-3:] == ".gz": eof = 0
-    else: eof = f.tell()
+  # --------------------------------------------------------------------
+  # read thermo entries from file, starting at byte offset eof
+  # file is read in chunks of complete lines, gzipped files are
+  #   decompressed while reading
+  # return offset after last complete entry
+
+  def read_one(self,file,eof=0):
+    if file[-3:] == ".gz": f = gzip.open(file,'rb')
+    else: f = open(file,'rb')
+    if eof: f.seek(eof)
+
+    nlen = self.nlen
+    offset = eof
+    rest = b""
+    entry = []
+    estart = offset
+    while True:
+      chunk = f.read(CHUNK)
+      if not chunk: break
+      chunk = rest + chunk
+      end = chunk.rfind(b"\n") + 1
+      rest = chunk[end:]
+      lines = chunk[:end].splitlines(True)
+
+      # rows = consecutive data lines of one-line style thermo output
+
+      rows = []
+      for line in lines:
+        start = offset
+        offset += len(line)
+        if self.style != 2 and b"----- Step" in line:
+          if self.style == -1: self.style = 1
+          if entry: self.add_entry(entry)
+          entry = [line]
+          estart = start
+          continue
+        if line.startswith(b"Loop time of"):
+          if entry: self.add_entry(entry)
+          entry = []
+          self.add_lines(rows)
+          rows = []
+          self.section = 0
+          continue
+        if self.style != 1:
+          words = b"Step" in line and line.split()
+          if words and words[0] == b"Step":
+            self.add_lines(rows)
+            rows = []
+            names = [word.decode() for word in words]
+            if self.style == -1:
+              self.style = 2
+              self.set_names(names)
+            if names == self.names: self.section = 1
+            else: self.section = -1
+            continue
+          if self.section == 1: rows.append(line)
+        elif entry: entry.append(line)
+      self.add_lines(rows)
     f.close()
 
-    start = last = 0
-    while not last:
-
-      # chunk = contiguous set of thermo entries (line or multi-line)
-      # s1 = 1st char on 1st line of chunk
-      # s2 = 1st char on line after chunk
-      # set last = 1 if this is last chunk in file, leave 0 otherwise
-      # set start = position in file to start looking for next chunk
-      # rewind eof if final entry is incomplete
-
-      s1 = txt.find(self.firststr,start)
-      s2 = txt.find("Loop time of",start+1)
-
-      if s1 >= 0 and s2 >= 0 and s1 < s2:    # found s1,s2 with s1 before s2
-        if self.style == 2:
-          s1 = txt.find("\n",s1) + 1
-      elif s1 >= 0 and s2 >= 0 and s2 < s1:  # found s1,s2 with s2 before s1
-        s1 = 0
-      elif s1 == -1 and s2 >= 0:             # found s2, but no s1
-        last = 1
-        s1 = 0
-      elif s1 >= 0 and s2 == -1:             # found s1, but no s2
-        last = 1
-        if self.style == 1:
-          s2 = txt.rfind("\n--",s1) + 1
-        else:
-          s1 = txt.find("\n",s1) + 1
-          s2 = txt.rfind("\n",s1) + 1
-        eof -= len(txt) - s2
-      elif s1 == -1 and s2 == -1:            # found neither
-                                             # could be end-of-file section
-                                             # or entire read was one chunk
-
-        if txt.find("Loop time of",start) == start:   # end of file, so exit
-          eof -= len(txt) - start                     # reset eof to "Loop"
-          break
-
-        last = 1                                      # entire read is a chunk
-        s1 = 0
-        if self.style == 1:
-          s2 = txt.rfind("\n--",s1) + 1
-        else:
-          s2 = txt.rfind("\n",s1) + 1
-        eof -= len(txt) - s2
-        if s1 == s2: break
-
-      chunk = txt[s1:s2-1]
-      start = s2
-
-      # split chunk into entries
-      # parse each entry for numeric fields, append to data
-
-      if self.style == 1:
-        sections = chunk.split("\n--")
-        pat1 = re.compile("Step\s*(\S*)\s")
-        pat2 = re.compile("=\s*(\S*)")
-        for section in sections:
-          word1 = [re.search(pat1,section).group(1)]
-          word2 = re.findall(pat2,section)
-          words = word1 + word2
-          self.data.append(list(map(float,words)))
-
-      else:
-        lines = chunk.split("\n")
-        for line in lines:
-          words = line.split()
-          self.data.append(list(map(float,words)))
+    # last multi style entry is kept if complete, else re-read next time
+    # offset of a partial last line is where to continue reading
 
-      # print last timestep of chunk
-      print(int(self.data[len(self.data)-1][0]),)
+    if entry and not self.add_entry(entry,not self.increment): offset = estart
+    if self.nlen > nlen:
+      print(int(self.data[-1][0]))
       sys.stdout.flush()
-
-    return eof
+    return offset
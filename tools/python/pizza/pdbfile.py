@@ -50,6 +50,9 @@ index,time,flag = p.iterator(1)
     time = timestep value (time stamp for snapshot, index for multiple PDB)
     flag = -1 when iteration is done, 1 otherwise
   typically call p.single(time) in iterated loop to write out one PDB file
+
+  if d is a dump object in streaming mode (d.stream()), one() and many()
+    convert one snapshot at a time with constant memory use
 """
 
 # History
@@ -69,6 +72,8 @@ index,time,flag = p.iterator(1)
 # Imports and external programs
 
 import sys, glob, urllib
+import numpy as np
+from dump import BUFSIZE, dump, write_rows
 PY3 = sys.version_info[0] == 3
 
 if PY3:
@@ -76,6 +81,7 @@ if PY3:
 else:
     string_types = basestring
 
+
 # Class definition
 
 class pdbfile:
@@ -142,7 +148,7 @@ class pdbfile:
     elif args[0][-4:] == ".pdb": file = args[0]
     else: file = args[0] + ".pdb"
 
-    f = open(file,'w')
+    f = open(file,'w',BUFSIZE)
 
     # use template PDB file with each snapshot
 
@@ -196,7 +202,7 @@ class pdbfile:
           file = root + str(n)
         file += ".pdb"
 
-        f = open(file,'w')
+        f = open(file,'w',BUFSIZE)
         self.convert(f,which)
         f.close()
 
@@ -242,7 +248,7 @@ class pdbfile:
     if len(args) == 0: file = "tmp.pdb"
     elif args[0][-4:] == ".pdb": file = args[0]
     else: file = args[0] + ".pdb"
-    f = open(file,'w')
+    f = open(file,'w',BUFSIZE)
 
     if self.data:
       which = self.data.findtime(time)
@@ -281,19 +287,21 @@ class pdbfile:
 
   # --------------------------------------------------------------------
   # convert one set of atoms to PDB format and write to f
+  # dump objects return atoms directly as NumPy array
 
   def convert(self,f,which):
-    time,box,atoms,bonds,tris,lines = self.data.viz(which)
+    if isinstance(self.data,dump):
+      time,box,atoms,bonds,tris,lines = self.data.viz(which,1)
+    else:
+      time,box,atoms,bonds,tris,lines = self.data.viz(which)
+      atoms = np.asarray(atoms,float).reshape(-1,5)
     if len(self.files):
-      for atom in atoms:
+      buf = []
+      for atom in atoms.tolist():
         id = atom[0]
         if id in self.atomlines:
           (begin,end) = self.atomlines[id]
-          line = "%s%8.3f%8.3f%8.3f%s" % (begin,atom[2],atom[3],atom[4],end)
-          print(line,file=f,end='')
+          buf.append("%s%8.3f%8.3f%8.3f%s" % (begin,atom[2],atom[3],atom[4],end))
+      f.write(''.join(buf))
     else:
-      for atom in atoms:
-        begin = "ATOM %6d %2d   R00     1    " % (atom[0],atom[1])
-        middle = "%8.3f%8.3f%8.3f" %  (atom[2],atom[3],atom[4])
-        end = "  1.00  0.00    NONE"
-        print(begin+middle+end,file=f)
+      write_rows(f,"ATOM %6d %2d   R00     1    %8.3f%8.3f%8.3f  1.00  0.00    NONE\n",atoms)
@@ -21,6 +21,9 @@ x.many()                write snapshots to tmp0000.xyz, tmp0001.xyz, etc
 x.many("new")           write snapshots to new0000.xyz, new0001.xyz, etc
 x.single(N)             write snapshot for timestep N to tmp.xyz
 x.single(N,"file")      write snapshot for timestep N to file.xyz
+
+  if d is a dump object in streaming mode (d.stream()), one() and many()
+    convert one snapshot at a time with constant memory use
 """
 
 # History
@@ -34,6 +37,8 @@ x.single(N,"file")      write snapshot for timestep N to file.xyz
 # Imports and external programs
 
 import sys
+import numpy as np
+from dump import BUFSIZE, dump, write_rows
 
 # Class definition
 
@@ -51,18 +56,12 @@ class xyz:
     elif args[0][-4:] == ".xyz": file = args[0]
     else: file = args[0] + ".xyz"
 
-    f = open(file,"w")
+    f = open(file,"w",BUFSIZE)
     n = flag = 0
     while 1:
       which,time,flag = self.data.iterator(flag)
       if flag == -1: break
-      time,box,atoms,bonds,tris,lines = self.data.viz(which)
-
-      print(len(atoms), file=f)
-      print("Atoms", file=f)
-      for atom in atoms:
-        itype = int(atom[1])
-        print(itype,atom[2],atom[3],atom[4], file=f)
+      self.convert(f,which)
 
       print(time)
       sys.stdout.flush()
@@ -81,8 +80,6 @@ class xyz:
     while 1:
       which,time,flag = self.data.iterator(flag)
       if flag == -1: break
-      time,box,atoms,bonds,tris,lines = self.data.viz(which)
-
       if n < 10:
         file = root + "000" + str(n)
       elif n < 100:
@@ -92,12 +89,8 @@ class xyz:
       else:
         file = root + str(n)
       file += ".xyz"
-      f = open(file,"w")
-      print(len(atoms), file=f)
-      print("Atoms", file=f)
-      for atom in atoms:
-        itype = int(atom[1])
-        print(itype,atom[2],atom[3],atom[4], file=f)
+      f = open(file,"w",BUFSIZE)
+      self.convert(f,which)
       print(time)
       sys.stdout.flush()
       f.close()
@@ -113,11 +106,19 @@ class xyz:
     else: file = args[0] + ".xyz"
 
     which = self.data.findtime(time)
-    time,box,atoms,bonds,tris,lines = self.data.viz(which)
-    f = open(file,"w")
-    print(len(atoms), file=f)
-    print("Atoms", file=f)
-    for atom in atoms:
-      itype = int(atom[1])
-      print(itype,atom[2],atom[3],atom[4], file=f)
+    f = open(file,"w",BUFSIZE)
+    self.convert(f,which)
     f.close()
+
+  # --------------------------------------------------------------------
+  # write selected atoms of one snapshot to f in XYZ format
+  # dump objects return atoms directly as NumPy array
+
+  def convert(self,f,which):
+    if isinstance(self.data,dump):
+      time,box,atoms,bonds,tris,lines = self.data.viz(which,1)
+    else:
+      time,box,atoms,bonds,tris,lines = self.data.viz(which)
+      atoms = np.asarray(atoms,float).reshape(-1,5)
+    f.write("%d\nAtoms\n" % len(atoms))
+    write_rows(f,"%d %r %r %r\n",atoms[:,1:5])
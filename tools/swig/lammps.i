@@ -121,6 +121,7 @@ extern void   lammps_extract_box(void *handle, double *boxlo, double *boxhi,
 extern void   lammps_reset_box(void *handle, double *boxlo, double *boxhi,
                         double xy, double yz, double xz);
 extern void   lammps_memory_usage(void *handle, double *meminfo);
+extern void   lammps_get_timing(void *handle, double *timing);
 extern int    lammps_get_mpi_comm(void *handle);
 extern int    lammps_extract_setting(void *handle, const char *keyword);
 extern int    lammps_extract_global_datatype(void *handle, const char *name);
@@ -149,6 +150,7 @@ extern void   lammps_gather_bonds(void *handle, void *data);
 extern void   lammps_gather_angles(void *handle, void *data);
 extern void   lammps_gather_dihedrals(void *handle, void *data);
 extern void   lammps_gather_impropers(void *handle, void *data);
+extern int64_t lammps_topology_checksum(void *handle, const char *keyword);
 extern void   lammps_gather(void *, char *, int, int, void *);
 extern void   lammps_gather_concat(void *, char *, int, int, void *);
 extern void   lammps_gather_subset(void *, char *, int, int, int, int *, void *);
@@ -199,9 +201,11 @@ extern int    lammps_plugin_name(int, char *, char *, int);
  * Supporting the fix external callback mechanism will require extra code specific to the application.
   typedef void (*FixExternalFnPtr)(void *, int64_t, int, int64_t *, double **, double **);
   extern  void lammps_set_fix_external_callback(void *handle, const char *id, FixExternalFnPtr funcptr, void *ptr);
- * these two functions can only be used from the callback, so we don't support them either
+ * these functions can only be used from the callback, so we don't support them either
   extern  void lammps_fix_external_set_energy_peratom(void *handle, const char *id, double *eng);
   extern void lammps_fix_external_set_virial_peratom(void *handle, const char *id, double **virial);
+  extern double *lammps_fix_external_get_energy_peratom(void *handle, const char *id);
+  extern double **lammps_fix_external_get_virial_peratom(void *handle, const char *id);
 */
 extern double **lammps_fix_external_get_force(void *handle, const char *id);
 extern void   lammps_fix_external_set_energy_global(void *handle, const char *id, double eng);
@@ -310,6 +314,7 @@ extern void   lammps_extract_box(void *handle, double *boxlo, double *boxhi,
 extern void   lammps_reset_box(void *handle, double *boxlo, double *boxhi,
                         double xy, double yz, double xz);
 extern void   lammps_memory_usage(void *handle, double *meminfo);
+extern void   lammps_get_timing(void *handle, double *timing);
 extern int    lammps_get_mpi_comm(void *handle);
 extern int    lammps_extract_setting(void *handle, const char *keyword);
 extern int    lammps_extract_global_datatype(void *handle, const char *name);
@@ -338,6 +343,7 @@ extern void   lammps_gather_bonds(void *handle, void *data);
 extern void   lammps_gather_angles(void *handle, void *data);
 extern void   lammps_gather_dihedrals(void *handle, void *data);
 extern void   lammps_gather_impropers(void *handle, void *data);
+extern int64_t lammps_topology_checksum(void *handle, const char *keyword);
 extern void   lammps_gather(void *, char *, int, int, void *);
 extern void   lammps_gather_concat(void *, char *, int, int, void *);
 extern void   lammps_gather_subset(void *, char *, int, int, int, int *, void *);
@@ -388,9 +394,11 @@ extern int    lammps_plugin_name(int, char *, char *, int);
  * Supporting the fix external callback mechanism will require extra code specific to the application.
   typedef void (*FixExternalFnPtr)(void *, int64_t, int, int64_t *, double **, double **);
   extern  void lammps_set_fix_external_callback(void *handle, const char *id, FixExternalFnPtr funcptr, void *ptr);
- * these two functions can only be used from the callback, so we don't support them either
+ * these functions can only be used from the callback, so we don't support them either
   extern  void lammps_fix_external_set_energy_peratom(void *handle, const char *id, double *eng);
   extern void lammps_fix_external_set_virial_peratom(void *handle, const char *id, double **virial);
+  extern double *lammps_fix_external_get_energy_peratom(void *handle, const char *id);
+  extern double **lammps_fix_external_get_virial_peratom(void *handle, const char *id);
 */
 extern double **lammps_fix_external_get_force(void *handle, const char *id);
 extern void   lammps_fix_external_set_energy_global(void *handle, const char *id, double eng);
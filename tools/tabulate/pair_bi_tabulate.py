@@ -100,22 +100,14 @@ class BI(PairTabulate):
 
         minr = min(r)
         maxr = max(r)
+        # Linear interpolation between points, works for a single distance
+        # or a NumPy array of distances.
+        x = np.asarray(x, dtype=float)
+        energy = np.interp(x, r, e)
+        # Linear extrapolation below minimum distance.
+        energy = np.where(x < minr, -f0 * (minr - x), energy)
         # Note that you might want OOB to return an error.
-        if x >= maxr:
-            return 0
-        if x < minr:
-            dx = minr - x
-            return -f0 * dx
-        else:
-            # Linear interpolation between points.
-            for i, ri in enumerate(r):
-                if r[i] < x:
-                    r1, e1 = r[i], e[i]
-                    r2, e2 = r[i + 1], e[i + 1]
-            dr12 = r2 - r1
-            dr = x - r1
-            de = (e2 - e1) / (r2 - r1)
-            return e1 + (de * dr / dr12)
+        return np.where(x >= maxr, 0.0, energy)
 
 
 ###############################################################################
@@ -3,24 +3,23 @@
 from tabulate import PairTabulate
 
 ################################################################################
-import math
-epsilon = 1.0
-sigma = 1.0
+# these functions accept single distances as well as NumPy arrays of distances
 
-def lj_energy(r):
-    f = 4.0*epsilon*(math.pow(sigma/r,12.0) - math.pow(sigma/r,6.0))
+def lj_energy(r, epsilon=1.0, sigma=1.0):
+    f = 4.0*epsilon*((sigma/r)**12 - (sigma/r)**6)
     return f
 
-def lj_force(r):
-    epsilon = 1.0
-    sigma = 1.0
-    f = -4.0*epsilon*(-12.0*math.pow(sigma/r,12.0)/r + 6.0*math.pow(sigma/r,6.0)/r)
+def lj_force(r, epsilon=1.0, sigma=1.0):
+    f = -4.0*epsilon*(-12.0*(sigma/r)**12/r + 6.0*(sigma/r)**6/r)
     return f
 ################################################################################
 
 if __name__ == "__main__":
     ptable = PairTabulate(lj_energy, lj_force)
-    ptable.run('LJ_11')
-    epsilon = 1.0
-    sigma = 1.5
-    ptable.run('LJ_12')
+    # create the tables for all pairs of atom types in parallel
+    tables = []
+    for label, epsilon, sigma in (('LJ_11', 1.0, 1.0), ('LJ_12', 1.0, 1.5)):
+        tables.append((label,
+                       lambda r, e=epsilon, s=sigma: lj_energy(r, e, s),
+                       lambda r, e=epsilon, s=sigma: lj_force(r, e, s)))
+    ptable.run_multi(tables)
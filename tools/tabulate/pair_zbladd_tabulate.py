@@ -3,13 +3,14 @@
 from tabulate import PairTabulate
 
 ################################################################################
-import math
+import numpy as np
 
 # this table contains a correction to be added to the Al_zhou.eam.alloy potential via hybrid/overlay
 # the purpose is to smoothly replace the original pairwise repulsion with the ZBL potential.
 # the combined potential switches from ZBL to EAM w/o embedding and then subtracts the full EAM term.
 # this way the table can be added to the eam/alloy pair style via hybrid/overlay
 # due to using a Fermi-like switching function (tanh()) there are no discontinuities in energy or force
+# the functions use NumPy, so they can be evaluated for all points of the table at once
 
 def eam_2body(r):
     biga  = 0.251519 # metal units
@@ -19,8 +20,8 @@ def eam_2body(r):
     beta  = 3.702623
     lamda = 0.790264
     kappa = 0.395132
-    return (biga * math.exp(-alpha * (r/rzero - 1.0))) / (1.0 + math.pow(r/rzero - kappa, 20)) \
-         - (bigb * math.exp(-beta  * (r/rzero - 1.0))) / (1.0 + math.pow(r/rzero - lamda, 20))
+    return (biga * np.exp(-alpha * (r/rzero - 1.0))) / (1.0 + (r/rzero - kappa)**20) \
+         - (bigb * np.exp(-beta  * (r/rzero - 1.0))) / (1.0 + (r/rzero - lamda)**20)
 
 def zbl_energy(r):
     qqr2e = 14.399645  # for metal units
@@ -39,14 +40,14 @@ def zbl_energy(r):
     zj = 13.0  # aluminium
 
     prefactor = zi * zj * qqr2e / r
-    rbya = r * (math.pow(zi, pzbl) + math.pow(zj, pzbl)) / a0
-    f = prefactor * (c4*math.exp(-d4*rbya) + c3*math.exp(-d3*rbya) \
-                     + c2*math.exp(-d2*rbya) + c1*math.exp(-d1*rbya))
+    rbya = r * (zi**pzbl + zj**pzbl) / a0
+    f = prefactor * (c4*np.exp(-d4*rbya) + c3*np.exp(-d3*rbya) \
+                     + c2*np.exp(-d2*rbya) + c1*np.exp(-d1*rbya))
     return f
 
 def combined(r):
     rmid = 2.886166
-    switch_on = 0.5*(math.tanh(math.exp(1.0)*(r - rmid))+1.0)
+    switch_on = 0.5*(np.tanh(np.exp(1.0)*(r - rmid))+1.0)
     return (1.0-switch_on)*zbl_energy(r) + (switch_on-1.0)*eam_2body(r)
 
 ################################################################################
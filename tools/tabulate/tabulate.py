@@ -20,27 +20,77 @@ from __future__ import print_function
 
 import sys
 import argparse
+import multiprocessing
 from os import path
 from datetime import datetime
 
+import numpy as np
+
 ########################################################################
 
 def numdiff(x, func):
     """ Get the value of the first derivative of a function 'func(x)' at 'x'
-        from numerical differentiation."""
+        from numerical differentiation with a 4th order central difference
+        stencil.  'x' may also be a NumPy array, if 'func' accepts one."""
+
+    # optimal relative delta x value for 4th order numerical differentiation
+    # of floating point numbers: (machine epsilon)**(1/5)
+    epsilon = 7.4e-4 * np.maximum(np.abs(x), 1.0e-3)
+    fval1 = func(x - 2.0*epsilon)
+    fval2 = func(x - epsilon)
+    fval3 = func(x + epsilon)
+    fval4 = func(x + 2.0*epsilon)
+    return (fval1 - 8.0*fval2 + 8.0*fval3 - fval4) / (12.0*epsilon)
+
+########################################################################
+
+def fprime(xmin, xmax, ffunc):
+    """ Get the derivatives of the force function 'ffunc' at the inner and
+    outer cutoff, as required for the FPRIME or FP header parameter."""
 
-    # optimal delta x value for 2-point numerical differentiation of two floating point numbers
-    epsilon = 6.05504e-6
-    fval1 = func(x - epsilon)
-    fval2 = func(x + epsilon)
-    return 0.5 * (fval2-fval1) / epsilon
+    return numdiff(xmin, ffunc), numdiff(xmax, ffunc)
+
+########################################################################
+
+def evaluate(func, x):
+    """ Evaluate the function 'func' for all elements of the NumPy array 'x'.
+    The whole array is passed to 'func' at once, if it accepts NumPy arrays
+    and returns an array of the same shape.  Otherwise 'func' is called for
+    one element at a time.  Returns the array of values and a flag whether
+    'func' accepted the array."""
+
+    try:
+        val = np.asarray(func(x), dtype=float)
+        if val.shape == x.shape:
+            return val, True
+    except Exception:
+        pass
+    return np.array([func(xi) for xi in x.tolist()], dtype=float), False
+
+########################################################################
+
+def tabvalues(x, efunc, diff=False, ffunc=None):
+    """ Compute energy and force for all elements of the NumPy array 'x'.
+    The force is from numerical differentiation of the energy, if 'diff'
+    is True or no force function is provided."""
+
+    energy, vector = evaluate(efunc, x)
+    if ffunc and not diff:
+        force, dummy = evaluate(ffunc, x)
+    elif vector:
+        force = -numdiff(x, efunc)
+    else:
+        force = -np.array([numdiff(xi, efunc) for xi in x.tolist()])
+    return energy, force
 
 ########################################################################
 
 def mktable(tstyle, label, num, xmin, xmax, efunc, diff=False, ffunc=None):
     """ Do the tabulation of the provided energy function. Compute force from
     numerical differentiation if no force function is provided.  Also detect
-    minimum for use to determine potential shifting in bonded potentials."""
+    minimum for use to determine potential shifting in bonded potentials.
+    Energy and force functions that accept NumPy arrays are evaluated for
+    all points at once."""
 
     # must use numerical differentiation if no force function provided
     if not ffunc:
@@ -48,25 +98,141 @@ def mktable(tstyle, label, num, xmin, xmax, efunc, diff=False, ffunc=None):
 
     print("# Creating %s table %s with %d points from %g to %g" % (tstyle, label, num, xmin, xmax))
 
-    table = []
     delx = (xmax - xmin) / (float(num) - 1.0)
-    emin = 999999999.0
-    xzero = 0.0
-
-    for i in range(0,num):
-        x = xmin + i*delx
-        energy = efunc(x)
-        if energy < emin:
-            emin = energy
-            xzero = x
-        if diff:
-            force = -numdiff(x, efunc)
-        else:
-            force = ffunc(x)
-        table.append([i+1, x, energy, force])
+    x = xmin + np.arange(num)*delx
+    energy, force = tabvalues(x, efunc, diff, ffunc)
+    xzero = x[np.argmin(energy)]
 
+    table = np.column_stack((np.arange(1, num+1), x, energy, force))
     return table, xzero
 
+########################################################################
+
+def formattable(table, offset, chunk=16384):
+    """ Format tabulated data with 4 columns as one string.  A whole block
+    of lines is formatted with a single string operation."""
+
+    table = np.array(table, dtype=float)
+    table[:, 2] -= offset
+    fmt = "%8d %- 22.15g %- 22.15g %- 22.15g\n"
+    lines = []
+    for i in range(0, len(table), chunk):
+        block = table[i:i+chunk]
+        lines.append((fmt*len(block)) % tuple(block.ravel().tolist()))
+    return ''.join(lines)
+
+########################################################################
+
+def spline(x, y, yp1, ypn):
+    """ Compute the second derivatives for cubic spline interpolation of
+    the tabulated values 'y(x)' with the first derivatives 'yp1' and 'ypn'
+    at the end points.  This is the same algorithm that the LAMMPS table
+    styles use to interpolate the data from table files."""
+
+    n = len(x)
+    x = x.tolist()
+    y = y.tolist()
+    y2 = [0.0] * n
+    u = [0.0] * n
+    y2[0] = -0.5
+    u[0] = (3.0 / (x[1] - x[0])) * ((y[1] - y[0]) / (x[1] - x[0]) - yp1)
+    for i in range(1, n - 1):
+        sig = (x[i] - x[i-1]) / (x[i+1] - x[i-1])
+        p = sig * y2[i-1] + 2.0
+        y2[i] = (sig - 1.0) / p
+        u[i] = (y[i+1] - y[i]) / (x[i+1] - x[i]) - (y[i] - y[i-1]) / (x[i] - x[i-1])
+        u[i] = (6.0 * u[i] / (x[i+1] - x[i-1]) - sig * u[i-1]) / p
+    qn = 0.5
+    un = (3.0 / (x[n-1] - x[n-2])) * (ypn - (y[n-1] - y[n-2]) / (x[n-1] - x[n-2]))
+    y2[n-1] = (un - qn * u[n-2]) / (qn * y2[n-2] + 1.0)
+    for k in range(n - 2, -1, -1):
+        y2[k] = y2[k] * y2[k+1] + u[k]
+    return np.array(y2)
+
+########################################################################
+
+def interpolate(xmin, delx, y, y2, x):
+    """ Interpolate the values 'y' tabulated with spacing 'delx' starting
+    at 'xmin' at the positions in the NumPy array 'x' with cubic splines
+    with the second derivatives 'y2'."""
+
+    klo = np.clip(((x - xmin) / delx).astype(int), 0, len(y) - 2)
+    a = (xmin + (klo + 1)*delx - x) / delx
+    b = 1.0 - a
+    return a*y[klo] + b*y[klo+1] \
+        + ((a*a*a - a)*y2[klo] + (b*b*b - b)*y2[klo+1]) * delx*delx / 6.0
+
+########################################################################
+
+def interperror(num, xmin, xmax, efunc, diff=False, ffunc=None, fp=None):
+    """ Determine the maximum errors of energy and force, when interpolating
+    between the 'num' points of a table with cubic splines, as LAMMPS does
+    for table files.  'fp' are the derivatives of the force at both ends
+    from the table header, if present.  The errors are sampled at three
+    points in each interval.  Returns the maximum energy error, its location,
+    the maximum force error, and its location."""
+
+    delx = (xmax - xmin) / (float(num) - 1.0)
+    x = xmin + np.arange(num)*delx
+    energy, force = tabvalues(x, efunc, diff, ffunc)
+    xtest = (x[:-1, np.newaxis] + np.array([0.25, 0.5, 0.75])*delx).ravel()
+    etest, ftest = tabvalues(xtest, efunc, diff, ffunc)
+
+    # same boundary conditions as LAMMPS uses for table files
+    # force derivatives are estimated from the table without FPRIME in the header
+    if fp is None:
+        fp = ((force[1] - force[0]) / delx, (force[-1] - force[-2]) / delx)
+    e2 = spline(x, energy, -force[0], -force[-1])
+    f2 = spline(x, force, fp[0], fp[1])
+    eerr = np.abs(interpolate(xmin, delx, energy, e2, xtest) - etest)
+    ferr = np.abs(interpolate(xmin, delx, force, f2, xtest) - ftest)
+    ie = np.argmax(eerr)
+    jf = np.argmax(ferr)
+    return eerr[ie], xtest[ie], ferr[jf], xtest[jf]
+
+########################################################################
+
+def adaptnum(xmin, xmax, efunc, diff=False, ffunc=None, eerr=None, ferr=None,
+             fp=None, maxnum=100000):
+    """ Find the smallest number of table points for which the interpolation
+    errors of energy and force do not exceed 'eerr' and 'ferr', respectively.
+    A limit of None is not checked.  The number of points is doubled until
+    the errors are small enough and then refined by bisection.  Returns the
+    number of points, the errors from interperror() and a flag whether the
+    requested accuracy was reached with at most 'maxnum' points."""
+
+    def converged(err):
+        return (eerr is None or err[0] <= eerr) and (ferr is None or err[2] <= ferr)
+
+    low = 1
+    num = min(16, maxnum)
+    err = interperror(num, xmin, xmax, efunc, diff, ffunc, fp)
+    while not converged(err) and num < maxnum:
+        low = num
+        num = min(2*num, maxnum)
+        err = interperror(num, xmin, xmax, efunc, diff, ffunc, fp)
+    if not converged(err):
+        return num, err, False
+
+    while num - low > 1:
+        mid = (low + num) // 2
+        miderr = interperror(mid, xmin, xmax, efunc, diff, ffunc, fp)
+        if converged(miderr):
+            num, err = mid, miderr
+        else:
+            low = mid
+    return num, err, True
+
+########################################################################
+
+# table function and arguments for worker processes in multi-table mode.
+# inherited by the forked processes, so functions need not be picklable
+_multi = None
+
+def _multi_table(idx):
+    tab, tables = _multi
+    return tab.maketable(*tables[idx])
+
 
 ########################################################################
 # base class with shared functionality
@@ -98,6 +264,14 @@ class Tabulate(object):
                                  help="Inner cutoff of table")
         self.parser.add_argument('--outer', '-o', dest='xmax', required=True, type=float,
                                  help="Outer cutoff of table")
+        self.parser.add_argument('--energy-error', dest='eerr', default=None, type=float,
+                                 help="Maximum energy interpolation error; "
+                                 + "selects the number of points automatically")
+        self.parser.add_argument('--force-error', dest='ferr', default=None, type=float,
+                                 help="Maximum force interpolation error; "
+                                 + "selects the number of points automatically")
+        self.parser.add_argument('--max-points', dest='maxnum', default=100000, type=int,
+                                 help="Maximum number of points with automatic selection")
 
     def openfile(self, label):
         """Open table file, if needed and print label for new table entry"""
@@ -120,8 +294,33 @@ class Tabulate(object):
 
     def writetable(self, table, offset):
         """ Formatted output tabulated data with 4 columns"""
-        for i,r,energy,force in table:
-            self.fp.write("%8d %- 22.15g %- 22.15g %- 22.15g\n" % (i, r, energy - offset, force))
+        self.fp.write(formattable(table, offset))
+
+    def numpoints(self, label, efunc, ffunc=None, fp=None):
+        """Return the number of table points.  If a maximum energy or force
+        error is given, determine the smallest number of points that meets it
+        and print an error report for the table.  'fp' are the force
+        derivatives written to the table header, if any"""
+        args = self.args
+        if args.eerr is None and args.ferr is None:
+            return args.num
+        if (args.eerr is not None and args.eerr <= 0.0) \
+           or (args.ferr is not None and args.ferr <= 0.0):
+            self.helpexit('Maximum interpolation errors must be > 0')
+        if args.maxnum < 2:
+            self.helpexit('Expect 2 or more points in table for tabulation')
+
+        num, err, ok = adaptnum(args.xmin, args.xmax, efunc, args.diff or not ffunc, ffunc,
+                                args.eerr, args.ferr, fp, args.maxnum)
+        print("# Interpolation error report for %s table %s (%d points):"
+              % (self.tstyle, label, num))
+        print("#   energy: max. error %-12.6g at %-12g limit: %s"
+              % (err[0], err[1], 'none' if args.eerr is None else '%g' % args.eerr))
+        print("#   force:  max. error %-12.6g at %-12g limit: %s"
+              % (err[2], err[3], 'none' if args.ferr is None else '%g' % args.ferr))
+        if not ok:
+            print("# WARNING: requested accuracy not reached with %d points" % num)
+        return num
 
     def helpexit(self, text):
         """ Convenience function to exit program with error and help message"""
@@ -135,12 +334,14 @@ class PairTabulate(Tabulate):
         self.parser.add_argument('--eshift', '-e', dest='eshift', default=False,
                                  action='store_true',
                                  help="Shift potential energy to be zero at outer cutoff")
+        self.parser.add_argument('--num-procs', '-p', dest='nprocs', default=0, type=int,
+                                 help="Number of processes for run_multi() (default: all cores)")
         try:
             self.args = self.parser.parse_args()
         except argparse.ArgumentError:
             sys.exit()
 
-    def run(self, label):
+    def checkargs(self):
         # sanity checks
         if self.args.num < 2:
             self.helpexit('Expect 2 or more points in table for tabulation')
@@ -149,31 +350,71 @@ class PairTabulate(Tabulate):
         if self.args.xmax <= self.args.xmin:
             self.helpexit('Outer cutoff must be larger than inner cutoff')
 
+    def maketable(self, label, efunc, ffunc=None):
+        """Tabulate one pair potential and return the table section as string"""
+        offset = 0.0
+        if self.args.eshift:
+            offset=efunc(self.args.xmax)
+
+        fp = fprime(self.args.xmin, self.args.xmax, ffunc) if ffunc else None
+        num = self.numpoints(label, efunc, ffunc, fp)
+        table, dummy = mktable(self.tstyle, label, num, self.args.xmin, self.args.xmax,
+                               efunc, self.args.diff, ffunc)
+
+        # pair style specific header
+        if ffunc:
+            diffmin, diffmax = fp
+            header = "N %d R %g %g FPRIME %- 22.15g %- 22.15g\n\n" \
+                % (num, self.args.xmin, self.args.xmax, diffmin, diffmax)
+        else:
+            header = "N %d R %g %g\n\n" % (num, self.args.xmin, self.args.xmax)
+
+        return header + formattable(table, offset)
+
+    def run(self, label):
+        self.checkargs()
         self.diff = self.args.diff
         if not self.forcefunc:
             self.diff = True
-        offset = 0.0
-        if self.args.eshift:
-            offset=self.energyfunc(self.args.xmax)
 
-        table, dummy = mktable(self.tstyle, label, self.args.num, self.args.xmin, self.args.xmax,
-                               self.energyfunc, self.args.diff, self.forcefunc)
+        text = self.maketable(label, self.energyfunc, self.forcefunc)
 
-        # open table file
+        # open table file and write table
         self.openfile(label)
+        self.fp.write(text)
+        if self.args.filename != '-':
+            self.fp.close()
 
-        # write pair style specific header
-        if self.forcefunc:
-            diffmin = -numdiff(self.args.xmin, self.forcefunc)
-            diffmax = -numdiff(self.args.xmax, self.forcefunc)
-            self.fp.write("N %d R %g %g FPRIME %- 22.15g %- 22.15g\n\n"
-                          % (self.args.num, self.args.xmin, self.args.xmax, diffmin, diffmax))
+    def run_multi(self, tables, nprocs=None):
+        """Generate multiple pair tables in parallel and write them in the given order.
+        'tables' is a list of (label, efunc, ffunc) tuples, ffunc may be None.
+        The functions are inherited by forked worker processes, so they may be
+        lambdas or closures, e.g. for the parameters of different pairs of atom types."""
+        self.checkargs()
+        global _multi
+        if nprocs is None:
+            nprocs = getattr(self.args, 'nprocs', 0)
+        if nprocs <= 0:
+            nprocs = multiprocessing.cpu_count()
+        nprocs = min(nprocs, len(tables))
+
+        if nprocs > 1:
+            _multi = (self, tables)
+            pool = multiprocessing.get_context('fork').Pool(nprocs)
+            try:
+                texts = pool.map(_multi_table, range(len(tables)), 1)
+            finally:
+                pool.terminate()
+                pool.join()
+                _multi = None
         else:
-            self.fp.write("N %d R %g %g\n\n" % (self.args.num, self.args.xmin, self.args.xmax))
+            texts = [self.maketable(*table) for table in tables]
 
-        self.writetable(table, offset)
-        if self.args.filename != '-':
-            self.fp.close()
+        for table, text in zip(tables, texts):
+            self.openfile(table[0])
+            self.fp.write(text)
+            if self.args.filename != '-':
+                self.fp.close()
 
 
 ################################################################################
@@ -209,7 +450,11 @@ class BondAngleTabulate(Tabulate):
         if not self.forcefunc:
             self.diff = True
 
-        table, xzero = mktable(self.tstyle, label, self.args.num, self.args.xmin, self.args.xmax,
+        fp = None
+        if self.forcefunc:
+            fp = fprime(self.args.xmin, self.args.xmax, self.forcefunc)
+        num = self.numpoints(label, self.energyfunc, self.forcefunc, fp)
+        table, xzero = mktable(self.tstyle, label, num, self.args.xmin, self.args.xmax,
                                self.energyfunc, self.args.diff, self.forcefunc)
         print("# Minimum energy of tabulated potential is at %g" % xzero)
         offset = 0.0
@@ -219,12 +464,11 @@ class BondAngleTabulate(Tabulate):
         self.openfile(label)
 
         if self.forcefunc:
-            diffmin = -numdiff(self.args.xmin, self.forcefunc)
-            diffmax = -numdiff(self.args.xmax, self.forcefunc)
+            diffmin, diffmax = fp
             self.fp.write("N %d FP %- 22.15g %- 22.15g EQ %g\n\n" %
-                          (self.args.num, diffmin, diffmax, xzero))
+                          (num, diffmin, diffmax, xzero))
         else:
-            self.fp.write("N %d EQ %g\n\n" % (self.args.num, xzero))
+            self.fp.write("N %d EQ %g\n\n" % (num, xzero))
 
         self.writetable(table, offset)
         if self.args.filename != '-':
@@ -271,10 +515,11 @@ class DihedralTabulate(Tabulate):
         if not self.forcefunc:
             self.diff = True
 
-        table, dummy = mktable(self.tstyle, label, self.args.num, self.args.xmin, self.args.xmax,
+        num = self.numpoints(label, self.energyfunc, self.forcefunc)
+        table, dummy = mktable(self.tstyle, label, num, self.args.xmin, self.args.xmax,
                                self.energyfunc, self.args.diff, self.forcefunc)
         self.openfile(label)
-        self.fp.write("N %d DEGREES \n\n" % (self.args.num))
+        self.fp.write("N %d DEGREES \n\n" % (num))
         self.writetable(table, 0.0)
         if self.args.filename != '-':
             self.fp.close()
@@ -306,7 +551,11 @@ class WallTabulate(Tabulate):
         if not self.forcefunc:
             self.diff = True
 
-        table, xzero = mktable(self.tstyle, label, self.args.num, self.args.xmin, self.args.xmax,
+        fp = None
+        if self.forcefunc:
+            fp = fprime(self.args.xmin, self.args.xmax, self.forcefunc)
+        num = self.numpoints(label, self.energyfunc, self.forcefunc, fp)
+        table, xzero = mktable(self.tstyle, label, num, self.args.xmin, self.args.xmax,
                                self.energyfunc, self.args.diff, self.forcefunc)
         print("# Minimum energy of tabulated potential is at %g" % xzero)
         offset = 0.0
@@ -316,11 +565,10 @@ class WallTabulate(Tabulate):
         self.openfile(label)
 
         if self.forcefunc:
-            diffmin = -numdiff(self.args.xmin, self.forcefunc)
-            diffmax = -numdiff(self.args.xmax, self.forcefunc)
-            self.fp.write("N %d FP %- 22.15g %- 22.15g\n\n" % (self.args.num, diffmin, diffmax))
+            diffmin, diffmax = fp
+            self.fp.write("N %d FP %- 22.15g %- 22.15g\n\n" % (num, diffmin, diffmax))
         else:
-            self.fp.write("N %d\n\n" % (self.args.num))
+            self.fp.write("N %d\n\n" % (num))
 
         self.writetable(table, offset)
         if self.args.filename != '-':
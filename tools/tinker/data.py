@@ -30,6 +30,10 @@ d.reorder("Atoms",1,3,2,4,5)     reorder columns (1-N) in a data file section
 d.title = "My LAMMPS data file"  set title of the data file
 d.headers["atoms"] = 1500        set a header value
 d.sections["Bonds"] = lines      set a section to list of lines (with newlines)
+d.newsection("Bonds",id,type,atom1,atom2)   set a section from column vectors
+
+  also sets the matching header value, e.g. "bonds", to the number of rows
+
 d.delete("bonds")        delete a keyword or section of data file
 d.delete("Bonds")
 d.replace("Atoms",5,vec)         replace Nth column of section with vector
@@ -38,6 +42,17 @@ d.newxyz(dmp,1000)       replace xyz in Atoms with xyz of snapshot N
   newxyz assumes id,x,y,z are defined in both data and dump files
     also replaces ix,iy,iz if they are defined
 
+sec = d.section("Atoms")         section as columns object
+x = sec.column(2)                3rd column as NumPy array, read-only
+sec.cols                         list of all columns as NumPy arrays
+
+  sections are kept as lines as read from the file, until a column
+    operation (get, reorder, replace, newxyz, viz, section) is applied
+  then they are split once into a columns object, each column is
+    converted to a NumPy array (int, float, or str) when first used
+  columns that are not replaced are written out as they were read
+  a columns object can be used like the list of lines it replaces
+
 index,time,flag = d.iterator(0/1)          loop over single data file snapshot
 time,box,atoms,bonds,tris,lines = d.viz(index)   return list of viz objects
 
@@ -68,12 +83,16 @@ d.write("data.new")             write a LAMMPS data file
 #   title = 1st line of data file
 #   names = dictionary with atom attributes as keys, col #s as values
 #   headers = dictionary with header name as key, value or tuple as values
-#   sections = dictionary with section name as key, array of lines as values
+#   sections = dictionary with section name as key,
+#              array of lines or columns object as values
 #   nselect = 1 = # of snapshots
 
 # Imports and external programs
 
 from os import popen
+from itertools import islice
+
+import numpy as np
 
 try: tmp = PIZZA_GUNZIP
 except: PIZZA_GUNZIP = "gunzip"
@@ -133,9 +152,7 @@ class data(object):
           if length not in headers:
             raise (Exception, "data section %s has no matching header value" % line)
           f.readline()
-          list = []
-          for i in range(headers[length]): list.append(f.readline())
-          sections[keyword] = list
+          sections[keyword] = [line for line in islice(f,headers[length])]
       if not found:
         raise (Exception,"invalid section %s in data file" % line)
       f.readline()
@@ -158,28 +175,25 @@ class data(object):
       j = i + 1
       self.names[pairs[j]] = pairs[i]-1
 
+  # --------------------------------------------------------------------
+  # return section as columns object, parse its lines on first use
+
+  def section(self,name):
+    sec = self.sections[name]
+    if not isinstance(sec,columns):
+      sec = self.sections[name] = parse(sec)
+    return sec
+
   # --------------------------------------------------------------------
   # extract info from data file fields
 
   def get(self,*list):
     if len(list) == 1:
-      field = list[0]
-      array = []
-      lines = self.sections[field]
-      for line in lines:
-        words = line.split()
-        values = list(map(float,words))
-        array.append(values)
-      return array
+      sec = self.section(list[0])
+      return np.column_stack(sec.cols).astype(float)
     elif len(list) == 2:
-      field = list[0]
-      n = list[1] - 1
-      vec = []
-      lines = self.sections[field]
-      for line in lines:
-        words = line.split()
-        vec.append(float(words[n]))
-      return vec
+      sec = self.section(list[0])
+      return sec.column(list[1]-1).astype(float)
     else:
       raise Exception("invalid arguments for data.get()")
 
@@ -187,32 +201,26 @@ class data(object):
   # reorder columns in a data file field
 
   def reorder(self,name,*order):
-    n = len(order)
-    natoms = len(self.sections[name])
-    oldlines = self.sections[name]
-    newlines = natoms*[""]
-    for index in order:
-      for i in range(len(newlines)):
-        words = oldlines[i].split()
-        newlines[i] += words[index-1] + " "
-    for i in range(len(newlines)):
-      newlines[i] += "\n"
-    self.sections[name] = newlines
+    self.section(name).select([index-1 for index in order])
 
   # --------------------------------------------------------------------
   # replace a column of named section with vector of values
 
   def replace(self,name,icol,vector):
-    lines = self.sections[name]
-    newlines = []
-    j = icol - 1
-    for i in range(len(lines)):
-      line = lines[i]
-      words = line.split()
-      words[j] = str(vector[i])
-      newline = ' '.join(words) + '\n'
-      newlines.append(newline)
-    self.sections[name] = newlines
+    sec = self.section(name)
+    vector = np.asarray(vector)
+    if len(vector) != len(sec):
+      raise Exception("vector length does not match data section %s" % name)
+    sec.replace(icol-1,vector)
+
+  # --------------------------------------------------------------------
+  # set a section from column vectors and the matching header value
+
+  def newsection(self,name,*vectors):
+    sec = columns([np.asarray(vector) for vector in vectors])
+    for keyword,length in skeywords:
+      if keyword == name: self.headers[length] = len(sec)
+    self.sections[name] = sec
 
   # --------------------------------------------------------------------
   # replace x,y,z in Atoms with x,y,z values from snapshot ntime of dump object
@@ -231,9 +239,9 @@ class data(object):
 
     if "ix" in dm.names and "ix" in self.names:
       ix,iy,iz = dm.vecs(ntime,"ix","iy","iz")
-      self.replace("Atoms",self.names['ix']+1,ix)
-      self.replace("Atoms",self.names['iy']+1,iy)
-      self.replace("Atoms",self.names['iz']+1,iz)
+      self.replace("Atoms",self.names['ix']+1,np.asarray(ix,dtype=np.int64))
+      self.replace("Atoms",self.names['iy']+1,np.asarray(iy,dtype=np.int64))
+      self.replace("Atoms",self.names['iz']+1,np.asarray(iz,dtype=np.int64))
 
   # --------------------------------------------------------------------
   # delete header value or section from data file
@@ -279,19 +287,25 @@ class data(object):
       keyword = pair[0]
       if keyword in self.sections:
         print("\n%s\n" % keyword, file=f)
-        for line in self.sections[keyword]:
-          print(line, end='', file=f)
+        self.write_section(f,keyword)
 
     skeyfirst = [pair[0] for pair in skeywords]
 
     for keyword in list(self.sections.keys()):
       if keyword not in skeyfirst:
         print("\n%s\n" % keyword, file=f)
-        for line in self.sections[keyword]:
-          print(line, end='', file=f)
+        self.write_section(f,keyword)
 
     f.close()
 
+  # --------------------------------------------------------------------
+  # write lines of a section, columns objects are formatted in bulk
+
+  def write_section(self,f,keyword):
+    sec = self.sections[keyword]
+    if isinstance(sec,columns): sec.write(f)
+    else: f.writelines(sec)
+
   # --------------------------------------------------------------------
   # iterator called from other tools
 
@@ -325,31 +339,26 @@ class data(object):
 
     # create atom list needed by viz from id,type,x,y,z
 
-    atoms = []
-    atomlines = self.sections["Atoms"]
-    for line in atomlines:
-      words = line.split()
-      atoms.append([int(words[id]),int(words[type]),
-                    float(words[x]),float(words[y]),float(words[z])])
+    sec = self.section("Atoms")
+    ids,types = sec.column(id).astype(int),sec.column(type).astype(int)
+    xyz = np.column_stack((sec.column(x),sec.column(y),
+                           sec.column(z))).astype(float)
+    atoms = [list(atom) for atom in zip(ids.tolist(),types.tolist(),
+                                        *xyz.T.tolist())]
 
     # create list of current bond coords from list of bonds
     # assumes atoms are sorted so can lookup up the 2 atoms in each bond
 
     bonds = []
     if "Bonds" in self.sections:
-      bondlines = self.sections["Bonds"]
-      for line in bondlines:
-        words = line.split()
-        bid,btype   = int(words[0]),int(words[1])
-        atom1,atom2 = int(words[2]),int(words[3])
-        atom1words  = atomlines[atom1-1].split()
-        atom2words  = atomlines[atom2-1].split()
-        bonds.append([bid,btype,
-                      float(atom1words[x]),float(atom1words[y]),
-                      float(atom1words[z]),
-                      float(atom2words[x]),float(atom2words[y]),
-                      float(atom2words[z]),
-                      float(atom1words[type]),float(atom2words[type])])
+      bsec = self.section("Bonds")
+      atom1 = bsec.column(2).astype(int) - 1
+      atom2 = bsec.column(3).astype(int) - 1
+      bonds = np.column_stack((bsec.column(0).astype(float),
+                               bsec.column(1).astype(float),
+                               xyz[atom1],xyz[atom2],
+                               types[atom1],types[atom2])).tolist()
+      for bond in bonds: bond[0],bond[1] = int(bond[0]),int(bond[1])
 
     tris = []
     lines = []
@@ -400,3 +409,142 @@ skeywords = [["Masses","atom types"],
              ["AngleAngleTorsion Coeffs","dihedral types"],
              ["BondBond13 Coeffs","dihedral types"],
              ["AngleAngle Coeffs","improper types"]]
+
+# --------------------------------------------------------------------
+# columnar storage of a data file section
+#   cols = list of 1d NumPy arrays, one per column
+#   comments = list of per-line comments including the "#", or None
+# columns parsed from a file keep the words they were read from,
+#   each column is converted to an int, float, or str array on first use
+#   and written back as the original words as long as it is not replaced,
+#   converted arrays are read-only, modify a column by assigning a new array
+# len() and iteration give the number of lines and the formatted lines,
+#   so it can be used in place of the list of lines of a section
+
+class columns(object):
+
+  def __init__(self,cols=None,comments=None,words=None):
+    if words is None: words = [None]*len(cols)
+    if cols is None: cols = [None]*len(words)
+    self._cols = list(cols)
+    self._words = list(words)
+    self._orig = [None]*len(words)
+    self.comments = comments
+
+  # all columns as list of arrays, converting words where needed
+  # assigning list elements replaces columns
+
+  @property
+  def cols(self):
+    for j in range(len(self._cols)): self.column(j)
+    return self._cols
+
+  @cols.setter
+  def cols(self,cols):
+    self._cols = list(cols)
+    self._words = [None]*len(cols)
+    self._orig = [None]*len(cols)
+
+  # single column (0-N) as array, only this column is converted
+
+  def column(self,j):
+    if self._cols[j] is None:
+      words = self._words[j]
+      for dtype in (np.int64,float,str):
+        try:
+          col = np.array(words,dtype=dtype)
+          break
+        except ValueError:
+          pass
+      col.flags.writeable = False
+      self._cols[j] = self._orig[j] = col
+    return self._cols[j]
+
+  # replace column j (0-N) with array
+
+  def replace(self,j,col):
+    self._cols[j] = col
+
+  # keep only columns in order (0-N), without converting any of them
+
+  def select(self,order):
+    self._cols = [self._cols[j] for j in order]
+    self._words = [self._words[j] for j in order]
+    self._orig = [self._orig[j] for j in order]
+
+  def __len__(self):
+    if not self._cols: return 0
+    if self._cols[0] is not None: return len(self._cols[0])
+    return len(self._words[0])
+
+  def __iter__(self):
+    return self.lines()
+
+  def __getitem__(self,i):
+    return list(self.lines())[i]
+
+  # words of one column, original words of unchanged columns,
+  #   ints and strs with str(), floats with repr() so values are exact
+
+  def strings(self,j):
+    col = self._cols[j]
+    if self._words[j] is not None and (col is None or col is self._orig[j]):
+      return self._words[j]
+    if col.dtype.kind == "f": return list(map(repr,col.tolist()))
+    return list(map(str,col.tolist()))
+
+  # formatted lines, generated in blocks of chunk lines
+
+  def lines(self,chunk=65536):
+    strings = [self.strings(j) for j in range(len(self._cols))]
+    if self.comments is not None:
+      strings.append([c and " " + c for c in self.comments])
+    for i in range(0,len(self),chunk):
+      block = [s[i:i+chunk] for s in strings]
+      if self.comments is not None:
+        for line in zip(*block): yield " ".join(line[:-1]) + line[-1] + "\n"
+      else:
+        for line in map(" ".join,zip(*block)): yield line + "\n"
+
+  # write lines of all blocks, each block as one string
+
+  def write(self,f,chunk=65536):
+    strings = [self.strings(j) for j in range(len(self._cols))]
+    for i in range(0,len(self),chunk):
+      block = [s[i:i+chunk] for s in strings]
+      rows = map(" ".join,zip(*block))
+      if self.comments is not None:
+        rows = map(str.__add__,rows,
+                   [c and " " + c for c in self.comments[i:i+chunk]])
+      f.write("\n".join(rows))
+      f.write("\n")
+
+# --------------------------------------------------------------------
+# split lines of a data file section into columns object of words
+# sections without comments are split in one step,
+#   otherwise each line is split and its comment is kept
+
+def parse(lines):
+  n = len(lines)
+  if n == 0: return columns([])
+  ncol = len(lines[0].split("#")[0].split())
+
+  text = "".join(lines)
+  if "#" not in text:
+    words = text.split()
+    if len(words) == n*ncol and len(lines[-1].split()) == ncol:
+      return columns(words=[words[j::ncol] for j in range(ncol)])
+
+  words = []
+  comments = []
+  for line in lines:
+    i = line.find("#")
+    if i >= 0:
+      comments.append(line[i:].strip())
+      line = line[:i]
+    else: comments.append("")
+    words.append(line.split())
+  if any(len(w) != ncol for w in words):
+    raise Exception("data section with varying number of columns")
+  if not any(comments): comments = None
+  return columns(words=[list(col) for col in zip(*words)],comments=comments)
@@ -17,6 +17,7 @@
 
 from __future__ import print_function
 import sys,os,math
+import numpy as np
 from data import data
 
 BIG = 1.0e20
@@ -40,41 +41,61 @@ Syntax: tinker2lmp.py -switch args ...
   sys.exit("ERROR: " + txt)
 
 # read and store values from a Tinker xyz file
+# bonds are stored as a CSR graph:
+#   bonds of atom I (0 to N-1) are nbr[start[I]:start[I+1]] (atom IDs 1-N)
 
 class XYZfile(object):
   def __init__(self,file):
     lines = open(file,'r').readlines()
     header = lines[0]
     natoms = int(lines[0].split()[0])
-    id = []
-    label = []
-    type = []
-    x = []
-    y = []
-    z = []
-    bonds = []
-
-    for line in lines[1:natoms+1]:
-      words = line.split()
-      id.append(int(words[0]))
-      label.append(words[1])
-      x.append(words[2])
-      y.append(words[3])
-      z.append(words[4])
-      type.append(int(words[5]))
-      blist = words[6:]
-      blist = [int(one) for one in blist]
-      bonds.append(blist)
+
+    words = [line.split() for line in lines[1:natoms+1]]
+    nbonds = [len(one)-6 for one in words]
 
     self.header = header
     self.natoms = natoms
-    self.id = id
-    self.label = label
-    self.type = type
-    self.x = x
-    self.y = y
-    self.z = z
-    self.bonds = bonds
+    self.id = np.array([one[0] for one in words],dtype=np.int64)
+    self.label = np.array([one[1] for one in words],dtype=object)
+    self.x = np.array([one[2] for one in words],dtype=np.float64)
+    self.y = np.array([one[3] for one in words],dtype=np.float64)
+    self.z = np.array([one[4] for one in words],dtype=np.float64)
+    self.type = np.array([one[5] for one in words],dtype=np.int64)
+    self.start = np.zeros(natoms+1,dtype=np.int64)
+    np.cumsum(nbonds,out=self.start[1:])
+    self.nbr = np.array([int(j) for one in words for j in one[6:]],
+                        dtype=np.int64)
+
+  # number of bonds of each atom
+
+  def nbonds(self):
+    return np.diff(self.start)
+
+  # all k-tuples of bond partners of each center atom (0 to N-1)
+  # returns center atom of each tuple and k arrays of positions into nbr
+  # tuples are in the order of k nested loops over bonds of the center
+
+  def bond_tuples(self,centers,k):
+    n = self.start[centers+1] - self.start[centers]
+    count = n**k
+    owner = np.repeat(centers,count)
+    local = np.arange(count.sum()) - np.repeat(np.cumsum(count)-count,count)
+    n = np.repeat(n,count)
+    first = self.start[owner]
+    pos = []
+    for j in range(k):
+      pos.append(first + local // n**(k-1-j) % n)
+    return owner,pos
+
+  # expand a list of atoms (0 to N-1) over their bonds
+  # returns index into the list and position into nbr of each bond
+
+  def expand(self,atoms):
+    n = self.start[atoms+1] - self.start[atoms]
+    index = np.repeat(np.arange(len(atoms)),n)
+    pos = np.arange(n.sum()) - np.repeat(np.cumsum(n)-n,n) + \
+          self.start[atoms][index]
+    return index,pos
 
   # set bond images flags in each dim for each bond of each atom
   # used for replication of a periodic system
@@ -83,171 +104,145 @@ class XYZfile(object):
   # +1 = bond partner is on other side of upper box bound in dim
 
   def bond_images(self):
+    atom = np.repeat(np.arange(self.natoms),self.nbonds())
+    partner = self.nbr - 1
 
-    xhalfsq = 0.25 * boxhi[0]*boxhi[0]
-    yhalfsq = 0.25 * boxhi[1]*boxhi[1]
-    zhalfsq = 0.25 * boxhi[2]*boxhi[2]
-
-    x = self.x
-    y = self.y
-    z = self.z
-    bonds = self.bonds
-    imageflags = []
-
-    for i in range(self.natoms):
-      xi = float(x[i])
-      yi = float(y[i])
-      zi = float(z[i])
-      oneflags = []
-
-      for j in bonds[i]:
-        xj = float(x[j-1])
-        yj = float(y[j-1])
-        zj = float(z[j-1])
-        dx = xi - xj
-        dy = yi - yj
-        dz = zi - zj
-
-        if dx*dx <= xhalfsq: ximage = 0
-        elif xi < xj: ximage = -1
-        elif xi > xj: ximage = 1
-        if dy*dy <= yhalfsq: yimage = 0
-        elif yi < yj: yimage = -1
-        elif yi > yj: yimage = 1
-        if dz*dz <= zhalfsq: zimage = 0
-        elif zi < zj: zimage = -1
-        elif zi > zj: zimage = 1
-        oneflags.append((ximage,yimage,zimage))
-
-      imageflags.append(oneflags)
+    imageflags = np.zeros((len(self.nbr),3),dtype=np.int64)
+    for dim,coord in enumerate((self.x,self.y,self.z)):
+      ci = coord[atom]
+      cj = coord[partner]
+      d = ci - cj
+      far = d*d > 0.25 * boxhi[dim]*boxhi[dim]
+      imageflags[:,dim] = np.where(far,np.sign(d),0)
 
     self.imageflags = imageflags
 
   # replicate system by Nx and Ny and Nz in each dim
   # rebuild data structs (except imageflags) in this class
   # also alter global boxhi
+  # replicated box (i,j,k) holds atoms natoms*(k*ny*nx + j*nx + i) + 1 to N
 
   def replicate(self,nx,ny,nz):
 
     natoms = self.natoms
-    id = self.id
-    label = self.label
-    type = self.type
-    x = self.x
-    y = self.y
-    z = self.z
-    bonds = self.bonds
-    imageflags = self.imageflags
+    nrep = nx*ny*nz
+    k,j,i = np.unravel_index(np.arange(nrep),(nz,ny,nx))
 
     xbox = boxhi[0]
     ybox = boxhi[1]
     zbox = boxhi[2]
 
-    idnew = []
-    labelnew = []
-    typenew = []
-    xnew = []
-    ynew = []
-    znew = []
-    bondsnew = []
-
-    count = 0
-    for k in range(nz):
-      for j in range(ny):
-        for i in range(nx):
-          for m in range(natoms):
-            count += 1
-            idnew.append(count)
-            labelnew.append(label[m])
-            typenew.append(type[m])
-            xnew.append(str(float(x[m]) + i*xbox))
-            ynew.append(str(float(y[m]) + j*ybox))
-            znew.append(str(float(z[m]) + k*zbox))
-
-            oneflags = imageflags[m]
-            onebonds = []
-
-            for n,mbond in enumerate(bonds[m]):
-
-              # ijk new = which replicated box the mbond atom is in
-
-              if oneflags[n][0] == 0: inew = i
-              elif oneflags[n][0] == -1: inew = i - 1
-              elif oneflags[n][0] == 1: inew = i + 1
-              if inew < 0: inew = nx-1
-              if inew == nx: inew = 0
-
-              if oneflags[n][1] == 0: jnew = j
-              elif oneflags[n][1] == -1: jnew = j - 1
-              elif oneflags[n][1] == 1: jnew = j + 1
-              if jnew < 0: jnew = ny-1
-              if jnew == ny: jnew = 0
-
-              if oneflags[n][2] == 0: knew = k
-              elif oneflags[n][2] == -1: knew = k - 1
-              elif oneflags[n][2] == 1: knew = k + 1
-              if knew < 0: knew = nz-1
-              if knew == nz: knew = 0
-
-              # bondnew = replicated atom ID of bond partner
-              # based on replication box (inew,jnew,knew) that owns it
-
-              bondnew = mbond + natoms*(knew*ny*nx + jnew*nx + inew)
-              onebonds.append(bondnew)
-
-            bondsnew.append(onebonds)
-
-    self.natoms = natoms * nx*ny*nz
-    self.id = idnew
-    self.label = labelnew
-    self.type = typenew
-    self.x = xnew
-    self.y = ynew
-    self.z = znew
-    self.bonds = bondsnew
+    # ijk new = which replicated box the bond partner is in
+    # bondnew = replicated atom ID of bond partner
+    #   based on replication box (inew,jnew,knew) that owns it
+
+    flags = self.imageflags
+    inew = (i[:,None] + flags[:,0]) % nx
+    jnew = (j[:,None] + flags[:,1]) % ny
+    knew = (k[:,None] + flags[:,2]) % nz
+    bondnew = self.nbr + natoms*(knew*ny*nx + jnew*nx + inew)
+
+    self.natoms = natoms * nrep
+    self.id = np.arange(1,self.natoms+1,dtype=np.int64)
+    self.label = np.tile(self.label,nrep)
+    self.type = np.tile(self.type,nrep)
+    self.x = (self.x + (i*xbox)[:,None]).ravel()
+    self.y = (self.y + (j*ybox)[:,None]).ravel()
+    self.z = (self.z + (k*zbox)[:,None]).ravel()
+    self.start = np.concatenate((len(self.nbr)*np.arange(nrep)[:,None] +
+                                 self.start[:-1],[nrep*len(self.nbr)]),
+                                axis=None)
+    self.nbr = bondnew.ravel()
 
   # write out new xyzfile for replicated system
+  # atoms with the same number of bonds are formatted together
 
   def output(self,outfile):
     fp = open(outfile,'w')
     words = self.header.split()
     print(self.natoms,"replicated",' '.join(words[1:]), file=fp)
 
-    id = self.id
-    label = self.label
-    type = self.type
-    x = self.x
-    y = self.y
-    z = self.z
-    bonds = self.bonds
-
     # NOTE: worry about formatting of line
 
-    for i in range(self.natoms):
-      print(i+1,label[i],x[i],y[i],z[i],type[i], end=' ', file=fp)
-      for j in bonds[i]: print(j, end=' ', file=fp)
-      print(file=fp)
+    nbonds = self.nbonds()
+    lines = np.empty(self.natoms,dtype=object)
+    for n in np.unique(nbonds):
+      index = np.flatnonzero(nbonds == n)
+      fmt = "%d %s %r %r %r %d " + n*"%d " + "\n"
+      bonds = self.nbr[self.start[index][:,None] + np.arange(n)]
+      rows = zip((index+1).tolist(),self.label[index].tolist(),
+                 self.x[index].tolist(),self.y[index].tolist(),
+                 self.z[index].tolist(),self.type[index].tolist(),
+                 *bonds.T.tolist())
+      lines[index] = list(map(fmt.__mod__,rows))
+    fp.writelines(lines.tolist())
 
     fp.close()
 
-  # triplet of atoms in an angle = atom 1,2,3
+  # molecule ID of each atom from bond connectivity (1 to Nmol)
+  # molecules are numbered in order of their lowest atom ID
+  # each atom is hooked onto the lowest label among its bond partners,
+  #   followed by pointer jumping, until no label changes
+
+  def molecules(self):
+    atom = np.repeat(np.arange(self.natoms),self.nbonds())
+    partner = self.nbr - 1
+
+    label = np.arange(self.natoms)
+    while True:
+      new = label.copy()
+      np.minimum.at(new,label[atom],label[partner])
+      while True:
+        jump = new[new]
+        if np.array_equal(jump,new): break
+        new = jump
+      if np.array_equal(new,label): break
+      label = new
+
+    lowest = np.full(self.natoms,self.natoms)
+    np.minimum.at(lowest,label,np.arange(self.natoms))
+    unique,molID = np.unique(lowest[label],return_inverse=True)
+    return molID+1,len(unique)
+
+  # triplets of atoms in angles = atom 1,2,3
   # atom2 is center atom
   # nbonds = number of atoms which atom2 is bonded to
   # hcount = # of H atoms which atom2 is bonded to, excluding atom1 and atom3
 
   def angle_hbond_count(self,atom1,atom2,atom3,lmptype,lmpmass):
-    bondlist = self.bonds[atom2-1]
-    nbonds = len(bondlist)
-
-    hcount = 0
-    for bondID in bondlist:
-      if atom1 == bondID: continue
-      if atom3 == bondID: continue
-      massone = lmpmass[lmptype[bondID-1]-1]
-      if int(massone+0.5) == 1: hcount += 1
+    hydrogen = (lmpmass[lmptype-1] + 0.5).astype(np.int64) == 1
+    atom = np.repeat(np.arange(self.natoms),self.nbonds())
+    nhydrogen = np.bincount(atom,weights=hydrogen[self.nbr-1],
+                            minlength=self.natoms).astype(np.int64)
 
+    nbonds = self.nbonds()[atom2-1]
+    hcount = nhydrogen[atom2-1] - hydrogen[atom1-1] - hydrogen[atom3-1]
     return nbonds,hcount
 
+# unique class tuples of a list of interactions
+# atoms = arrays of atom IDs of the interactions, one per position
+# returns list of unique class tuples, index of first interaction
+#   with each tuple, and index into unique tuples for each interaction
+
+def class_tuples(classes,*atoms):
+  c = np.column_stack([classes[one-1] for one in atoms])
+  if not len(c): return [],np.zeros(0,dtype=np.int64),np.zeros(0,dtype=np.int64)
+  key = np.ravel_multi_index(tuple(c.T),len(atoms)*(classes.max()+1,))
+  unique,first,inverse = np.unique(key,return_index=True,return_inverse=True)
+  return [tuple(one) for one in c[first].tolist()],first,inverse
+
+# LAMMPS types (1-N) for list of PRM file entries M, one per interaction
+# types are numbered in order of first appearance of each M
+# returns type of each interaction, M of each type,
+#   and index of first interaction with each type
+
+def first_types(m):
+  unique,first,inverse = np.unique(m,return_index=True,return_inverse=True)
+  order = np.argsort(first)
+  rank = np.empty(len(unique),dtype=np.int64)
+  rank[order] = np.arange(len(unique))
+  return rank[inverse]+1,unique[order],first[order]
+
 # read and store select values from a Tinker force field PRM file
 # ntypes = # of Tinker types
 # per-type values: class and mass
@@ -740,15 +735,8 @@ z = xyz.z
 if pbcflag:
   boxlo = [0,0,0]
 else:
-  xlo = ylo = zlo = BIG
-  xhi = yhi = zhi = -BIG
-  for i in range(natoms):
-    xlo = min(xlo,float(x[i]))
-    ylo = min(ylo,float(y[i]))
-    zlo = min(zlo,float(z[i]))
-    xhi = max(xhi,float(x[i]))
-    yhi = max(yhi,float(y[i]))
-    zhi = max(zhi,float(z[i]))
+  xlo,ylo,zlo = x.min(),y.min(),z.min()
+  xhi,yhi,zhi = x.max(),y.max(),z.max()
   boxlo = [xlo-DELTA,ylo-DELTA,zlo-DELTA]
   boxhi = [xhi+DELTA,yhi+DELTA,zhi+DELTA]
 
@@ -763,114 +751,83 @@ else:
 # lmpmass = list of per-type masses
 # ttype = list of Tinker types for each atom (1 to prm.ntypes)
 # tink2lmp = mapping of Tinker types to LAMMPS types
+# Tinker types are processed in order of first appearance
 
 natoms = xyz.natoms
 ttype = xyz.type
 tmasses = prm.masses
 
 ntypes = 0
-lmptype = []
 lmpmass = []
 tink2lmp = {}
 
-for itype in ttype:
-  if itype not in tink2lmp:
-    mass = tmasses[itype-1]
-    if mass not in lmpmass:
-      ntypes += 1
-      lmpmass.append(mass)
-      jtype = ntypes
-    else: jtype = lmpmass.index(mass) + 1
-    tink2lmp[itype] = jtype
-  lmptype.append(tink2lmp[itype])
+unique,first = np.unique(ttype,return_index=True)
+for itype in unique[np.argsort(first)].tolist():
+  mass = tmasses[itype-1]
+  if mass not in lmpmass:
+    ntypes += 1
+    lmpmass.append(mass)
+    jtype = ntypes
+  else: jtype = lmpmass.index(mass) + 1
+  tink2lmp[itype] = jtype
+
+lookup = np.zeros(ttype.max()+1,dtype=np.int64)
+lookup[list(tink2lmp.keys())] = list(tink2lmp.values())
+lmptype = lookup[ttype]
 
 # ----------------------------------------
 # identify molecules from Tinker bond connectivity
 # ----------------------------------------
 
 # molID = which molecule each atom is in (1 to Nmol)
-# use stack to store IDs of atoms to recursively loop over
 
-natoms = xyz.natoms
-id = xyz.id
-bonds = xyz.bonds
-
-molID = natoms*[0]
-nmol = 0
-
-for i in id:
-  if molID[i-1] > 0: continue
-  nmol += 1
-  molID[i-1] = nmol
-  stack = [i]
-  while stack:
-    j = stack.pop()
-    for k in bonds[j-1]:
-      if molID[k-1] == 0:
-        molID[k-1] = nmol
-        stack.append(k)
+molID,nmol = xyz.molecules()
 
 # ----------------------------------------
 # create lists of bonds, angles, dihedrals, impropers
 # ----------------------------------------
 
-# create blist = list of bonds
-# avoid double counting by requiring atom1 < atom2
+# each list is a tuple of arrays of atom IDs, one array per atom position
+# interactions are generated from bond tuples of center atoms,
+#   in the same order as nested loops over the bonds would generate them
 
 id = xyz.id
-type = xyz.type
-bonds = xyz.bonds
+nbr = xyz.nbr
+center = np.arange(natoms)
 
-blist = []
+# create blist = list of bonds
+# avoid double counting by requiring atom1 < atom2
 
-for atom1 in id:
-  for atom2 in bonds[atom1-1]:
-    if atom1 < atom2:
-      blist.append((atom1,atom2))
+owner,(p,) = xyz.bond_tuples(center,1)
+atom1,atom2 = id[owner],nbr[p]
+keep = atom1 < atom2
+blist = (atom1[keep],atom2[keep])
 
 # create alist = list of angles
 # generate topology by double loop over bonds of center atom2
 # avoid double counting by requiring atom1 < atom3
 
-id = xyz.id
-type = xyz.type
-bonds = xyz.bonds
-
-alist = []
-
-for atom2 in id:
-  for atom1 in bonds[atom2-1]:
-    for atom3 in bonds[atom2-1]:
-      if atom3 == atom1: continue
-      if atom1 < atom3:
-        alist.append((atom1,atom2,atom3))
+owner,(p,q) = xyz.bond_tuples(center,2)
+atom1,atom2,atom3 = nbr[p],id[owner],nbr[q]
+keep = atom1 < atom3
+alist = (atom1[keep],atom2[keep],atom3[keep])
 
 # create dlist = list of dihedrals
 # generate topology via triple loop over neighbors of dihedral atom2
 #   double loop over bonds of atom2
 #   additional loop over bonds of atom3
-# avoid double counting the reverse dihedral by use of ddict dictionary
-
-# NOTE: could just avoid double count by "if atom1 < atom4" as in bond, angle ?
-#       gives different list, but is it still identical ?
-#       would have to check 2 data files, write comparison Py script
-
-id = xyz.id
-type = xyz.type
-bonds = xyz.bonds
-
-dlist = []
-ddict = {}
-
-for atom2 in id:
-  for atom1 in bonds[atom2-1]:
-    for atom3 in bonds[atom2-1]:
-      if atom3 == atom1: continue
-      for atom4 in bonds[atom3-1]:
-        if atom4 == atom2 or atom4 == atom1: continue
-        if (atom4,atom3,atom2,atom1) in ddict: continue
-        dlist.append((atom1,atom2,atom3,atom4))
-        ddict[(atom1,atom2,atom3,atom4)] = 1
+# avoid double counting the reverse dihedral by requiring atom2 < atom3
+#   the reverse dihedral is generated with atom3 as center atom, so this
+#   keeps the first one of the two in the order of the loops
+
+owner,(p,q) = xyz.bond_tuples(center,2)
+atom1,atom2,atom3 = nbr[p],id[owner],nbr[q]
+keep = (atom1 != atom3) & (atom2 < atom3)
+atom1,atom2,atom3 = atom1[keep],atom2[keep],atom3[keep]
+index,pos = xyz.expand(atom3-1)
+atom1,atom2,atom3,atom4 = atom1[index],atom2[index],atom3[index],nbr[pos]
+keep = (atom4 != atom2) & (atom4 != atom1)
+dlist = (atom1[keep],atom2[keep],atom3[keep],atom4[keep])
 
 # create olist = list of out-of-plane impropers
 # generate topology by triple loop over bonds of center atom2
@@ -878,21 +835,10 @@ for atom2 in id:
 # avoid double counting by requiring atom3 < atom4
 # this is since in Tinker the final 2 atoms in the improper are interchangeable
 
-id = xyz.id
-type = xyz.type
-bonds = xyz.bonds
-
-olist = []
-
-for atom2 in id:
-  if len(bonds[atom2-1]) < 3: continue
-  for atom1 in bonds[atom2-1]:
-    for atom3 in bonds[atom2-1]:
-      for atom4 in bonds[atom2-1]:
-        if atom1 == atom3: continue
-        if atom1 == atom4: continue
-        if atom3 >= atom4: continue
-        olist.append((atom1,atom2,atom3,atom4))
+owner,(p,q,r) = xyz.bond_tuples(np.flatnonzero(xyz.nbonds() >= 3),3)
+atom1,atom2,atom3,atom4 = nbr[p],id[owner],nbr[q],nbr[r]
+keep = (atom1 != atom3) & (atom1 != atom4) & (atom3 < atom4)
+olist = (atom1[keep],atom2[keep],atom3[keep],atom4[keep])
 
 # ----------------------------------------
 # create list of Urey-Bradley triplet matches
@@ -901,253 +847,174 @@ for atom2 in id:
 # scan list of angles to find triplets that match UB parameters
 # if match, add it to UB bond list
 
-type = xyz.type
-classes = prm.classes
-
-ublist = []
+classes = np.array(prm.classes)[xyz.type-1]
 
 ubdict = {}
 for m,params in enumerate(prm.ureyparams):
   ubdict[(params[0],params[1],params[2])] = (m,params)
 
-for atom1,atom2,atom3 in alist:
-  type1 = type[atom1-1]
-  type2 = type[atom2-1]
-  type3 = type[atom3-1]
-  c1 = classes[type1-1]
-  c2 = classes[type2-1]
-  c3 = classes[type3-1]
-
-  if (c1,c2,c3) in ubdict:
-    ublist.append((atom1,atom2,atom3))
-  elif (c3,c2,c1) in ubdict:
-    ublist.append((atom3,atom2,atom1))
+tuples,first,inverse = class_tuples(classes,*alist)
+match = np.array([c in ubdict or c[::-1] in ubdict for c in tuples],dtype=bool)
+flip = np.array([c not in ubdict for c in tuples],dtype=bool)
+keep = match[inverse]
+atom1,atom2,atom3 = alist
+reverse = flip[inverse]
+ublist = (np.where(reverse,atom3,atom1)[keep],atom2[keep],
+          np.where(reverse,atom1,atom3)[keep])
 
 # create pitorsionlist = list of 6-body interactions
 # based on central bond, each bond atom is bonded to exactly 2 other atoms
 # avoid double counting by requiring atom1 < atom2
 # NOTE: need more info on how to order the 6 atoms for Tinker to compute on
 
-type = xyz.type
-classes = prm.classes
-bonds = xyz.bonds
-
-pitorsionlist = []
-
-for atom1 in id:
-  for atom2 in bonds[atom1-1]:
-    if atom1 < atom2:
-      if len(bonds[atom1-1]) != 3: continue
-      if len(bonds[atom2-1]) != 3: continue
-
-      if bonds[atom1-1][0] == atom2:
-        atom3 = bonds[atom1-1][1]
-        atom4 = bonds[atom1-1][2]
-      elif bonds[atom1-1][1] == atom2:
-        atom3 = bonds[atom1-1][0]
-        atom4 = bonds[atom1-1][2]
-      elif bonds[atom1-1][2] == atom2:
-        atom3 = bonds[atom1-1][0]
-        atom4 = bonds[atom1-1][1]
-
-      if bonds[atom2-1][0] == atom1:
-        atom5 = bonds[atom2-1][1]
-        atom6 = bonds[atom2-1][2]
-      elif bonds[atom2-1][1] == atom1:
-        atom5 = bonds[atom2-1][0]
-        atom6 = bonds[atom2-1][2]
-      elif bonds[atom2-1][2] == atom1:
-        atom5 = bonds[atom2-1][0]
-        atom6 = bonds[atom2-1][1]
-
-      pitorsionlist.append((atom3,atom4,atom1,atom2,atom5,atom6))
+nbonds = xyz.nbonds()
+atom1,atom2 = blist
+keep = (nbonds[atom1-1] == 3) & (nbonds[atom2-1] == 3)
+atom1,atom2 = atom1[keep],atom2[keep]
+
+# other 2 bond partners of each atom, in the order of its bonds
+
+def others(atom,partner):
+  bonds = nbr[xyz.start[atom-1][:,None] + np.arange(3)]
+  first = np.where(bonds[:,0] == partner,bonds[:,1],bonds[:,0])
+  second = np.where(bonds[:,2] == partner,bonds[:,1],bonds[:,2])
+  return first,second
+
+atom3,atom4 = others(atom1,atom2)
+atom5,atom6 = others(atom2,atom1)
+pitorsionlist = (atom3,atom4,atom1,atom2,atom5,atom6)
 
 # create bitorsionlist = list of 5-body interactions
 # generate topology via double loop over neighbors of central atom3
 #   additional double loop over bonds of atom2 and bonds of atom4
-# avoid double counting the reverse bitorsion by use of btdict dictionary
-
-type = xyz.type
-classes = prm.classes
-bonds = xyz.bonds
-
-bitorsionlist = []
-btdict = {}
-
-for atom3 in id:
-  for atom2 in bonds[atom3-1]:
-    for atom4 in bonds[atom3-1]:
-      if atom2 == atom4: continue
-      for atom1 in bonds[atom2-1]:
-        for atom5 in bonds[atom4-1]:
-          if atom1 == atom3 or atom5 == atom3 or atom1 == atom5: continue
-          if (atom5,atom4,atom3,atom2,atom1) in btdict: continue
-          bitorsionlist.append((atom1,atom2,atom3,atom4,atom5))
-          btdict[(atom1,atom2,atom3,atom4,atom5)] = 1
+# avoid double counting the reverse bitorsion by requiring that atom2
+#   comes before atom4 in the bonds of atom3
+#   the reverse bitorsion swaps atom2 and atom4 for the same center atom,
+#   so this keeps the first one of the two in the order of the loops
+
+owner,(p,q) = xyz.bond_tuples(center,2)
+atom2,atom3,atom4 = nbr[p],id[owner],nbr[q]
+keep = (atom2 != atom4) & (p < q)
+atom2,atom3,atom4 = atom2[keep],atom3[keep],atom4[keep]
+index,pos = xyz.expand(atom2-1)
+atom1,atom2,atom3,atom4 = nbr[pos],atom2[index],atom3[index],atom4[index]
+keep = atom1 != atom3
+atom1,atom2,atom3,atom4 = atom1[keep],atom2[keep],atom3[keep],atom4[keep]
+index,pos = xyz.expand(atom4-1)
+atom1,atom2,atom3,atom4,atom5 = \
+  atom1[index],atom2[index],atom3[index],atom4[index],nbr[pos]
+keep = (atom5 != atom3) & (atom1 != atom5)
+bitorsionlist = (atom1[keep],atom2[keep],atom3[keep],atom4[keep],atom5[keep])
 
 # ----------------------------------------
 # create lists of bond/angle/dihedral/improper types
 # ----------------------------------------
 
+# PRM file params are looked up once for each unique tuple of classes
+#   of the atoms in an interaction
+# LAMMPS types are numbered in order of first appearance in each list
+
 # generate btype = LAMMPS type of each bond
 # generate bparams = LAMMPS params for each bond type
-# flags[i] = which LAMMPS bond type (1-N) the Ith Tinker PRM file bond is
-#        0 = none
 # convert prm.bondparams to a dictionary for efficient searching
 # key = (class1,class2)
 # value = (M,params) where M is index into prm.bondparams
 
-id = xyz.id
-type = xyz.type
-classes = prm.classes
-
 bdict = {}
 for m,params in enumerate(prm.bondparams):
   bdict[(params[0],params[1])] = (m,params)
 
-flags = len(prm.bondparams)*[0]
-btype = []
-bparams = []
-
-for atom1,atom2 in blist:
-  type1 = type[atom1-1]
-  type2 = type[atom2-1]
-  c1 = classes[type1-1]
-  c2 = classes[type2-1]
-
+tuples,first,inverse = class_tuples(classes,*blist)
+mtuple = []
+for (c1,c2),ifirst in zip(tuples,first.tolist()):
   if (c1,c2) in bdict: m,params = bdict[(c1,c2)]
   elif (c2,c1) in bdict: m,params = bdict[(c2,c1)]
-  else: error("bond not found: %d %d: %d %d" % (atom1,atom2,c1,c2))
+  else:
+    atom1,atom2 = [one[ifirst] for one in blist]
+    error("bond not found: %d %d: %d %d" % (atom1,atom2,c1,c2))
+  mtuple.append(m)
 
-  if not flags[m]:
-    v1,v2,v3,v4 = params[2:]
-    bparams.append((v1,v2,v3,v4))
-    flags[m] = len(bparams)
-  btype.append(flags[m])
+btype,mtypes,first = first_types(np.array(mtuple,dtype=np.int64)[inverse])
+bparams = [tuple(prm.bondparams[m][2:]) for m in mtypes.tolist()]
 
 # generate atype = LAMMPS type of each angle
 # generate aparams = LAMMPS params for each angle type
-# flags[i] = which LAMMPS angle type (1-N) the Tinker FF file angle I is
-#        0 = none
 # Tinker FF file angle entries can have 1, 2, or 3 options
 # noptions = total # of Tinker FF file entries with options included
+# options = list of all options of all entries
 # convert prm.angleparams to a dictionary for efficient searching
 # key = (class1,class2)
-# value = (M,params) where M is index into prm.angleparams
-
-id = xyz.id
-type = xyz.type
-classes = prm.classes
+# value = (M,params) where M is index into options for option 1
 
 adict = {}
 noptions = 0
+options = []
 for m,params in enumerate(prm.angleparams):
   adict[(params[0],params[1],params[2])] = (noptions,params)
   n = len(params[3])
   noptions += n
-
-flags = noptions*[0]
-atype = []
-aparams = []
-
-for i,one in enumerate(alist):
-  atom1,atom2,atom3 = one
-  type1 = type[atom1-1]
-  type2 = type[atom2-1]
-  type3 = type[atom3-1]
-  c1 = classes[type1-1]
-  c2 = classes[type2-1]
-  c3 = classes[type3-1]
-
-  if (c1,c2,c3) in adict or (c3,c2,c1) in adict:
-    if (c1,c2,c3) in adict: m,params = adict[(c1,c2,c3)]
-
-    # IMPORTANT subtlety
-    # flip order of 3 atoms in alist if the angle
-    #   matches Angle Bending section of PRM file in reverse order
-    #   no need to flip if c1 = c3
-    # necessary b/c BondAngle coeffs will be generated with r1,r2 params
-    #   from Bond Stretching section of PRM file
-    # since in general r1 != r2, the LAMMPS AngleAmoeba class requires
-    #   the 3 atoms in the angle be in the order that matches r1 and r2
-
-    if c1 != c3 and (c3,c2,c1) in adict:
-      m,params = adict[(c3,c2,c1)]
-      alist[i] = (atom3,atom2,atom1)
-
-    # params is a sequence of 1 or 2 or 3 options
-    # which = which of 1,2,3 options this atom triplet matches
-    # for which = 2 or 3, increment m to index correct position in flags
-    # how match is determined:
-    #   if 2 options:
-    #     require atom2 have 3 bond partners, including atom1 and atom3
-    #     option 1 if additional bond is not to an H atom
-    #     option 2 if additional bond is to an H atom
-    #   if 3 options:
-    #     require atom2 have 4 bond partners, including atom1 and atom3
-    #     option 1 if neither of 2 additional bonds is to an H atom
-    #     option 2 if one of 2 additional bonds is to an H atom
-    #     option 3 if both of 2 additional bonds is to an H atom
-
-    if len(params[3]) == 1:
-      which = 1
-
-    elif len(params[3]) == 2:
-      nbonds,hcount = xyz.angle_hbond_count(atom1,atom2,atom3,lmptype,lmpmass)
-
-      #if nbonds != 3:
-        #print("Center angle atom has wrong bond count")
-        #print("  angle atom IDs:",atom1,atom2,atom3)
-        #print("  angle atom classes:",c1,c2,c3)
-        #print("  Tinker FF file param options:",len(params[3]))
-        #print("  Nbonds and hydrogen count:",nbonds,hcount)
-        # NOTE: allow this for now
-        #sys.exit()
-
-      if hcount == 0: which = 1
-      elif hcount == 1:
-        which = 2
-        m += 1
-
-      #print("3-bond angle")
-      #print("  angle atom IDs:",atom1,atom2,atom3)
-      #print("  angle atom classes:",c1,c2,c3)
-      #print("  Tinker FF file param options:",len(params[3]))
-      #print("  Nbonds and hydrogen count:",nbonds,hcount)
-      #print("  which:",which,m)
-
-    elif len(params[3]) == 3:
-      nbonds,hcount = xyz.angle_hbond_count(atom1,atom2,atom3,lmptype,lmpmass)
-
-      #if nbonds != 4:
-        #print("Center angle atom has wrong bond count")
-        #print("  angle atom IDs:",atom1,atom2,atom3)
-        #print("  angle atom classes:",c1,c2,c3)
-        #print("  Tinker FF file param options:",len(params[3]))
-        #print("  Nbonds and hydrogen count:",nbonds,hcount)
-        # NOTE: allow this for now
-        #sys.exit()
-
-      if hcount == 0: which = 1
-      elif hcount == 1:
-        which = 2
-        m += 1
-      elif hcount == 2:
-        which = 3
-        m += 2
-
+  options += params[3]
+
+tuples,first,inverse = class_tuples(classes,*alist)
+mtuple = []
+ntuple = []
+flip = []
+for (c1,c2,c3),ifirst in zip(tuples,first.tolist()):
+  if (c1,c2,c3) not in adict and (c3,c2,c1) not in adict:
+    atom1,atom2,atom3 = [one[ifirst] for one in alist]
+    error("angle not found: %d %d %d: %d %d %d" % \
+          (atom1,atom2,atom3,c1,c2,c3))
+
+  # IMPORTANT subtlety
+  # flip order of 3 atoms in alist if the angle
+  #   matches Angle Bending section of PRM file in reverse order
+  #   no need to flip if c1 = c3
+  # necessary b/c BondAngle coeffs will be generated with r1,r2 params
+  #   from Bond Stretching section of PRM file
+  # since in general r1 != r2, the LAMMPS AngleAmoeba class requires
+  #   the 3 atoms in the angle be in the order that matches r1 and r2
+
+  if c1 != c3 and (c3,c2,c1) in adict:
+    m,params = adict[(c3,c2,c1)]
+    flip.append(True)
   else:
-    error("angle not found: %d %d %d: %d %d %d" % (atom1,atom2,atom3,c1,c2,c3))
-
-  if not flags[m]:
-    pflag,ubflag,v1,v2,v3,v4,v5,v6 = params[3][which-1]
-    aparams.append((pflag,ubflag,v1,v2,v3,v4,v5,v6))
-    flags[m] = len(aparams)
-  atype.append(flags[m])
+    m,params = adict[(c1,c2,c3)]
+    flip.append(False)
+  mtuple.append(m)
+  ntuple.append(len(params[3]))
+
+# params is a sequence of 1 or 2 or 3 options
+# which = which of 1,2,3 options this atom triplet matches
+# for which = 2 or 3, increment m to index correct position in options
+# how match is determined:
+#   if 2 options:
+#     require atom2 have 3 bond partners, including atom1 and atom3
+#     option 1 if additional bond is not to an H atom
+#     option 2 if additional bond is to an H atom
+#   if 3 options:
+#     require atom2 have 4 bond partners, including atom1 and atom3
+#     option 1 if neither of 2 additional bonds is to an H atom
+#     option 2 if one of 2 additional bonds is to an H atom
+#     option 3 if both of 2 additional bonds is to an H atom
+# NOTE: a center atom with more H atoms than options uses option 1 for now
+
+nbonds,hcount = xyz.angle_hbond_count(alist[0],alist[1],alist[2],
+                                      lmptype,np.array(lmpmass))
+noption = np.array(ntuple,dtype=np.int64)[inverse]
+which = np.where(hcount < noption,hcount,0) + 1
+
+reverse = np.array(flip,dtype=bool)[inverse]
+atom1,atom2,atom3 = alist
+alist = (np.where(reverse,atom3,atom1),atom2,np.where(reverse,atom1,atom3))
+
+m = np.array(mtuple,dtype=np.int64)[inverse] + which - 1
+atype,mtypes,afirst = first_types(m)
+aparams = [tuple(options[m]) for m in mtypes.tolist()]
 
 # augment the aparams with bond-angle cross terms from bondangleparams
 # generate baparams = LAMMPS bond-angle params for each angle type
 # badict = dictionary for angle tuples in bongangleparams
+# each angle type uses the classes of its first angle
 
 badict = {}
 for v1,v2,v3,v4,v5,v6,v7 in prm.bondangleparams:
@@ -1156,15 +1023,11 @@ for v1,v2,v3,v4,v5,v6,v7 in prm.bondangleparams:
 
 baparams = []
 
-for itype in range(len(aparams)):
-  iangle = atype.index(itype+1)
-  atom1,atom2,atom3 = alist[iangle]
-  type1 = type[atom1-1]
-  type2 = type[atom2-1]
-  type3 = type[atom3-1]
-  c1 = classes[type1-1]
-  c2 = classes[type2-1]
-  c3 = classes[type3-1]
+for iangle in afirst.tolist():
+  atom1,atom2,atom3 = [one[iangle] for one in alist]
+  c1 = classes[atom1-1]
+  c2 = classes[atom2-1]
+  c3 = classes[atom3-1]
 
   if (c1,c2,c3) in badict:
     n1,n2,r1,r2 = badict[(c1,c2,c3)]
@@ -1188,15 +1051,11 @@ for v1,v2,v3,v4,v5 in prm.ureyparams:
 
 ubparams = []
 
-for itype in range(len(aparams)):
-  iangle = atype.index(itype+1)
-  atom1,atom2,atom3 = alist[iangle]
-  type1 = type[atom1-1]
-  type2 = type[atom2-1]
-  type3 = type[atom3-1]
-  c1 = classes[type1-1]
-  c2 = classes[type2-1]
-  c3 = classes[type3-1]
+for itype,iangle in enumerate(afirst.tolist()):
+  atom1,atom2,atom3 = [one[iangle] for one in alist]
+  c1 = classes[atom1-1]
+  c2 = classes[atom2-1]
+  c3 = classes[atom3-1]
 
   # if UB settings exist for this angle type, set ubflag in aparams to 1
 
@@ -1217,189 +1076,98 @@ for itype in range(len(aparams)):
 
 # generate dtype = LAMMPS type of each dihedral
 # generate dparams = LAMMPS params for each dihedral type
-# flags[i] = which LAMMPS dihedral type (1-N) the Tinker FF file dihedral I is
-#        0 = none
 # convert prm.torsionparams to a dictionary for efficient searching
 # key = (class1,class2,class3,class4)
 # value = (M,params) where M is index into prm.torsionparams
 
-id = xyz.id
-type = xyz.type
-classes = prm.classes
-
 ddict = {}
 for m,params in enumerate(prm.torsionparams):
   ddict[(params[0],params[1],params[2],params[3])] = (m,params)
 
-flags = len(prm.torsionparams)*[0]
-dtype = []
-dparams = []
-
-for atom1,atom2,atom3,atom4 in dlist:
-  type1 = type[atom1-1]
-  type2 = type[atom2-1]
-  type3 = type[atom3-1]
-  type4 = type[atom4-1]
-  c1 = classes[type1-1]
-  c2 = classes[type2-1]
-  c3 = classes[type3-1]
-  c4 = classes[type4-1]
-
+tuples,first,inverse = class_tuples(classes,*dlist)
+mtuple = []
+for (c1,c2,c3,c4),ifirst in zip(tuples,first.tolist()):
   if (c1,c2,c3,c4) in ddict: m,params = ddict[(c1,c2,c3,c4)]
   elif (c4,c3,c2,c1) in ddict: m,params = ddict[(c4,c3,c2,c1)]
   else:
+    atom1,atom2,atom3,atom4 = [one[ifirst] for one in dlist]
     error("dihedral not found: %d %d %d %d: %d %d %d %d" % \
           (atom1,atom2,atom3,atom4,c1,c2,c3,c4))
+  mtuple.append(m)
 
-  if not flags[m]:
-    oneparams = params[4:]
-    dparams.append(oneparams)
-    flags[m] = len(dparams)
-  dtype.append(flags[m])
+dtype,mtypes,first = first_types(np.array(mtuple,dtype=np.int64)[inverse])
+dparams = [prm.torsionparams[m][4:] for m in mtypes.tolist()]
 
 # generate otype = LAMMPS type of each out-of-plane improper
 # generate oparams = LAMMPS params for each improper type
-# flags[i] = which LAMMPS improper type (1-N) the Tinker FF file improper I is
-#        0 = none
 # convert prm.opbendparams to a dictionary for efficient searching
 # key = (class1,class2)
 # value = (M,params) where M is index into prm.opbendparams
-
-id = xyz.id
-type = xyz.type
-classes = prm.classes
+# 4-tuple is only an improper if matches an entry in PRM file
+# olist is reduced to just these 4-tuples
 
 odict = {}
 for m,params in enumerate(prm.opbendparams):
   odict[(params[0],params[1])] = (m,params)
 
-flags = len(prm.opbendparams)*[0]
-otype = []
-oparams = []
-olist_reduced = []
+tuples,first,inverse = class_tuples(classes,*olist[:2])
+mtuple = [odict[c][0] if c in odict else -1 for c in tuples]
+m = np.array(mtuple,dtype=np.int64)[inverse]
+keep = m >= 0
+olist = tuple(one[keep] for one in olist)
 
-for atom1,atom2,atom3,atom4 in olist:
-  type1 = type[atom1-1]
-  type2 = type[atom2-1]
-  type3 = type[atom3-1]
-  type4 = type[atom4-1]
-  c1 = classes[type1-1]
-  c2 = classes[type2-1]
-  c3 = classes[type3-1]
-  c4 = classes[type4-1]
-
-  # 4-tuple is only an improper if matches an entry in PRM file
-  # olist_reduced = list of just these 4-tuples
-
-  if (c1,c2) in odict:
-    m,params = odict[(c1,c2)]
-    olist_reduced.append((atom1,atom2,atom3,atom4))
-
-    if not flags[m]:
-      oneparams = params[4:]
-      oparams.append(oneparams)
-      flags[m] = len(oparams)
-    otype.append(flags[m])
-
-# replace original olist with reduced version
-
-olist = olist_reduced
+otype,mtypes,first = first_types(m[keep])
+oparams = [prm.opbendparams[m][4:] for m in mtypes.tolist()]
 
 # generate pitorsiontype = LAMMPS type of each pitorsion
 # generate pitorsionparams = LAMMPS params for each pitorsion type
-# flags[i] = which LAMMPS pitorsion type (1-N) the Ith Tinker PRM file ptors is
-#        0 = none
 # convert prm.pitorsionparams to a dictionary for efficient searching
 # key = (class1,class2)
 # value = (M,params) where M is index into prm.pitorsionparams
-
-id = xyz.id
-type = xyz.type
-classes = prm.classes
+# 6-tuple is only a PiTorsion if central 2 atoms match an entry in PRM file
+# pitorsionlist is reduced to just these 6-tuples
 
 pitdict = {}
 for m,params in enumerate(prm.pitorsionparams):
   pitdict[(params[0],params[1])] = (m,params)
 
-flags = len(prm.pitorsionparams)*[0]
-pitorsiontype = []
-pitorsionparams = []
-pitorsionlist_reduced = []
-
-for tmp1,tmp2,atom1,atom2,tmp3,tmp4 in pitorsionlist:
-  type1 = type[atom1-1]
-  type2 = type[atom2-1]
-  c1 = classes[type1-1]
-  c2 = classes[type2-1]
-
-  # 6-tuple is only a PiTorsion if central 2 atoms match an entry in PRM file
-  # pitorsionlist_reduced = list of just these 6-tuples
-
-  if (c1,c2) in pitdict or (c2,c1) in pitdict:
-    if (c1,c2) in pitdict: m,params = pitdict[(c1,c2)]
-    else: m,params = pitdict[(c2,c1)]
-    pitorsionlist_reduced.append((tmp1,tmp2,atom1,atom2,tmp3,tmp4))
+tuples,first,inverse = class_tuples(classes,*pitorsionlist[2:4])
+mtuple = []
+for c in tuples:
+  if c in pitdict: mtuple.append(pitdict[c][0])
+  elif c[::-1] in pitdict: mtuple.append(pitdict[c[::-1]][0])
+  else: mtuple.append(-1)
+m = np.array(mtuple,dtype=np.int64)[inverse]
+keep = m >= 0
+pitorsionlist = tuple(one[keep] for one in pitorsionlist)
 
-    if not flags[m]:
-      v1 = params[2:]
-      pitorsionparams.append(v1)
-      flags[m] = len(pitorsionparams)
-    pitorsiontype.append(flags[m])
-
-# replace original pitorsionlist with reduced version
-
-pitorsionlist = pitorsionlist_reduced
+pitorsiontype,mtypes,first = first_types(m[keep])
+pitorsionparams = [prm.pitorsionparams[m][2:] for m in mtypes.tolist()]
 
 # generate bitorsiontype = LAMMPS type of each bitorsion
 # generate bitorsionparams = LAMMPS params for each bitorsion type
-# flags[i] = which LAMMPS bitorsion type (1-N) the Ith Tinker PRM file btors is
-#        0 = none
 # convert prm.bitorsionparams to a dictionary for efficient searching
 # key = (class1,class2,class3,class4,class5)
 # value = (M,params) where M is index into prm.bitorsionparams
-
-id = xyz.id
-type = xyz.type
-classes = prm.classes
+# 5-tuple is only a BiTorsion if 5 atoms match an entry in PRM file
+# bitorsionlist is reduced to just these 5-tuples
 
 bitdict = {}
 for m,params in enumerate(prm.bitorsionparams):
   bitdict[(params[0],params[1],params[2],params[3],params[4])] = (m,params)
 
-flags = len(prm.bitorsionparams)*[0]
-bitorsiontype = []
-bitorsionparams = []
-bitorsionlist_reduced = []
-
-for atom1,atom2,atom3,atom4,atom5 in bitorsionlist:
-  type1 = type[atom1-1]
-  type2 = type[atom2-1]
-  type3 = type[atom3-1]
-  type4 = type[atom4-1]
-  type5 = type[atom5-1]
-  c1 = classes[type1-1]
-  c2 = classes[type2-1]
-  c3 = classes[type3-1]
-  c4 = classes[type4-1]
-  c5 = classes[type5-1]
-
-  # 5-tuple is only a BiTorsion if 5 atoms match an entry in PRM file
-  # bitorsionlist_reduced = list of just these 5-tuples
-
-  if (c1,c2,c3,c4,c5) in bitdict or (c5,c4,c3,c2,c1) in bitdict:
-    if (c1,c2,c3,c4,c5) in bitdict: m,params = bitdict[(c1,c2,c3,c4,c5)]
-    else: m,params = bitdict[(c5,c4,c3,c2,c1)]
-    bitorsionlist_reduced.append((atom1,atom2,atom3,atom4,atom5))
-
-    if not flags[m]:
-      v1 = params[5:]
-      bitorsionparams.append(v1)
-      flags[m] = len(bitorsionparams)
-    bitorsiontype.append(flags[m])
-
-# replace original bitorsionlist with reduced version
-
-bitorsionlist = bitorsionlist_reduced
+tuples,first,inverse = class_tuples(classes,*bitorsionlist)
+mtuple = []
+for c in tuples:
+  if c in bitdict: mtuple.append(bitdict[c][0])
+  elif c[::-1] in bitdict: mtuple.append(bitdict[c[::-1]][0])
+  else: mtuple.append(-1)
+m = np.array(mtuple,dtype=np.int64)[inverse]
+keep = m >= 0
+bitorsionlist = tuple(one[keep] for one in bitorsionlist)
+
+bitorsiontype,mtypes,first = first_types(m[keep])
+bitorsionparams = [prm.bitorsionparams[m][5:] for m in mtypes.tolist()]
 
 # ----------------------------------------
 # assign each atom to a Tinker group
@@ -1451,12 +1219,12 @@ y = xyz.y
 z = xyz.z
 ttype = xyz.type
 
-nbonds = len(blist)
-nangles = len(alist)
-ndihedrals = len(dlist)
-nimpropers = len(olist)
-npitorsions = len(pitorsionlist)
-nbitorsions = len(bitorsionlist)
+nbonds = len(blist[0])
+nangles = len(alist[0])
+ndihedrals = len(dlist[0])
+nimpropers = len(olist[0])
+npitorsions = len(pitorsionlist[0])
+nbitorsions = len(bitorsionlist[0])
 
 # data file header values
 
@@ -1471,6 +1239,7 @@ d.headers["ylo yhi"] = (boxlo[1],boxhi[1])
 d.headers["zlo zhi"] = (boxlo[2],boxhi[2])
 
 # data file sections
+# per-atom and per-interaction sections are set from column vectors
 
 lines = []
 for i,mass in enumerate(lmpmass):
@@ -1478,22 +1247,15 @@ for i,mass in enumerate(lmpmass):
   lines.append(line+'\n')
 d.sections["Masses"] = lines
 
-lines = []
-for i,one in enumerate(id):
-  line = "%d %d %d %g %s %s %s" % (one,molID[i],lmptype[i],0.0,x[i],y[i],z[i])
-  lines.append(line+'\n')
-d.sections["Atoms"] = lines
+q = np.zeros(natoms,dtype=np.int64)
+d.newsection("Atoms",id,molID,lmptype,q,x,y,z)
 
-lines = []
-for i,one in enumerate(ttype):
-  # comment out inclusion of Tinker group, now done by LAMMPS
-  #line = "%d %d %d" % (id[i],one,tgroup[i])
-  line = "%d %d" % (id[i],one)
-  lines.append(line+'\n')
-d.sections["Tinker Types"] = lines
+# comment out inclusion of Tinker group, now done by LAMMPS
+#d.newsection("Tinker Types",id,ttype,tgroup)
+d.newsection("Tinker Types",id,ttype)
 
 if nbonds:
-  d.headers["bonds"] = len(blist)
+  d.headers["bonds"] = nbonds
   d.headers["bond types"] = len(bparams)
 
   lines = []
@@ -1503,14 +1265,10 @@ if nbonds:
     lines.append(line+'\n')
   d.sections["Bond Coeffs"] = lines
 
-  lines = []
-  for i,one in enumerate(blist):
-    line = "%d %d %d %d" % (i+1,btype[i],one[0],one[1])
-    lines.append(line+'\n')
-  d.sections["Bonds"] = lines
+  d.newsection("Bonds",np.arange(1,nbonds+1),btype,*blist)
 
 if nangles:
-  d.headers["angles"] = len(alist)
+  d.headers["angles"] = nangles
   d.headers["angle types"] = len(aparams)
 
   lines = []
@@ -1534,14 +1292,10 @@ if nangles:
     lines.append(line+'\n')
   d.sections["UreyBradley Coeffs"] = lines
 
-  lines = []
-  for i,one in enumerate(alist):
-    line = "%d %d %d %d %d" % (i+1,atype[i],one[0],one[1],one[2])
-    lines.append(line+'\n')
-  d.sections["Angles"] = lines
+  d.newsection("Angles",np.arange(1,nangles+1),atype,*alist)
 
 if ndihedrals:
-  d.headers["dihedrals"] = len(dlist)
+  d.headers["dihedrals"] = ndihedrals
   d.headers["dihedral types"] = len(dparams)
 
   lines = []
@@ -1551,14 +1305,10 @@ if ndihedrals:
     lines.append(line+'\n')
   d.sections["Dihedral Coeffs"] = lines
 
-  lines = []
-  for i,one in enumerate(dlist):
-    line = "%d %d %d %d %d %d" % (i+1,dtype[i],one[0],one[1],one[2],one[3])
-    lines.append(line+'\n')
-  d.sections["Dihedrals"] = lines
+  d.newsection("Dihedrals",np.arange(1,ndihedrals+1),dtype,*dlist)
 
 if nimpropers:
-  d.headers["impropers"] = len(olist)
+  d.headers["impropers"] = nimpropers
   d.headers["improper types"] = len(oparams)
 
   lines = []
@@ -1568,14 +1318,10 @@ if nimpropers:
     lines.append(line+'\n')
   d.sections["Improper Coeffs"] = lines
 
-  lines = []
-  for i,one in enumerate(olist):
-    line = "%d %d %d %d %d %d" % (i+1,otype[i],one[0],one[1],one[2],one[3])
-    lines.append(line+'\n')
-  d.sections["Impropers"] = lines
+  d.newsection("Impropers",np.arange(1,nimpropers+1),otype,*olist)
 
 if npitorsions:
-  d.headers["pitorsions"] = len(pitorsionlist)
+  d.headers["pitorsions"] = npitorsions
   d.headers["pitorsion types"] = len(pitorsionparams)
 
   lines = []
@@ -1585,15 +1331,11 @@ if npitorsions:
     lines.append(line+'\n')
   d.sections["PiTorsion Coeffs"] = lines
 
-  lines = []
-  for i,one in enumerate(pitorsionlist):
-    line = "%d %d %d %d %d %d %d %d" % \
-           (i+1,pitorsiontype[i],one[0],one[1],one[2],one[3],one[4],one[5])
-    lines.append(line+'\n')
-  d.sections["PiTorsions"] = lines
+  d.newsection("PiTorsions",np.arange(1,npitorsions+1),pitorsiontype,
+               *pitorsionlist)
 
 if nbitorsions:
-  d.headers["bitorsions"] = len(bitorsionlist)
+  d.headers["bitorsions"] = nbitorsions
 
   # if there are bitorsions, then -bitorsion file must have been specified
 
@@ -1615,12 +1357,8 @@ if nbitorsions:
         print(" ",xgrid,ygrid,value, file=fp)
   fp.close()
 
-  lines = []
-  for i,one in enumerate(bitorsionlist):
-    line = "%d %d %d %d %d %d %d" % \
-           (i+1,bitorsiontype[i],one[0],one[1],one[2],one[3],one[4])
-    lines.append(line+'\n')
-  d.sections["BiTorsions"] = lines
+  d.newsection("BiTorsions",np.arange(1,nbitorsions+1),bitorsiontype,
+               *bitorsionlist)
 
 d.write(datafile)
 
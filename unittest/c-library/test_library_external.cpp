@@ -60,6 +60,28 @@ static void callback(void *handle, step_t timestep, int nlocal, tag_t *, double
     delete[] vatom[0];
     delete[] vatom;
 }
+
+// same as callback() but with per-atom data written directly into the fix storage
+static void callback_direct(void *handle, step_t timestep, int nlocal, tag_t *, double **,
+                            double **f)
+{
+    for (int i = 0; i < nlocal; ++i)
+        f[i][0] = f[i][1] = f[i][2] = (double)timestep;
+
+    double v[6] = {1.0, 1.0, 1.0, 0.0, 0.0, 0.0};
+    lammps_fix_external_set_virial_global(handle, "ext", v);
+    lammps_fix_external_set_energy_global(handle, "ext", (timestep < 10) ? 0.5 : 1.0);
+
+    double *eatom  = lammps_fix_external_get_energy_peratom(handle, "ext");
+    double **vatom = lammps_fix_external_get_virial_peratom(handle, "ext");
+    if (!eatom || !vatom) return;
+
+    for (int i = 0; i < nlocal; ++i) {
+        eatom[i]    = 0.1 * i;
+        vatom[i][0] = vatom[i][1] = vatom[i][2] = (i > 0) ? 0.1 : 0.0;
+        vatom[i][3] = vatom[i][4] = vatom[i][5] = (i > 0) ? -0.2 : 0.0;
+    }
+}
 }
 
 TEST(lammps_external, callback)
@@ -129,6 +151,68 @@ TEST(lammps_external, callback)
     if (verbose) std::cout << output;
 }
 
+TEST(lammps_external, callback_direct)
+{
+    const char *args[] = {"liblammps", "-log", "none", "-nocite", nullptr};
+    char **argv        = (char **)args;
+    int argc           = (sizeof(args) / sizeof(char *)) - 1;
+
+    ::testing::internal::CaptureStdout();
+    void *handle       = lammps_open_no_mpi(argc, argv, nullptr);
+    std::string output = ::testing::internal::GetCapturedStdout();
+    if (verbose) std::cout << output;
+
+    ::testing::internal::CaptureStdout();
+    lammps_commands_string(handle, "lattice sc 1.0\n"
+                                   "region box block -1 1 -1 1 -1 1\n"
+                                   "create_box 1 box\n"
+                                   "create_atoms 1 box\n"
+                                   "mass 1 1.0\n"
+                                   "pair_style zero 0.1\n"
+                                   "pair_coeff 1 1\n"
+                                   "velocity all set 0.1 0.0 -0.1\n"
+                                   "fix 1 all nve\n"
+                                   "fix ext all external pf/callback 5 1\n"
+                                   "compute eatm all pe/atom fix\n"
+                                   "compute vatm all stress/atom NULL fix\n"
+                                   "compute sum all reduce sum c_eatm c_vatm[*]\n"
+                                   "thermo_style custom step temp pe ke etotal press c_sum[*]\n"
+                                   "thermo 5\n"
+                                   "fix_modify ext energy yes virial yes\n");
+    output = ::testing::internal::GetCapturedStdout();
+    if (verbose) std::cout << output;
+
+    // per-atom storage is only available from within the callback
+    EXPECT_EQ(lammps_fix_external_get_energy_peratom(handle, "ext"), nullptr);
+    EXPECT_EQ(lammps_fix_external_get_virial_peratom(handle, "ext"), nullptr);
+
+    ::testing::internal::CaptureStdout();
+    lammps_set_fix_external_callback(handle, "ext", &callback_direct, handle);
+    lammps_command(handle, "run 10 post no");
+    double temp  = lammps_get_thermo(handle, "temp");
+    double pe    = lammps_get_thermo(handle, "pe");
+    double press = lammps_get_thermo(handle, "press");
+    auto *reduce =
+        (double *)lammps_extract_compute(handle, "sum", LMP_STYLE_GLOBAL, LMP_TYPE_VECTOR);
+    output = ::testing::internal::GetCapturedStdout();
+    if (verbose) std::cout << output;
+    EXPECT_DOUBLE_EQ(temp, 1.0 / 30.0);
+    EXPECT_DOUBLE_EQ(pe, 1.0 / 8.0);
+    EXPECT_DOUBLE_EQ(press, 0.15416666666666667);
+    EXPECT_DOUBLE_EQ(reduce[0], 2.8);
+    EXPECT_DOUBLE_EQ(reduce[1], -0.7);
+    EXPECT_DOUBLE_EQ(reduce[2], -0.7);
+    EXPECT_DOUBLE_EQ(reduce[3], -0.7);
+    EXPECT_DOUBLE_EQ(reduce[4], 1.4);
+    EXPECT_DOUBLE_EQ(reduce[5], 1.4);
+    EXPECT_DOUBLE_EQ(reduce[6], 1.4);
+
+    ::testing::internal::CaptureStdout();
+    lammps_close(handle);
+    output = ::testing::internal::GetCapturedStdout();
+    if (verbose) std::cout << output;
+}
+
 TEST(lammps_external, array)
 {
     const char *args[] = {"liblammps", "-log", "none", "-nocite", nullptr};
@@ -78,6 +78,32 @@ TEST_F(LibraryProperties, memory_usage)
 #endif
 };
 
+TEST_F(LibraryProperties, get_timing)
+{
+    double timing[60];
+    if (!verbose) ::testing::internal::CaptureStdout();
+    lammps_command(lmp, "region box block 0 2 0 2 0 2");
+    lammps_command(lmp, "create_box 1 box");
+    lammps_command(lmp, "mass 1 1.0");
+    lammps_command(lmp, "create_atoms 1 single 1.0 1.0 1.0");
+    lammps_command(lmp, "run 10 post no");
+    if (!verbose) ::testing::internal::GetCapturedStdout();
+    lammps_get_timing(lmp, timing);
+    // Total and Other
+    EXPECT_GT(timing[1], 0.0);
+    EXPECT_GE(timing[55], 0.0);
+    double sum = 0.0;
+    for (int i = 0; i < 10; ++i) {
+        // min <= avg <= max for wall and CPU time
+        EXPECT_LE(timing[6 * i], timing[6 * i + 1]);
+        EXPECT_LE(timing[6 * i + 1], timing[6 * i + 2]);
+        EXPECT_LE(timing[6 * i + 3], timing[6 * i + 4]);
+        EXPECT_LE(timing[6 * i + 4], timing[6 * i + 5]);
+        if (i > 0) sum += timing[6 * i + 1];
+    }
+    EXPECT_NEAR(sum, timing[1], 1.0e-10);
+};
+
 TEST_F(LibraryProperties, get_mpi_comm)
 {
     int f_comm = lammps_get_mpi_comm(lmp);
@@ -368,3 +368,40 @@ TEST_F(GatherProperties, gather_impropers_newton_off)
     delete[] impropers;
 #undef CHECK_IMPROPERS
 };
+
+TEST_F(GatherProperties, topology_checksum)
+{
+    if (!lammps_has_style(lmp, "atom", "full")) GTEST_SKIP();
+    std::string input = path_join(INPUT_DIR, "in.fourmol");
+    if (!verbose) ::testing::internal::CaptureStdout();
+    lammps_command(lmp, "newton on on");
+    lammps_file(lmp, input.c_str());
+    if (!verbose) ::testing::internal::GetCapturedStdout();
+
+    EXPECT_EQ(lammps_topology_checksum(lmp, "unknown"), 0);
+    int64_t bonds     = lammps_topology_checksum(lmp, "bonds");
+    int64_t angles    = lammps_topology_checksum(lmp, "angles");
+    int64_t dihedrals = lammps_topology_checksum(lmp, "dihedrals");
+    int64_t impropers = lammps_topology_checksum(lmp, "impropers");
+    EXPECT_NE(bonds, 0);
+    EXPECT_NE(angles, 0);
+    EXPECT_NE(dihedrals, 0);
+    EXPECT_NE(impropers, 0);
+    EXPECT_NE(bonds, angles);
+    EXPECT_NE(dihedrals, impropers);
+
+    // atoms migrating and being sorted must not change the checksum
+    if (!verbose) ::testing::internal::CaptureStdout();
+    lammps_command(lmp, "atom_modify sort 1 1.0");
+    lammps_command(lmp, "run 2 post no");
+    if (!verbose) ::testing::internal::GetCapturedStdout();
+    EXPECT_EQ(lammps_topology_checksum(lmp, "bonds"), bonds);
+    EXPECT_EQ(lammps_topology_checksum(lmp, "impropers"), impropers);
+
+    // removing bonds must change it
+    if (!verbose) ::testing::internal::CaptureStdout();
+    lammps_command(lmp, "delete_bonds all bond 5 remove");
+    if (!verbose) ::testing::internal::GetCapturedStdout();
+    EXPECT_NE(lammps_topology_checksum(lmp, "bonds"), bonds);
+    EXPECT_EQ(lammps_topology_checksum(lmp, "impropers"), impropers);
+};
@@ -0,0 +1,47 @@
+import os
+import sys
+import unittest
+
+AMBER2LMP_DIR=os.path.abspath(os.path.join(__file__, '..', '..', '..', 'tools', 'amber2lmp'))
+sys.path.insert(1,AMBER2LMP_DIR)
+
+has_numpy = False
+try:
+    import numpy
+    has_numpy = True
+    import amber2lammps
+except ImportError:
+    pass
+
+@unittest.skipIf(not has_numpy, "Missing the NumPy python module")
+class FixedWidthFields(unittest.TestCase):
+    def testIntegers(self):
+        lines = ['       1       2      13\n', '     -40       5\n']
+        values = amber2lammps.Parse_fixed(lines, '(3I8)')
+        self.assertEqual(values.tolist(), [1, 2, 13, -40, 5])
+
+    def testNoBlanks(self):
+        lines = ['  1.00000000E+00-2.50000000E-01\n']
+        values = amber2lammps.Parse_fixed(lines, '(5E16.8)')
+        self.assertEqual(values.tolist(), [1.0, -0.25])
+
+    def testTrailingBlanks(self):
+        lines = ['  1.00000000E+00  2.00000000E+00   \n',
+                 '  3.00000000E+00' + ' '*16 + '\n',
+                 '  4.00000000E+00\r\n']
+        values = amber2lammps.Parse_fixed(lines, '(2E16.8)')
+        self.assertEqual(values.tolist(), [1.0, 2.0, 3.0, 4.0])
+
+    def testShortLastField(self):
+        lines = ['       1       2\n', '       3      4\n', '   5\n']
+        values = amber2lammps.Parse_fixed(lines, '(2I8)')
+        self.assertEqual(values.tolist(), [1, 2, 3, 4, 5])
+
+    def testCharacters(self):
+        lines = ['C   H1  O   \n', 'N   \n']
+        values = amber2lammps.Parse_fixed(lines, '(20a4)')
+        self.assertEqual(values.tolist(), ['C', 'H1', 'O', 'N'])
+
+##############################
+if __name__ == "__main__":
+    unittest.main()
@@ -102,6 +102,27 @@ create_atoms 1 single &
         natoms = self.lmp.get_natoms()
         self.assertEqual(natoms,2)
 
+    def testCommandBatch(self):
+        """Test executing a pre-encoded batch of commands with substitutions"""
+        self.lmp.commands_string(self.demo_input)
+        batch = self.lmp.command_batch(["variable zz equal @{z}",
+                                        "create_atoms 1 single @{x} 0.5 ${zz}",
+                                        "variable last string @{z}/@{z}"])
+        self.assertEqual(len(batch), 3)
+        self.assertEqual(batch.parameters, {"x", "z"})
+        for i in range(4):
+            batch(x=0.1+0.2*i, z=0.25*i)
+        self.assertEqual(self.lmp.get_natoms(),5)
+        self.assertEqual(self.lmp.extract_variable("zz"), 0.75)
+        self.assertEqual(self.lmp.extract_variable("last"), "0.75/0.75")
+        with self.assertRaises(ValueError):
+            batch(x=1.0)
+
+        # batch without placeholders
+        batch = self.lmp.command_batch(self.cont_input.splitlines())
+        batch()
+        self.assertEqual(self.lmp.get_natoms(),6)
+
     def testCommandsString(self):
         """Test executing block of commands from string"""
         natoms = self.lmp.get_natoms()
@@ -592,6 +613,85 @@ create_atoms 1 single &
                 "Press" : 0.0}
         self.assertDictEqual(self.lmp.last_thermo(), ref)
 
+    def test_memory_usage(self):
+        meminfo = self.lmp.memory_usage()
+        self.assertEqual(len(meminfo), 3)
+        self.assertGreater(meminfo[0], 0.0)
+        if sys.platform.startswith('linux'):
+            self.assertGreater(meminfo[2], 0.0)
+
+    def setup_async(self, lmp):
+        lmp.commands_string("""
+units lj
+lattice fcc 0.8442
+region box block 0 4 0 4 0 4
+create_box 1 box
+create_atoms 1 box
+mass 1 1.0
+velocity all create 3.0 87287 loop geom
+pair_style lj/cut 2.5
+pair_coeff 1 1 1.0 1.0 2.5
+fix 1 all nve
+""")
+
+    def test_run_async(self):
+        import asyncio
+        self.setup_async(self.lmp)
+
+        async def monitor():
+            job = self.lmp.run_async(100, 20, maxsize=10)
+            rows = [row async for row in job]
+            return rows, await job
+
+        rows, last = asyncio.run(monitor())
+        self.assertEqual([row["Step"] for row in rows], [20, 40, 60, 80, 100])
+        self.assertDictEqual(last, rows[-1])
+        self.assertFalse(self.lmp.is_running)
+
+        # same trajectory as a single run
+        machine=None
+        if 'LAMMPS_MACHINE_NAME' in os.environ:
+            machine=os.environ['LAMMPS_MACHINE_NAME']
+        ref=lammps(name=machine, cmdargs=['-nocite', '-log', 'none', '-screen', 'none'])
+        self.setup_async(ref)
+        ref.command("run 100")
+        self.assertAlmostEqual(ref.get_thermo("pe"), last["E_pair"], 12)
+        ref.close()
+
+    def test_run_async_queue(self):
+        self.setup_async(self.lmp)
+        job = self.lmp.run_async(100, 10, maxsize=3)
+        last = job.result()
+        self.assertTrue(job.done())
+        self.assertEqual(last["Step"], 100)
+        rows = job.get_rows()
+        self.assertEqual([row["Step"] for row in rows], [80, 90, 100])
+        self.assertEqual(job.dropped, 7)
+        self.assertEqual(job.get_rows(), [])
+
+        with self.assertRaises(ValueError):
+            self.lmp.run_async(100, 0)
+
+    def test_run_async_cancel(self):
+        import asyncio
+        self.setup_async(self.lmp)
+
+        async def monitor():
+            job = self.lmp.run_async(100000, 10)
+            async for row in job:
+                if row["Step"] >= 30:
+                    job.cancel()
+            return job, await job
+
+        job, last = asyncio.run(monitor())
+        self.assertTrue(job.cancelled)
+        self.assertLess(last["Step"], 100000)
+        self.assertGreaterEqual(last["Step"], 30)
+
+        # the instance is usable afterwards
+        self.lmp.command("run 10")
+        self.assertEqual(self.lmp.extract_global("ntimestep"), last["Step"] + 10)
+
     def test_extract_setting(self):
         self.assertEqual(self.lmp.extract_setting("dimension"), 3)
         self.assertEqual(self.lmp.extract_setting("box_exist"), 0)
@@ -774,6 +874,45 @@ create_atoms 1 single &
             if sametag[myidx] < 0: continue
             self.assertEqual(mytag, tags[sametag[myidx]])
 
+    def test_snapshot_restore(self):
+        self.lmp.commands_string("""
+        units lj
+        atom_modify map array
+        lattice fcc 0.8442
+        region box block 0 3 0 3 0 3
+        create_box 1 box
+        create_atoms 1 box
+        mass 1 1.0
+        velocity all create 3.0 87287 loop geom
+        pair_style lj/cut 2.5
+        pair_coeff 1 1 1.0 1.0 2.5
+        fix 1 all nve
+        fix 2 all store/state 0 x
+        run 20 post no""")
+        snap = self.lmp.snapshot(fixes=['2'])
+        self.assertEqual(snap.timestep, 20)
+        self.assertEqual(snap.natoms, 108)
+        self.assertEqual([d[0] for d in snap.data], ['x', 'v', 'image', 'type', 'mask', 'f_2'])
+        self.lmp.command("run 10 post no")
+        pe = self.lmp.get_thermo("pe")
+        x = self.lmp.gather("x", 1, 3)
+
+        self.lmp.command("change_box all triclinic x delta 0 0.5 xy final 0.2 remap units box")
+        self.lmp.command("run 40 post no")
+        self.lmp.restore(snap)
+        self.assertEqual(self.lmp.extract_global("ntimestep"), 20)
+        self.assertEqual(self.lmp.extract_setting("triclinic"), 0)
+        self.assertEqual(self.lmp.extract_box()[:5], tuple(snap.box))
+        self.lmp.command("run 10 post no")
+        self.assertAlmostEqual(self.lmp.get_thermo("pe"), pe, 12)
+        xnew = self.lmp.gather("x", 1, 3)
+        for i in range(len(x)):
+            self.assertAlmostEqual(xnew[i], x[i], 12)
+
+        self.lmp.command("create_atoms 1 single 0.1 0.1 0.1")
+        with self.assertRaises(ValueError):
+            self.lmp.restore(snap)
+
 ##############################
 if __name__ == "__main__":
     unittest.main()
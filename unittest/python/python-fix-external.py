@@ -46,6 +46,33 @@ def callback_one(lmp, ntimestep, nlocal, tag, x, f):
         lmp.numpy.fix_external_set_energy_peratom("ext",eng)
         lmp.numpy.fix_external_set_virial_peratom("ext",vir)
 
+# same as callback_one, but write per-atom data directly into the fix storage
+def callback_two(lmp, ntimestep, nlocal, tag, x, f):
+    lmp.fix_external_set_virial_global("ext",[1.0, 1.0, 1.0, 0.0, 0.0, 0.0])
+    f[:] = float(ntimestep)
+    if ntimestep < 10:
+        lmp.fix_external_set_energy_global("ext", 0.5)
+    else:
+        lmp.fix_external_set_energy_global("ext", 1.0)
+
+    # remember the arrays to check that they are reused
+    lmp.views.append((tag, x, f))
+
+    eatom = lmp.numpy.fix_external_get_energy_peratom("ext")
+    vatom = lmp.numpy.fix_external_get_virial_peratom("ext")
+    if eatom is None or vatom is None:
+        lmp.untallied += 1
+        return
+    eatom[:] = [0.0,0.1,0.2,0.3,0.4,0.5,0.6,0.7]
+    vatom[:] = [ [0.1,0.0,0.0,0.0,0.0,0.0],
+                 [0.0,0.2,0.0,0.0,0.0,0.0],
+                 [0.0,0.0,0.3,0.0,0.0,0.0],
+                 [0.0,0.0,0.0,0.4,0.0,0.0],
+                 [0.0,0.0,0.0,0.0,0.5,0.0],
+                 [0.0,0.0,0.0,0.0,0.0,0.6],
+                 [0.0,0.0,0.0,0.0,-7.0,0.0],
+                 [0.0,-8.0,0.0,0.0,0.0,0.0] ]
+
     # ------------------------------------------------------------------------
 
 class PythonExternal(unittest.TestCase):
@@ -110,6 +137,72 @@ class PythonExternal(unittest.TestCase):
             val += lmp.extract_fix("ext",LMP_STYLE_GLOBAL,LMP_TYPE_VECTOR,nrow=i)
         self.assertAlmostEqual(val,15.0,14)
 
+    @unittest.skipIf(not NUMPY_INSTALLED, "NumPy is not available")
+    def testExternalCallbackCached(self):
+        """Test fix external from Python with pf/callback, cached arrays and direct per-atom access"""
+
+        machine=None
+        if 'LAMMPS_MACHINE_NAME' in os.environ:
+            machine=os.environ['LAMMPS_MACHINE_NAME']
+        lmp=lammps(name=machine, cmdargs=['-nocite', '-log','none', '-echo', 'screen'])
+
+        # a few commands to set up simple system
+        basic_system="""lattice sc 1.0
+                        region box block -1 1 -1 1 -1 1
+                        create_box 1 box
+                        create_atoms 1 box
+                        mass 1 1.0
+                        pair_style zero 0.1
+                        pair_coeff 1 1
+                        velocity all set 0.1 0.0 -0.1
+                        fix 1 all nve
+                        fix ext all external pf/callback 5 1
+                        compute eatm all pe/atom fix
+                        compute vatm all stress/atom NULL fix
+                        compute sum all reduce sum c_eatm c_vatm[*]
+                        thermo_style custom step temp pe ke etotal press c_sum[*]
+                        thermo 10
+                        fix_modify ext energy yes virial yes
+"""
+        lmp.commands_string(basic_system)
+        lmp.views = []
+        lmp.untallied = 0
+        lmp.set_fix_external_callback("ext",callback_two,lmp,cached=True)
+
+        # per-atom storage is not accessible outside the callback
+        self.assertIsNone(lmp.numpy.fix_external_get_energy_peratom("ext"))
+        self.assertIsNone(lmp.numpy.fix_external_get_virial_peratom("ext"))
+
+        lmp.command("run 10 post no")
+        self.assertAlmostEqual(lmp.get_thermo("temp"),1.0/30.0,14)
+        self.assertAlmostEqual(lmp.get_thermo("pe"),1.0/8.0,14)
+        self.assertAlmostEqual(lmp.get_thermo("press"),0.15416666666666667,14)
+        reduce = lmp.extract_compute("sum", LMP_STYLE_GLOBAL, LMP_TYPE_VECTOR)
+        self.assertAlmostEqual(reduce[0],2.8,14)
+        self.assertAlmostEqual(reduce[1],-0.1,14)
+        self.assertAlmostEqual(reduce[2],7.8,14)
+        self.assertAlmostEqual(reduce[3],-0.3,14)
+        self.assertAlmostEqual(reduce[4],-0.4,14)
+        self.assertAlmostEqual(reduce[5],6.5,14)
+        self.assertAlmostEqual(reduce[6],-0.6,14)
+        self.assertEqual(lmp.untallied,1)
+
+        # the same arrays are passed on every call
+        self.assertEqual(len(lmp.views),3)
+        for tag, x, f in lmp.views:
+            self.assertIs(tag,lmp.views[0][0])
+            self.assertIs(x,lmp.views[0][1])
+            self.assertIs(f,lmp.views[0][2])
+
+        # the arrays are recreated when the number of atoms changes
+        lmp.views = []
+        lmp.command("create_atoms 1 single 0.5 0.5 0.5")
+        lmp.command("run 0 post no")
+        self.assertEqual(len(lmp.views),1)
+        self.assertEqual(len(lmp.views[0][0]),9)
+        self.assertEqual(len(lmp.views[0][1]),9)
+        self.assertEqual(lmp.views[0][2][8][0],10.0)
+
     def testExternalArray(self):
         """Test fix external from Python with pf/array"""
 
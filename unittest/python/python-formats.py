@@ -1,6 +1,6 @@
 import os
 import unittest
-from lammps.formats import LogFile, AvgChunkFile
+from lammps.formats import LogFile, AvgChunkFile, BinaryDumpFile
 
 has_yaml = False
 try:
@@ -13,6 +13,13 @@ try:
 except:
     pass
 
+has_numpy = False
+try:
+    import numpy
+    has_numpy = True
+except ImportError:
+    pass
+
 EXAMPLES_DIR=os.path.abspath(os.path.join(__file__, '..', '..', '..', 'examples'))
 
 DEFAULT_STYLE_EXAMPLE_LOG="melt/log.8Apr21.melt.g++.1"
@@ -120,6 +127,68 @@ class AvgChunkFiles(unittest.TestCase):
 
         self.assertEqual(len(chunk['coord'][0]), 1)
 
+    @unittest.skipIf(not has_numpy, "Missing the NumPy python module")
+    def testReadBlock(self):
+        ref = AvgChunkFile(os.path.join(EXAMPLES_DIR, AVG_CHUNK_FILE))
+        cfile = AvgChunkFile(os.path.join(EXAMPLES_DIR, AVG_CHUNK_FILE), block=True)
+        self.assertEqual(cfile.fix_name, "4")
+        self.assertEqual(cfile.group_name, "all")
+        self.assertEqual(cfile.columns, ['Chunk', 'Coord1', 'Ncount', 'vx'])
+        self.assertEqual(list(cfile.timesteps), ref.timesteps)
+        self.assertEqual(list(cfile.total_count), ref.total_count)
+        self.assertIsNone(cfile.chunks)
+        self.assertEqual(cfile.data.shape, (20, 20, 4))
+        self.assertEqual(cfile.values.shape, (400, 4))
+
+        for i, chunk in enumerate(ref.chunks):
+            self.assertEqual(list(cfile.column('Chunk')[:, i]), [chunk['id']]*20)
+            self.assertEqual(list(cfile.column('Coord1')[:, i]), [c[0] for c in chunk['coord']])
+            self.assertEqual(list(cfile.column('Ncount')[:, i]), chunk['ncount'])
+            self.assertEqual(list(cfile.column('vx')[:, i]), chunk['vx'])
+        self.assertEqual(list(cfile.block(3)[:, 3]), [chunk['vx'][3] for chunk in ref.chunks])
+
+    @unittest.skipIf(not has_numpy, "Missing the NumPy python module")
+    def testReadBlockVariableChunks(self):
+        chunkfile = os.path.join(os.path.abspath('.'), 'ave.chunk')
+        cache = os.path.join(os.path.abspath('.'), 'ave.chunk.npy')
+        with open(chunkfile, 'w') as f:
+            f.write("# Chunk-averaged data for fix 2 and group all\n"
+                    "# Timestep Number-of-chunks Total-count\n"
+                    "# Chunk OrigID Ncount c_1\n"
+                    "100 2 5\n  1 3 2 0.5\n  2 7 3 1.5\n"
+                    "200 3 6\n  1 3 1 -0.5\n  2 7 3 2.5\n  3 9 2 4\n"
+                    "300 1 6\n  1 7 6 1e-3\n")
+        for name in (cache, cache + '.index.npz'):
+            if os.path.exists(name):
+                os.remove(name)
+
+        # the cache is written, loaded while it is newer than the file, and
+        # written again once it is older
+        mtime = os.path.getmtime(chunkfile)
+        for stamp in (None, mtime + 100, mtime - 100):
+            if stamp is not None:
+                for name in (cache, cache + '.index.npz'):
+                    os.utime(name, (stamp, stamp))
+            cfile = AvgChunkFile(chunkfile, block=True, cache=cache)
+            self.assertIsInstance(cfile.values, numpy.memmap)
+            if stamp is not None:
+                self.assertEqual(os.path.getmtime(cache) == stamp, stamp > mtime)
+                self.assertEqual(os.path.getmtime(cache + '.index.npz') == stamp, stamp > mtime)
+            self.assertEqual(list(cfile.timesteps), [100, 200, 300])
+            self.assertEqual(list(cfile.nchunks), [2, 3, 1])
+            self.assertEqual(list(cfile.offsets), [0, 2, 5, 6])
+            self.assertEqual(list(cfile.total_count), [5, 6, 6])
+            self.assertIsNone(cfile.data)
+            self.assertEqual(list(cfile.column('OrigID')), [3, 7, 3, 7, 9, 7])
+            self.assertEqual(list(cfile.block(1)[:, 3]), [-0.5, 2.5, 4.0])
+            self.assertEqual(list(cfile.block(2)[0]), [1, 7, 6, 0.001])
+            self.assertTrue(os.path.exists(cache))
+            self.assertTrue(os.path.exists(cache + '.index.npz'))
+            del cfile
+
+        for name in (chunkfile, cache, cache + '.index.npz'):
+            os.remove(name)
+
 
 from lammps import lammps
 has_dump_yaml = False
@@ -170,5 +239,81 @@ class PythonDump(unittest.TestCase):
         self.assertEqual(traj[0]['data'][0],[1, 3, 1, -0.47, -0.279937, 2.47266, -0.172009,
                                              0.000778678, 0.000589703, -0.000221795])
 
+@unittest.skipIf(not has_numpy, "Missing the NumPy python module")
+class BinaryDumpFiles(unittest.TestCase):
+    def setUp(self):
+        machine = None
+        if 'LAMMPS_MACHINE_NAME' in os.environ:
+            machine=os.environ['LAMMPS_MACHINE_NAME']
+        self.lmp = lammps(name=machine,  cmdargs=['-nocite', '-log','none', '-echo','screen'])
+        self.binfile = os.path.join(os.path.abspath('.'), 'dump.bin')
+        self.txtfile = os.path.join(os.path.abspath('.'), 'dump.txt')
+        self.lmp.commands_string("""
+units lj
+lattice fcc 0.8442
+region box block 0 3 0 3 0 3
+create_box 1 box
+create_atoms 1 box
+mass 1 1.0
+velocity all create 3.0 87287 loop geom
+pair_style lj/cut 2.5
+pair_coeff 1 1 1.0 1.0 2.5
+fix 1 all nve
+""")
+        self.lmp.command("dump 1 all custom 5 " + self.binfile + " id type x y z vx")
+        self.lmp.command("dump_modify 1 sort id time yes units yes")
+        self.lmp.command("dump 2 all custom 5 " + self.txtfile + " id type x y z vx")
+        self.lmp.command("dump_modify 2 sort id format float %.17g")
+        self.lmp.command("run 10 post no")
+        self.lmp.close()
+
+    def tearDown(self):
+        del self.lmp
+        for f in (self.binfile, self.txtfile):
+            if os.path.exists(f):
+                os.remove(f)
+
+    def testRead(self):
+        dump = BinaryDumpFile(self.binfile)
+        self.assertEqual(len(dump), 3)
+        self.assertEqual(dump.timesteps, [0, 5, 10])
+        self.assertEqual(dump.natoms, [108, 108, 108])
+        self.assertEqual(dump.columns, ['id', 'type', 'x', 'y', 'z', 'vx'])
+        self.assertEqual(dump.units, 'lj')
+        self.assertEqual(dump.index(10), 2)
+        header = dump.header(1)
+        self.assertEqual(header['triclinic'], 0)
+        self.assertEqual(header['boundary'], (0, 0, 0, 0, 0, 0))
+        self.assertEqual(len(header['box']), 6)
+        self.assertAlmostEqual(header['time'], 0.025, 14)
+
+        with open(self.txtfile) as f:
+            frames = f.read().split('ITEM: TIMESTEP')[1:]
+        for frame, data in zip(frames, dump):
+            ref = numpy.loadtxt(frame.splitlines()[9:])
+            self.assertTrue(numpy.array_equal(ref, data))
+
+    def testColumns(self):
+        dump = BinaryDumpFile(self.binfile)
+        data = dump.frame(1)
+        x = dump.frame(1, ['x', 'y', 'z'])
+        self.assertEqual(x.shape, (108, 3))
+        self.assertFalse(x.flags['OWNDATA'])
+        self.assertTrue(numpy.array_equal(x, data[:, 2:5]))
+        vx = dump[2]
+        self.assertTrue(numpy.array_equal(dump.frame(2, 'vx'), vx[:, 5]))
+        self.assertTrue(numpy.array_equal(dump.frame(2, [5, 0]), vx[:, [5, 0]]))
+        self.assertEqual(len(dump.chunks(0)), 1)
+        with self.assertRaises(Exception):
+            dump.frame(0, 'vy')
+
+    def testTruncated(self):
+        with open(self.binfile, 'rb') as f:
+            data = f.read()
+        with open(self.binfile, 'wb') as f:
+            f.write(data[:-8])
+        dump = BinaryDumpFile(self.binfile)
+        self.assertEqual(dump.timesteps, [0, 5])
+
 if __name__ == "__main__":
     unittest.main()
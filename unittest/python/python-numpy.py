@@ -1,7 +1,7 @@
 import sys,os,unittest
 from lammps import lammps, LAMMPS_INT, LMP_STYLE_GLOBAL, LMP_STYLE_LOCAL, \
                    LMP_STYLE_ATOM, LMP_TYPE_VECTOR, LMP_TYPE_SCALAR, LMP_TYPE_ARRAY, \
-                   LMP_VAR_ATOM
+                   LMP_VAR_ATOM, LMP_TIMING_CATEGORIES
 from ctypes import c_void_p
 
 has_manybody=False
@@ -239,6 +239,45 @@ class PythonNumpy(unittest.TestCase):
             count += self.checkBond(bond, 5, 29, 27)
         self.assertEqual(count,10)
 
+    @unittest.skipIf(not has_full,"Gather bonds test")
+    def testGatherBondBuffer(self):
+        self.lmp.command('shell cd ' + os.environ['TEST_INPUT_DIR'])
+        self.lmp.command("newton on on")
+        self.lmp.file("in.fourmol")
+        self.lmp.command("run 0 post no")
+        ref = self.lmp.numpy.gather_bonds()
+        buf = numpy.zeros((100,3), dtype=ref.dtype)
+        bonds = self.lmp.numpy.gather_bonds(out=buf)
+        self.assertEqual(bonds.shape, (24,3))
+        self.assertTrue(numpy.shares_memory(bonds, buf))
+        self.assertTrue((bonds == ref).all())
+        # incompatible buffers are replaced
+        bonds = self.lmp.numpy.gather_bonds(out=numpy.zeros((10,3), dtype=ref.dtype))
+        self.assertTrue((bonds == ref).all())
+        # only the array passed as out is written to
+        buf[:] = 0
+        bonds = self.lmp.numpy.gather_bonds(out=buf[:10])
+        self.assertFalse(numpy.shares_memory(bonds, buf))
+        self.assertTrue((bonds == ref).all())
+        self.assertFalse(buf.any())
+        with self.assertRaises(KeyError):
+            self.lmp.numpy.topology_generation("bends")
+        with self.assertRaises(KeyError):
+            self.lmp.numpy.gather_topology("bends")
+
+        gen, bonds = self.lmp.numpy.gather_topology("bonds", buf)
+        self.assertTrue(numpy.shares_memory(bonds, buf))
+        self.assertEqual(self.lmp.numpy.topology_generation("bonds"), gen)
+        self.lmp.command("run 2 post no")
+        gen2, bonds2 = self.lmp.numpy.gather_topology("bonds", bonds, gen)
+        self.assertEqual(gen2, gen)
+        self.assertIs(bonds2, bonds)
+        self.lmp.command("delete_bonds all bond 5 remove")
+        gen2, bonds2 = self.lmp.numpy.gather_topology("bonds", bonds, gen)
+        self.assertEqual(gen2, gen+1)
+        self.assertEqual(len(bonds2), self.lmp.extract_global("nbonds"))
+        self.assertFalse((bonds2[:,0] == 5).any())
+
     @unittest.skipIf(not has_full,"Gather bonds test")
     def testGatherBond_newton_off(self):
         self.lmp.command('shell cd ' + os.environ['TEST_INPUT_DIR'])
@@ -703,5 +742,107 @@ class PythonNumpy(unittest.TestCase):
         self.assertEqual(a[0], x[0]*x[0]+x[1]*x[1]+x[2]*x[2])
         self.assertEqual(a[1], x[3]*x[3]+x[4]*x[4]+x[5]*x[5])
 
+    def test_create_atoms(self):
+        self.lmp.command("atom_modify map array")
+        self.lmp.command("boundary f p m")
+        self.lmp.command("region box block 0 10 0 10 0 10")
+        self.lmp.command("create_box 2 box")
+        # second atom is outside the box -> dropped
+        x = numpy.array([[1.0, 1.0, 3.0], [5.0, 8.0, 12.0]])
+        self.assertEqual(self.lmp.numpy.create_atoms([1,2], numpy.array([1,1]), x), 1)
+        self.assertEqual(self.lmp.get_natoms(),1)
+        # non-zero velocities, flat coordinate list
+        v = numpy.array([[0.1, 0.2, 0.3], [-0.1, -0.2, -0.3]])
+        self.assertEqual(self.lmp.numpy.create_atoms(None, [2,2], [2.0, 2.0, 1.0, 3.0, 4.0, 6.0], v=v), 2)
+        self.assertEqual(self.lmp.get_natoms(),3)
+        # insufficient data
+        self.assertEqual(self.lmp.numpy.create_atoms(None, [2,2], [2.0, 2.0, 1.0]), 0)
+        # chunked insertion with image flags
+        n = 10
+        types = numpy.full(n, 2)
+        x = numpy.zeros((n,3))
+        x[:,0] = numpy.linspace(0.5, 9.5, n)
+        x[:,1:] = 5.0
+        img = numpy.full(n, self.lmp.encode_image_flags(1,0,-1))
+        self.assertEqual(self.lmp.numpy.create_atoms(None, types, x, image=img, chunksize=3), n)
+        self.assertEqual(self.lmp.get_natoms(),3+n)
+
+        tag = self.lmp.numpy.extract_atom("id")
+        pos = self.lmp.numpy.extract_atom("x")
+        vel = self.lmp.numpy.extract_atom("v")
+        img = self.lmp.numpy.extract_atom("image")
+        self.assertEqual(list(tag), list(range(1,n+4)))
+        self.assertTrue((pos[0] == (1.0, 1.0, 3.0)).all())
+        self.assertTrue((vel[2] == (-0.1, -0.2, -0.3)).all())
+        self.assertTrue((pos[3:,0] == x[:,0]).all())
+        for i in range(3,n+3):
+            self.assertEqual(self.lmp.decode_image_flags(img[i]), [1, 0, -1])
+
+    def test_image_flags(self):
+        flags = numpy.array([[0, 0, 0], [1, 0, -1], [-3, 7, 2], [-511, 511, -100]])
+        image = self.lmp.numpy.encode_image_flags(flags[:,0], flags[:,1], flags[:,2])
+        self.assertEqual(len(image), len(flags))
+        for i in range(len(flags)):
+            self.assertEqual(image[i], self.lmp.encode_image_flags(*[int(f) for f in flags[i]]))
+        self.assertTrue((self.lmp.numpy.decode_image_flags(image) == flags).all())
+        self.assertEqual(list(self.lmp.numpy.decode_image_flags(image[1])), [1, 0, -1])
+
+    def test_unwrap(self):
+        self.lmp.command("region box prism 0 10 0 8 0 6 1.0 2.0 3.0")
+        self.lmp.command("create_box 1 box")
+        x = numpy.array([[1.0, 2.0, 3.0], [4.0, 5.0, 5.0]])
+        flags = numpy.array([[1, 0, 0], [-1, 2, 1]])
+        image = self.lmp.numpy.encode_image_flags(flags[:,0], flags[:,1], flags[:,2])
+        expected = numpy.array([[11.0, 2.0, 3.0],
+                                [4.0 - 10.0 + 2*1.0 + 2.0, 5.0 + 2*8.0 + 3.0, 5.0 + 6.0]])
+        self.assertTrue(numpy.allclose(self.lmp.numpy.unwrap(x, image), expected))
+        self.assertTrue(numpy.allclose(self.lmp.numpy.unwrap(x, flags), expected))
+
+    def setupLJ(self):
+        self.lmp.command("units lj")
+        self.lmp.command("lattice fcc 0.8442")
+        self.lmp.command("region box block 0 4 0 4 0 4")
+        self.lmp.command("create_box 1 box")
+        self.lmp.command("create_atoms 1 box")
+        self.lmp.command("mass 1 1.0")
+        self.lmp.command("velocity all create 3.0 87287")
+        self.lmp.command("pair_style lj/cut 2.5")
+        self.lmp.command("pair_coeff 1 1 1.0 1.0 2.5")
+        self.lmp.command("fix 1 all nve")
+
+    def test_timing(self):
+        self.setupLJ()
+        self.lmp.command("run 20 post no")
+        timing = self.lmp.timing()
+        self.assertEqual(list(timing.keys()), list(LMP_TIMING_CATEGORIES))
+        for name, data in timing.items():
+            self.assertEqual(data.shape, (2, 3), name)
+            self.assertTrue((data[:,0] <= data[:,1]).all(), name)
+            self.assertTrue((data[:,1] <= data[:,2]).all(), name)
+        self.assertGreater(timing["Total"][0,1], 0.0)
+        self.assertGreater(timing["Pair"][0,1], 0.0)
+        self.assertEqual(timing["Bond"][0,1], 0.0)
+        self.assertEqual(timing["Pair"][1,1], 0.0)
+        sections = sum(timing[name][0,1] for name in LMP_TIMING_CATEGORIES[1:])
+        self.assertAlmostEqual(sections, timing["Total"][0,1])
+
+        self.lmp.command("timer full")
+        self.lmp.command("run 20 post no")
+        timing = self.lmp.timing()
+        self.assertGreater(timing["Total"][1,1], 0.0)
+
+    def test_sample_run(self):
+        self.setupLJ()
+        samples = list(self.lmp.sample_run(25, 10))
+        self.assertEqual([step for step, timing, memory in samples], [10, 20, 25])
+        self.assertEqual(self.lmp.extract_global("ntimestep"), 25)
+        for step, timing, memory in samples:
+            self.assertGreater(timing["Total"][0,1], 0.0)
+            self.assertEqual(len(memory), 3)
+            self.assertGreater(memory[0], 0.0)
+        self.assertEqual(list(self.lmp.sample_run(0, 10)), [])
+        with self.assertRaises(ValueError):
+            list(self.lmp.sample_run(10, 0))
+
 if __name__ == "__main__":
     unittest.main()
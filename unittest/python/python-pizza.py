@@ -1,5 +1,6 @@
 import os
 import sys
+import glob
 import unittest
 from lammps import lammps
 
@@ -23,6 +24,8 @@ try:
     import numpy
     has_numpy = True
     import dump
+    import xyz
+    import cfg
 except:
     pass
 do_dump_test = has_numpy and has_molecule
@@ -76,6 +79,40 @@ class Logfiles(unittest.TestCase):
         self.assertEqual(l.style, 2)
         self.assertEqual(l.nvec, 6)
 
+    def testTailLogFile(self):
+        for logfile in (DEFAULT_STYLE_EXAMPLE_LOG, MULTI_STYLE_EXAMPLE_LOG):
+            logfile = glob.glob(os.path.join(EXAMPLES_DIR, logfile))[0]
+            ref = log.log(logfile)
+            with open(logfile) as f:
+                txt = f.read()
+
+            # grow log file in pieces that end in the middle of lines
+            l = log.log('tail.log', 0)
+            self.assertEqual(l.next(), -1)
+            steps = []
+            for end in range(0, len(txt)+1000, 1000):
+                with open('tail.log', 'w') as f:
+                    f.write(txt[:end])
+                t = l.next()
+                if t >= 0: steps.append(t)
+            self.assertEqual(l.nlen, ref.nlen)
+            self.assertEqual(l.names, ref.names)
+            self.assertEqual(l.data.tolist(), ref.data.tolist())
+            self.assertEqual(steps[-1], int(ref.get("Step")[-1]))
+            self.assertEqual(l.next(), -1)
+            os.remove('tail.log')
+
+    def testGzipLogFile(self):
+        import gzip
+        logfile = os.path.join(EXAMPLES_DIR, MULTI_STYLE_EXAMPLE_LOG)
+        with open(logfile, 'rb') as f1, gzip.open('log.gz', 'wb') as f2:
+            f2.write(f1.read())
+        l1 = log.log(logfile)
+        l2 = log.log('log.gz')
+        self.assertEqual(l2.names, l1.names)
+        self.assertEqual(l2.data.tolist(), l1.data.tolist())
+        os.remove('log.gz')
+
     def testMultiLogFile(self):
         l = log.log(os.path.join(EXAMPLES_DIR, MULTI_STYLE_EXAMPLE_LOG))
         self.assertEqual(l.nvec, 14)
@@ -165,5 +202,129 @@ class PythonDump(unittest.TestCase):
 
         os.remove(dumpfile)
 
+    @unittest.skipIf(not do_dump_test,"Missing the NumPy python module or MOLECULE package")
+    def testDumpStream(self):
+        dumpfile = os.path.join(os.path.abspath('.'), 'dump.atom')
+        self.lmp.command('shell cd ' + os.environ['TEST_INPUT_DIR'])
+        self.lmp.command("newton on on")
+        self.lmp.file("in.fourmol")
+        self.lmp.command("dump 1 all atom 2 " + dumpfile)
+        self.lmp.command("run 4 post no")
+        self.lmp.command("undump 1")
+
+        d = dump.dump(dumpfile)
+        xyz.xyz(d).one("all.xyz")
+        cfg.cfg(d).one("all.cfg")
+
+        s = dump.dump(dumpfile,0)
+        s.stream()
+        times = []
+        flag = 0
+        while True:
+            index, time, flag = s.iterator(flag)
+            if flag == -1: break
+            self.assertEqual(index,0)
+            self.assertEqual(s.nsnaps,1)
+            times.append(time)
+            time, box, atoms, bonds, tris, lines = s.viz(index)
+            self.assertEqual(len(atoms),29)
+        self.assertEqual(times,[0,2,4])
+        self.assertEqual(s.names["x"],2)
+
+        xyz.xyz(s).one("stream.xyz")
+        cfg.cfg(s).one("stream.cfg")
+        for suffix in ("xyz","cfg"):
+            with open("all." + suffix) as f1, open("stream." + suffix) as f2:
+                self.assertEqual(f1.read(),f2.read())
+            os.remove("all." + suffix)
+            os.remove("stream." + suffix)
+
+        with open("stream.xyz","w") as f:
+            xyz.xyz(d).convert(f,0)
+        with open("stream.xyz") as f:
+            lines = f.readlines()
+        self.assertEqual(len(lines),31)
+        self.assertEqual(lines[1],"Atoms\n")
+        self.assertEqual(int(lines[2].split()[0]),int(d.snaps[0].atoms[0][1]))
+        self.assertAlmostEqual(float(lines[2].split()[1]),d.snaps[0].atoms[0][2])
+        os.remove("stream.xyz")
+        os.remove(dumpfile)
+
+    @unittest.skipIf(not do_dump_test,"Missing the NumPy python module or MOLECULE package")
+    def testVizArray(self):
+        dumpfile = os.path.join(os.path.abspath('.'), 'dump.atom')
+        self.lmp.command('shell cd ' + os.environ['TEST_INPUT_DIR'])
+        self.lmp.command("newton on on")
+        self.lmp.file("in.fourmol")
+        self.lmp.command("dump 1 all atom 2 " + dumpfile)
+        self.lmp.command("run 0 post no")
+        self.lmp.command("undump 1")
+
+        d = dump.dump(dumpfile)
+        d.bondflag = 1
+        d.bondlist = [[1,1,1,2],[2,1,2,3],[3,2,3,4],[4,1,3,100]]
+        time, box, atoms, bonds, tris, lines = d.viz(0)
+        time, box, aatoms, abonds, tris, lines = d.viz(0,1)
+        self.assertEqual(aatoms.shape,(29,5))
+        self.assertEqual(abonds.shape,(3,10))
+        self.assertEqual(aatoms.tolist(),atoms)
+        self.assertEqual(abonds.tolist(),bonds)
+        self.assertEqual([type(v) for v in bonds[0][0:2]],[int,int])
+        self.assertEqual(bonds[2][0:2],[3,2])
+        self.assertIsNotNone(d.snaps[0].idindex)
+
+        x = dict((int(atom[0]),atom[2:5]) for atom in atoms)
+        self.assertEqual(bonds[1][2:5],x[2])
+        self.assertEqual(bonds[1][5:8],x[3])
+
+        # bonds with an unselected atom are skipped
+        d.aselect.test("$id != 3")
+        time, box, atoms, bonds, tris, lines = d.viz(0,1)
+        self.assertEqual(atoms.shape,(28,5))
+        self.assertEqual(bonds[:,0].tolist(),[1])
+        self.assertEqual(bonds[0,5:8].tolist(),x[2])
+
+        # sorting invalidates the cached index
+        d.sort()
+        self.assertIsNone(d.snaps[0].idindex)
+        d.aselect.test("$id != 3")
+        time, box, atoms, bonds, tris, lines = d.viz(0,1)
+        self.assertEqual(bonds[:,0].tolist(),[1])
+        os.remove(dumpfile)
+
+    @unittest.skipIf(not do_dump_test,"Missing the NumPy python module or MOLECULE package")
+    def testDumpParallel(self):
+        dumpfile = os.path.join(os.path.abspath('.'), 'dump.custom')
+        self.lmp.command('shell cd ' + os.environ['TEST_INPUT_DIR'])
+        self.lmp.command("newton on on")
+        self.lmp.file("in.fourmol")
+        self.lmp.command("dump 1 all custom 1 " + dumpfile + " id type x y z ix iy iz")
+        self.lmp.command("dump_modify 1 sort 2 units yes")
+        self.lmp.command("run 9 post no")
+        self.lmp.command("undump 1")
+
+        d = dump.dump(dumpfile)
+        d.unwrap()
+        d.sort()
+        d.write("serial.dump")
+
+        p = dump.dump(dumpfile,0)
+        p.index()
+        self.assertEqual([frame[2] for frame in p.frames],list(range(10)))
+        self.assertEqual(p.frames[0][3],29)
+        self.assertEqual(p.read_frame(p.frames[0]).units,"real")
+        p.parallel("parallel.dump",1,"unwrap","sort")
+        with open("serial.dump") as f1, open("parallel.dump") as f2:
+            self.assertEqual(f1.read(),f2.read())
+        p.parallel("parallel.dump",3,"unwrap","sort")
+        with open("serial.dump") as f1, open("parallel.dump") as f2:
+            self.assertEqual(f1.read(),f2.read())
+        with self.assertRaises(Exception):
+            p.parallel("parallel.dump",2,"shuffle")
+
+        os.remove("serial.dump")
+        os.remove("parallel.dump")
+        os.remove(dumpfile)
+
 if __name__ == "__main__":
     unittest.main()
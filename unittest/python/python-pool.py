@@ -0,0 +1,84 @@
+
+import os,unittest
+from lammps import lammps
+from lammps.pool import LammpsPool
+
+machine=''
+if 'LAMMPS_MACHINE_NAME' in os.environ:
+    machine=os.environ['LAMMPS_MACHINE_NAME']
+
+setup_cmds = """
+units lj
+lattice fcc 0.8442
+region box block 0 3 0 3 0 3
+create_box 1 box
+create_atoms 1 box
+mass 1 1.0
+velocity all create 3.0 87287 loop geom
+pair_style lj/cut 2.5
+pair_coeff 1 1 1.0 1.0 2.5
+"""
+
+reset_cmds = ['fix 1 all nve']
+
+def run_task(lmp, task):
+    seed, nsteps = task
+    # displacement from previous tasks must have been undone by the reset
+    xmin = lmp.extract_box()[0][0]
+    lmp.command("velocity all create 3.0 %d loop geom" % seed)
+    lmp.command("displace_atoms all move 0.1 0.0 0.0")
+    lmp.command("run %d" % nsteps)
+    nfix = lmp.has_id("fix", "1")
+    return seed, xmin, lmp.get_natoms(), lmp.get_thermo("step"), nfix
+
+def reference(seed, nsteps):
+    lmp = lammps(name=machine, cmdargs=['-nocite', '-screen', 'none', '-log', 'none'])
+    lmp.commands_string(setup_cmds)
+    lmp.commands_list(reset_cmds)
+    lmp.command("velocity all create 3.0 %d loop geom" % seed)
+    lmp.command("displace_atoms all move 0.1 0.0 0.0")
+    lmp.command("run %d" % nsteps)
+    pe = lmp.get_thermo("pe")
+    lmp.close()
+    return pe
+
+def run_pe(lmp, task):
+    lmp.command("velocity all create 3.0 %d loop geom" % task)
+    lmp.command("displace_atoms all move 0.1 0.0 0.0")
+    lmp.command("run 10")
+    return lmp.get_thermo("pe")
+
+class PythonPool(unittest.TestCase):
+
+    def testMap(self):
+        tasks = [(1000 + i, 10) for i in range(6)]
+        with LammpsPool(2, setup=setup_cmds, reset=reset_cmds, name=machine) as pool:
+            results = pool.map(run_task, tasks)
+        self.assertEqual(len(results), len(tasks))
+        for task, result in zip(tasks, results):
+            seed, xmin, natoms, step, nfix = result
+            self.assertEqual(seed, task[0])
+            self.assertEqual(xmin, 0.0)
+            self.assertEqual(natoms, 108)
+            self.assertEqual(step, 10)
+            self.assertTrue(nfix)
+
+    def testReproducible(self):
+        with LammpsPool(2, setup=setup_cmds, reset=reset_cmds, name=machine) as pool:
+            results = dict(zip(range(4), pool.imap(run_pe, range(1, 5))))
+            unordered = sorted(pool.imap_unordered(run_pe, [3, 3, 3]))
+        self.assertAlmostEqual(results[0], reference(1, 10), 10)
+        self.assertAlmostEqual(results[2], reference(3, 10), 10)
+        self.assertAlmostEqual(unordered[0], results[2], 10)
+        self.assertAlmostEqual(unordered[2], results[2], 10)
+
+    def testSetupFunction(self):
+        def setup(lmp):
+            lmp.commands_string(setup_cmds)
+        with LammpsPool(1, setup=setup, reset=reset_cmds, name=machine, context='fork') as pool:
+            results = pool.map(run_task, [(1, 0), (2, 0)])
+        self.assertEqual([r[2] for r in results], [108, 108])
+
+##############################
+if __name__ == "__main__":
+    unittest.main()